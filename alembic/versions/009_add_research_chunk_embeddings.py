@@ -0,0 +1,63 @@
+"""add_research_chunk_embeddings
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Chunk embeddings of knowledge_base research documents, shared by all
+    # workers (see src/intelligence/utils/research_vector_store.py)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS research_chunk_embeddings (
+            seq BIGSERIAL PRIMARY KEY,
+            doc_id VARCHAR NOT NULL,
+            chunk_index INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            embedding REAL[] NOT NULL,
+            model VARCHAR,
+            metadata JSONB DEFAULT '{}'::jsonb,
+            content_type VARCHAR,
+            created_at TIMESTAMPTZ DEFAULT NOW(),
+            CONSTRAINT uq_research_chunk UNIQUE (doc_id, chunk_index)
+        );
+    """)
+
+    # pgvector column + HNSW index when the extension can be installed;
+    # without it the table still backs the in-process index.
+    # The column is fixed at 1024 dimensions (embed-english-v3.0). The
+    # pgvector backend refuses embeddings of any other size (PGVECTOR_DIMENSION
+    # in research_vector_store.py), so a model with a different
+    # EMBEDDING_DIMENSION / COHERE_EMBED_MODEL needs a migration altering it.
+    op.execute("""
+        DO $$
+        BEGIN
+            BEGIN
+                CREATE EXTENSION IF NOT EXISTS vector;
+            EXCEPTION WHEN OTHERS THEN
+                RAISE NOTICE 'pgvector not available, skipping vector column';
+            END;
+
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'vector') THEN
+                ALTER TABLE research_chunk_embeddings ADD COLUMN IF NOT EXISTS embedding_vec vector(1024);
+                CREATE INDEX IF NOT EXISTS idx_research_chunk_embedding_hnsw
+                    ON research_chunk_embeddings USING hnsw (embedding_vec vector_cosine_ops);
+            END IF;
+        END
+        $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS research_chunk_embeddings;")
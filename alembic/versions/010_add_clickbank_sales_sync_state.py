@@ -0,0 +1,57 @@
+"""add_clickbank_sales_sync_state
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18 12:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Sales written by the nightly ClickBank sync
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS clickbank_sales (
+            id BIGSERIAL PRIMARY KEY,
+            user_id VARCHAR(36) NOT NULL,
+            transaction_id VARCHAR NOT NULL,
+            product_title TEXT,
+            amount NUMERIC(12, 2),
+            commission NUMERIC(12, 2),
+            transaction_date TIMESTAMPTZ,
+            type VARCHAR,
+            created_at TIMESTAMPTZ DEFAULT NOW(),
+            CONSTRAINT uq_clickbank_sales_transaction UNIQUE (transaction_id)
+        );
+    """)
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS idx_clickbank_sales_user_date
+            ON clickbank_sales (user_id, transaction_date);
+    """)
+
+    # Per-account high-water mark and failure backoff for incremental syncs
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS clickbank_sync_state (
+            user_id VARCHAR(36) PRIMARY KEY,
+            last_transaction_at TIMESTAMPTZ,
+            last_synced_at TIMESTAMPTZ,
+            failures INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at TIMESTAMPTZ,
+            last_error TEXT
+        );
+    """)
+
+
+def downgrade() -> None:
+    # clickbank_sales predates this migration (the nightly task wrote to it);
+    # only the objects added here are removed, never the sales history
+    op.execute("DROP TABLE IF EXISTS clickbank_sync_state;")
+    op.execute("DROP INDEX IF EXISTS idx_clickbank_sales_user_date;")
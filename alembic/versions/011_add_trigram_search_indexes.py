@@ -0,0 +1,60 @@
+"""add_trigram_search_indexes
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18 14:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+# (index, table, column) searched by src/core/database/search.py
+TRIGRAM_INDEXES = [
+    ("idx_intelligence_core_product_name_trgm", "intelligence_core", "product_name"),
+    ("idx_campaigns_name_trgm", "campaigns", "name"),
+    ("idx_campaigns_description_trgm", "campaigns", "description"),
+    ("idx_users_email_trgm", "users", "email"),
+    ("idx_users_full_name_trgm", "users", "full_name"),
+]
+
+
+def upgrade() -> None:
+    op.execute("""
+        DO $$
+        BEGIN
+            CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        EXCEPTION WHEN OTHERS THEN
+            RAISE NOTICE 'pg_trgm not available, skipping trigram search indexes';
+        END
+        $$;
+    """)
+
+    # Without the extension, search falls back to substring matching
+    has_trigram = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+    ).scalar()
+    if not has_trigram:
+        return
+
+    # Built concurrently so the tables stay writable; CONCURRENTLY cannot run
+    # inside the migration transaction
+    with op.get_context().autocommit_block():
+        for index, table, column in TRIGRAM_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} "
+                f"ON {table} USING gin ({column} gin_trgm_ops);"
+            )
+
+
+def downgrade() -> None:
+    # pg_trgm itself is left installed
+    with op.get_context().autocommit_block():
+        for index, _, _ in TRIGRAM_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index};")
@@ -0,0 +1,30 @@
+"""add_subject_template_minhash
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18 16:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # MinHash signature of each template's word shingles, used by the
+    # near-duplicate index (src/intelligence/utils/subject_similarity_index.py).
+    # Existing rows are filled in when the index first loads them.
+    op.execute("""
+        ALTER TABLE IF EXISTS email_subject_templates
+            ADD COLUMN IF NOT EXISTS minhash_signature BYTEA;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE IF EXISTS email_subject_templates DROP COLUMN IF EXISTS minhash_signature;")
@@ -0,0 +1,181 @@
+# scripts/benchmark_api_serialization.py
+"""
+API SERIALIZATION BENCHMARK
+GET /api/intelligence/campaigns/{campaign_id} (the campaign intelligence
+endpoint: SuccessResponse[List[Dict[str, Any]]] of up to 50 intelligence
+records with their full_analysis_data) served two ways:
+
+    json      FastAPI's JSONResponse (json.dumps), the previous default
+    orjson    CampaignForgeJSONResponse, the application default
+
+For each, response time over --requests requests and tracemalloc figures
+averaged over --traced requests: peak traced bytes during a request, and
+the blocks and bytes each request allocated that were still live when it
+returned (the rendered body included). tracemalloc only sees live blocks,
+so temporaries freed within a request show up in the peak alone.
+
+Also compares serialize_for_api on the same payload:
+
+    round-trip   json.loads(safe_json_dumps(data)) (the previous implementation)
+    walk         to_jsonable, a single pass with no intermediate string
+
+Usage:
+    python scripts/benchmark_api_serialization.py --records 50 --kb 40
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from src.core.shared.responses import SuccessResponse
+from src.utils.json_utils import ORJSON_AVAILABLE, CampaignForgeJSONResponse, safe_json_dumps, to_jsonable
+
+ENDPOINT = "/api/intelligence/campaigns/{campaign_id}"
+WORDS = ("metabolism energy support natural formula customers results guarantee bottle "
+         "ingredients clinical weight sleep focus urgency proof bonus official").split()
+
+
+def sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 16))).capitalize() + "."
+
+
+def full_analysis(rng: random.Random, size: int) -> Dict[str, Any]:
+    """A full_analysis_data blob of roughly ``size`` bytes of JSON"""
+    analysis = {
+        "product_analysis": {key: [sentence(rng) for _ in range(5)] for key in
+                             ("features", "benefits", "ingredients", "conditions", "usage_instructions")},
+        "market_enhancement": {"category": "health", "positioning": sentence(rng),
+                               "competitive_advantages": [sentence(rng) for _ in range(4)], "target_audience": sentence(rng)},
+        "insights": [],
+    }
+    while len(safe_json_dumps(analysis)) < size:
+        analysis["insights"].append({
+            "text": sentence(rng),
+            "score": rng.random(),
+            "evidence": [sentence(rng) for _ in range(3)],
+            "sources": [{"url": f"https://example.com/{rng.randint(1, 10**6)}", "confidence": rng.random()}],
+        })
+    return analysis
+
+
+def campaign_intelligence(records: int, size: int) -> List[Dict[str, Any]]:
+    """Records shaped like IntelligenceService.get_campaign_intelligence output"""
+    rng = random.Random(0)
+    created = datetime(2025, 7, 1, tzinfo=timezone.utc)
+    data = []
+    for index in range(records):
+        analysis = full_analysis(rng, size)
+        data.append({
+            "id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "product_name": f"Product {index}",
+            "confidence_score": rng.random(),
+            "created_at": (created + timedelta(hours=index)).isoformat(),
+            "product_info": analysis["product_analysis"],
+            "market_info": analysis["market_enhancement"],
+            "research": [],
+            "full_analysis_data": analysis,
+        })
+    return data
+
+
+def make_app(response_class, data: List[Dict[str, Any]]) -> FastAPI:
+    app = FastAPI(default_response_class=response_class)
+
+    @app.get(ENDPOINT, response_model=SuccessResponse[List[Dict[str, Any]]])
+    async def get_campaign_intelligence(campaign_id: str):
+        return SuccessResponse(data=data, message="Campaign intelligence retrieved successfully")
+
+    return app
+
+
+def time_calls(func: Callable[[], Any], runs: int) -> List[float]:
+    """Milliseconds per call"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def traced(func: Callable[[], Any], runs: int) -> Dict[str, float]:
+    """Per-call tracemalloc figures, averaged over ``runs`` calls"""
+    peaks, blocks, sizes = [], [], []
+    tracemalloc.start()
+    try:
+        for _ in range(runs):
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            result = func()
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            stats = after.compare_to(before, "filename")
+            peaks.append(peak)
+            blocks.append(sum(stat.count_diff for stat in stats))
+            sizes.append(sum(stat.size_diff for stat in stats))
+            del result
+    finally:
+        tracemalloc.stop()
+    return {"peak": statistics.mean(peaks), "blocks": statistics.mean(blocks), "bytes": statistics.mean(sizes)}
+
+
+HEADER = f"{'ms p50':>8} {'p95':>8} {'peak MB':>9} {'blocks/req':>11} {'KB/req':>9}"
+
+
+def report(label: str, timings: List[float], memory: Dict[str, float]):
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(f"{label:<12} {statistics.median(timings):>8.2f} {p95:>8.2f} {memory['peak'] / 1024 / 1024:>9.2f} "
+          f"{memory['blocks']:>11,.0f} {memory['bytes'] / 1024:>9,.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API response serialization")
+    parser.add_argument("--records", type=int, default=50, help="intelligence records per response")
+    parser.add_argument("--kb", type=int, default=40, help="approximate full_analysis_data size per record")
+    parser.add_argument("--requests", type=int, default=30)
+    parser.add_argument("--traced", type=int, default=5, help="requests measured under tracemalloc")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    data = campaign_intelligence(args.records, args.kb * 1024)
+    url = ENDPOINT.format(campaign_id=uuid.uuid4())
+
+    bodies = {}
+    print(f"{args.records} records, {len(safe_json_dumps(data)) / 1024 / 1024:.1f} MB of JSON, orjson: {ORJSON_AVAILABLE}")
+    print(f"{'endpoint':<12} {HEADER}")
+    for label, response_class in (("json", JSONResponse), ("orjson", CampaignForgeJSONResponse)):
+        with TestClient(make_app(response_class, data)) as client:
+            client.get(url)
+            timings = time_calls(lambda: client.get(url), args.requests)
+            memory = traced(lambda: client.get(url), args.traced)
+            bodies[label] = client.get(url).json()
+        report(label, timings, memory)
+    bodies["json"].pop("timestamp"), bodies["orjson"].pop("timestamp")
+    assert bodies["json"] == bodies["orjson"], "response bodies differ"
+
+    payload = {"success": True, "timestamp": datetime.now(), "data": data}
+    print(f"{'serialize':<12} {HEADER}")
+    for label, func in (("round-trip", lambda: json.loads(safe_json_dumps(payload))), ("walk", lambda: to_jsonable(payload))):
+        timings = time_calls(func, args.requests)
+        report(label, timings, traced(func, args.traced))
+    assert json.loads(safe_json_dumps(payload)) == to_jsonable(payload)
+
+
+if __name__ == "__main__":
+    main()
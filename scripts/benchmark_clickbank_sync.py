@@ -0,0 +1,257 @@
+# scripts/benchmark_clickbank_sync.py
+"""
+CLICKBANK SALES SYNC BENCHMARK
+Syncs N fake accounts x M transactions from a local stub ClickBank server into
+Postgres and compares:
+
+    baseline     one account at a time, one INSERT ... ON CONFLICT and commit
+                 per transaction (the previous task), run on a sample of
+                 accounts and extrapolated
+    pipeline     ClickBankSalesSync: concurrent fetches, COPY + merge
+    insert       ClickBankSalesSync with multi-row INSERT instead of COPY
+    incremental  a second pipeline run; high-water marks limit each account
+                 to its newest day
+
+The stub serves transactions spread over the last 30 days and honours the
+``days`` parameter, with --latency-ms of simulated API latency per request.
+
+Tables are created in a separate ``clickbank_benchmark`` schema of the given
+database, which is dropped first. Requires sqlalchemy, asyncpg and httpx.
+
+Usage:
+    python scripts/benchmark_clickbank_sync.py \\
+        --database-url postgresql+asyncpg://postgres@localhost/postgres \\
+        --accounts 1000 --transactions 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.platforms.clickbank.services.clickbank_client import ClickBankClient
+from src.platforms.clickbank.services.sales_sync import ClickBankSalesSync
+
+SCHEMA = "clickbank_benchmark"
+HISTORY_DAYS = 30
+
+
+def generate_transactions(accounts: int, per_account: int, seed: int = 0) -> Dict[str, List[Dict[str, Any]]]:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    data = {}
+    for a in range(accounts):
+        transactions = []
+        for t in range(per_account):
+            amount = round(rng.uniform(10, 200), 2)
+            transactions.append({
+                "transaction_id": f"TX{a:05d}{t:05d}",
+                "product_title": f"Product {rng.randint(1, 50)}",
+                "amount": amount,
+                "commission": round(amount * 0.5, 2),
+                "transaction_date": (now - timedelta(seconds=rng.uniform(0, HISTORY_DAYS * 86400))).isoformat(),
+                "type": rng.choice(["SALE", "SALE", "SALE", "RFND"]),
+            })
+        transactions.sort(key=lambda s: s["transaction_date"])
+        data[f"acct{a}"] = transactions
+    return data
+
+
+class StubClickBankServer:
+    """Minimal keep-alive HTTP server for /analytics/summary in a background thread"""
+
+    def __init__(self, transactions: Dict[str, List[Dict[str, Any]]], latency: float):
+        self.transactions = transactions
+        self.latency = latency
+        self.requests = 0
+        self.port = None
+        self._loop = None
+        self._ready = threading.Event()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                target = head.split(b" ", 2)[1].decode()
+                query = parse_qs(urlsplit(target).query)
+                account = query.get("account", [""])[0]
+                days = int(query.get("days", [HISTORY_DAYS])[0])
+                cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+                sales = [s for s in self.transactions.get(account, []) if s["transaction_date"] >= cutoff]
+                body = json.dumps({"account": account, "transactions": sales}).encode()
+                self.requests += 1
+                await asyncio.sleep(self.latency)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        server = self._loop.run_until_complete(asyncio.start_server(self._handle, "127.0.0.1", 0))
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    def start(self) -> str:
+        threading.Thread(target=self._run, daemon=True).start()
+        self._ready.wait()
+        return f"http://127.0.0.1:{self.port}"
+
+
+async def create_schema(engine, accounts: int):
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.execute(text("""
+            CREATE TABLE clickbank_accounts (
+                user_id VARCHAR(36) PRIMARY KEY, nickname VARCHAR, api_key VARCHAR
+            )
+        """))
+        await conn.execute(text("""
+            CREATE TABLE clickbank_sales (
+                id BIGSERIAL PRIMARY KEY,
+                user_id VARCHAR(36) NOT NULL,
+                transaction_id VARCHAR NOT NULL UNIQUE,
+                product_title TEXT,
+                amount NUMERIC(12, 2),
+                commission NUMERIC(12, 2),
+                transaction_date TIMESTAMPTZ,
+                type VARCHAR,
+                created_at TIMESTAMPTZ DEFAULT NOW()
+            )
+        """))
+        await conn.execute(text("CREATE INDEX ON clickbank_sales (user_id, transaction_date)"))
+        await conn.execute(text("""
+            CREATE TABLE clickbank_sync_state (
+                user_id VARCHAR(36) PRIMARY KEY,
+                last_transaction_at TIMESTAMPTZ,
+                last_synced_at TIMESTAMPTZ,
+                failures INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at TIMESTAMPTZ,
+                last_error TEXT
+            )
+        """))
+        await conn.execute(
+            text("INSERT INTO clickbank_accounts (user_id, nickname, api_key) VALUES (:user_id, :nickname, 'key')"),
+            [{"user_id": f"user-{a}", "nickname": f"acct{a}"} for a in range(accounts)]
+        )
+
+
+async def reset_sales(engine):
+    async with engine.begin() as conn:
+        await conn.execute(text("TRUNCATE clickbank_sales, clickbank_sync_state"))
+
+
+async def run_baseline(session_factory, client: ClickBankClient, accounts: int) -> float:
+    """The previous task: sequential fetch, one statement and commit per transaction"""
+    started = time.perf_counter()
+    for a in range(accounts):
+        sales = await client.fetch_sales(f"acct{a}", "key", days=HISTORY_DAYS)
+        async with session_factory() as session:
+            for s in sales.get("transactions", []):
+                await session.execute(text("""
+                    INSERT INTO clickbank_sales
+                        (user_id, transaction_id, product_title, amount, commission, transaction_date, type)
+                    VALUES
+                        (:user_id, :transaction_id, :product_title, :amount, :commission,
+                         CAST(:transaction_date AS TIMESTAMPTZ), :type)
+                    ON CONFLICT (transaction_id) DO NOTHING
+                """), {"user_id": f"user-{a}", **s})
+                await session.commit()
+    return time.perf_counter() - started
+
+
+async def count_sales(engine) -> int:
+    async with engine.connect() as conn:
+        return (await conn.execute(text("SELECT COUNT(*) FROM clickbank_sales"))).scalar()
+
+
+async def main_async(args):
+    transactions = generate_transactions(args.accounts, args.transactions)
+    stub = StubClickBankServer(transactions, args.latency_ms / 1000)
+    base_url = stub.start()
+
+    engine = create_async_engine(
+        args.database_url,
+        pool_size=4,
+        connect_args={"server_settings": {"search_path": SCHEMA}}
+    )
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def transaction():
+        async with sessions() as session:
+            async with session.begin():
+                yield session
+
+    await create_schema(engine, args.accounts)
+    total_rows = args.accounts * args.transactions
+    results = {}
+
+    client = ClickBankClient(base_url=base_url, max_connections=args.concurrency)
+    try:
+        baseline_accounts = min(args.baseline_accounts, args.accounts)
+        if baseline_accounts:
+            elapsed = await run_baseline(sessions, client, baseline_accounts)
+            results["baseline"] = (elapsed * args.accounts / baseline_accounts, baseline_accounts * args.transactions)
+            await reset_sales(engine)
+
+        for mode, use_copy in (("insert", False), ("pipeline", True)):
+            sync = ClickBankSalesSync(client=client, session_factory=transaction, concurrency=args.concurrency, use_copy=use_copy)
+            stats = await sync.run()
+            results[mode] = (stats["duration_seconds"], stats["inserted_rows"])
+            if mode == "insert":
+                await reset_sales(engine)
+
+        stored = await count_sales(engine)
+        sync = ClickBankSalesSync(client=client, session_factory=transaction, concurrency=args.concurrency)
+        stats = await sync.run()
+        results["incremental"] = (stats["duration_seconds"], stats["fetched_rows"])
+    finally:
+        await client.close()
+        await engine.dispose()
+
+    print(f"{args.accounts} accounts x {args.transactions} transactions ({total_rows} rows), "
+          f"{args.latency_ms:.0f} ms API latency, concurrency {args.concurrency}")
+    print(f"{'mode':<12} {'seconds':>9} {'rows':>9} {'rows/s':>10}")
+    for mode, (seconds, rows) in results.items():
+        note = " (extrapolated)" if mode == "baseline" else ""
+        shown_rows = total_rows if mode == "baseline" else rows
+        print(f"{mode:<12} {seconds:>9.1f} {shown_rows:>9} {shown_rows / max(seconds, 1e-9):>10.0f}{note}")
+    print(f"\nrows stored after full sync: {stored}")
+    if "baseline" in results:
+        print(f"pipeline vs baseline: {results['baseline'][0] / results['pipeline'][0]:.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ClickBank sales sync")
+    parser.add_argument("--database-url", default=os.getenv("BENCHMARK_DATABASE_URL"), required=os.getenv("BENCHMARK_DATABASE_URL") is None)
+    parser.add_argument("--accounts", type=int, default=1000)
+    parser.add_argument("--transactions", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--baseline-accounts", type=int, default=20, help="Accounts synced by the baseline (0 to skip)")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+# scripts/benchmark_json_extraction.py
+"""
+JSON EXTRACTION BENCHMARK
+validate_and_parse_json on pathological --size-kb AI responses:
+
+    legacy   json.loads, regex rewrite passes, then backtracking object/array
+             patterns over the whole text (the previous implementation; run
+             in a subprocess and stopped after --legacy-timeout seconds)
+    scan     json_extractor: one bracket/string-aware pass
+
+The scan must finish every input within --max-ms, or the script exits 1.
+
+Usage:
+    python scripts/benchmark_json_extraction.py --size-kb 100
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import random
+import re
+import sys
+import time
+from typing import Any, Callable, Dict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.intelligence.utils.ai_throttle import validate_and_parse_json
+from src.intelligence.utils.json_extractor import ORJSON_AVAILABLE
+
+
+def legacy_validate_and_parse_json(response_text: str) -> Any:
+    """validate_and_parse_json before the single-pass extractor (logging removed)"""
+    if not response_text or not response_text.strip():
+        return None
+    cleaned = response_text.strip()
+    try:
+        return json.loads(cleaned)
+    except json.JSONDecodeError:
+        try:
+            if "```json" in cleaned:
+                match = re.search(r'```json\s*(.*?)\s*```', cleaned, re.DOTALL)
+                if match:
+                    cleaned = match.group(1).strip()
+            elif "```" in cleaned:
+                match = re.search(r'```\s*(.*?)\s*```', cleaned, re.DOTALL)
+                if match:
+                    cleaned = match.group(1).strip()
+            cleaned = re.sub(r'^[^{\[]*', '', cleaned)
+            cleaned = re.sub(r'[^}\]]*$', '', cleaned)
+            cleaned = re.sub(r',\s*}', '}', cleaned)
+            cleaned = re.sub(r',\s*]', ']', cleaned)
+            cleaned = re.sub(r'}\s*{', '},{', cleaned)
+            return json.loads(cleaned)
+        except json.JSONDecodeError:
+            for pattern in [r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', r'\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]', r'\{.*?\}', r'\[.*?\]']:
+                for match in re.findall(pattern, cleaned, re.DOTALL):
+                    try:
+                        return json.loads(match)
+                    except Exception:
+                        continue
+            matches = re.findall(r'"([^"]+)":\s*(?:"([^"]+)"|(\[[^\]]+\])|\{[^}]+\})', cleaned)
+            result = {}
+            for match in matches:
+                if match[1]:
+                    result[match[0]] = match[1]
+                elif match[2]:
+                    try:
+                        result[match[0]] = json.loads(match[2])
+                    except Exception:
+                        result[match[0]] = match[2]
+            return result or None
+        except RecursionError:
+            return None
+
+
+def _repeat(unit: str, size: int) -> str:
+    return (unit * (size // len(unit) + 1))[:size]
+
+
+def make_inputs(size: int) -> Dict[str, str]:
+    rng = random.Random(0)
+    analysis = {
+        "offer_intelligence": {"products": ["AquaSculpt"], "value_propositions": []},
+        "insights": [],
+    }
+    while len(json.dumps(analysis)) < size - 200:
+        analysis["insights"].append({"text": "Customers respond to {urgency} and [social proof]", "score": rng.random()})
+    valid = json.dumps(analysis, indent=2)
+    trailing = re.sub(r'(\d)\n(\s*)}', r'\1,\n\2}', valid)
+    return {
+        "fenced_trailing_commas": f"Sure! Here is the analysis:\n```json\n{trailing}\n```\nLet me know.",
+        "truncated_object": valid[:size // 2],
+        # Unclosed values followed by one stray closer: the worst case for
+        # lazy/backtracking patterns, which rescan to the end from every opener
+        "unclosed_braces": _repeat("{", size - 1) + "]",
+        "brace_prose": _repeat("see {note ", size - 1) + "]",
+        "unclosed_objects": "[" + _repeat('{"a": 1, ', size - 2) + "]",
+        "nested_keys_unclosed": _repeat('{"a": {"b": ', size - 1) + "]",
+        "array_keys_unclosed": _repeat('"k": [1, ', size - 1) + "}",
+        "quote_brace_soup": "".join(rng.choice('{}[]",:\\ ab') for _ in range(size)),
+    }
+
+
+def _legacy_worker(text: str, queue):
+    started = time.perf_counter()
+    try:
+        legacy_validate_and_parse_json(text)
+        error = ""
+    except Exception as e:
+        # Escaped validate_and_parse_json, failing the whole provider call
+        error = type(e).__name__
+    queue.put((time.perf_counter() - started, error))
+
+
+def time_legacy(text: str, timeout: float) -> str:
+    """Milliseconds taken by the legacy parser, or how it failed"""
+    queue = multiprocessing.Queue()
+    worker = multiprocessing.Process(target=_legacy_worker, args=(text, queue), daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        worker.terminate()
+        worker.join()
+        return f">{timeout * 1000:.0f}"
+    seconds, error = queue.get()
+    return f"{seconds * 1000:.1f}" + (f" ({error})" if error else "")
+
+
+def time_scan(func: Callable[[], Any], runs: int) -> float:
+    """Worst seconds over ``runs`` calls"""
+    worst = 0.0
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        worst = max(worst, time.perf_counter() - started)
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON extraction on pathological AI responses")
+    parser.add_argument("--size-kb", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=250.0, help="hard bound per input for the scan")
+    parser.add_argument("--legacy-timeout", type=float, default=10.0)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    inputs = make_inputs(args.size_kb * 1024)
+    print(f"{args.size_kb} KB inputs, orjson: {ORJSON_AVAILABLE}, bound {args.max_ms:.0f} ms")
+    print(f"{'input':<24} {'legacy ms':>24} {'scan ms':>9} {'result':>8}")
+
+    failures = []
+    for name, text in inputs.items():
+        result = validate_and_parse_json(text, "benchmark")
+        scan_ms = time_scan(lambda: validate_and_parse_json(text, "benchmark"), args.runs) * 1000
+        legacy = "-" if args.skip_legacy else time_legacy(text, args.legacy_timeout)
+        found = type(result).__name__ if result is not None else "None"
+        print(f"{name:<24} {legacy:>24} {scan_ms:>9.1f} {found:>8}")
+        if scan_ms > args.max_ms:
+            failures.append(name)
+
+    if failures:
+        print(f"scan exceeded {args.max_ms:.0f} ms on: {', '.join(failures)}")
+        sys.exit(1)
+    print(f"all inputs within {args.max_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# scripts/benchmark_middleware.py
+"""
+MIDDLEWARE STACK BENCHMARK
+Requests per second of a trivial endpoint under uvicorn with:
+
+    none       no middleware (baseline)
+    base_http  rate limiting + error handling as BaseHTTPMiddleware subclasses
+    asgi       the pure ASGI RateLimitMiddleware / ErrorHandlingMiddleware
+
+The BaseHTTPMiddleware variants wrap the same limiter and error responses, so
+the difference between the two stacks is the middleware plumbing itself. CORS
+is Starlette's CORSMiddleware (already pure ASGI) in both stacks.
+
+Each stack is served by its own uvicorn process; load is generated from this
+process over keep-alive connections. Requires fastapi and uvicorn.
+
+Usage:
+    python scripts/benchmark_middleware.py --duration 10 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import logging
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+STACKS = ("none", "base_http", "asgi")
+
+# High enough that the benchmark never hits the limit
+BENCHMARK_CALLS_PER_MINUTE = 10 ** 9
+
+
+def build_app(stack: str):
+    """FastAPI app with a trivial endpoint behind the requested middleware stack"""
+
+    from fastapi import FastAPI, Request
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    from src.core.middleware.error_handling import ErrorHandlingMiddleware
+    from src.core.middleware.rate_limiting import RateLimitMiddleware, RateLimiter, rate_limit_headers
+
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if stack == "none":
+        return app
+
+    app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+
+    if stack == "asgi":
+        app.add_middleware(ErrorHandlingMiddleware)
+        app.add_middleware(RateLimitMiddleware, calls=BENCHMARK_CALLS_PER_MINUTE, period=60)
+        return app
+
+    class BaseHTTPErrorHandling(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next):
+            try:
+                return await call_next(request)
+            except Exception as e:
+                return JSONResponse(status_code=500, content={"success": False, "error_type": type(e).__name__})
+
+    class BaseHTTPRateLimit(BaseHTTPMiddleware):
+        def __init__(self, app):
+            super().__init__(app)
+            self.limiter = RateLimiter(BENCHMARK_CALLS_PER_MINUTE, 60)
+
+        async def dispatch(self, request: Request, call_next):
+            result, _ = await self.limiter.check(
+                request.url.path, request.headers, request.client.host if request.client else None
+            )
+            if not result.allowed:
+                return JSONResponse(status_code=429, content={"success": False}, headers=rate_limit_headers(result))
+            response = await call_next(request)
+            response.headers.update(rate_limit_headers(result))
+            return response
+
+    app.add_middleware(BaseHTTPErrorHandling)
+    app.add_middleware(BaseHTTPRateLimit)
+    return app
+
+
+def serve(stack: str, port: int):
+    import uvicorn
+    uvicorn.run(build_app(stack), host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server on port {port} did not start")
+
+
+async def _get(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: bytes) -> int:
+    """One keep-alive GET; returns the status code"""
+    writer.write(request)
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_code = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line[:15].lower() == b"content-length:":
+            length = int(line[15:])
+    await reader.readexactly(length)
+    return status_code
+
+
+async def generate_load(port: int, path: str, duration: float, concurrency: int) -> Dict[str, Any]:
+    """
+    Drive keep-alive connections with a minimal HTTP/1.1 client
+
+    A full client library costs more CPU per request than the endpoint under
+    test, which would hide the server-side difference on small machines.
+    """
+
+    request = f"GET {path} HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\n\r\n".encode()
+    latencies: List[float] = []
+    errors = 0
+    deadline = 0.0
+
+    async def worker():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            # Warm up the connection
+            await _get(reader, writer, request)
+            await start.wait()
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                if await _get(reader, writer, request) != 200:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+        finally:
+            writer.close()
+
+    start = asyncio.Event()
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    await asyncio.sleep(0.5)
+    started = time.perf_counter()
+    deadline = started + duration
+    start.set()
+    await asyncio.gather(*workers)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[max(0, int(len(latencies) * 0.99) - 1)] * 1000,
+    }
+
+
+def benchmark_stack(stack: str, duration: float, concurrency: int) -> Dict[str, Any]:
+    port = free_port()
+    server = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--serve", stack, "--port", str(port)])
+    try:
+        wait_for_port(port)
+        return asyncio.run(generate_load(port, "/ping", duration, concurrency))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BaseHTTPMiddleware vs pure ASGI middleware")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load per stack")
+    parser.add_argument("--concurrency", type=int, default=64, help="Concurrent client connections")
+    parser.add_argument("--stacks", nargs="+", choices=STACKS, default=list(STACKS))
+    parser.add_argument("--serve", choices=STACKS, help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port)
+        return
+
+    results = {}
+    for stack in args.stacks:
+        print(f"Benchmarking {stack} ({args.duration:.0f}s, concurrency {args.concurrency})...")
+        results[stack] = benchmark_stack(stack, args.duration, args.concurrency)
+
+    print()
+    print(f"{'stack':<10} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for stack, result in results.items():
+        print(
+            f"{stack:<10} {result['rps']:>10.0f} {result['p50_ms']:>8.2f} "
+            f"{result['p99_ms']:>8.2f} {result['errors']:>7}"
+        )
+
+    if "base_http" in results and "asgi" in results:
+        speedup = results["asgi"]["rps"] / results["base_http"]["rps"]
+        print(f"\nPure ASGI vs BaseHTTPMiddleware: {speedup:.2f}x requests per second")
+
+
+if __name__ == "__main__":
+    main()
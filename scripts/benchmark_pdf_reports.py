@@ -0,0 +1,206 @@
+# scripts/benchmark_pdf_reports.py
+"""
+PDF REPORT RENDERING BENCHMARK
+Latency of an unrelated endpoint (/ping) while ten reports render at once:
+
+    inline    reports built with render_report() directly in the async
+              handler (the previous behaviour: reportlab on the event loop)
+    offload   PDFReportService.generate_intelligence_report (process pool)
+    cached    the same ten reports requested again (served from the cache)
+
+Each mode runs in its own uvicorn process. The reports get distinct
+campaign ids, so inline/offload renders all ten. Requires fastapi, uvicorn
+and reportlab.
+
+Usage:
+    python scripts/benchmark_pdf_reports.py --reports 10 --paragraph-words 1500
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_middleware import free_port, wait_for_port
+
+MODES = ("inline", "offload", "cached")
+
+SECTIONS = [
+    "executive_summary", "product_analysis", "target_audience", "competition_analysis",
+    "marketing_strategy", "content_recommendations", "sales_psychology",
+    "conversion_opportunities", "actionable_insights",
+]
+
+
+def make_intelligence(words: int) -> Dict[str, Any]:
+    """Intelligence data whose every list item is a long paragraph"""
+    paragraph = " ".join(f"insight{i % 97}" for i in range(words))
+    items = [f"{n}: {paragraph}" for n in range(10)]
+    keys = [
+        "features", "marketing_angles", "recommended_platforms",
+        "content_themes", "recommended_content_types", "key_messages", "cta_recommendations",
+        "psychological_triggers", "emotional_appeals", "common_objections", "optimization_opportunities",
+        "traffic_strategies", "immediate_actions", "short_term_strategy", "long_term_recommendations",
+        "success_metrics",
+    ]
+    data: Dict[str, Any] = {key: items for key in keys}
+    data["competitors"] = [
+        {"name": f"Competitor {n}", "strengths": paragraph, "weaknesses": paragraph} for n in range(5)
+    ]
+    data["target_audience"] = {
+        "demographics": {"age_range": "25-54", "income": paragraph},
+        "pain_points": items,
+        "interests": items,
+    }
+    data.update({
+        "campaign_name": "Benchmark Campaign",
+        "salespage_url": "https://example.com",
+        "executive_summary": paragraph,
+        "confidence_score": 0.9,
+    })
+    return data
+
+
+def build_app(mode: str, words: int):
+    from fastapi import FastAPI
+    from fastapi.responses import StreamingResponse
+
+    from src.intelligence.services.pdf_report_service import PDFReportService, iter_pdf_chunks
+
+    service = PDFReportService()
+
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        service.close()
+
+    app = FastAPI(lifespan=lifespan)
+    intelligence = make_intelligence(words)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/report/{campaign_id}")
+    async def report(campaign_id: str):
+        if mode == "inline":
+            pdf_bytes = service.render_report(campaign_id, intelligence, SECTIONS)
+        else:
+            pdf_bytes = await service.generate_intelligence_report(campaign_id, intelligence, SECTIONS)
+        return StreamingResponse(
+            iter_pdf_chunks(pdf_bytes),
+            media_type="application/pdf",
+            headers={"Content-Length": str(len(pdf_bytes))}
+        )
+
+    return app
+
+
+def serve(mode: str, port: int, words: int):
+    import uvicorn
+    uvicorn.run(build_app(mode, words), host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+async def http_request(port: int, method: str, path: str) -> int:
+    """One request on a fresh connection; returns the body size"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(f"{method} {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Length: 0\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        if not head.startswith(b"HTTP/1.1 200"):
+            raise RuntimeError(head.split(b"\r\n", 1)[0].decode())
+        return len(await reader.read())
+    finally:
+        writer.close()
+
+
+async def measure(port: int, reports: int, rounds: int) -> Dict[str, Any]:
+    """Fire the reports concurrently and ping the server until they finish"""
+
+    ping_latencies: List[float] = []
+    report_sizes: List[int] = []
+
+    async def pinger(done: asyncio.Event):
+        while not done.is_set():
+            started = time.perf_counter()
+            await http_request(port, "GET", "/ping")
+            ping_latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(0.01)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        done = asyncio.Event()
+        ping_task = asyncio.create_task(pinger(done))
+        report_sizes = await asyncio.gather(*(
+            http_request(port, "POST", f"/report/campaign-{i}") for i in range(reports)
+        ))
+        done.set()
+        await ping_task
+    elapsed = time.perf_counter() - started
+
+    ping_latencies.sort()
+    return {
+        "reports_seconds": elapsed / rounds,
+        "report_kb": sum(report_sizes) / len(report_sizes) / 1024,
+        "pings": len(ping_latencies),
+        "p50_ms": statistics.median(ping_latencies) * 1000,
+        "p99_ms": ping_latencies[min(len(ping_latencies) - 1, int(len(ping_latencies) * 0.99))] * 1000,
+        "max_ms": ping_latencies[-1] * 1000,
+    }
+
+
+def benchmark_mode(mode: str, reports: int, words: int) -> Dict[str, Any]:
+    port = free_port()
+    server_mode = "offload" if mode == "cached" else mode
+    server = subprocess.Popen([
+        sys.executable, os.path.abspath(__file__), "--serve", server_mode, "--port", str(port), "--paragraph-words", str(words)
+    ])
+    try:
+        wait_for_port(port)
+        # cached: the first round fills the cache, the second is measured
+        if mode == "cached":
+            asyncio.run(measure(port, reports, 1))
+        return asyncio.run(measure(port, reports, 1))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF report rendering off the event loop")
+    parser.add_argument("--reports", type=int, default=10, help="Concurrent reports")
+    parser.add_argument("--paragraph-words", type=int, default=1500, help="Words per list item (report size)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--serve", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port, args.paragraph_words)
+        return
+
+    results = {}
+    for mode in args.modes:
+        print(f"Benchmarking {mode} ({args.reports} concurrent reports)...")
+        results[mode] = benchmark_mode(mode, args.reports, args.paragraph_words)
+
+    print()
+    print(f"{'mode':<8} {'reports s':>10} {'KB/report':>10} {'pings':>6} {'p50 ms':>8} {'p99 ms':>9} {'max ms':>9}")
+    for mode, r in results.items():
+        print(
+            f"{mode:<8} {r['reports_seconds']:>10.2f} {r['report_kb']:>10.0f} {r['pings']:>6} "
+            f"{r['p50_ms']:>8.2f} {r['p99_ms']:>9.2f} {r['max_ms']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
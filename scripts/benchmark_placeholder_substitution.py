@@ -0,0 +1,124 @@
+# scripts/benchmark_placeholder_substitution.py
+"""
+PLACEHOLDER SUBSTITUTION BENCHMARK
+substitute_placeholders_in_data over a realistic intelligence payload
+(--payload-kb of nested dicts and lists of AI-written sentences, some with
+placeholders):
+
+    sequential  one str.replace / re.sub pass per placeholder for every
+                string (the previous implementation)
+    compiled    PlaceholderSubstitution: one compiled alternation, one pass
+
+Both results are compared for equality.
+
+Usage:
+    python scripts/benchmark_placeholder_substitution.py --payload-kb 200
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.intelligence.utils.product_name_fix import _substitute_sequential, substitute_placeholders_in_data
+
+SENTENCES = [
+    "PRODUCT supports healthy weight management with a blend of natural ingredients.",
+    "Customers report that Your Product helped them feel more energetic within weeks.",
+    "The product is backed by a 60-day money-back guarantee from COMPANY.",
+    "Position [Product Name] as the premium alternative to generic supplements.",
+    "Highlight how your product differs from competitors on ingredient quality.",
+    "Clinical research on green tea extract suggests benefits for metabolism.",
+    "Emphasize social proof: thousands of verified buyers trust the brand.",
+    "Your Company should address shipping concerns in the FAQ section.",
+    "Target audience: adults 35-65 who have tried diets without lasting results.",
+    "Use urgency sparingly; limited-time bundles convert better than countdowns.",
+    "Independent lab testing confirms purity and potency of every batch.",
+    "Content angle: a day-in-the-life story of a customer using this product.",
+]
+SECTIONS = [
+    "offer_intelligence", "psychology_intelligence", "competitive_intelligence",
+    "content_intelligence", "brand_intelligence", "scientific_intelligence",
+    "credibility_intelligence", "market_intelligence", "emotional_transformation_intelligence",
+]
+FIELDS = [
+    "key_insights", "value_propositions", "pain_points", "opportunities",
+    "recommendations", "messaging_angles", "objections", "supporting_evidence",
+]
+
+
+def make_payload(target_kb: int, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    payload: Dict[str, Any] = {"product_name": "PRODUCT", "confidence_score": 0.87}
+    size = 0
+    section_index = 0
+    while size < target_kb * 1024:
+        section: Dict[str, Any] = {"analysis_timestamp": "2025-07-22T20:30:00", "score": rng.random()}
+        for field in FIELDS:
+            items: List[str] = [
+                " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(3, 8))
+            ]
+            section[field] = items
+        section["summary"] = {"text": " ".join(rng.choice(SENTENCES) for _ in range(6)), "tags": ["health", "weight loss"]}
+        payload[f"{SECTIONS[section_index % len(SECTIONS)]}_{section_index}"] = section
+        section_index += 1
+        size = len(json.dumps(payload))
+    return payload
+
+
+def substitute_sequential_in_data(data: Any, product_name: str, company_name: str) -> Any:
+    if isinstance(data, dict):
+        return {k: substitute_sequential_in_data(v, product_name, company_name) for k, v in data.items()}
+    if isinstance(data, list):
+        return [substitute_sequential_in_data(item, product_name, company_name) for item in data]
+    if isinstance(data, str):
+        return _substitute_sequential(data, product_name, company_name)
+    return data
+
+
+def time_runs(func, runs: int) -> float:
+    """Median milliseconds per run"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark placeholder substitution")
+    parser.add_argument("--payload-kb", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--product", default="AquaSculpt")
+    parser.add_argument("--company", default="Aqua Labs")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    payload = make_payload(args.payload_kb)
+    strings = json.dumps(payload).count('"') // 2
+
+    sequential = substitute_sequential_in_data(payload, args.product, args.company)
+    compiled = substitute_placeholders_in_data(payload, args.product, args.company)
+    assert compiled == sequential, "compiled substitution differs from the sequential result"
+
+    sequential_ms = time_runs(lambda: substitute_sequential_in_data(payload, args.product, args.company), args.runs)
+    compiled_ms = time_runs(lambda: substitute_placeholders_in_data(payload, args.product, args.company), args.runs)
+
+    print(f"payload {len(json.dumps(payload)) / 1024:.0f} KB, ~{strings} strings, product {args.product!r}")
+    print(f"{'mode':<12} {'ms/payload':>11}")
+    print(f"{'sequential':<12} {sequential_ms:>11.2f}")
+    print(f"{'compiled':<12} {compiled_ms:>11.2f}")
+    print(f"speedup: {sequential_ms / compiled_ms:.1f}x (results identical)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# scripts/benchmark_product_extraction.py
+"""
+PRODUCT NAME EXTRACTION BENCHMARK
+extract_product_name_from_intelligence / extract_company_name_from_intelligence
+over a corpus of sales pages:
+
+    cold    first extraction of every page (compiled patterns, one
+            tokenization pass for mention counts)
+    warm    the same pages again (content-hash memo hits)
+
+Pages come from --corpus (a directory of saved .html/.htm/.txt sales pages;
+the file name stem is used as the sales page domain) or, without it, from a
+generated corpus of --pages synthetic sales pages.
+
+Usage:
+    python scripts/benchmark_product_extraction.py --pages 200
+    python scripts/benchmark_product_extraction.py --corpus ~/salespages
+"""
+
+import argparse
+import logging
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.intelligence.utils.product_name_fix import (
+    clear_extraction_cache,
+    extract_company_name_from_intelligence,
+    extract_product_name_from_intelligence,
+)
+
+PRODUCTS = [
+    "AquaSculpt", "LiverPure", "GlucoTrust", "NeuroThrive", "SleepRestore", "VitaBoost",
+    "Keto Burn Max", "Joint Guard", "DentaShield", "Metabo Force", "FlexiCore", "PureRenew",
+]
+COMPANIES = ["Aqua Labs", "Nature Path", "Vital Health", "Prime Wellness", "Peak Nutrition"]
+PARAGRAPHS = [
+    "Discover how {p} helps thousands of adults support healthy weight and energy levels every day.",
+    "{p} supports a healthy metabolism with a blend of eight natural, plant-based ingredients.",
+    "Thanks to {p} I finally feel like myself again. I have more energy and sleep better. - Sarah, 42",
+    "Every bottle of {p} is manufactured in an FDA registered, GMP certified facility in the USA.",
+    "Order {p} today and claim two free bonus guides plus free shipping on the six bottle package.",
+    "What is {p}? It is a natural formula created by {c} to target the root cause of stubborn fat.",
+    "The difference {p} may make is visible within weeks, according to customers who tried it.",
+    "Scientists at leading universities have studied green tea extract, chromium and berberine for years.",
+    "Your order is protected by our 60-day, 100% money-back guarantee. No questions asked.",
+    "Click here to get {p} at the lowest price ever, available only on the official website.",
+    "How many bottles should I order? Most customers choose the 180-day supply for the best results.",
+    "Is {p} safe? Yes. It contains no stimulants, no GMOs and is suitable for vegetarians.",
+    "Copyright © 2025 {c}. All rights reserved. Privacy Policy | Terms and Conditions | Contact Us",
+    "Results may vary. These statements have not been evaluated by the Food and Drug Administration.",
+    "Real customers, real results: over 94,000 happy users have already tried this breakthrough.",
+]
+
+
+def make_page(rng: random.Random, product: str, company: str, paragraphs: int) -> str:
+    return "\n\n".join(
+        rng.choice(PARAGRAPHS).format(p=product, c=company) for _ in range(paragraphs)
+    )
+
+
+def make_intelligence(raw_content: str, url: str, product: str, rng: random.Random) -> Dict[str, Any]:
+    sentences = [s for s in re.split(r"(?<=[.!?])\s+", raw_content) if len(s) > 20]
+    return {
+        "salespage_url": url,
+        "raw_content": raw_content,
+        "page_title": rng.choice([f"{product} - Official Website", "Stock Up - Exclusive Offer", f"Try {product} Today"]),
+        "offer_intelligence": {"products": [product if rng.random() < 0.5 else "Island"], "pricing": ["$69"]},
+        "psychology_intelligence": {
+            "emotional_triggers": [{"trigger": "hope", "context": s} for s in rng.sample(sentences, min(4, len(sentences)))]
+        },
+        "content_intelligence": {"key_messages": rng.sample(sentences, min(5, len(sentences)))},
+        "scientific_intelligence": {"scientific_backing": rng.sample(sentences, min(3, len(sentences)))},
+        "brand_intelligence": {"brand_positioning": sentences[0] if sentences else ""},
+    }
+
+
+def generated_corpus(pages: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(pages):
+        product = rng.choice(PRODUCTS)
+        company = rng.choice(COMPANIES)
+        slug = product.lower().replace(" ", "")
+        url = rng.choice([f"https://get{slug}now.com/", f"https://www.{slug}.com/order", f"https://offer{index}.com/vsl"])
+        raw_content = make_page(rng, product, company, rng.randint(40, 200))
+        corpus.append(make_intelligence(raw_content, url, product, rng))
+    return corpus
+
+
+def saved_corpus(directory: str) -> List[Dict[str, Any]]:
+    rng = random.Random(0)
+    corpus = []
+    for path in sorted(Path(directory).expanduser().iterdir()):
+        if path.suffix.lower() not in (".html", ".htm", ".txt"):
+            continue
+        text = path.read_text(encoding="utf-8", errors="ignore")
+        if path.suffix.lower() != ".txt":
+            text = re.sub(r"(?is)<(script|style)\b.*?</\1>", " ", text)
+            text = re.sub(r"<[^>]+>", " ", text)
+        text = re.sub(r"[ \t]+", " ", text)
+        corpus.append(make_intelligence(text, f"https://{path.stem}.com/", "", rng))
+    return corpus
+
+
+def extract(intelligence: Dict[str, Any]):
+    return extract_product_name_from_intelligence(intelligence), extract_company_name_from_intelligence(intelligence)
+
+
+def time_pages(corpus: List[Dict[str, Any]]) -> List[float]:
+    """Milliseconds per page"""
+    timings = []
+    for intelligence in corpus:
+        started = time.perf_counter()
+        extract(intelligence)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark product name extraction")
+    parser.add_argument("--corpus", help="directory of saved sales pages (.html/.htm/.txt)")
+    parser.add_argument("--pages", type=int, default=200, help="generated pages when --corpus is not given")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    corpus = saved_corpus(args.corpus) if args.corpus else generated_corpus(args.pages)
+    if not corpus:
+        sys.exit("no sales pages found")
+    sizes = [len(page["raw_content"]) for page in corpus]
+
+    clear_extraction_cache()
+    cold = time_pages(corpus)
+    warm = time_pages(corpus)
+
+    print(f"{len(corpus)} pages, median {statistics.median(sizes) / 1024:.1f} KB of text (max {max(sizes) / 1024:.1f} KB)")
+    print(f"{'pass':<6} {'ms/page p50':>12} {'p95':>8} {'max':>8} {'total s':>8}")
+    for label, timings in (("cold", cold), ("warm", warm)):
+        ordered = sorted(timings)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        print(f"{label:<6} {statistics.median(timings):>12.2f} {p95:>8.2f} {ordered[-1]:>8.2f} {sum(timings) / 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
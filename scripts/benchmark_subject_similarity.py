@@ -0,0 +1,148 @@
+# scripts/benchmark_subject_similarity.py
+"""
+SUBJECT SIMILARITY BENCHMARK
+Near-duplicate checks against --templates synthetic subject templates:
+
+    index      SubjectSimilarityIndex: MinHash signature, LSH bucket lookup,
+               exact Jaccard on the bucket candidates only
+    pairwise   exact word-shingle Jaccard against every template (what a
+               straightforward implementation of the check would do), timed
+               on --pairwise-queries queries
+
+Queries are near-duplicates of indexed templates (one word changed, dropped
+or added, punctuation/case changes) and novel subjects. Recall counts the
+near-duplicates at or above the threshold that the index reports.
+
+Usage:
+    python scripts/benchmark_subject_similarity.py --templates 100000
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.intelligence.utils.subject_similarity_index import SubjectSimilarityIndex, jaccard, shingles
+
+OPENERS = ["Why", "How", "The truth about", "Finally:", "Breaking:", "Inside", "Warning:", "Revealed:", "Stop ignoring",
+           "Here's why", "What nobody tells you about", "Quick question about", "Last chance for", "Meet", "Don't miss",
+           "Introducing", "Everything about", "Can", "Is", "Should you try", "The real reason behind", "3 facts about",
+           "Urgent:", "Psst...", "Ready for", "Still thinking about", "You asked about", "A note on", "New study on", "Big news:"]
+SUBJECTS = ["{product}", "your {product} order", "{product} users", "the {product} method", "{product} fans",
+            "{product} buyers", "our {product} team", "{product} experts", "{product} customers", "the {product} formula"]
+VERBS = ["changed", "doubled", "fixed", "boosted", "transformed", "simplified", "rescued", "upgraded", "reset", "improved",
+         "protected", "restored", "unlocked", "supercharged", "rebuilt", "cleared", "balanced", "calmed", "sharpened", "renewed"]
+ADJECTIVES = ["morning", "evening", "weekend", "daily", "busy", "tired", "stubborn", "hidden", "lazy", "nightly",
+              "summer", "holiday", "stressful", "midlife", "post-workout", "late-night", "first", "final", "quiet", "slow"]
+NOUNS = ["energy", "metabolism", "sleep", "focus", "routine", "cravings", "digestion", "mood", "skin", "joints",
+         "memory", "stamina", "confidence", "habits", "recovery", "weight", "immunity", "hydration", "posture", "balance"]
+ENDINGS = ["", "...", "!", "?", " (today only)", " in 7 days", " for good", " overnight", " - see why", " (proof inside)",
+           " by Friday", " without dieting", " in 2 weeks", " this month", " for 1,000+ readers", " again"]
+FILLERS = ["really", "finally", "quietly", "actually", "almost", "totally", "suddenly", "slowly"]
+
+
+def make_template(rng: random.Random) -> str:
+    return (f"{rng.choice(OPENERS)} {rng.choice(SUBJECTS)} {rng.choice(VERBS)} "
+            f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}{rng.choice(ENDINGS)}")
+
+
+def make_templates(count: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    templates = set()
+    while len(templates) < count:
+        templates.add(make_template(rng))
+    return sorted(templates)
+
+
+def near_duplicate(template: str, rng: random.Random) -> str:
+    """One small edit: change, drop or add a word, or change case/punctuation"""
+    words = template.split()
+    edit = rng.randrange(4)
+    position = rng.randrange(len(words))
+    if edit == 0 and "{product}" not in words[position]:
+        words[position] = rng.choice(NOUNS + VERBS)
+    elif edit == 1 and len(words) > 6 and "{product}" not in words[position]:
+        del words[position]
+    elif edit == 2:
+        words.insert(position, rng.choice(FILLERS))
+    else:
+        return template.upper().rstrip(".!?") + "!!"
+    return " ".join(words)
+
+
+def timed(func: Callable[[], object], runs: int) -> List[float]:
+    """Milliseconds per call"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate subject template checks")
+    parser.add_argument("--templates", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--pairwise-queries", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    templates = make_templates(args.templates)
+    index = SubjectSimilarityIndex()
+
+    started = time.perf_counter()
+    for template_id, template in enumerate(templates):
+        index.add(template_id, template, rebuild=False)
+    index._rebuild()
+    build_seconds = time.perf_counter() - started
+    print(f"{len(index):,} templates indexed in {build_seconds:.1f} s "
+          f"({index.num_perm} permutations, {index.bands} bands, threshold {index.threshold})")
+
+    rng = random.Random(1)
+    sources = [rng.randrange(len(templates)) for _ in range(args.queries // 2)]
+    duplicates = [near_duplicate(templates[source], rng) for source in sources]
+    existing = set(templates)
+    novel = []
+    while len(novel) < args.queries // 2:
+        subject = make_template(rng)
+        if subject not in existing:
+            novel.append(subject)
+
+    results = {}
+    for label, queries in (("near-dup", duplicates), ("novel", novel)):
+        timings, flagged = [], 0
+        for query in queries:
+            started = time.perf_counter()
+            flagged += index.find_similar(query) is not None
+            timings.append((time.perf_counter() - started) * 1000)
+        results[label] = (timings, flagged)
+
+    expected = [jaccard(shingles(query), shingles(templates[source])) >= index.threshold
+                for query, source in zip(duplicates, sources)]
+    found = sum(index.find_similar(query) is not None for query, hit in zip(duplicates, expected) if hit)
+
+    pairwise_query = novel[:args.pairwise_queries]
+    pairwise = timed(lambda: [max(jaccard(shingles(q), shingles(t)) for t in templates) for q in pairwise_query], 1)[0]
+
+    print(f"{'queries':<10} {'count':>6} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'flagged':>8}")
+    for label, (timings, flagged) in results.items():
+        print(f"{label:<10} {len(timings):>6} {statistics.median(timings):>8.3f} {percentile(timings, 0.99):>8.3f} "
+              f"{max(timings):>8.3f} {flagged:>8}")
+    print(f"recall: {found}/{sum(expected)} near-duplicates at or above the threshold found")
+    print(f"pairwise: {pairwise / len(pairwise_query):.1f} ms per query")
+
+
+if __name__ == "__main__":
+    main()
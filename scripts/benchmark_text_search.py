@@ -0,0 +1,221 @@
+# scripts/benchmark_text_search.py
+"""
+TEXT SEARCH BENCHMARK
+Seeds --rows campaign-like rows (name, description, owner) into a scratch
+table and times search queries built by src/core/database/search.py:
+
+    legacy     ILIKE '%term%' on each column, newest first (the previous
+               search_campaigns / search_users / search_intelligence_by_product)
+    search     build_text_search: ILIKE or trigram word similarity, ranked by
+               word_similarity (PostgreSQL with pg_trgm), or the substring
+               fallback ranked by prefix match (SQLite)
+
+On PostgreSQL every query runs twice: first without and then with the
+migration 011 trigram GIN indexes. For each run the script prints the
+query plan's scan nodes and the median latency over --runs runs.
+
+Usage:
+    python scripts/benchmark_text_search.py --database-url postgresql://localhost/bench --rows 1000000
+    python scripts/benchmark_text_search.py --rows 200000            # SQLite fallback
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Iterator, List, Tuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, Table, Text, create_engine, select, text
+from sqlalchemy.engine import Engine
+
+from src.core.database.search import build_text_search, escape_like, LIKE_ESCAPE
+
+TABLE = "search_benchmark_campaigns"
+PREFIXES = ["Aqua", "Liver", "Gluco", "Neuro", "Sleep", "Vita", "Keto", "Joint",
+            "Denta", "Metabo", "Flexi", "Pure", "Prime", "Zen", "Bio", "Cardio"]
+SUFFIXES = ["Sculpt", "Pure", "Trust", "Thrive", "Restore", "Boost", "Burn", "Guard",
+            "Shield", "Force", "Core", "Renew", "Max", "Lean", "Flow", "Vital"]
+CAMPAIGNS = ["Spring Launch", "Email Blast", "Retargeting", "Black Friday", "Webinar Funnel",
+             "Video Series", "Influencer Push", "Evergreen", "Summer Sale", "Holiday Promo"]
+AUDIENCES = ["busy moms", "men over 50", "keto dieters", "night shift workers", "athletes",
+             "retirees", "students", "new parents", "office workers", "seniors"]
+# A common product, a rarer word from descriptions, and a misspelling
+DEFAULT_TERMS = ["AquaSculpt", "shift workers", "glucotrst"]
+
+metadata = MetaData()
+campaigns = Table(
+    TABLE, metadata,
+    Column("id", Integer, primary_key=True),
+    Column("owner_id", Integer, nullable=False),
+    Column("name", Text, nullable=False),
+    Column("description", Text),
+    Column("updated_at", DateTime, nullable=False),
+    Index(f"idx_{TABLE}_owner", "owner_id"),
+)
+TRIGRAM_INDEXES = [(f"idx_{TABLE}_name_trgm", "name"), (f"idx_{TABLE}_description_trgm", "description")]
+
+
+def make_rows(rows: int, owners: int) -> Iterator[Tuple]:
+    """Deterministic campaign rows: ~256 products, unique names"""
+    started = datetime(2025, 1, 1)
+    for g in range(1, rows + 1):
+        product = PREFIXES[g * 7 % len(PREFIXES)] + SUFFIXES[g * 13 // 7 % len(SUFFIXES)]
+        name = f"{product} {CAMPAIGNS[g % len(CAMPAIGNS)]} {g % 997}"
+        description = f"{product} campaign for {AUDIENCES[g * 3 % len(AUDIENCES)]}, variant {g}"
+        yield g, g % owners, name, description, started + timedelta(minutes=g)
+
+
+def seed(engine: Engine, rows: int, owners: int):
+    with engine.begin() as connection:
+        count = connection.execute(text(f"SELECT count(*) FROM {TABLE}")).scalar() if engine.dialect.has_table(connection, TABLE) else None
+    if count == rows:
+        print(f"reusing {rows:,} seeded rows")
+        return
+
+    started = time.perf_counter()
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    if engine.dialect.name == "postgresql":
+        buffer = io.StringIO()
+        for row in make_rows(rows, owners):
+            buffer.write("\t".join(str(value) for value in row) + "\n")
+        buffer.seek(0)
+        raw = engine.raw_connection()
+        try:
+            raw.cursor().copy_expert(f"COPY {TABLE} (id, owner_id, name, description, updated_at) FROM STDIN", buffer)
+            raw.commit()
+        finally:
+            raw.close()
+    else:
+        batch, columns = [], ("id", "owner_id", "name", "description", "updated_at")
+        with engine.begin() as connection:
+            for row in make_rows(rows, owners):
+                batch.append(dict(zip(columns, row)))
+                if len(batch) == 10000:
+                    connection.execute(campaigns.insert(), batch)
+                    batch = []
+            if batch:
+                connection.execute(campaigns.insert(), batch)
+    with engine.begin() as connection:
+        connection.execute(text(f"ANALYZE {TABLE}"))
+    print(f"seeded {rows:,} rows in {time.perf_counter() - started:.1f} s")
+
+
+def queries(term: str, owner: int, trigram: bool, limit: int):
+    """(label, query) pairs: single column, two columns, two columns scoped to an owner"""
+    pattern = f"%{escape_like(term)}%"
+    single = build_text_search(term, campaigns.c.name, trigram=trigram)
+    double = build_text_search(term, campaigns.c.name, campaigns.c.description, trigram=trigram)
+    base = select(campaigns.c.id, campaigns.c.name)
+    newest = campaigns.c.updated_at.desc()
+    legacy_double = campaigns.c.name.ilike(pattern, escape=LIKE_ESCAPE) | campaigns.c.description.ilike(pattern, escape=LIKE_ESCAPE)
+    return [
+        ("legacy name", base.where(campaigns.c.name.ilike(pattern, escape=LIKE_ESCAPE)).order_by(newest).limit(limit)),
+        ("search name", base.where(single.condition).order_by(single.rank.desc(), newest).limit(limit)),
+        ("legacy name+desc", base.where(legacy_double).order_by(newest).limit(limit)),
+        ("search name+desc", base.where(double.condition).order_by(double.rank.desc(), newest).limit(limit)),
+        ("legacy owner", base.where(campaigns.c.owner_id == owner, legacy_double).order_by(newest).limit(limit)),
+        ("search owner", base.where(campaigns.c.owner_id == owner, double.condition).order_by(double.rank.desc(), newest).limit(limit)),
+    ]
+
+
+def plan_summary(connection, query) -> str:
+    """Scan nodes of the query plan, e.g. 'Bitmap Index Scan(idx_..)'"""
+    # Literal SQL is already escaped for the driver's paramstyle, so it
+    # bypasses text() rather than being escaped twice
+    compiled = query.compile(connection, compile_kwargs={"literal_binds": True})
+    if connection.dialect.name == "postgresql":
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}").scalar()
+        plan = json.loads(plan) if isinstance(plan, str) else plan
+        scans = []
+
+        def walk(node):
+            if "Scan" in node["Node Type"]:
+                scans.append(f"{node['Node Type']}({node.get('Index Name') or node.get('Relation Name')})")
+            for child in node.get("Plans", []):
+                walk(child)
+
+        walk(plan[0]["Plan"])
+        return ", ".join(scans)
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+    return ", ".join(row[-1] for row in rows)
+
+
+def time_query(connection, query, runs: int) -> Tuple[float, int]:
+    """(median ms, rows returned)"""
+    timings, found = [], 0
+    for _ in range(runs):
+        started = time.perf_counter()
+        found = len(connection.execute(query).all())
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), found
+
+
+def run_queries(engine: Engine, terms: List[str], trigram: bool, runs: int, limit: int, owners: int):
+    with engine.connect() as connection:
+        for term in terms:
+            print(f"  term {term!r}")
+            for label, query in queries(term, owner=owners // 2, trigram=trigram, limit=limit):
+                median, found = time_query(connection, query, runs)
+                print(f"    {label:<18} {median:>9.1f} ms {found:>4} rows  {plan_summary(connection, query)}")
+
+
+def set_trigram_indexes(engine: Engine, enabled: bool):
+    with engine.begin() as connection:
+        if not enabled:
+            for index, _ in TRIGRAM_INDEXES:
+                connection.execute(text(f"DROP INDEX IF EXISTS {index}"))
+            return
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        started = time.perf_counter()
+        for index, column in TRIGRAM_INDEXES:
+            connection.execute(text(f"CREATE INDEX IF NOT EXISTS {index} ON {TABLE} USING gin ({column} gin_trgm_ops)"))
+        connection.execute(text(f"ANALYZE {TABLE}"))
+    print(f"built trigram indexes in {time.perf_counter() - started:.1f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark trigram search against ILIKE scans")
+    parser.add_argument("--database-url", default=os.getenv("SEARCH_BENCHMARK_DATABASE_URL"),
+                        help="scratch database (default: a SQLite file in the temp directory)")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--owners", type=int, default=20000, help="distinct owners (rows per owner = rows / owners)")
+    parser.add_argument("--term", action="append", dest="terms", help="search term (repeatable)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded table for later runs")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'search_benchmark.db')}"
+    engine = create_engine(url.replace("postgresql+asyncpg://", "postgresql://"))
+    terms = args.terms or DEFAULT_TERMS
+
+    print(f"{engine.dialect.name}, {args.rows:,} rows, {args.owners:,} owners")
+    seed(engine, args.rows, args.owners)
+    try:
+        if engine.dialect.name == "postgresql":
+            set_trigram_indexes(engine, enabled=False)
+            print("without trigram indexes:")
+            run_queries(engine, terms, trigram=False, runs=args.runs, limit=args.limit, owners=args.owners)
+            set_trigram_indexes(engine, enabled=True)
+            print("with trigram indexes:")
+            run_queries(engine, terms, trigram=True, runs=args.runs, limit=args.limit, owners=args.owners)
+        else:
+            print("substring fallback (no trigram support):")
+            run_queries(engine, terms, trigram=False, runs=args.runs, limit=args.limit, owners=args.owners)
+    finally:
+        if not args.keep:
+            metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
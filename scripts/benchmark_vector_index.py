@@ -0,0 +1,107 @@
+# scripts/benchmark_vector_index.py
+"""
+VECTOR INDEX BENCHMARK
+Top-k research retrieval latency over N chunk embeddings:
+
+    loop    per-document cosine similarity in Python (the previous approach)
+    matrix  VectorIndex brute force (one matrix-vector product + argpartition)
+    ivf     VectorIndex with the IVF layer built
+
+Recall@k of the IVF search is measured against the exact matrix results.
+Vectors are drawn around random cluster centers, like real embeddings.
+
+Usage:
+    python scripts/benchmark_vector_index.py --vectors 100000 --dim 256
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.intelligence.utils.vector_index import VectorIndex, normalize_rows
+
+
+def make_vectors(count: int, dim: int, clusters: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    assignment = rng.integers(0, clusters, size=count)
+    return centers[assignment] + 0.3 * rng.normal(size=(count, dim)).astype(np.float32)
+
+
+def time_queries(search, queries) -> float:
+    """Median milliseconds per query"""
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        search(query)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark research vector retrieval")
+    parser.add_argument("--vectors", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--chunks-per-doc", type=int, default=10)
+    parser.add_argument("--clusters", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    vectors = make_vectors(args.vectors, args.dim, args.clusters)
+    queries = make_vectors(args.queries, args.dim, args.clusters, seed=1)
+
+    # Previous layout: doc_id -> list of chunk vectors, scored document by document
+    documents = {
+        f"doc_{i}": vectors[start:start + args.chunks_per_doc]
+        for i, start in enumerate(range(0, args.vectors, args.chunks_per_doc))
+    }
+
+    def loop_search(query):
+        query_norm = query / np.linalg.norm(query)
+        scored = []
+        for doc_id, embeddings in documents.items():
+            normalized, _ = normalize_rows(embeddings)
+            for i, similarity in enumerate(normalized @ query_norm):
+                scored.append((doc_id, i, float(similarity)))
+        scored.sort(key=lambda x: x[2], reverse=True)
+        return scored[:args.top_k]
+
+    index = VectorIndex(ivf_min_vectors=args.vectors + 1)
+    started = time.perf_counter()
+    for doc_id, embeddings in documents.items():
+        index.add(doc_id, embeddings)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    exact = [index.search(query, args.top_k) for query in queries]
+    matrix_ms = time_queries(lambda q: index.search(q, args.top_k), queries)
+    loop_ms = time_queries(loop_search, queries[:3])
+
+    started = time.perf_counter()
+    index.build_ivf()
+    ivf_build_ms = (time.perf_counter() - started) * 1000
+    approximate = [index.search(query, args.top_k) for query in queries]
+    ivf_ms = time_queries(lambda q: index.search(q, args.top_k), queries)
+
+    hits = sum(
+        len({(d, c) for d, c, _ in exact_result} & {(d, c) for d, c, _ in ivf_result})
+        for exact_result, ivf_result in zip(exact, approximate)
+    )
+    recall = hits / max(1, sum(len(result) for result in exact))
+
+    print(f"{args.vectors} vectors x {args.dim} dims, top {args.top_k}")
+    print(f"index build      {build_ms:>9.1f} ms")
+    print(f"ivf build        {ivf_build_ms:>9.1f} ms")
+    print(f"loop search      {loop_ms:>9.2f} ms/query")
+    print(f"matrix search    {matrix_ms:>9.2f} ms/query ({loop_ms / matrix_ms:.1f}x)")
+    print(f"ivf search       {ivf_ms:>9.2f} ms/query ({loop_ms / ivf_ms:.1f}x), recall@{args.top_k} {recall:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# scripts/benchmark_video_assembly.py
+"""
+VIDEO ASSEMBLY BENCHMARK
+Compares multi-pass (per-scene clips + concat + branding re-encodes) with
+single-pass (one filter_complex graph, one encode) video assembly.
+
+Fixture images and narration are generated with FFmpeg's lavfi sources, so the
+only requirement is an ``ffmpeg``/``ffprobe`` binary on PATH.
+
+Usage:
+    python scripts/benchmark_video_assembly.py --scenes 6 --runs 3
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import logging
+from typing import Dict, List, Any
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.content.services.video_assembly_pipeline import VideoAssemblyPipeline, VideoScene
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# H.264 encodes a frame passes through before reaching the final file
+ENCODE_GENERATIONS = {
+    "multi_pass": "3 (scene clip, concat, branding)",
+    "single_pass": "1",
+}
+
+
+def create_fixtures(work_dir: str, scene_count: int, scene_duration: float) -> Dict[str, Any]:
+    """Generate test images, narration clips, music and a logo with FFmpeg"""
+
+    images, narrations = [], []
+    for i in range(scene_count):
+        image_path = os.path.join(work_dir, f"scene_{i}.png")
+        audio_path = os.path.join(work_dir, f"scene_{i}.m4a")
+        subprocess.run(
+            ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'lavfi', '-i', f'testsrc2=size=1600x1200:rate=1',
+             '-frames:v', '1', image_path],
+            check=True
+        )
+        subprocess.run(
+            ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'lavfi',
+             '-i', f'sine=frequency={300 + i * 50}:duration={scene_duration}', '-c:a', 'aac', audio_path],
+            check=True
+        )
+        images.append(image_path)
+        narrations.append(audio_path)
+
+    music_path = os.path.join(work_dir, "music.m4a")
+    subprocess.run(
+        ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'lavfi', '-i', 'sine=frequency=110:duration=30',
+         '-c:a', 'aac', music_path],
+        check=True
+    )
+    logo_path = os.path.join(work_dir, "logo.png")
+    subprocess.run(
+        ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'lavfi', '-i', 'color=c=orange:size=256x256',
+         '-frames:v', '1', logo_path],
+        check=True
+    )
+
+    return {"images": images, "narrations": narrations, "music": music_path, "logo": logo_path}
+
+
+async def run_mode(
+    mode: str,
+    fixtures: Dict[str, Any],
+    scene_duration: float,
+    video_type: str,
+    runs: int
+) -> Dict[str, Any]:
+    """Assemble the same video ``runs`` times in one mode"""
+
+    pipeline = VideoAssemblyPipeline()
+    timings: List[float] = []
+    sizes: List[float] = []
+
+    for run in range(runs):
+        scenes = [
+            VideoScene(
+                scene_id=f"scene_{i}",
+                image_path=image,
+                audio_path=audio,
+                duration=scene_duration,
+                text_overlay=f"Scene {i + 1}",
+                effects=["fade_in", "fade_out"]
+            )
+            for i, (image, audio) in enumerate(zip(fixtures["images"], fixtures["narrations"]))
+        ]
+
+        started = time.perf_counter()
+        result = await pipeline.assemble_video(
+            scenes=scenes,
+            video_type=video_type,
+            brand_config={"logo_url": fixtures["logo"]},
+            music_path=fixtures["music"],
+            output_filename=f"benchmark_{mode}_{run}.mp4",
+            assembly_mode=mode
+        )
+        timings.append(time.perf_counter() - started)
+        sizes.append(result.file_size_mb)
+
+        if result.metadata.get("assembly_mode") != mode:
+            logger.warning(f"{mode} run {run} fell back to {result.metadata.get('assembly_mode')}")
+        if os.path.exists(result.video_path):
+            os.remove(result.video_path)
+
+    return {
+        "mode": mode,
+        "runs": runs,
+        "mean_seconds": statistics.mean(timings),
+        "min_seconds": min(timings),
+        "mean_size_mb": statistics.mean(sizes),
+        "encode_generations": ENCODE_GENERATIONS[mode],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-pass vs single-pass video assembly")
+    parser.add_argument("--scenes", type=int, default=6)
+    parser.add_argument("--scene-duration", type=float, default=4.0)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--video-type", default="youtube_short")
+    args = parser.parse_args()
+
+    if not shutil.which("ffmpeg"):
+        print("ffmpeg not found on PATH")
+        sys.exit(1)
+
+    work_dir = tempfile.mkdtemp(prefix="video_assembly_benchmark_")
+    try:
+        fixtures = create_fixtures(work_dir, args.scenes, args.scene_duration)
+        results = []
+        for mode in ("multi_pass", "single_pass"):
+            results.append(await run_mode(mode, fixtures, args.scene_duration, args.video_type, args.runs))
+
+        print(f"\n{args.scenes} scenes x {args.scene_duration}s, {args.video_type}, {args.runs} runs")
+        print(f"{'mode':<12} {'mean s':>8} {'min s':>8} {'size MB':>9}  encode generations")
+        for r in results:
+            print(
+                f"{r['mode']:<12} {r['mean_seconds']:>8.2f} {r['min_seconds']:>8.2f} "
+                f"{r['mean_size_mb']:>9.2f}  {r['encode_generations']}"
+            )
+        speedup = results[0]["mean_seconds"] / results[1]["mean_seconds"] if results[1]["mean_seconds"] else 0
+        print(f"\nsingle-pass speedup: {speedup:.2f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
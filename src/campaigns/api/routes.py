@@ -13,6 +13,7 @@ from src.campaigns.schemas.campaign import (
 from src.core.database.session import get_async_db
 from src.core.shared.responses import success_response, error_response
 from src.users.services.auth_service import AuthService
+from src.core.auth.dependencies import get_active_user_id, get_current_user_claims
 
 from src.core.factories.service_factory import ServiceFactory
 from src.campaigns.services.enhanced_campaign_service import EnhancedCampaignService
@@ -22,15 +23,10 @@ router = APIRouter(prefix="/api/campaigns", tags=["campaigns"])
 security = HTTPBearer()
 
 async def get_current_user_id(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_async_db)
+    claims: dict = Depends(get_current_user_claims)
 ) -> str:
-    """Get current user ID from token"""
-    auth_service = AuthService(db)
-    user = await auth_service.get_current_user(credentials.credentials)
-    if not user:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    return str(user.id)
+    """Get current user ID from the token claims, without a user lookup (read-only endpoints)"""
+    return str(claims["id"])
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -182,7 +178,7 @@ async def get_campaign(
 async def update_campaign(
     campaign_id: str,
     campaign_data: CampaignUpdate,
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_active_user_id),
     db: AsyncSession = Depends(get_async_db)
 ):
     """Update campaign"""
@@ -199,7 +195,7 @@ async def update_campaign(
 @router.delete("/{campaign_id}", response_model=Dict[str, Any])
 async def delete_campaign(
     campaign_id: str,
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_active_user_id),
     db: AsyncSession = Depends(get_async_db)
 ):
     """Delete campaign"""
@@ -393,7 +389,7 @@ async def get_affiliate_campaigns(
 @affiliate_router.post("/campaigns")
 async def create_affiliate_campaign(
     campaign_data: Dict[str, Any],
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_active_user_id),
     db: AsyncSession = Depends(get_async_db)
 ):
     """Create affiliate campaign"""
@@ -450,7 +446,7 @@ async def create_affiliate_campaign(
 async def update_affiliate_campaign_status(
     campaign_id: str,
     status_data: Dict[str, Any],
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_active_user_id),
     db: AsyncSession = Depends(get_async_db)
 ):
     """Update affiliate campaign status"""
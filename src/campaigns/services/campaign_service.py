@@ -10,6 +10,7 @@ import logging
 
 from src.campaigns.models.campaign import Campaign, CampaignStatusEnum, CampaignTypeEnum
 from src.core.shared.exceptions import NotFoundError
+from src.core.database.search import text_search
 
 logger = logging.getLogger(__name__)
 
@@ -282,26 +283,23 @@ class CampaignService:
         skip: int = 0,
         limit: int = 50
     ) -> List[Campaign]:
-        """Search campaigns by title or description"""
+        """Search campaigns by title or description, best matches first"""
         try:
             logger.info(f"Searching campaigns for term: {search_term}")
             
             user_uuid = UUID(str(user_id))
             company_uuid = UUID(str(company_id))
             
-            # Use PostgreSQL ILIKE for case-insensitive search
-            search_pattern = f"%{search_term}%"
+            # Trigram-indexed similarity search (substring match without pg_trgm)
+            search = await text_search(self.db, search_term, Campaign.name, Campaign.description)
             
             query = select(Campaign).where(
                 and_(
                     Campaign.user_id == user_uuid,
                     Campaign.company_id == company_uuid,
-                    or_(
-                        Campaign.name.ilike(search_pattern),
-                        Campaign.description.ilike(search_pattern)
-                    )
+                    search.condition
                 )
-            ).offset(skip).limit(limit).order_by(desc(Campaign.updated_at))
+            ).offset(skip).limit(limit).order_by(search.rank.desc(), desc(Campaign.updated_at))
             
             result = await self.db.execute(query)
             campaigns = list(result.scalars().all())
@@ -11,7 +11,7 @@ from typing import Dict, Any, List, Optional
 import logging
 
 from src.core.database.session import get_async_db
-from src.users.services.auth_service import AuthService
+from src.core.auth.dependencies import get_active_user_id, get_current_user_claims
 from src.content.services.content_orchestrator import create_content_orchestrator
 from src.intelligence.services.intelligence_service import IntelligenceService
 
@@ -20,20 +20,15 @@ security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
 async def get_current_user_id(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_async_db)
+    claims: dict = Depends(get_current_user_claims)
 ) -> str:
-    """Get current user ID from token"""
-    auth_service = AuthService(db)
-    user = await auth_service.get_current_user(credentials.credentials)
-    if not user:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    return str(user.id)
+    """Get current user ID from the token claims, without a user lookup (read-only endpoints)"""
+    return str(claims["id"])
 
 @router.post("/generate/{campaign_id}")
 async def trigger_content_generation(
     campaign_id: str,
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_active_user_id),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
@@ -224,7 +219,7 @@ async def get_generated_content(
 async def regenerate_content(
     campaign_id: str,
     request_data: Dict[str, Any],
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_active_user_id),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
@@ -12,7 +12,7 @@ from pydantic import BaseModel
 import logging
 
 from src.core.database.session import get_async_db
-from src.users.services.auth_service import AuthService
+from src.core.auth.dependencies import get_active_user_id, get_current_user_claims
 from src.content.services.integrated_content_service import IntegratedContentService
 
 router = APIRouter(prefix="/api/content/enhanced-images", tags=["enhanced-images"])
@@ -35,15 +35,10 @@ class MultiPlatformImageRequest(BaseModel):
     user_tier: str = "professional"
 
 async def get_current_user_id(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_async_db)
+    claims: dict = Depends(get_current_user_claims)
 ) -> str:
-    """Get current user ID from token"""
-    auth_service = AuthService(db)
-    user = await auth_service.get_current_user(credentials.credentials)
-    if not user:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    return str(user.id)
+    """Get current user ID from the token claims, without a user lookup (read-only endpoints)"""
+    return str(claims["id"])
 
 @router.get("/platform-specs")
 async def get_platform_specifications():
@@ -71,7 +66,7 @@ async def get_platform_specifications():
 @router.post("/generate-platform")
 async def generate_platform_image(
     request: PlatformImageRequest,
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_active_user_id),
     db: AsyncSession = Depends(get_async_db)
 ):
     """Generate single platform-optimized image using existing content service"""
@@ -126,7 +121,7 @@ async def generate_platform_image(
 @router.post("/generate-batch")
 async def generate_multi_platform_batch(
     request: MultiPlatformImageRequest,
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_active_user_id),
     db: AsyncSession = Depends(get_async_db)
 ):
     """Generate multi-platform image batch using existing content service"""
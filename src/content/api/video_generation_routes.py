@@ -11,7 +11,7 @@ from typing import Dict, Any, List, Optional
 import logging
 
 from src.core.database.session import get_async_db
-from src.users.services.auth_service import AuthService
+from src.core.auth.dependencies import get_active_user_id, get_current_user_claims
 from src.content.services.video_generation_orchestrator import (
     create_video_generation_orchestrator,
     VideoGenerationRequest,
@@ -28,21 +28,16 @@ security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
 async def get_current_user_id(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_async_db)
+    claims: dict = Depends(get_current_user_claims)
 ) -> str:
-    """Get current user ID from token"""
-    auth_service = AuthService(db)
-    user = await auth_service.get_current_user(credentials.credentials)
-    if not user:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    return str(user.id)
+    """Get current user ID from the token claims, without a user lookup (read-only endpoints)"""
+    return str(claims["id"])
 
 @router.post("/generate/{campaign_id}")
 async def generate_video_from_script(
     campaign_id: str,
     request_data: Dict[str, Any],
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_active_user_id),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
@@ -257,7 +252,7 @@ async def get_video_generation_status(
 async def regenerate_video_scene(
     job_id: str,
     request_data: Dict[str, Any],
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_active_user_id),
     db: AsyncSession = Depends(get_async_db)
 ):
     """
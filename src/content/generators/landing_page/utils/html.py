@@ -138,14 +138,52 @@ class HTMLStructureBuilder:
         src: str, 
         alt: str, 
         classes: List[str] = None,
-        lazy_load: bool = True
+        lazy_load: bool = True,
+        manifest: Optional[Dict[str, Any]] = None,
+        sizes: str = "100vw"
     ) -> str:
-        """Build responsive image with optimization"""
+        """Build responsive image with optimization
+        
+        When a derivative manifest from the storage module is given, renders a
+        <picture> with AVIF/WebP sources and a JPEG srcset fallback.
+        """
         
         img_classes = ' '.join(classes or ['responsive-image'])
-        loading_attr = 'loading="lazy"' if lazy_load else ''
+        loading_attr = 'loading="lazy" decoding="async"' if lazy_load else ''
+        
+        if not manifest or not manifest.get('variants'):
+            return f'<img src="{escape(src)}" alt="{escape(alt)}" class="{img_classes}" {loading_attr}>'
+        
+        sources = []
+        for fmt, mime_type in (('avif', 'image/avif'), ('webp', 'image/webp')):
+            srcset = self._build_srcset(manifest, fmt)
+            if srcset:
+                sources.append(f'<source type="{mime_type}" srcset="{escape(srcset)}" sizes="{escape(sizes)}">')
+        
+        jpeg_variants = [v for v in manifest['variants'] if v.get('format') == 'jpeg' and v.get('url')]
+        fallback_src = max(jpeg_variants, key=lambda v: v['width'])['url'] if jpeg_variants else src
+        jpeg_srcset = self._build_srcset(manifest, 'jpeg')
+        srcset_attr = f' srcset="{escape(jpeg_srcset)}" sizes="{escape(sizes)}"' if jpeg_srcset else ''
+        
+        original = manifest.get('original', {})
+        dimension_attr = ''
+        if original.get('width') and original.get('height'):
+            dimension_attr = f' width="{original["width"]}" height="{original["height"]}"'
+        
+        img_tag = (
+            f'<img src="{escape(fallback_src)}"{srcset_attr}{dimension_attr} '
+            f'alt="{escape(alt)}" class="{img_classes}" {loading_attr}>'
+        )
+        return f'<picture>{"".join(sources)}{img_tag}</picture>'
+    
+    def _build_srcset(self, manifest: Dict[str, Any], fmt: str) -> str:
+        """Build srcset value for one format of a derivative manifest"""
         
-        return f'<img src="{escape(src)}" alt="{escape(alt)}" class="{img_classes}" {loading_attr}>'
+        variants = sorted(
+            (v for v in manifest.get('variants', []) if v.get('format') == fmt and v.get('url')),
+            key=lambda v: v['width']
+        )
+        return ', '.join(f"{v['url']} {v['width']}w" for v in variants)
     
     def build_cta_button(
         self, 
@@ -17,8 +17,11 @@ from urllib.parse import urljoin
 import boto3
 from google.cloud import texttospeech
 import tempfile
+import uuid
 import wave
 
+from .tts_audio_cache import TTSAudioCache, get_tts_audio_cache
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -55,6 +58,9 @@ class AIVoiceGenerator:
         # Create local storage directory
         self.storage_dir = os.path.join(os.getcwd(), "generated_assets", "audio")
         os.makedirs(self.storage_dir, exist_ok=True)
+        
+        # Synthesized narration is reused across videos (None when disabled)
+        self.audio_cache: Optional[TTSAudioCache] = get_tts_audio_cache()
     
     async def generate_voiceover(
         self,
@@ -65,6 +71,9 @@ class AIVoiceGenerator:
     ) -> GeneratedVoice:
         """
         Generate voiceover from script text
+        
+        Identical narration (same provider, voice, settings and normalized
+        text) is served from the TTS audio cache without calling the provider.
         """
         
         provider_name = provider or self.default_provider
@@ -90,6 +99,27 @@ class AIVoiceGenerator:
         
         start_time = datetime.now()
         
+        cache_key = None
+        if self.audio_cache:
+            cache_key = self.audio_cache.make_key(
+                provider_name, request.voice_id, request.voice_settings, processed_text
+            )
+            cached = await self.audio_cache.get(
+                cache_key,
+                os.path.join(self.storage_dir, f"voiceover_{voice_type}_{provider_name}_cached_{uuid.uuid4().hex[:8]}.mp3")
+            )
+            if cached:
+                logger.info(f"Voiceover served from TTS cache ({cache_key[:12]})")
+                return GeneratedVoice(
+                    audio_url=cached.metadata.get("url", ""),
+                    local_path=cached.local_path,
+                    duration_seconds=cached.duration_seconds,
+                    voice_id=request.voice_id,
+                    provider=provider_name,
+                    generation_time=(datetime.now() - start_time).total_seconds(),
+                    metadata={**cached.metadata.get("provider_metadata", {}), "cache_hit": True}
+                )
+        
         try:
             # Generate voice using provider
             audio_data = await voice_provider.generate_voice(request)
@@ -102,6 +132,17 @@ class AIVoiceGenerator:
             # Calculate duration
             duration = await self._get_audio_duration(local_path)
             
+            if cache_key:
+                try:
+                    audio_bytes = await asyncio.to_thread(self._read_file, local_path)
+                    await self.audio_cache.put(cache_key, audio_bytes, duration, {
+                        "provider": provider_name,
+                        "voice_id": request.voice_id,
+                        "provider_metadata": audio_data.get("metadata", {})
+                    })
+                except Exception as e:
+                    logger.warning(f"Failed to cache voiceover: {e}")
+            
             generation_time = (datetime.now() - start_time).total_seconds()
             
             return GeneratedVoice(
@@ -133,10 +174,10 @@ class AIVoiceGenerator:
         for i, scene in enumerate(scenes):
             script_text = scene.get("narration", "")
             if script_text.strip():
-                # Add scene timing cues
-                scene_text = f"[Scene {i+1}] {script_text}"
+                # Narrate the text as-is (no scene cue in the spoken text) so
+                # identical narration hits the TTS cache across scenes and videos
                 task = self.generate_voiceover(
-                    scene_text, voice_type, intelligence_data, provider
+                    script_text, voice_type, intelligence_data, provider
                 )
                 tasks.append((i, task))
         
@@ -312,6 +353,11 @@ class AIVoiceGenerator:
         
         return processed_text
     
+    @staticmethod
+    def _read_file(path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+    
     async def _save_audio_locally(
         self,
         audio_data: Dict[str, Any],
@@ -323,7 +369,8 @@ class AIVoiceGenerator:
         """
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"voiceover_{voice_type}_{provider}_{timestamp}.mp3"
+        # Unique suffix: concurrent scene narrations finish within the same second
+        filename = f"voiceover_{voice_type}_{provider}_{timestamp}_{uuid.uuid4().hex[:8]}.mp3"
         file_path = os.path.join(self.storage_dir, filename)
         
         try:
@@ -19,6 +19,8 @@ from datetime import datetime
 import uuid
 from enum import Enum
 
+from src.storage.utils.image_executor import run_image_job
+
 logger = logging.getLogger(__name__)
 
 
@@ -172,78 +174,30 @@ class CompositeImageService:
             logger.info(f"  Foreground layers: {len(request.foreground_layers)}")
             logger.info(f"  Text layers: {len(request.text_layers)}")
 
-            # Step 1: Download and prepare background
-            background = await self._download_image(request.background_image_url)
-            if not background:
+            # Step 1: Download background and foreground layers concurrently
+            downloads = await asyncio.gather(
+                self._download_image_bytes(request.background_image_url),
+                *[self._download_image_bytes(layer.image_url) for layer in request.foreground_layers]
+            )
+            background_data, layer_data = downloads[0], list(downloads[1:])
+            if not background_data:
                 return CompositeImageResponse(
                     success=False,
                     composite_id=composite_id,
                     error="Failed to download background image"
                 )
 
-            # Resize background if dimensions specified
-            if request.output_width or request.output_height:
-                background = self._resize_image(
-                    background,
-                    request.output_width,
-                    request.output_height
-                )
-
-            canvas_width, canvas_height = background.size
-            logger.info(f"  Canvas size: {canvas_width}x{canvas_height}")
-
-            # Step 2: Collect all layers (foreground + text) and sort by z-index
-            all_layers = []
-
-            # Add foreground image layers
-            for fg_layer in request.foreground_layers:
-                all_layers.append(("image", fg_layer))
-
-            # Add text layers
-            for text_layer in request.text_layers:
-                all_layers.append(("text", text_layer))
-
-            # Sort by z-index
-            all_layers.sort(key=lambda x: x[1].z_index)
-
-            # Step 3: Compose layers onto background
-            canvas = background.convert("RGBA")
-
-            for layer_type, layer in all_layers:
-                if layer_type == "image":
-                    canvas = await self._apply_image_layer(
-                        canvas,
-                        layer,
-                        canvas_width,
-                        canvas_height
-                    )
-                elif layer_type == "text":
-                    canvas = self._apply_text_layer(
-                        canvas,
-                        layer,
-                        canvas_width,
-                        canvas_height
-                    )
-
-            # Step 4: Convert to output format and export
-            output_buffer = io.BytesIO()
-
-            if request.output_format.upper() == "PNG":
-                canvas.save(output_buffer, format="PNG", optimize=True)
-            elif request.output_format.upper() in ["JPG", "JPEG"]:
-                # Convert RGBA to RGB for JPEG
-                rgb_canvas = Image.new("RGB", canvas.size, (255, 255, 255))
-                rgb_canvas.paste(canvas, mask=canvas.split()[3])  # Use alpha as mask
-                rgb_canvas.save(
-                    output_buffer,
-                    format="JPEG",
-                    quality=request.quality,
-                    optimize=True
-                )
-            else:
-                canvas.save(output_buffer, format=request.output_format)
+            for layer, data in zip(request.foreground_layers, layer_data):
+                if not data:
+                    logger.warning(f"Failed to download layer image: {layer.image_url}")
 
-            image_data = output_buffer.getvalue()
+            # Steps 2-4: Decode, compose and encode in the image processing pool
+            image_data, canvas_width, canvas_height, layers_count = await run_image_job(
+                render_composite,
+                request,
+                background_data,
+                layer_data
+            )
             generation_time = (datetime.now() - start_time).total_seconds()
 
             logger.info(f"✅ Composite {composite_id} created in {generation_time:.2f}s")
@@ -253,10 +207,10 @@ class CompositeImageService:
                 success=True,
                 composite_id=composite_id,
                 image_data=image_data,
-                width=canvas.width,
-                height=canvas.height,
+                width=canvas_width,
+                height=canvas_height,
                 file_size=len(image_data),
-                layers_count=len(all_layers),
+                layers_count=layers_count,
                 generation_time=generation_time,
                 metadata={
                     **request.metadata,
@@ -274,8 +228,8 @@ class CompositeImageService:
                 error=str(e)
             )
 
-    async def _download_image(self, url: str) -> Optional[Image.Image]:
-        """Download image from URL"""
+    async def _download_image_bytes(self, url: str) -> Optional[bytes]:
+        """Download raw image bytes from URL"""
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url) as response:
@@ -283,8 +237,7 @@ class CompositeImageService:
                         logger.error(f"Failed to download image: {response.status}")
                         return None
 
-                    image_data = await response.read()
-                    return Image.open(io.BytesIO(image_data))
+                    return await response.read()
         except Exception as e:
             logger.error(f"Error downloading image from {url}: {e}")
             return None
@@ -371,21 +324,16 @@ class CompositeImageService:
 
         return (x + position.offset_x, y + position.offset_y)
 
-    async def _apply_image_layer(
+    def _apply_image_layer(
         self,
         canvas: Image.Image,
         layer: ImageLayer,
+        layer_image: Image.Image,
         canvas_width: int,
         canvas_height: int
     ) -> Image.Image:
         """Apply foreground image layer to canvas"""
 
-        # Download layer image
-        layer_image = await self._download_image(layer.image_url)
-        if not layer_image:
-            logger.warning(f"Failed to download layer image: {layer.image_url}")
-            return canvas
-
         # Convert to RGBA
         layer_image = layer_image.convert("RGBA")
 
@@ -516,6 +464,103 @@ class CompositeImageService:
             return ImageFont.load_default()
 
 
+def render_composite(
+    request: CompositeImageRequest,
+    background_data: bytes,
+    layer_data: List[Optional[bytes]]
+) -> Tuple[bytes, int, int, int]:
+    """
+    Compose and encode a composite image from already-downloaded bytes.
+
+    Runs inside the image processing pool, so it only takes picklable
+    arguments. ``layer_data`` is aligned with ``request.foreground_layers``;
+    layers whose download failed (None) are skipped.
+
+    Returns:
+        (image_data, width, height, layers_count)
+    """
+    service = _get_worker_service()
+
+    background = Image.open(io.BytesIO(background_data))
+
+    # Resize background if dimensions specified
+    if request.output_width or request.output_height:
+        background = service._resize_image(
+            background,
+            request.output_width,
+            request.output_height
+        )
+
+    canvas_width, canvas_height = background.size
+    logger.info(f"  Canvas size: {canvas_width}x{canvas_height}")
+
+    # Collect all layers (foreground + text) and sort by z-index
+    all_layers = []
+
+    # Add foreground image layers
+    for fg_layer, data in zip(request.foreground_layers, layer_data):
+        all_layers.append(("image", fg_layer, data))
+
+    # Add text layers
+    for text_layer in request.text_layers:
+        all_layers.append(("text", text_layer, None))
+
+    # Sort by z-index
+    all_layers.sort(key=lambda x: x[1].z_index)
+
+    # Compose layers onto background
+    canvas = background.convert("RGBA")
+
+    for layer_type, layer, data in all_layers:
+        if layer_type == "image":
+            if not data:
+                continue
+            canvas = service._apply_image_layer(
+                canvas,
+                layer,
+                Image.open(io.BytesIO(data)),
+                canvas_width,
+                canvas_height
+            )
+        elif layer_type == "text":
+            canvas = service._apply_text_layer(
+                canvas,
+                layer,
+                canvas_width,
+                canvas_height
+            )
+
+    # Convert to output format and export
+    output_buffer = io.BytesIO()
+
+    if request.output_format.upper() == "PNG":
+        canvas.save(output_buffer, format="PNG", optimize=True)
+    elif request.output_format.upper() in ["JPG", "JPEG"]:
+        # Convert RGBA to RGB for JPEG
+        rgb_canvas = Image.new("RGB", canvas.size, (255, 255, 255))
+        rgb_canvas.paste(canvas, mask=canvas.split()[3])  # Use alpha as mask
+        rgb_canvas.save(
+            output_buffer,
+            format="JPEG",
+            quality=request.quality,
+            optimize=True
+        )
+    else:
+        canvas.save(output_buffer, format=request.output_format)
+
+    return output_buffer.getvalue(), canvas.width, canvas.height, len(all_layers)
+
+
+# Per-process service used by render_composite so the font cache survives between jobs
+_worker_service: Optional[CompositeImageService] = None
+
+def _get_worker_service() -> CompositeImageService:
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = CompositeImageService()
+    return _worker_service
+
+
 # Factory function for dependency injection
 def get_composite_service() -> CompositeImageService:
     """Get singleton composite service instance"""
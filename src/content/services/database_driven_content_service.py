@@ -9,11 +9,72 @@ from uuid import UUID, uuid4
 from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
+import copy
 import logging
 import json
 
+from src.core.database import AsyncSessionManager
+from src.core.shared.decorators import cache_result
+from src.core.crud.subject_template_crud import EMAIL_TEMPLATE_CACHE
+
 logger = logging.getLogger(__name__)
 
+# Same active template set for every caller; empty results (errors) are not cached
+@cache_result(ttl=300, stale_ttl=600, key_func=lambda: "active", namespace=EMAIL_TEMPLATE_CACHE, should_cache=bool)
+async def _load_active_email_templates() -> List[Dict[str, Any]]:
+    """Active email templates, best performing first"""
+    try:
+        query = text("""
+            SELECT 
+                id,
+                template_text,
+                category,
+                performance_level,
+                avg_open_rate,
+                total_uses,
+                psychology_triggers,
+                keywords,
+                is_active,
+                source
+            FROM email_subject_templates 
+            WHERE is_active = TRUE
+            ORDER BY performance_level DESC, avg_open_rate DESC
+            LIMIT 50
+        """)
+
+        # Own session: the cached load can run for another request (single-flight)
+        # or in the background (stale refresh), after the caller's session is gone
+        async with AsyncSessionManager.get_session() as session:
+            result = await session.execute(query)
+            rows = result.fetchall()
+
+        if not rows:
+            logger.warning("No email templates found in database")
+            return []
+
+        templates = []
+        for row in rows:
+            template = {
+                "template_id": str(row.id),
+                "template_text": row.template_text,
+                "category": row.category,
+                "performance_level": row.performance_level,
+                "avg_open_rate": float(row.avg_open_rate) if row.avg_open_rate else 0.0,
+                "total_uses": row.total_uses or 0,
+                "psychology_triggers": row.psychology_triggers if row.psychology_triggers else [],
+                "keywords": row.keywords if row.keywords else [],
+                "source": row.source
+            }
+            templates.append(template)
+
+        logger.info(f"Retrieved {len(templates)} email templates from database")
+        return templates
+
+    except Exception as e:
+        logger.error(f"Failed to get email templates: {e}")
+        return []
+
+
 class DatabaseDrivenContentService:
     """
     Content service that generates content exclusively from database intelligence
@@ -189,53 +250,8 @@ class DatabaseDrivenContentService:
     
     async def _get_email_templates_from_database(self) -> List[Dict[str, Any]]:
         """Get email templates from database - NO mock templates"""
-        try:
-            query = text("""
-                SELECT 
-                    id,
-                    template_text,
-                    category,
-                    performance_level,
-                    avg_open_rate,
-                    total_uses,
-                    psychology_triggers,
-                    keywords,
-                    is_active,
-                    source
-                FROM email_subject_templates 
-                WHERE is_active = TRUE
-                ORDER BY performance_level DESC, avg_open_rate DESC
-                LIMIT 50
-            """)
-            
-            result = await self.db.execute(query)
-            rows = result.fetchall()
-            
-            if not rows:
-                logger.warning("No email templates found in database")
-                return []
-            
-            templates = []
-            for row in rows:
-                template = {
-                    "template_id": str(row.id),
-                    "template_text": row.template_text,
-                    "category": row.category,
-                    "performance_level": row.performance_level,
-                    "avg_open_rate": float(row.avg_open_rate) if row.avg_open_rate else 0.0,
-                    "total_uses": row.total_uses or 0,
-                    "psychology_triggers": row.psychology_triggers if row.psychology_triggers else [],
-                    "keywords": row.keywords if row.keywords else [],
-                    "source": row.source
-                }
-                templates.append(template)
-            
-            logger.info(f"Retrieved {len(templates)} email templates from database")
-            return templates
-            
-        except Exception as e:
-            logger.error(f"Failed to get email templates: {e}")
-            return []
+        # Copies, so callers cannot modify the cached list
+        return copy.deepcopy(await _load_active_email_templates())
     
     async def _generate_email_from_intelligence(
         self, 
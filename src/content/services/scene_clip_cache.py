@@ -0,0 +1,251 @@
+# src/content/services/scene_clip_cache.py
+"""
+Scene Clip Cache
+Content-addressed local disk cache for rendered scene clips
+
+A clip is keyed on everything that affects its pixels and samples: the image
+and audio file contents, duration, effects, text overlay and the VideoSpec.
+Regenerating one scene, or changing only music or branding, reuses the other
+clips and only re-runs concatenation.
+
+The cache is bounded by total size; least recently used clips are evicted
+first. Hits are hard-linked (or copied) into the caller's work directory so a
+concurrent eviction never pulls a clip out from under a running job.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the scene render command changes so old clips are not reused
+SCENE_RENDER_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "video_scene_cache")
+DEFAULT_MAX_SIZE_MB = 2048
+
+
+class SceneClipCache:
+    """LRU-bounded, content-addressed cache of rendered scene clips"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_size_mb: Optional[float] = None
+    ):
+        self.cache_dir = cache_dir or os.getenv("VIDEO_SCENE_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.max_size_bytes = int(
+            (max_size_mb if max_size_mb is not None else float(os.getenv("VIDEO_SCENE_CACHE_MAX_MB", DEFAULT_MAX_SIZE_MB)))
+            * 1024 * 1024
+        )
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # key -> size in bytes, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total_size = 0
+        # (path, size, mtime_ns) -> sha256, so unchanged inputs are hashed once
+        self._file_hashes: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._max_file_hashes = 4096
+
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._load_index()
+
+    def _load_index(self):
+        """Rebuild the LRU index from clips already on disk (oldest access first)"""
+
+        clips = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".mp4"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            clips.append((stat.st_mtime, name[:-4], stat.st_size))
+
+        for _, key, size in sorted(clips):
+            self._entries[key] = size
+            self._total_size += size
+
+        self._evict()
+        if self._entries:
+            logger.info(f"Scene clip cache loaded {len(self._entries)} clips ({self._total_size / (1024 * 1024):.1f}MB)")
+
+    def _clip_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.mp4")
+
+    def _hash_file(self, path: str) -> str:
+        """sha256 of a file's contents, memoized on (path, size, mtime)"""
+
+        stat = os.stat(path)
+        memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            cached = self._file_hashes.get(memo_key)
+            if cached:
+                self._file_hashes.move_to_end(memo_key)
+                return cached
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        file_hash = digest.hexdigest()
+
+        with self._lock:
+            self._file_hashes[memo_key] = file_hash
+            while len(self._file_hashes) > self._max_file_hashes:
+                self._file_hashes.popitem(last=False)
+        return file_hash
+
+    def compute_key(self, scene: Any, specs: Any) -> str:
+        """
+        Cache key for a scene clip
+
+        ``scene`` is a pipeline VideoScene, ``specs`` a VideoSpec. Reads the
+        image and audio files, so call through ``compute_key_async`` from
+        async code.
+        """
+
+        fingerprint = {
+            "version": SCENE_RENDER_VERSION,
+            "image": self._hash_file(scene.image_path),
+            "audio": self._hash_file(scene.audio_path) if scene.audio_path else None,
+            "duration": round(float(scene.duration), 3),
+            "effects": list(scene.effects or []),
+            "text_overlay": scene.text_overlay,
+            "specs": asdict(specs),
+        }
+        encoded = json.dumps(fingerprint, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    async def compute_key_async(self, scene: Any, specs: Any) -> str:
+        """Compute the cache key without blocking the event loop on file hashing"""
+        return await asyncio.to_thread(self.compute_key, scene, specs)
+
+    def fetch(self, key: str, destination: str) -> bool:
+        """
+        Materialize a cached clip at ``destination``
+
+        Returns:
+            True on a hit, False on a miss
+        """
+
+        source = self._clip_path(key)
+        with self._lock:
+            if key not in self._entries:
+                self._stats["misses"] += 1
+                return False
+            try:
+                _link_or_copy(source, destination)
+                # mtime doubles as the access time for LRU order across restarts
+                os.utime(source, None)
+            except OSError as e:
+                logger.warning(f"Scene clip cache entry {key[:12]} unreadable, dropping: {e}")
+                self._drop(key)
+                self._stats["misses"] += 1
+                return False
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return True
+
+    def store(self, key: str, clip_path: str):
+        """Add a freshly rendered clip to the cache (the source file is left in place)"""
+
+        try:
+            size = os.path.getsize(clip_path)
+        except OSError:
+            return
+        if size > self.max_size_bytes:
+            return
+
+        # Copy under a unique temp name, then rename atomically into place
+        temp_path = os.path.join(self.cache_dir, f".{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            _link_or_copy(clip_path, temp_path)
+            os.replace(temp_path, self._clip_path(key))
+        except OSError as e:
+            logger.warning(f"Failed to store scene clip {key[:12]}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_size -= previous
+            self._entries[key] = size
+            self._total_size += size
+            self._stats["stores"] += 1
+            self._evict()
+
+    def _evict(self):
+        """Evict least recently used clips until under the size cap (lock held)"""
+        while self._total_size > self.max_size_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._drop(key)
+            self._stats["evictions"] += 1
+
+    def _drop(self, key: str):
+        size = self._entries.pop(key, 0)
+        self._total_size -= size
+        try:
+            os.remove(self._clip_path(key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to evict scene clip {key[:12]}: {e}")
+
+    def clear(self):
+        """Remove every cached clip"""
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and disk usage"""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "size_mb": round(self._total_size / (1024 * 1024), 2),
+                "max_size_mb": round(self.max_size_bytes / (1024 * 1024), 2),
+                "cache_dir": self.cache_dir
+            }
+
+
+def _link_or_copy(source: str, destination: str):
+    """Hard link when source and destination share a filesystem, otherwise copy"""
+    if os.path.exists(destination):
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+# Global instance
+_scene_clip_cache = None
+
+def get_scene_clip_cache() -> Optional[SceneClipCache]:
+    """Get the global scene clip cache, or None when disabled via VIDEO_SCENE_CACHE_ENABLED"""
+    global _scene_clip_cache
+    if os.getenv("VIDEO_SCENE_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    if _scene_clip_cache is None:
+        _scene_clip_cache = SceneClipCache()
+    return _scene_clip_cache
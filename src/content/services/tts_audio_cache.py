@@ -0,0 +1,273 @@
+# src/content/services/tts_audio_cache.py
+"""
+TTS Audio Cache
+Content-addressed cache for synthesized narration
+
+Entries are keyed on provider, voice_id, voice settings and the normalized
+script text, so the same narration is synthesized once and reused by every
+later video. Each entry stores the audio and its duration, which lets a hit
+skip both the provider call and the ffprobe duration probe.
+
+Two tiers: local disk (LRU-bounded by size) in front of R2 through the
+universal dual storage manager, so entries survive redeploys and are shared
+between instances. A hit is handed out as a hard link (or copy) at a path
+chosen by the caller, so eviction never removes audio that is still in use.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import unicodedata
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when text preprocessing or the entry format changes
+TTS_CACHE_VERSION = 1
+
+R2_PREFIX = "cache/tts"
+
+_whitespace = re.compile(r"\s+")
+
+
+@dataclass
+class CachedAudio:
+    key: str
+    local_path: str
+    duration_seconds: float
+    metadata: Dict[str, Any]
+
+
+def normalize_text(text: str) -> str:
+    """Unicode-normalize and collapse whitespace so trivially different scripts share an entry"""
+    return _whitespace.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class TTSAudioCache:
+    """Local disk + R2 cache of synthesized audio"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_size_mb: Optional[float] = None,
+        use_remote: Optional[bool] = None
+    ):
+        self.cache_dir = cache_dir or os.getenv(
+            "TTS_CACHE_DIR", os.path.join(os.getcwd(), "generated_assets", "audio_cache")
+        )
+        self.max_size_bytes = int(
+            (max_size_mb if max_size_mb is not None else float(os.getenv("TTS_CACHE_MAX_MB", 1024)))
+            * 1024 * 1024
+        )
+        if use_remote is None:
+            use_remote = os.getenv("TTS_CACHE_R2_ENABLED", "true").lower() not in ("0", "false", "no")
+        self.use_remote = use_remote
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._stats = {"local_hits": 0, "remote_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(provider: str, voice_id: str, voice_settings: Dict[str, Any], text: str) -> str:
+        """Cache key for one synthesis request"""
+        fingerprint = {
+            "version": TTS_CACHE_VERSION,
+            "provider": provider,
+            "voice_id": voice_id,
+            "voice_settings": voice_settings,
+            "text": normalize_text(text),
+        }
+        encoded = json.dumps(fingerprint, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _audio_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.mp3")
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _get_storage(self):
+        """Dual storage manager for the R2 tier, None when unavailable"""
+        if not self.use_remote:
+            return None
+        try:
+            from src.storage.universal_dual_storage import get_storage_manager
+            return get_storage_manager()
+        except Exception as e:
+            logger.debug(f"TTS cache remote tier unavailable: {e}")
+            return None
+
+    async def get(self, key: str, destination_path: str) -> Optional[CachedAudio]:
+        """
+        Look up an entry locally, then in R2 (populating the local tier on a remote hit)
+
+        The audio is linked or copied to ``destination_path``, which becomes the
+        returned entry's ``local_path`` and belongs to the caller.
+        """
+
+        entry = await asyncio.to_thread(self._checkout_local, key, destination_path)
+        if entry:
+            self._stats["local_hits"] += 1
+            return entry
+
+        storage = self._get_storage()
+        if storage:
+            meta_bytes = await storage.fetch_object(f"{R2_PREFIX}/{key}.json")
+            audio_bytes = await storage.fetch_object(f"{R2_PREFIX}/{key}.mp3") if meta_bytes else None
+            if meta_bytes and audio_bytes:
+                try:
+                    metadata = json.loads(meta_bytes)
+                    duration_seconds = float(metadata["duration_seconds"])
+                    await asyncio.to_thread(self._write_local, key, audio_bytes, metadata)
+                    await asyncio.to_thread(self._write_file, destination_path, audio_bytes)
+                    self._stats["remote_hits"] += 1
+                    return CachedAudio(key, destination_path, duration_seconds, metadata)
+                except (ValueError, KeyError, OSError) as e:
+                    logger.warning(f"Ignoring corrupt remote TTS cache entry {key[:12]}: {e}")
+
+        self._stats["misses"] += 1
+        return None
+
+    async def put(
+        self,
+        key: str,
+        audio_bytes: bytes,
+        duration_seconds: float,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> CachedAudio:
+        """
+        Store synthesized audio with its duration in both tiers
+
+        The returned entry points at the cache file itself; use ``get`` for a
+        path that is safe to hand to other code.
+        """
+
+        entry_metadata = {
+            **(metadata or {}),
+            "duration_seconds": duration_seconds,
+            "size": len(audio_bytes),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        await asyncio.to_thread(self._write_local, key, audio_bytes, entry_metadata)
+        self._stats["stores"] += 1
+
+        storage = self._get_storage()
+        if storage:
+            audio_url = await storage.store_object(f"{R2_PREFIX}/{key}.mp3", audio_bytes, "audio/mpeg")
+            if audio_url:
+                entry_metadata["url"] = audio_url
+                # The sidecar goes last: its presence marks a complete remote entry
+                await storage.store_object(
+                    f"{R2_PREFIX}/{key}.json", json.dumps(entry_metadata).encode(), "application/json"
+                )
+
+        return CachedAudio(key, self._audio_path(key), duration_seconds, entry_metadata)
+
+    def _read_local(self, key: str) -> Optional[CachedAudio]:
+        audio_path, meta_path = self._audio_path(key), self._meta_path(key)
+        try:
+            with open(meta_path) as f:
+                metadata = json.load(f)
+            if not os.path.exists(audio_path):
+                return None
+            # mtime doubles as the access time for LRU eviction
+            os.utime(meta_path, None)
+            return CachedAudio(key, audio_path, float(metadata["duration_seconds"]), metadata)
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, OSError) as e:
+            logger.warning(f"Ignoring corrupt local TTS cache entry {key[:12]}: {e}")
+            return None
+
+    def _checkout_local(self, key: str, destination_path: str) -> Optional[CachedAudio]:
+        """Local entry linked to ``destination_path``; the lock keeps eviction out in between"""
+        with self._lock:
+            entry = self._read_local(key)
+            if not entry:
+                return None
+            try:
+                if os.path.exists(destination_path):
+                    os.remove(destination_path)
+                try:
+                    os.link(entry.local_path, destination_path)
+                except OSError:
+                    # Different filesystem or no hard link support
+                    shutil.copyfile(entry.local_path, destination_path)
+            except OSError as e:
+                logger.warning(f"Could not check out TTS cache entry {key[:12]}: {e}")
+                return None
+        return CachedAudio(key, destination_path, entry.duration_seconds, entry.metadata)
+
+    @staticmethod
+    def _write_file(path: str, data: bytes):
+        """Write via a temp file and rename, so readers never see a partial file"""
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def _write_local(self, key: str, audio_bytes: bytes, metadata: Dict[str, Any]):
+        """Atomically write audio then sidecar, then enforce the size cap"""
+        self._write_file(self._audio_path(key), audio_bytes)
+        self._write_file(self._meta_path(key), json.dumps(metadata).encode())
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the local tier fits the size cap"""
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".json"):
+                    continue
+                key = name[:-5]
+                try:
+                    size = os.path.getsize(self._audio_path(key))
+                    accessed = os.path.getmtime(self._meta_path(key))
+                except OSError:
+                    continue
+                entries.append((accessed, key, size))
+                total += size
+
+            for _, key, size in sorted(entries):
+                if total <= self.max_size_bytes:
+                    break
+                for path in (self._meta_path(key), self._audio_path(key)):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= size
+                self._stats["evictions"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per tier"""
+        lookups = self._stats["local_hits"] + self._stats["remote_hits"] + self._stats["misses"]
+        hits = self._stats["local_hits"] + self._stats["remote_hits"]
+        return {
+            **self._stats,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "remote_enabled": self.use_remote,
+            "cache_dir": self.cache_dir
+        }
+
+
+# Global instance
+_tts_audio_cache = None
+
+def get_tts_audio_cache() -> Optional[TTSAudioCache]:
+    """Get the global TTS audio cache, or None when disabled via TTS_CACHE_ENABLED"""
+    global _tts_audio_cache
+    if os.getenv("TTS_CACHE_ENABLED", "true").lower() in ("0", "false", "no"):
+        return None
+    if _tts_audio_cache is None:
+        _tts_audio_cache = TTSAudioCache()
+    return _tts_audio_cache
@@ -4,20 +4,104 @@ Video Assembly Pipeline
 Combines AI-generated images, voiceovers, and effects into complete videos using FFmpeg
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 import asyncio
+import inspect
 import subprocess
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import os
 import json
 import tempfile
 import shutil
+import time
+import uuid
+import weakref
 from pathlib import Path
 
+from .scene_clip_cache import SceneClipCache, get_scene_clip_cache
+
 logger = logging.getLogger(__name__)
 
+# Assembly modes: "multi_pass" renders each scene, concatenates and brands in
+# separate encodes; "single_pass" builds one filter_complex graph and encodes once
+ASSEMBLY_MODES = ("multi_pass", "single_pass")
+DEFAULT_ASSEMBLY_MODE = os.getenv("VIDEO_ASSEMBLY_MODE", "multi_pass")
+
+# Scene transition types rendered with xfade in single-pass mode; anything
+# else (including the default "fade") is a hard cut, as in multi-pass mode
+XFADE_TRANSITIONS = {
+    "crossfade": "fade",
+    "dissolve": "dissolve",
+    "slide_left": "slideleft",
+    "slide_right": "slideright",
+    "wipe": "wipeleft",
+}
+XFADE_DURATION = 0.5
+
+# Cap on concurrently running FFmpeg processes, shared by every pipeline
+# instance (orchestrator, slideshow generator, batch jobs). asyncio primitives
+# belong to the loop that first waits on them, so there is one per event loop
+FFMPEG_MAX_CONCURRENT = int(os.getenv("FFMPEG_MAX_CONCURRENT", os.cpu_count() or 2))
+_ffmpeg_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+def get_ffmpeg_slots() -> asyncio.Semaphore:
+    """Get the FFmpeg slot semaphore of the running event loop"""
+    loop = asyncio.get_running_loop()
+    slots = _ffmpeg_slots.get(loop)
+    if slots is None:
+        slots = _ffmpeg_slots[loop] = asyncio.Semaphore(FFMPEG_MAX_CONCURRENT)
+    return slots
+
+class VideoAssemblyCancelled(Exception):
+    """Raised when an assembly job is cancelled through its CancellationToken"""
+    pass
+
+class CancellationToken:
+    """
+    Job-level cancellation signal
+
+    Calling cancel() stops scheduling new FFmpeg work for the job and kills
+    the FFmpeg processes it already has running.
+    """
+
+    def __init__(self):
+        self._cancelled = False
+        # One Event per loop that waits on the token, created on first wait
+        self._events: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Event]" = weakref.WeakKeyDictionary()
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = "cancelled"):
+        self.reason = reason
+        self._cancelled = True
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        for loop, event in list(self._events.items()):
+            if loop is current_loop:
+                event.set()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def raise_if_cancelled(self):
+        if self._cancelled:
+            raise VideoAssemblyCancelled(self.reason or "cancelled")
+
+    async def wait(self):
+        loop = asyncio.get_running_loop()
+        event = self._events.get(loop)
+        if event is None:
+            event = self._events[loop] = asyncio.Event()
+        if self._cancelled:
+            event.set()
+        await event.wait()
+
 @dataclass
 class VideoScene:
     scene_id: str
@@ -38,8 +122,40 @@ class VideoSpec:
     audio_codec: str = "aac"
     format: str = "mp4"
 
+@dataclass
+class AssemblyJob:
+    """Per-call state of one assemble_video run"""
+    job_id: str
+    work_dir: str
+    cancel_token: CancellationToken = field(default_factory=CancellationToken)
+    progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+    started_at: float = field(default_factory=time.monotonic)
+
+    async def emit(self, event: str, **data):
+        """Send a progress event to the job's callback, if any"""
+        if not self.progress_callback:
+            return
+        payload = {
+            "job_id": self.job_id,
+            "event": event,
+            "elapsed_seconds": round(time.monotonic() - self.started_at, 3),
+            **data
+        }
+        try:
+            result = self.progress_callback(payload)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"Progress callback failed for {event}: {e}")
+
 @dataclass
 class AssembledVideo:
+    """
+    Finished video on local disk
+    
+    Consumers hand ``video_path`` on (e.g. to a streamed storage upload)
+    rather than reading the file into memory.
+    """
     video_path: str
     duration_seconds: float
     file_size_mb: float
@@ -54,7 +170,6 @@ class VideoAssemblyPipeline:
     """
     
     def __init__(self):
-        self.temp_dir = tempfile.mkdtemp(prefix="video_assembly_")
         self.output_dir = os.path.join(os.getcwd(), "generated_assets", "videos")
         os.makedirs(self.output_dir, exist_ok=True)
         
@@ -68,6 +183,9 @@ class VideoAssemblyPipeline:
             "linkedin_post": VideoSpec(1200, 1200, 30, "2M")   # 1:1 square
         }
         
+        # Rendered scene clips are reused across runs (None when disabled)
+        self.scene_cache: Optional[SceneClipCache] = get_scene_clip_cache()
+        
         # Verify FFmpeg installation
         self._verify_ffmpeg()
     
@@ -89,36 +207,94 @@ class VideoAssemblyPipeline:
         video_type: str,
         brand_config: Optional[Dict[str, Any]] = None,
         music_path: Optional[str] = None,
-        output_filename: Optional[str] = None
+        output_filename: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        assembly_mode: Optional[str] = None
     ) -> AssembledVideo:
         """
         Assemble complete video from scenes
+        
+        ``assembly_mode`` selects "multi_pass" (default, per-scene clips then
+        concat and branding re-encodes) or "single_pass" (one filter_complex
+        graph, one H.264 encode). Single-pass falls back to multi-pass if
+        FFmpeg rejects the graph.
+        
+        In multi-pass mode rendered scene clips are kept in the scene clip
+        cache, so re-assembling after changing one scene, the music or the
+        branding only renders what changed and re-runs concatenation.
+        
+        Scenes are rendered concurrently (bounded by CPU count and the global
+        FFmpeg slot limit). ``progress_callback`` receives a dict per event
+        (scene_started, scene_completed, scene_failed, scene_cached, stage); it may be sync
+        or async. Cancelling ``cancel_token`` kills the job's running FFmpeg
+        processes and raises VideoAssemblyCancelled.
         """
         
         start_time = datetime.now()
+        job = AssemblyJob(
+            job_id=uuid.uuid4().hex[:12],
+            work_dir=tempfile.mkdtemp(prefix="video_assembly_"),
+            cancel_token=cancel_token or CancellationToken(),
+            progress_callback=progress_callback
+        )
         
         try:
             # Get video specifications
             specs = self.video_specs.get(video_type, self.video_specs["youtube_short"])
             
-            # Prepare scenes (resize images, sync audio)
-            prepared_scenes = await self._prepare_scenes(scenes, specs)
+            mode = assembly_mode or DEFAULT_ASSEMBLY_MODE
+            if mode not in ASSEMBLY_MODES:
+                raise ValueError(f"Unknown assembly mode: {mode}")
             
-            # Create video segments for each scene
-            scene_videos = await self._create_scene_videos(prepared_scenes, specs)
+            branded_video = None
+            cached_scenes = 0
+            if mode == "single_pass":
+                try:
+                    await job.emit("stage", stage="single_pass_encode", total_scenes=len(scenes))
+                    branded_video = await self._assemble_single_pass(
+                        scenes, specs, job, brand_config, music_path
+                    )
+                except VideoAssemblyCancelled:
+                    raise
+                except Exception as e:
+                    logger.warning(f"Single-pass assembly failed, falling back to multi-pass: {e}")
+                    mode = "multi_pass"
             
-            # Combine scenes into final video
-            combined_video = await self._combine_scenes(
-                scene_videos, specs, music_path
-            )
+            if branded_video is None:
+                # Reuse previously rendered clips; only changed scenes are prepared and rendered
+                scene_videos, scene_keys = await self._fetch_cached_scenes(scenes, specs, job)
+                pending = [i for i, video in enumerate(scene_videos) if video is None]
+                
+                cached_scenes = len(scenes) - len(pending)
+                if pending:
+                    # Prepare scenes (resize images, sync audio)
+                    await job.emit("stage", stage="prepare_scenes", total_scenes=len(pending))
+                    prepared_scenes = await self._prepare_scenes([scenes[i] for i in pending], specs, job)
+                
+                    # Create video segments for each scene
+                    await job.emit("stage", stage="render_scenes", total_scenes=len(pending))
+                    rendered = await self._create_scene_videos(prepared_scenes, specs, job)
+                    
+                    for i, video_path in zip(pending, rendered):
+                        scene_videos[i] = video_path
+                        if scene_keys[i]:
+                            await asyncio.to_thread(self.scene_cache.store, scene_keys[i], video_path)
             
-            # Add brand elements if provided
-            if brand_config:
-                branded_video = await self._add_brand_elements(
-                    combined_video, brand_config, specs
+                # Combine scenes into final video
+                await job.emit("stage", stage="combine_scenes", total_scenes=len(scenes))
+                combined_video = await self._combine_scenes(
+                    scene_videos, specs, job, music_path
                 )
-            else:
-                branded_video = combined_video
+            
+                # Add brand elements if provided
+                if brand_config:
+                    await job.emit("stage", stage="branding", total_scenes=len(scenes))
+                    branded_video = await self._add_brand_elements(
+                        combined_video, brand_config, specs, job
+                    )
+                else:
+                    branded_video = combined_video
             
             # Move to final output location
             final_path = self._get_output_path(output_filename, video_type)
@@ -130,6 +306,7 @@ class VideoAssemblyPipeline:
             assembly_time = (datetime.now() - start_time).total_seconds()
             
             logger.info(f"Video assembled successfully: {final_path}")
+            await job.emit("stage", stage="completed", total_scenes=len(scenes), video_path=final_path)
             
             return AssembledVideo(
                 video_path=final_path,
@@ -143,42 +320,83 @@ class VideoAssemblyPipeline:
                     "scenes": len(scenes),
                     "has_music": music_path is not None,
                     "has_branding": brand_config is not None,
+                    "assembly_mode": mode,
+                    "cached_scenes": cached_scenes,
                     "created_at": datetime.now().isoformat()
                 }
             )
             
+        except VideoAssemblyCancelled as e:
+            logger.info(f"Video assembly {job.job_id} cancelled: {e}")
+            await job.emit("stage", stage="cancelled", reason=str(e))
+            raise
         except Exception as e:
             logger.error(f"Video assembly failed: {e}")
             raise
         finally:
             # Cleanup temporary files
-            self._cleanup_temp_files()
+            self._cleanup_temp_files(job.work_dir)
+    
+    async def _fetch_cached_scenes(
+        self,
+        scenes: List[VideoScene],
+        specs: VideoSpec,
+        job: AssemblyJob
+    ) -> Tuple[List[Optional[str]], List[Optional[str]]]:
+        """
+        Look up rendered clips in the scene cache
+        
+        Returns:
+            (clip paths with None for misses, cache keys with None where uncacheable)
+        """
+        
+        scene_videos: List[Optional[str]] = [None] * len(scenes)
+        scene_keys: List[Optional[str]] = [None] * len(scenes)
+        if self.scene_cache is None:
+            return scene_videos, scene_keys
+        
+        for i, scene in enumerate(scenes):
+            try:
+                key = await self.scene_cache.compute_key_async(scene, specs)
+            except OSError as e:
+                logger.warning(f"Scene {scene.scene_id} not cacheable: {e}")
+                continue
+            
+            scene_keys[i] = key
+            destination = os.path.join(job.work_dir, f"scene_{scene.scene_id}.mp4")
+            if await asyncio.to_thread(self.scene_cache.fetch, key, destination):
+                scene_videos[i] = destination
+                await job.emit("scene_cached", scene_id=scene.scene_id, scene_index=i, total_scenes=len(scenes))
+        
+        hits = sum(1 for video in scene_videos if video)
+        if hits:
+            logger.info(f"Reusing {hits}/{len(scenes)} cached scene clips")
+        return scene_videos, scene_keys
     
     async def _prepare_scenes(
         self,
         scenes: List[VideoScene],
-        specs: VideoSpec
+        specs: VideoSpec,
+        job: AssemblyJob
     ) -> List[Dict[str, Any]]:
         """
         Prepare scene assets (resize images, prepare audio)
         """
         
-        prepared_scenes = []
-        
-        for scene in scenes:
+        async def prepare(scene: VideoScene) -> Dict[str, Any]:
             # Resize and format image
             prepared_image = await self._prepare_image(
-                scene.image_path, specs, scene.scene_id
+                scene.image_path, specs, scene.scene_id, job
             )
             
             # Prepare audio if present
             prepared_audio = None
             if scene.audio_path:
                 prepared_audio = await self._prepare_audio(
-                    scene.audio_path, scene.duration, scene.scene_id
+                    scene.audio_path, scene.duration, scene.scene_id, job
                 )
             
-            prepared_scenes.append({
+            return {
                 "scene_id": scene.scene_id,
                 "image_path": prepared_image,
                 "audio_path": prepared_audio,
@@ -186,21 +404,23 @@ class VideoAssemblyPipeline:
                 "text_overlay": scene.text_overlay,
                 "transition_type": scene.transition_type,
                 "effects": scene.effects or []
-            })
+            }
         
-        return prepared_scenes
+        # Preparation is cheap per scene; the global FFmpeg slots bound it
+        return await self._gather_or_cancel([prepare(scene) for scene in scenes])
     
     async def _prepare_image(
         self,
         image_path: str,
         specs: VideoSpec,
-        scene_id: str
+        scene_id: str,
+        job: AssemblyJob
     ) -> str:
         """
         Resize and format image for video specifications
         """
         
-        output_path = os.path.join(self.temp_dir, f"scene_{scene_id}_prepared.png")
+        output_path = os.path.join(job.work_dir, f"scene_{scene_id}_prepared.png")
         
         # FFmpeg command to resize and format image
         cmd = [
@@ -211,7 +431,7 @@ class VideoAssemblyPipeline:
             output_path
         ]
         
-        result = await self._run_ffmpeg_command(cmd)
+        result = await self._run_ffmpeg_command(cmd, job.cancel_token)
         if result.returncode != 0:
             raise Exception(f"Failed to prepare image for scene {scene_id}")
         
@@ -221,13 +441,14 @@ class VideoAssemblyPipeline:
         self,
         audio_path: str,
         target_duration: float,
-        scene_id: str
+        scene_id: str,
+        job: AssemblyJob
     ) -> str:
         """
         Prepare audio to match scene duration
         """
         
-        output_path = os.path.join(self.temp_dir, f"scene_{scene_id}_audio.mp3")
+        output_path = os.path.join(job.work_dir, f"scene_{scene_id}_audio.mp3")
         
         # FFmpeg command to format audio and adjust duration
         cmd = [
@@ -240,7 +461,7 @@ class VideoAssemblyPipeline:
             output_path
         ]
         
-        result = await self._run_ffmpeg_command(cmd)
+        result = await self._run_ffmpeg_command(cmd, job.cancel_token)
         if result.returncode != 0:
             raise Exception(f"Failed to prepare audio for scene {scene_id}")
         
@@ -249,31 +470,75 @@ class VideoAssemblyPipeline:
     async def _create_scene_videos(
         self,
         prepared_scenes: List[Dict[str, Any]],
-        specs: VideoSpec
+        specs: VideoSpec,
+        job: AssemblyJob
     ) -> List[str]:
         """
-        Create individual video clips for each scene
+        Create individual video clips for each scene, rendering them concurrently
         """
         
-        scene_videos = []
+        total = len(prepared_scenes)
+        cpu_count = os.cpu_count() or 1
+        max_parallel = max(1, min(total, cpu_count))
+        # Split cores between concurrently running encoders instead of oversubscribing
+        threads_per_scene = max(1, cpu_count // max_parallel)
+        scene_slots = asyncio.Semaphore(max_parallel)
+        completed = 0
         
-        for scene in prepared_scenes:
-            video_path = await self._create_single_scene_video(scene, specs)
-            scene_videos.append(video_path)
+        async def render(index: int, scene: Dict[str, Any]) -> str:
+            nonlocal completed
+            async with scene_slots:
+                job.cancel_token.raise_if_cancelled()
+                await job.emit("scene_started", scene_id=scene["scene_id"], scene_index=index, total_scenes=total)
+                scene_start = time.monotonic()
+                try:
+                    video_path = await self._create_single_scene_video(scene, specs, job, threads_per_scene)
+                except Exception as e:
+                    await job.emit("scene_failed", scene_id=scene["scene_id"], scene_index=index, total_scenes=total, error=str(e))
+                    raise
+                completed += 1
+                await job.emit(
+                    "scene_completed",
+                    scene_id=scene["scene_id"],
+                    scene_index=index,
+                    total_scenes=total,
+                    completed_scenes=completed,
+                    render_seconds=round(time.monotonic() - scene_start, 3)
+                )
+                return video_path
+        
+        logger.info(f"Rendering {total} scenes with up to {max_parallel} in parallel")
         
-        return scene_videos
+        # Results keep scene order regardless of completion order
+        return await self._gather_or_cancel([render(i, scene) for i, scene in enumerate(prepared_scenes)])
+    
+    async def _gather_or_cancel(self, coroutines: List[Any]) -> List[Any]:
+        """Run coroutines concurrently; on the first failure cancel the rest"""
+        
+        tasks = [asyncio.ensure_future(coro) for coro in coroutines]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            # Let cancelled tasks kill their FFmpeg processes before returning
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
     
     async def _create_single_scene_video(
         self,
         scene: Dict[str, Any],
-        specs: VideoSpec
+        specs: VideoSpec,
+        job: AssemblyJob,
+        threads: int = 0
     ) -> str:
         """
         Create video clip for a single scene
         """
         
         scene_id = scene["scene_id"]
-        output_path = os.path.join(self.temp_dir, f"scene_{scene_id}.mp4")
+        output_path = os.path.join(job.work_dir, f"scene_{scene_id}.mp4")
         
         # Build FFmpeg command
         cmd = ['ffmpeg', '-y']
@@ -296,19 +561,8 @@ class VideoAssemblyPipeline:
         zoom_filter = f"zoompan=z='min(zoom+0.0015,1.3)':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d={specs.fps * scene['duration']}"
         video_filters.append(zoom_filter)
         
-        # Add effects if specified
-        for effect in scene.get("effects", []):
-            if effect == "fade_in":
-                video_filters.append("fade=in:0:30")
-            elif effect == "fade_out":
-                fade_start = int((scene["duration"] - 1) * specs.fps)
-                video_filters.append(f"fade=out:{fade_start}:30")
-        
-        # Add text overlay if present
-        if scene.get("text_overlay"):
-            text = scene["text_overlay"].replace("'", "\\'")
-            text_filter = f"drawtext=text='{text}':fontfile=/System/Library/Fonts/Arial.ttf:fontsize=60:fontcolor=white:x=(w-text_w)/2:y=h-150:enable='between(t,1,{scene['duration']-1})'"
-            video_filters.append(text_filter)
+        # Add fades and text overlay
+        video_filters.extend(self._scene_overlay_filters(scene, specs))
         
         # Apply video filters
         if video_filters:
@@ -321,6 +575,8 @@ class VideoAssemblyPipeline:
             '-r', str(specs.fps),
             '-b:v', specs.bitrate,
         ])
+        if threads:
+            cmd.extend(['-threads', str(threads)])
         
         # Audio settings
         if scene["audio_path"]:
@@ -334,23 +590,47 @@ class VideoAssemblyPipeline:
         
         cmd.append(output_path)
         
-        result = await self._run_ffmpeg_command(cmd)
+        result = await self._run_ffmpeg_command(cmd, job.cancel_token)
         if result.returncode != 0:
             raise Exception(f"Failed to create video for scene {scene_id}")
         
         return output_path
     
+    def _scene_overlay_filters(self, scene: Dict[str, Any], specs: VideoSpec) -> List[str]:
+        """
+        Fade effects and text overlay filters for a scene (shared by both assembly modes)
+        """
+        
+        filters = []
+        
+        # Add effects if specified
+        for effect in scene.get("effects", []):
+            if effect == "fade_in":
+                filters.append("fade=in:0:30")
+            elif effect == "fade_out":
+                fade_start = int((scene["duration"] - 1) * specs.fps)
+                filters.append(f"fade=out:{fade_start}:30")
+        
+        # Add text overlay if present
+        if scene.get("text_overlay"):
+            text = scene["text_overlay"].replace("'", "\\'")
+            text_filter = f"drawtext=text='{text}':fontfile=/System/Library/Fonts/Arial.ttf:fontsize=60:fontcolor=white:x=(w-text_w)/2:y=h-150:enable='between(t,1,{scene['duration']-1})'"
+            filters.append(text_filter)
+        
+        return filters
+    
     async def _combine_scenes(
         self,
         scene_videos: List[str],
         specs: VideoSpec,
+        job: AssemblyJob,
         music_path: Optional[str] = None
     ) -> str:
         """
         Combine individual scene videos into final video
         """
         
-        output_path = os.path.join(self.temp_dir, "combined_video.mp4")
+        output_path = os.path.join(job.work_dir, "combined_video.mp4")
         
         if len(scene_videos) == 1:
             # Single scene - just copy with music if needed
@@ -369,7 +649,7 @@ class VideoAssemblyPipeline:
                 return output_path
         else:
             # Multiple scenes - create concat file and combine
-            concat_file = os.path.join(self.temp_dir, "concat_list.txt")
+            concat_file = os.path.join(job.work_dir, "concat_list.txt")
             with open(concat_file, 'w') as f:
                 for video in scene_videos:
                     f.write(f"file '{video}'\n")
@@ -396,7 +676,7 @@ class VideoAssemblyPipeline:
                 output_path
             ])
         
-        result = await self._run_ffmpeg_command(cmd)
+        result = await self._run_ffmpeg_command(cmd, job.cancel_token)
         if result.returncode != 0:
             raise Exception("Failed to combine scene videos")
         
@@ -406,13 +686,14 @@ class VideoAssemblyPipeline:
         self,
         video_path: str,
         brand_config: Dict[str, Any],
-        specs: VideoSpec
+        specs: VideoSpec,
+        job: AssemblyJob
     ) -> str:
         """
         Add brand elements like logo, watermark, colors
         """
         
-        output_path = os.path.join(self.temp_dir, "branded_video.mp4")
+        output_path = os.path.join(job.work_dir, "branded_video.mp4")
         
         cmd = ['ffmpeg', '-y', '-i', video_path]
         
@@ -431,36 +712,262 @@ class VideoAssemblyPipeline:
             output_path
         ])
         
-        result = await self._run_ffmpeg_command(cmd)
+        result = await self._run_ffmpeg_command(cmd, job.cancel_token)
         if result.returncode != 0:
             raise Exception("Failed to add brand elements")
         
         return output_path
     
-    async def _run_ffmpeg_command(self, cmd: List[str]) -> subprocess.CompletedProcess:
+    async def _assemble_single_pass(
+        self,
+        scenes: List[VideoScene],
+        specs: VideoSpec,
+        job: AssemblyJob,
+        brand_config: Optional[Dict[str, Any]] = None,
+        music_path: Optional[str] = None
+    ) -> str:
+        """
+        Assemble the whole video with a single FFmpeg invocation
+        
+        Scaling/padding, zoompan, fades, text overlays, concat or xfade,
+        music ducking and the logo overlay all live in one filter_complex
+        graph, so the output is encoded exactly once.
+        """
+        
+        output_path = os.path.join(job.work_dir, "single_pass_video.mp4")
+        cmd, _ = self._build_single_pass_command(scenes, specs, brand_config, music_path, output_path)
+        
+        result = await self._run_ffmpeg_command(cmd, job.cancel_token)
+        if result.returncode != 0:
+            stderr = result.stderr.decode(errors="replace")[-500:] if result.stderr else ""
+            raise Exception(f"Single-pass assembly failed: {stderr}")
+        
+        return output_path
+    
+    def _build_single_pass_command(
+        self,
+        scenes: List[VideoScene],
+        specs: VideoSpec,
+        brand_config: Optional[Dict[str, Any]],
+        music_path: Optional[str],
+        output_path: str
+    ) -> Tuple[List[str], str]:
+        """
+        Build the single-pass FFmpeg command
+        
+        Returns:
+            (command, filter_complex) - the graph is returned separately for logging/tests
+        """
+        
+        cmd = ['ffmpeg', '-y']
+        graph = []
+        input_index = 0
+        audio_format = "aformat=sample_rates=44100:channel_layouts=stereo"
+        has_voice = any(scene.audio_path for scene in scenes)
+        has_audio = has_voice or bool(music_path)
+        
+        video_labels = []
+        audio_labels = []
+        for i, scene in enumerate(scenes):
+            duration = float(scene.duration)
+            frames = max(1, int(round(duration * specs.fps)))
+            scene_dict = {
+                "scene_id": scene.scene_id,
+                "duration": duration,
+                "text_overlay": scene.text_overlay,
+                "effects": scene.effects or []
+            }
+            
+            # One still frame in; zoompan emits exactly `frames` frames at the target fps
+            cmd.extend(['-i', scene.image_path])
+            image_input = input_index
+            input_index += 1
+            
+            video_chain = [
+                f"scale={specs.width}:{specs.height}:force_original_aspect_ratio=decrease",
+                f"pad={specs.width}:{specs.height}:(ow-iw)/2:(oh-ih)/2:black",
+                "setsar=1",
+                f"zoompan=z='min(zoom+0.0015,1.3)':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d={frames}:s={specs.width}x{specs.height}:fps={specs.fps}",
+                *self._scene_overlay_filters(scene_dict, specs),
+                "format=yuv420p",
+                "setpts=PTS-STARTPTS"
+            ]
+            graph.append(f"[{image_input}:v]{','.join(video_chain)}[v{i}]")
+            video_labels.append(f"[v{i}]")
+            
+            if has_voice:
+                if scene.audio_path:
+                    cmd.extend(['-i', scene.audio_path])
+                    graph.append(
+                        f"[{input_index}:a]atrim=0:{duration},apad=whole_dur={duration},"
+                        f"asetpts=PTS-STARTPTS,{audio_format}[a{i}]"
+                    )
+                    input_index += 1
+                else:
+                    graph.append(f"anullsrc=r=44100:cl=stereo,atrim=0:{duration},asetpts=PTS-STARTPTS[a{i}]")
+                audio_labels.append(f"[a{i}]")
+        
+        total_duration = sum(float(scene.duration) for scene in scenes)
+        
+        # Join scenes: xfade when every scene asks for a supported transition, else concat (hard cuts).
+        # A transition may take at most half of either scene it joins, so short
+        # scenes get shorter fades and every xfade offset stays positive
+        fades = [
+            min(XFADE_DURATION, float(scenes[i - 1].duration) / 2, float(scenes[i].duration) / 2)
+            for i in range(1, len(scenes))
+        ]
+        use_xfade = (
+            len(scenes) > 1
+            and all(scene.transition_type in XFADE_TRANSITIONS for scene in scenes)
+            and all(fade >= 1 / specs.fps for fade in fades)
+        )
+        if len(scenes) == 1:
+            graph.append(f"{video_labels[0]}null[vjoined]")
+            if has_voice:
+                graph.append(f"{audio_labels[0]}anull[voice]")
+        elif use_xfade:
+            joined_duration = 0.0
+            previous_video, previous_audio = video_labels[0], audio_labels[0] if has_voice else None
+            for i in range(1, len(scenes)):
+                fade = fades[i - 1]
+                joined_duration += float(scenes[i - 1].duration) - (fades[i - 2] if i > 1 else 0.0)
+                offset = joined_duration - fade
+                transition = XFADE_TRANSITIONS[scenes[i].transition_type]
+                video_out = "[vjoined]" if i == len(scenes) - 1 else f"[vx{i}]"
+                graph.append(
+                    f"{previous_video}{video_labels[i]}xfade=transition={transition}:"
+                    f"duration={fade:.3f}:offset={offset:.3f}{video_out}"
+                )
+                previous_video = video_out
+                if has_voice:
+                    audio_out = "[voice]" if i == len(scenes) - 1 else f"[ax{i}]"
+                    graph.append(f"{previous_audio}{audio_labels[i]}acrossfade=d={fade:.3f}{audio_out}")
+                    previous_audio = audio_out
+            total_duration -= sum(fades)
+        else:
+            if has_voice:
+                interleaved = ''.join(f"{v}{a}" for v, a in zip(video_labels, audio_labels))
+                graph.append(f"{interleaved}concat=n={len(scenes)}:v=1:a=1[vjoined][voice]")
+            else:
+                graph.append(f"{''.join(video_labels)}concat=n={len(scenes)}:v=1:a=0[vjoined]")
+        
+        # Background music, ducked under the narration
+        if music_path:
+            cmd.extend(['-stream_loop', '-1', '-i', music_path])
+            music_input = input_index
+            input_index += 1
+            if has_voice:
+                graph.append(f"[voice]asplit=2[voice_mix][voice_sidechain]")
+                graph.append(f"[{music_input}:a]volume=0.2,{audio_format},atrim=0:{total_duration:.3f}[music]")
+                graph.append("[music][voice_sidechain]sidechaincompress=threshold=0.05:ratio=8:attack=20:release=400[ducked]")
+                graph.append("[voice_mix][ducked]amix=inputs=2:duration=first:dropout_transition=0[aout]")
+            else:
+                graph.append(f"[{music_input}:a]volume=0.3,{audio_format},atrim=0:{total_duration:.3f}[aout]")
+        elif has_voice:
+            graph.append("[voice]anull[aout]")
+        
+        # Logo overlay in the top-right corner
+        video_out = "[vjoined]"
+        logo_path = (brand_config or {}).get("logo_url")
+        if logo_path and os.path.exists(logo_path):
+            cmd.extend(['-i', logo_path])
+            graph.append(f"[{input_index}:v]scale=120:120[logo]")
+            graph.append("[vjoined][logo]overlay=W-w-20:20[vbranded]")
+            video_out = "[vbranded]"
+            input_index += 1
+        
+        filter_complex = ';'.join(graph)
+        cmd.extend(['-filter_complex', filter_complex, '-map', video_out])
+        
+        cmd.extend([
+            '-c:v', specs.codec,
+            '-pix_fmt', 'yuv420p',
+            '-r', str(specs.fps),
+            '-b:v', specs.bitrate,
+        ])
+        if has_audio:
+            cmd.extend(['-map', '[aout]', '-c:a', specs.audio_codec, '-b:a', '128k'])
+        else:
+            cmd.append('-an')
+        
+        cmd.extend(['-t', f"{total_duration:.3f}", '-movflags', '+faststart', output_path])
+        return cmd, filter_complex
+    
+    async def _run_ffmpeg_command(
+        self,
+        cmd: List[str],
+        cancel_token: Optional[CancellationToken] = None,
+        use_slot: bool = True
+    ) -> subprocess.CompletedProcess:
         """
         Run FFmpeg command asynchronously
+        
+        Holds one global FFmpeg slot for the lifetime of the process. The
+        process is killed if the task is cancelled or the token fires.
         """
         
+        if not use_slot:
+            return await self._exec_ffmpeg(cmd, cancel_token)
+        
+        async with get_ffmpeg_slots():
+            return await self._exec_ffmpeg(cmd, cancel_token)
+    
+    async def _exec_ffmpeg(
+        self,
+        cmd: List[str],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> subprocess.CompletedProcess:
+        """Spawn one FFmpeg/FFprobe process and wait for it"""
+        
+        if cancel_token:
+            cancel_token.raise_if_cancelled()
+        
         logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
         
         try:
-            result = await asyncio.create_subprocess_exec(
+            process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE
             )
-            stdout, stderr = await result.communicate()
-            
-            return subprocess.CompletedProcess(
-                args=cmd,
-                returncode=result.returncode,
-                stdout=stdout,
-                stderr=stderr
-            )
         except Exception as e:
             logger.error(f"FFmpeg command failed: {e}")
             raise
+        
+        communicate = asyncio.ensure_future(process.communicate())
+        cancel_wait = asyncio.ensure_future(cancel_token.wait()) if cancel_token else None
+        try:
+            if cancel_wait:
+                await asyncio.wait({communicate, cancel_wait}, return_when=asyncio.FIRST_COMPLETED)
+                if not communicate.done():
+                    self._kill_process(process)
+                    await communicate
+                    raise VideoAssemblyCancelled(cancel_token.reason or "cancelled")
+            stdout, stderr = await communicate
+        except asyncio.CancelledError:
+            self._kill_process(process)
+            communicate.cancel()
+            await process.wait()
+            raise
+        finally:
+            if cancel_wait:
+                cancel_wait.cancel()
+        
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=process.returncode,
+            stdout=stdout,
+            stderr=stderr
+        )
+    
+    def _kill_process(self, process: asyncio.subprocess.Process):
+        """Kill a running FFmpeg process, ignoring already-exited ones"""
+        
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
     
     async def _get_video_duration(self, video_path: str) -> float:
         """
@@ -475,7 +982,7 @@ class VideoAssemblyPipeline:
         ]
         
         try:
-            result = await self._run_ffmpeg_command(cmd)
+            result = await self._run_ffmpeg_command(cmd, use_slot=False)
             if result.returncode == 0:
                 return float(result.stdout.decode().strip())
             else:
@@ -496,14 +1003,14 @@ class VideoAssemblyPipeline:
         filename = f"video_{video_type}_{timestamp}.mp4"
         return os.path.join(self.output_dir, filename)
     
-    def _cleanup_temp_files(self):
+    def _cleanup_temp_files(self, work_dir: str):
         """
         Clean up temporary files and directories
         """
         
         try:
-            if os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
+            if os.path.exists(work_dir):
+                shutil.rmtree(work_dir)
                 logger.debug("Temporary files cleaned up")
         except Exception as e:
             logger.warning(f"Failed to cleanup temp files: {e}")
@@ -15,9 +15,11 @@ import asyncio
 import logging
 from typing import Dict, List, Any, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from collections import OrderedDict
 import json
 import hashlib
+import uuid
 from datetime import datetime
 
 # Import our new AI services
@@ -86,6 +88,10 @@ class VideoGenerationOrchestrator:
         self.ai_providers = self._initialize_ai_providers()
         self.generation_queue = []
         
+        # Inputs of recent jobs, kept so single scenes can be regenerated
+        self.generation_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_tracked_jobs = 100
+        
         # Initialize AI services
         self.image_generator = create_ai_image_generator()
         self.voice_generator = create_ai_voice_generator()
@@ -180,6 +186,8 @@ class VideoGenerationOrchestrator:
         5. Add branding and final touches
         """
         
+        job_id = uuid.uuid4().hex
+        
         try:
             logger.info(f"Starting video generation for campaign {request.campaign_id}")
             
@@ -203,8 +211,17 @@ class VideoGenerationOrchestrator:
             final_video = await self._add_branding_and_effects(video_file, request)
             logger.info(f"Added branding and effects: {final_video}")
             
+            self._remember_job(job_id, {
+                "request": request,
+                "scenes": scenes,
+                "visual_assets": visual_assets,
+                "audio_assets": audio_assets,
+                "video_file": video_file
+            })
+            
             return {
                 "success": True,
+                "job_id": job_id,
                 "video_url": final_video,
                 "scenes_count": len(scenes),
                 "duration_seconds": sum(scene.duration_seconds for scene in scenes),
@@ -359,7 +376,7 @@ class VideoGenerationOrchestrator:
             visual_assets = []
             for img in generated_images:
                 visual_assets.append({
-                    "scene_id": img.scene_id.split('_')[0],  # Extract original scene ID
+                    "scene_id": img.scene_id.rsplit('_', 1)[0],  # Strip the prompt index suffix
                     "asset_id": f"img_{img.scene_id}",
                     "file_path": img.local_path,
                     "image_url": img.image_url,
@@ -535,27 +552,108 @@ class VideoGenerationOrchestrator:
             "estimated_completion_minutes": 8
         }
     
+    def _remember_job(self, job_id: str, job: Dict[str, Any]):
+        """Track job inputs for scene regeneration, dropping the oldest jobs"""
+        self.generation_jobs[job_id] = job
+        self.generation_jobs.move_to_end(job_id)
+        while len(self.generation_jobs) > self.max_tracked_jobs:
+            self.generation_jobs.popitem(last=False)
+    
     async def regenerate_scene(
         self, 
         job_id: str, 
         scene_id: str, 
         modifications: Dict[str, Any]
     ) -> Dict[str, Any]:
-        """Regenerate specific scene with modifications"""
+        """
+        Regenerate specific scene with modifications
+        
+        Supported modifications: script_text, text_overlay, duration_seconds,
+        transition_type, visual_prompts, visual_style, plus video-level
+        logo_url and brand_colors. Only the modified scene is re-rendered;
+        the other scene clips come from the assembly pipeline's scene cache.
+        A script_text change also regenerates the voiceover, which is a single
+        narration track over all scenes, so every clip that carries it is
+        re-rendered with the new narration.
+        """
         
         try:
-            # TODO: Implement scene regeneration
-            # This would allow users to:
-            # - Change visual style for specific scenes
-            # - Modify script text
-            # - Adjust timing
-            # - Change visual prompts
+            job = self.generation_jobs.get(job_id)
+            if not job:
+                return {"success": False, "error": f"Unknown video generation job: {job_id}"}
+            
+            scene = next((s for s in job["scenes"] if s.scene_id == scene_id), None)
+            if not scene:
+                return {"success": False, "error": f"Scene {scene_id} not found in job {job_id}"}
+            
+            # Work on copies: the job keeps its previous scenes and assets
+            # unless the new scene is rendered successfully
+            scene = replace(scene)
+            scenes = [scene if s.scene_id == scene_id else s for s in job["scenes"]]
+            request = job["request"]
+            visual_assets = job["visual_assets"]
+            audio_assets = job["audio_assets"]
+            
+            # Scene-level changes
+            for attr in ("script_text", "text_overlay", "duration_seconds", "transition_type"):
+                if attr in modifications:
+                    setattr(scene, attr, modifications[attr])
+            
+            # Video-level changes: branding is applied after concatenation, so scene clips stay valid
+            if "logo_url" in modifications:
+                request = replace(request, logo_url=modifications["logo_url"])
+            if "brand_colors" in modifications:
+                request = replace(request, brand_colors=modifications["brand_colors"])
+            
+            # New visuals when prompts, style or narration text change
+            visual_request = request
+            if "visual_style" in modifications:
+                visual_request = replace(request, visual_style=VisualStyle(modifications["visual_style"]))
             
+            regenerated_assets = []
+            if "visual_prompts" in modifications:
+                scene.visual_prompts = list(modifications["visual_prompts"])
+            elif "visual_style" in modifications or "script_text" in modifications:
+                scene.visual_prompts = await self._create_visual_prompts(
+                    scene.script_text, visual_request.visual_style, request.intelligence_data
+                )
+            
+            if any(key in modifications for key in ("visual_prompts", "visual_style", "script_text")):
+                new_assets = await self._generate_scene_visuals([scene], visual_request)
+                visual_assets = [
+                    asset for asset in visual_assets if asset["scene_id"] != scene_id
+                ] + new_assets
+                regenerated_assets = [asset["file_path"] for asset in new_assets]
+            
+            # The narration is read from the full script; rebuild it from the scenes
+            if "script_text" in modifications:
+                request = replace(
+                    request,
+                    script_content=" ".join(s.script_text.strip() for s in scenes if s.script_text)
+                )
+                audio_assets = await self._generate_voiceover(request)
+                regenerated_assets.append(audio_assets["file_path"])
+            
+            # Re-assemble; unchanged scenes are served from the scene clip cache
+            video_file = await self._assemble_video(scenes, visual_assets, audio_assets, request)
+            final_video = await self._add_branding_and_effects(video_file, request)
+            
+            job.update(
+                scenes=scenes,
+                request=request,
+                visual_assets=visual_assets,
+                audio_assets=audio_assets,
+                video_file=video_file
+            )
+            
+            scene_cache = self.video_assembler.scene_cache
             return {
                 "success": True,
+                "job_id": job_id,
                 "scene_id": scene_id,
-                "regenerated_assets": ["new_visual_1.png", "new_visual_2.png"],
-                "estimated_completion_minutes": 3
+                "video_url": final_video,
+                "regenerated_assets": regenerated_assets,
+                "scene_cache": scene_cache.get_stats() if scene_cache else None
             }
             
         except Exception as e:
@@ -14,12 +14,37 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_async_db
-from src.users.services.auth_service import AuthService
+from src.core.auth.principal_cache import get_principal_cache
+from src.users.services.auth_service import decode_access_token
+from src.users.services.user_service import UserService
 from src.users.models.user import UserRoleEnum
 
 security = HTTPBearer(auto_error=False)
 
 
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _build_principal(user) -> dict:
+    """User dict returned by get_current_user (and stored in the principal cache)"""
+    return {
+        "id": str(user.id),
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "full_name": user.full_name,
+        "role": user.role,
+        "user_type": user.user_type,
+        "company_id": str(user.company_id) if user.company_id else None,
+        "subscription_tier": user.subscription_tier if hasattr(user, 'subscription_tier') else "FREE"
+    }
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     session: AsyncSession = Depends(get_async_db)
@@ -38,35 +63,74 @@ async def get_current_user(
         HTTPException: If authentication fails
     """
     if not credentials:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise _unauthorized("Authentication required")
 
-    auth_service = AuthService(session)
-    user = await auth_service.get_current_user(credentials.credentials)
+    claims = decode_access_token(credentials.credentials)
+    if not claims or not claims.get("sub"):
+        raise _unauthorized("Invalid authentication credentials")
 
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    # Served from the principal cache; the user query only runs on a miss
+    cache = get_principal_cache()
+    user_id, jti = claims["sub"], claims.get("jti")
+    principal = await cache.get(user_id, jti)
+    if principal is not None:
+        return principal
+
+    user = await UserService(session).get_user_by_id(user_id, include_company=True)
+    if not user or not user.is_active:
+        raise _unauthorized("Invalid authentication credentials")
+
+    principal = _build_principal(user)
+    await cache.set(user_id, jti, principal)
+    return principal
+
+
+async def get_current_user_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> dict:
+    """
+    Stateless authentication from the JWT alone.
+
+    For endpoints that only need identity, role or company: no database
+    session and no user lookup. Claims reflect the user at token issue time,
+    so use get_current_user where changes must apply immediately.
+
+    Returns:
+        dict: id, email, role, user_type and company_id from the token
+
+    Raises:
+        HTTPException: If authentication fails
+    """
+    if not credentials:
+        raise _unauthorized("Authentication required")
+
+    claims = decode_access_token(credentials.credentials)
+    if not claims or not claims.get("sub"):
+        raise _unauthorized("Invalid authentication credentials")
 
     return {
-        "id": str(user.id),
-        "email": user.email,
-        "first_name": user.first_name,
-        "last_name": user.last_name,
-        "full_name": user.full_name,
-        "role": user.role,
-        "user_type": user.user_type,
-        "company_id": str(user.company_id) if user.company_id else None,
-        "subscription_tier": user.subscription_tier if hasattr(user, 'subscription_tier') else "FREE"
+        "id": claims["sub"],
+        "email": claims.get("email"),
+        "role": claims.get("role"),
+        "user_type": claims.get("user_type"),
+        "company_id": claims.get("company_id"),
+        "jti": claims.get("jti")
     }
 
 
+async def get_active_user_id(
+    current_user: dict = Depends(get_current_user)
+) -> str:
+    """
+    User id for write and generation endpoints.
+
+    Goes through get_current_user, so deactivated or deleted users are
+    rejected: the principal cache is invalidated when a user changes.
+    Read-only endpoints can use get_current_user_claims instead.
+    """
+    return current_user["id"]
+
+
 async def require_admin(
     current_user: dict = Depends(get_current_user)
 ) -> dict:
@@ -0,0 +1,170 @@
+# =====================================
+# File: src/core/auth/password_hasher.py
+# =====================================
+
+"""
+Password hashing off the event loop.
+
+bcrypt is deliberately slow (hundreds of milliseconds of CPU per hash or
+check). Running it inline on the asyncio loop stalls every other request on
+the worker during a burst of logins, so hashes and checks run in a dedicated
+bounded thread pool. bcrypt releases the GIL while hashing, so threads give
+real parallelism without the pickling overhead of a process pool.
+
+The number of queued plus running operations is capped; past the cap callers
+get a ServiceUnavailableError (503) instead of piling up behind the pool.
+
+Hashes made with a different cost than the configured one are reported by
+``needs_rehash`` so logins can transparently upgrade them.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import bcrypt
+
+from src.core.shared.exceptions import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", 12))
+DEFAULT_MAX_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+DEFAULT_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 64))
+
+
+def _hash_sync(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def _verify_sync(password: str, hashed_password: str) -> bool:
+    try:
+        return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+    except Exception:
+        return False
+
+
+class PasswordHasher:
+    """bcrypt hashing and verification on a bounded thread pool"""
+
+    def __init__(
+        self,
+        rounds: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None
+    ):
+        self.rounds = rounds or DEFAULT_BCRYPT_ROUNDS
+        self.max_workers = max(1, max_workers or DEFAULT_MAX_WORKERS)
+        self.max_pending = max(self.max_workers, max_pending or DEFAULT_MAX_PENDING)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+
+        self._pending = 0
+        self._running = 0
+        self._running_lock = threading.Lock()
+        self._stats = {
+            "hashes": 0,
+            "verifications": 0,
+            "rehashes": 0,
+            "rejected": 0,
+            "wait_seconds": 0.0,
+            "run_seconds": 0.0,
+            "max_wait_seconds": 0.0
+        }
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the configured cost"""
+        hashed = await self._submit(_hash_sync, password, self.rounds)
+        self._stats["hashes"] += 1
+        return hashed
+
+    async def verify(self, password: str, hashed_password: Optional[str]) -> bool:
+        """Check a password against a stored hash; False for missing or malformed hashes"""
+        if not hashed_password:
+            return False
+        valid = await self._submit(_verify_sync, password, hashed_password)
+        self._stats["verifications"] += 1
+        return valid
+
+    def needs_rehash(self, hashed_password: Optional[str]) -> bool:
+        """True when a bcrypt hash was made with a cost other than the configured one"""
+        try:
+            # "$2b$12$<salt+hash>"
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (AttributeError, IndexError, ValueError):
+            return False
+
+    async def rehash_if_needed(self, password: str, hashed_password: Optional[str]) -> Optional[str]:
+        """New hash for a just-verified password if its cost is outdated, else None"""
+        if not self.needs_rehash(hashed_password):
+            return None
+        self._stats["rehashes"] += 1
+        return await self.hash(password)
+
+    async def _submit(self, func: Callable[..., Any], *args) -> Any:
+        if self._pending >= self.max_pending:
+            self._stats["rejected"] += 1
+            logger.warning(f"Password hashing queue full ({self._pending} pending), rejecting request")
+            raise ServiceUnavailableError("Authentication is busy, please retry shortly", service_name="password_hasher")
+
+        queued_at = time.perf_counter()
+        timing = {}
+
+        def run():
+            timing["started"] = time.perf_counter()
+            with self._running_lock:
+                self._running += 1
+            try:
+                return func(*args)
+            finally:
+                with self._running_lock:
+                    self._running -= 1
+                timing["finished"] = time.perf_counter()
+
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, run)
+        finally:
+            self._pending -= 1
+            if "finished" in timing:
+                wait_seconds = timing["started"] - queued_at
+                self._stats["wait_seconds"] += wait_seconds
+                self._stats["run_seconds"] += timing["finished"] - timing["started"]
+                self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], wait_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, throughput and latency counters"""
+        operations = self._stats["hashes"] + self._stats["verifications"]
+        return {
+            "rounds": self.rounds,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "running": self._running,
+            "queued": max(0, self._pending - self._running),
+            "hashes": self._stats["hashes"],
+            "verifications": self._stats["verifications"],
+            "rehashes": self._stats["rehashes"],
+            "rejected": self._stats["rejected"],
+            "avg_wait_ms": round(self._stats["wait_seconds"] / operations * 1000, 2) if operations else 0.0,
+            "avg_run_ms": round(self._stats["run_seconds"] / operations * 1000, 2) if operations else 0.0,
+            "max_wait_ms": round(self._stats["max_wait_seconds"] * 1000, 2)
+        }
+
+    def shutdown(self):
+        """Stop the worker threads"""
+        self._executor.shutdown(wait=False)
+
+
+# Global instance
+_password_hasher = None
+
+def get_password_hasher() -> PasswordHasher:
+    """Get global password hasher instance"""
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher()
+    return _password_hasher
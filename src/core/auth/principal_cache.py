@@ -0,0 +1,178 @@
+# =====================================
+# File: src/core/auth/principal_cache.py
+# =====================================
+
+"""
+Principal cache for authenticated requests.
+
+Caches the user dict built by get_current_user so authenticated calls do not
+run a user + company query each time. Entries are keyed by user id and token
+jti, live for a short TTL, and are held in a bounded in-process LRU with an
+optional Redis tier shared between workers.
+
+UserService invalidates a user's entries whenever profile, type, role or
+active state change. Other workers' in-process entries expire within the
+local TTL, which is kept short when Redis is enabled.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple, Union
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # redis is optional
+    redis_asyncio = None
+
+REDIS_KEY_PREFIX = "principal"
+
+
+class PrincipalCache:
+    """Bounded TTL cache of authenticated principals"""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        redis_url: Optional[str] = None
+    ):
+        self.max_entries = max_entries or int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", 10000))
+        self.ttl_seconds = ttl_seconds or float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", 30))
+
+        self._redis = None
+        if redis_url and redis_asyncio is not None:
+            self._redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+        # With a shared tier, local copies only smooth out bursts
+        self.local_ttl_seconds = min(self.ttl_seconds, 5.0) if self._redis else self.ttl_seconds
+
+        # (user_id, jti) -> (expires_at, principal), least recently used first
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._user_index: Dict[str, Set[Tuple[str, str]]] = {}
+        self._stats = {"hits": 0, "redis_hits": 0, "misses": 0, "invalidations": 0, "evictions": 0, "redis_errors": 0}
+
+    @staticmethod
+    def _key(user_id: Union[str, UUID], jti: Optional[str]) -> Tuple[str, str]:
+        return str(user_id), jti or "-"
+
+    async def get(self, user_id: Union[str, UUID], jti: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Cached principal for a user/token, or None"""
+
+        key = self._key(user_id, jti)
+        entry = self._entries.get(key)
+        if entry:
+            expires_at, principal = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return dict(principal)
+            self._drop(key)
+
+        if self._redis is not None:
+            try:
+                cached = await self._redis.hget(f"{REDIS_KEY_PREFIX}:{key[0]}", key[1])
+            except Exception as e:
+                self._stats["redis_errors"] += 1
+                logger.warning(f"Principal cache Redis read failed: {e}")
+                cached = None
+            if cached:
+                principal = json.loads(cached)
+                self._store_local(key, principal)
+                self._stats["redis_hits"] += 1
+                return dict(principal)
+
+        self._stats["misses"] += 1
+        return None
+
+    async def set(self, user_id: Union[str, UUID], jti: Optional[str], principal: Dict[str, Any]):
+        """Cache a principal for a user/token"""
+
+        key = self._key(user_id, jti)
+        self._store_local(key, principal)
+
+        if self._redis is not None:
+            redis_key = f"{REDIS_KEY_PREFIX}:{key[0]}"
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.hset(redis_key, key[1], json.dumps(principal, default=str))
+                    pipe.expire(redis_key, int(self.ttl_seconds))
+                    await pipe.execute()
+            except Exception as e:
+                self._stats["redis_errors"] += 1
+                logger.warning(f"Principal cache Redis write failed: {e}")
+
+    async def invalidate(self, user_id: Union[str, UUID]):
+        """Drop every cached principal of a user (all tokens)"""
+
+        user_key = str(user_id)
+        for key in list(self._user_index.get(user_key, ())):
+            self._drop(key)
+        self._stats["invalidations"] += 1
+
+        if self._redis is not None:
+            try:
+                await self._redis.delete(f"{REDIS_KEY_PREFIX}:{user_key}")
+            except Exception as e:
+                self._stats["redis_errors"] += 1
+                logger.warning(f"Principal cache Redis invalidation failed for {user_key}: {e}")
+
+    def clear(self):
+        """Drop all in-process entries"""
+        self._entries.clear()
+        self._user_index.clear()
+
+    def _store_local(self, key: Tuple[str, str], principal: Dict[str, Any]):
+        self._entries[key] = (time.monotonic() + self.local_ttl_seconds, dict(principal))
+        self._entries.move_to_end(key)
+        self._user_index.setdefault(key[0], set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self._stats["evictions"] += 1
+
+    def _drop(self, key: Tuple[str, str]):
+        self._entries.pop(key, None)
+        keys = self._user_index.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._user_index[key[0]]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size"""
+        lookups = self._stats["hits"] + self._stats["redis_hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round((self._stats["hits"] + self._stats["redis_hits"]) / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "redis_enabled": self._redis is not None
+        }
+
+
+# Global instance
+_principal_cache = None
+
+def get_principal_cache() -> PrincipalCache:
+    """Get global principal cache instance (Redis tier when PRINCIPAL_CACHE_REDIS is enabled)"""
+    global _principal_cache
+    if _principal_cache is None:
+        redis_url = None
+        if os.getenv("PRINCIPAL_CACHE_REDIS", "false").lower() in ("1", "true", "yes"):
+            from src.core.config.settings import get_redis_url
+            redis_url = get_redis_url()
+        _principal_cache = PrincipalCache(redis_url=redis_url)
+    return _principal_cache
+
+async def invalidate_principal(user_id: Union[str, UUID]):
+    """Invalidate a user's cached principals; never raises"""
+    try:
+        await get_principal_cache().invalidate(user_id)
+    except Exception as e:
+        logger.warning(f"Principal cache invalidation failed for {user_id}: {e}")
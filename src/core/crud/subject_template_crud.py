@@ -8,7 +8,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, func
 from sqlalchemy.orm import selectinload
 from src.core.crud.base_crud import BaseCRUD
+from src.core.shared.decorators import get_result_cache
 from src.intelligence.models.email_subject_templates import EmailSubjectTemplate, EmailSubjectPerformance, SubjectLineCategory, PerformanceLevel
+from src.intelligence.utils.subject_similarity_index import get_subject_similarity_index
+
+# cache_result namespace of active template lookups (see DatabaseDrivenContentService)
+EMAIL_TEMPLATE_CACHE = "email_subject_templates"
+
+
+async def invalidate_template_cache():
+    """Drop cached template lookups so new templates are picked up immediately"""
+    cache = get_result_cache(EMAIL_TEMPLATE_CACHE)
+    if cache:
+        await cache.clear()
+
 
 class SubjectTemplateCRUD(BaseCRUD[EmailSubjectTemplate]):
     """CRUD operations for email subject templates"""
@@ -16,6 +29,16 @@ class SubjectTemplateCRUD(BaseCRUD[EmailSubjectTemplate]):
     def __init__(self):
         super().__init__(EmailSubjectTemplate)
     
+    async def create(self, db: AsyncSession, obj_in: Dict[str, Any]) -> EmailSubjectTemplate:
+        """Create template, index it for duplicate checks and invalidate cached template lookups"""
+        similarity_index = get_subject_similarity_index()
+        if not obj_in.get("minhash_signature"):
+            obj_in = {**obj_in, "minhash_signature": similarity_index.signature_bytes(obj_in["template_text"])}
+        template = await super().create(db=db, obj_in=obj_in)
+        similarity_index.add(template.id, template.template_text)
+        await invalidate_template_cache()
+        return template
+    
     async def get_templates_by_category(
         self, 
         db: AsyncSession, 
@@ -101,6 +124,7 @@ class SubjectTemplateCRUD(BaseCRUD[EmailSubjectTemplate]):
     ) -> List[EmailSubjectTemplate]:
         """Add multiple templates at once"""
         
+        similarity_index = get_subject_similarity_index()
         templates = []
         for data in templates_data:
             template = EmailSubjectTemplate(
@@ -110,6 +134,7 @@ class SubjectTemplateCRUD(BaseCRUD[EmailSubjectTemplate]):
                 psychology_triggers=data.get("psychology_triggers", []),
                 keywords=data.get("keywords", []),
                 character_count=len(data["template_text"]),
+                minhash_signature=similarity_index.signature_bytes(data["template_text"]),
                 source=data.get("source", "initial_load"),
                 is_verified=data.get("is_verified", False)
             )
@@ -120,7 +145,9 @@ class SubjectTemplateCRUD(BaseCRUD[EmailSubjectTemplate]):
         
         for template in templates:
             await db.refresh(template)
+            similarity_index.add(template.id, template.template_text)
         
+        await invalidate_template_cache()
         return templates
 
 class SubjectPerformanceCRUD(BaseCRUD[EmailSubjectPerformance]):
@@ -0,0 +1,105 @@
+# src/core/database/search.py
+"""
+Text search conditions and relevance ranking for search endpoints.
+
+``ILIKE '%term%'`` cannot use a b-tree index. Migration 011 adds pg_trgm
+GIN indexes (``gin_trgm_ops``) on the searched columns. With those
+indexes, PostgreSQL serves both of these from the index:
+
+- the substring match
+- a trigram word-similarity match (``term <% column``), which also finds
+  misspelt terms
+
+Results are ranked by ``word_similarity``.
+
+When pg_trgm is not installed, or on SQLite test runs, the same builder
+falls back to a case-insensitive substring match and ranks prefix matches
+first.
+
+Usage:
+    search = await text_search(session, term, Campaign.name, Campaign.description)
+    query = select(Campaign).where(search.condition).order_by(search.rank.desc())
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict
+
+from sqlalchemy import case, func, literal, or_, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+logger = logging.getLogger(__name__)
+
+LIKE_ESCAPE = "\\"
+# Shorter terms contain no complete trigram, so similarity cannot match them
+MIN_TRIGRAM_TERM_LENGTH = 3
+
+# Engine URL -> whether pg_trgm is installed, checked once per engine
+_trigram_support: Dict[str, bool] = {}
+
+
+@dataclass
+class TextSearch:
+    """WHERE condition and relevance score (higher is better) for one search term"""
+    condition: ColumnElement
+    rank: ColumnElement
+
+
+def escape_like(term: str) -> str:
+    """``term`` with LIKE wildcards escaped for ``escape=LIKE_ESCAPE``"""
+    return (
+        term.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", LIKE_ESCAPE + "%")
+        .replace("_", LIKE_ESCAPE + "_")
+    )
+
+
+def build_text_search(term: str, *columns: ColumnElement, trigram: bool = False) -> TextSearch:
+    """
+    Match ``term`` against any of ``columns``
+
+    Args:
+        term: Search term as typed by the user
+        columns: Text columns to search
+        trigram: Use pg_trgm similarity matching and ranking (PostgreSQL
+            with the extension installed)
+    """
+    term = term.strip()
+    escaped = escape_like(term)
+    contains = [column.ilike(f"%{escaped}%", escape=LIKE_ESCAPE) for column in columns]
+
+    if trigram and len(term) >= MIN_TRIGRAM_TERM_LENGTH:
+        # term <% column: word_similarity(term, column) is above
+        # pg_trgm.word_similarity_threshold (0.6 by default)
+        similar = [literal(term).op("<%", is_comparison=True)(column) for column in columns]
+        scores = [func.coalesce(func.word_similarity(term, column), 0.0) for column in columns]
+        rank = scores[0] if len(scores) == 1 else func.greatest(*scores)
+        return TextSearch(condition=or_(*contains, *similar), rank=rank)
+
+    prefix = [column.ilike(f"{escaped}%", escape=LIKE_ESCAPE) for column in columns]
+    return TextSearch(condition=or_(*contains), rank=case((or_(*prefix), 1.0), else_=0.0))
+
+
+async def trigram_search_available(session: AsyncSession) -> bool:
+    """Whether the session's database is PostgreSQL with pg_trgm installed"""
+    bind = session.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+
+    key = bind.engine.url.render_as_string(hide_password=True)
+    if key not in _trigram_support:
+        try:
+            result = await session.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+        except Exception as e:
+            logger.warning(f"⚠️ Could not check for pg_trgm, using substring search: {e}")
+            return False
+        _trigram_support[key] = result.scalar() is not None
+        if not _trigram_support[key]:
+            logger.warning("⚠️ pg_trgm is not installed (run migration 011); search falls back to substring matching")
+    return _trigram_support[key]
+
+
+async def text_search(session: AsyncSession, term: str, *columns: ColumnElement) -> TextSearch:
+    """``build_text_search`` with trigram matching wherever the database supports it"""
+    return build_text_search(term, *columns, trigram=await trigram_search_available(session))
@@ -10,11 +10,25 @@ capabilities for Railway deployment.
 """
 
 from src.core.health.health_checks import HealthChecker, get_health_status
-from src.core.health.metrics import MetricsCollector, get_system_metrics
+from src.core.health.metrics import (
+    MetricsCollector,
+    get_system_metrics,
+    initialize_health_checks,
+    metrics_access_allowed,
+    render_prometheus_metrics,
+    shutdown_health_checks,
+)
+from src.core.health.prometheus import CONTENT_TYPE as PROMETHEUS_CONTENT_TYPE, get_metrics_registry
 
 __all__ = [
     "HealthChecker",
     "get_health_status",
     "MetricsCollector",
     "get_system_metrics",
+    "initialize_health_checks",
+    "metrics_access_allowed",
+    "render_prometheus_metrics",
+    "shutdown_health_checks",
+    "PROMETHEUS_CONTENT_TYPE",
+    "get_metrics_registry",
 ]
\ No newline at end of file
@@ -7,73 +7,219 @@ System metrics collection for CampaignForge.
 
 Provides performance monitoring and usage statistics
 for Railway deployment monitoring.
+
+System gauges are refreshed by a background sampler; requests and /metrics
+scrapes only read the latest sample. Request, cache and AI provider metrics
+are labelled counters and histograms in the shared registry
+(src.core.health.prometheus).
 """
 
+import hmac
+import ipaddress
+import os
+import threading
 import psutil
 import time
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
 from fastapi import FastAPI
 
+from src.core.health.prometheus import get_metrics_registry
+
 logger = logging.getLogger(__name__)
 
+# How often the background sampler refreshes the system gauges
+SAMPLE_INTERVAL_SECONDS = float(os.getenv("METRICS_SAMPLE_INTERVAL", 15))
+# Bearer token for /metrics; without one only direct private-network clients may scrape
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+registry = get_metrics_registry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "HTTP requests by route template, method and status", ("route", "method", "status")
+)
+HTTP_ERRORS = registry.counter(
+    "http_request_errors_total", "HTTP requests answered with a 5xx status", ("route", "method")
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("route", "method")
+)
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total", "Cache lookups by cache name and result (hit/miss)", ("cache", "result")
+)
+AI_PROVIDER_REQUESTS = registry.counter(
+    "ai_provider_requests_total", "AI provider calls by provider and outcome", ("provider", "outcome")
+)
+AI_PROVIDER_DURATION = registry.histogram(
+    "ai_provider_request_duration_seconds", "AI provider call latency", ("provider",)
+)
+
+SYSTEM_CPU_PERCENT = registry.gauge("system_cpu_percent", "Host CPU utilisation since the previous sample")
+SYSTEM_MEMORY_USED = registry.gauge("system_memory_used_bytes", "Host memory in use")
+SYSTEM_MEMORY_PERCENT = registry.gauge("system_memory_percent", "Host memory utilisation")
+SYSTEM_DISK_USED = registry.gauge("system_disk_used_bytes", "Root filesystem space in use")
+SYSTEM_DISK_PERCENT = registry.gauge("system_disk_percent", "Root filesystem utilisation")
+PROCESS_CPU_PERCENT = registry.gauge("process_cpu_percent", "Process CPU utilisation since the previous sample")
+PROCESS_MEMORY = registry.gauge("process_resident_memory_bytes", "Process resident memory")
+PROCESS_THREADS = registry.gauge("process_threads", "Process thread count")
+PROCESS_CONNECTIONS = registry.gauge("process_open_connections", "Process open network connections")
+PROCESS_UPTIME = registry.gauge("process_uptime_seconds", "Seconds since the metrics collector started")
+SAMPLE_TIMESTAMP = registry.gauge("system_metrics_sample_timestamp_seconds", "Unix time of the last system sample")
+
+
+class SystemMetricsSampler:
+    """
+    Refreshes the system gauges every ``interval`` seconds in a daemon thread.
+
+    psutil's interval-less cpu_percent() reports utilisation since the
+    previous call, so each sample covers the whole interval and readers
+    never wait on a measurement.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self._process = psutil.Process()
+        self._latest: Dict[str, Any] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # Prime the CPU counters; their first reading is always 0.0
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
+
+    def sample(self) -> Dict[str, Any]:
+        """Take one sample and publish it to the gauges"""
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        process = self._process
+        # net_connections() replaces connections() in psutil 6
+        connections = getattr(process, "net_connections", None) or process.connections
+        sampled_at = time.time()
+
+        snapshot = {
+            "sampled_at": sampled_at,
+            "cpu": {
+                "percent": psutil.cpu_percent(interval=None),
+                "count": psutil.cpu_count(),
+            },
+            "memory": {
+                "total_bytes": memory.total,
+                "available_bytes": memory.available,
+                "used_bytes": memory.used,
+                "percent": memory.percent,
+            },
+            "disk": {
+                "total_bytes": disk.total,
+                "free_bytes": disk.free,
+                "used_bytes": disk.used,
+                "percent": (disk.used / disk.total) * 100,
+            },
+            "process": {
+                "cpu_percent": process.cpu_percent(interval=None),
+                "memory_bytes": process.memory_info().rss,
+                "threads": process.num_threads(),
+                "connections": len(connections()),
+            },
+        }
+
+        SYSTEM_CPU_PERCENT.set(snapshot["cpu"]["percent"])
+        SYSTEM_MEMORY_USED.set(memory.used)
+        SYSTEM_MEMORY_PERCENT.set(memory.percent)
+        SYSTEM_DISK_USED.set(disk.used)
+        SYSTEM_DISK_PERCENT.set(snapshot["disk"]["percent"])
+        PROCESS_CPU_PERCENT.set(snapshot["process"]["cpu_percent"])
+        PROCESS_MEMORY.set(snapshot["process"]["memory_bytes"])
+        PROCESS_THREADS.set(snapshot["process"]["threads"])
+        PROCESS_CONNECTIONS.set(snapshot["process"]["connections"])
+        SAMPLE_TIMESTAMP.set(sampled_at)
+
+        self._latest = snapshot
+        return snapshot
+
+    def latest(self) -> Dict[str, Any]:
+        """Most recent sample (taken now if the sampler has not run yet)"""
+        return self._latest or self.sample()
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="system-metrics-sampler", daemon=True)
+        self._thread.start()
+        logger.info(f"System metrics sampler started ({self.interval}s interval)")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self):
+        while True:
+            try:
+                self.sample()
+            except Exception as e:
+                logger.error(f"Failed to sample system metrics: {e}")
+            if self._stop.wait(self.interval):
+                return
+
+
+def _result_cache_families() -> List[tuple]:
+    """cache_result / ResultCache statistics, read at scrape time"""
+    from src.core.shared.decorators import get_cache_stats
+
+    events = []
+    entries = []
+    for name, stats in get_cache_stats().items():
+        for event in ("hits", "stale_hits", "remote_hits", "misses", "coalesced", "refreshes", "evictions", "expirations", "errors"):
+            events.append(({"cache": name, "event": event}, stats.get(event, 0)))
+        entries.append(({"cache": name}, stats.get("entries", 0)))
+    return [
+        ("result_cache_events_total", "counter", "ResultCache lookups and maintenance events by cache name", events),
+        ("result_cache_entries", "gauge", "Entries held in the in-process ResultCache", entries),
+    ]
+
+
+registry.register_collector(_result_cache_families)
+
+
 class MetricsCollector:
     """System metrics collection and monitoring."""
     
-    def __init__(self):
+    def __init__(self, sampler: Optional[SystemMetricsSampler] = None):
         self.start_time = time.time()
-        self._cache_hits = 0
-        self._cache_misses = 0
-        self._request_count = 0
-        self._error_count = 0
+        self._sampler = sampler
+    
+    @property
+    def sampler(self) -> SystemMetricsSampler:
+        if self._sampler is None:
+            self._sampler = SystemMetricsSampler()
+        return self._sampler
+    
+    def start_sampler(self):
+        """Start refreshing system metrics in the background."""
+        self.sampler.start()
+    
+    def stop_sampler(self):
+        """Stop the background sampler."""
+        if self._sampler is not None:
+            self._sampler.stop()
     
     def get_system_metrics(self) -> Dict[str, Any]:
         """
-        Collect comprehensive system metrics.
+        Latest system metrics from the background sampler.
         
         Returns:
             Dict[str, Any]: System performance metrics
         """
         try:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
-            
-            # Memory metrics
-            memory = psutil.virtual_memory()
-            
-            # Disk metrics
-            disk = psutil.disk_usage('/')
-            
-            # Process metrics
-            process = psutil.Process()
-            
+            snapshot = dict(self.sampler.latest())
+            sampled_at = snapshot.pop("sampled_at")
             return {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcfromtimestamp(sampled_at).isoformat(),
+                "sample_age_seconds": round(time.time() - sampled_at, 3),
                 "uptime_seconds": time.time() - self.start_time,
-                "cpu": {
-                    "percent": cpu_percent,
-                    "count": cpu_count,
-                },
-                "memory": {
-                    "total_bytes": memory.total,
-                    "available_bytes": memory.available,
-                    "used_bytes": memory.used,
-                    "percent": memory.percent,
-                },
-                "disk": {
-                    "total_bytes": disk.total,
-                    "free_bytes": disk.free,
-                    "used_bytes": disk.used,
-                    "percent": (disk.used / disk.total) * 100,
-                },
-                "process": {
-                    "cpu_percent": process.cpu_percent(),
-                    "memory_bytes": process.memory_info().rss,
-                    "threads": process.num_threads(),
-                    "connections": len(process.connections()),
-                },
+                **snapshot,
             }
         except Exception as e:
             logger.error(f"Failed to collect system metrics: {e}")
@@ -89,44 +235,78 @@ class MetricsCollector:
         Returns:
             Dict[str, Any]: Application performance metrics
         """
+        cache_hits = sum(value for (_, result), value in CACHE_REQUESTS.samples() if result == "hit")
+        cache_misses = sum(value for (_, result), value in CACHE_REQUESTS.samples() if result == "miss")
+        request_count = HTTP_REQUESTS.total()
+        error_count = HTTP_ERRORS.total()
+        
         cache_hit_rate = 0
-        if self._cache_hits + self._cache_misses > 0:
-            cache_hit_rate = self._cache_hits / (self._cache_hits + self._cache_misses)
+        if cache_hits + cache_misses > 0:
+            cache_hit_rate = cache_hits / (cache_hits + cache_misses)
         
         error_rate = 0
-        if self._request_count > 0:
-            error_rate = self._error_count / self._request_count
+        if request_count > 0:
+            error_rate = error_count / request_count
         
         return {
             "timestamp": datetime.utcnow().isoformat(),
             "uptime_seconds": time.time() - self.start_time,
             "cache_stats": {
-                "hits": self._cache_hits,
-                "misses": self._cache_misses,
+                "hits": cache_hits,
+                "misses": cache_misses,
                 "hit_rate": cache_hit_rate,
             },
             "request_stats": {
-                "total_requests": self._request_count,
-                "total_errors": self._error_count,
+                "total_requests": request_count,
+                "total_errors": error_count,
                 "error_rate": error_rate,
             },
+            "password_hashing": self._get_password_hashing_stats(),
+            "result_caches": self._get_result_cache_stats(),
         }
     
-    def record_cache_hit(self):
+    def _get_result_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction metrics of cache_result caches."""
+        from src.core.shared.decorators import get_cache_stats
+        return get_cache_stats()
+    
+    def _get_password_hashing_stats(self) -> Dict[str, Any]:
+        """Queue metrics of the password hashing pool."""
+        try:
+            from src.core.auth.password_hasher import get_password_hasher
+            return get_password_hasher().get_stats()
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def record_cache_hit(self, cache: str = "default"):
         """Record a cache hit."""
-        self._cache_hits += 1
+        CACHE_REQUESTS.inc(cache=cache, result="hit")
     
-    def record_cache_miss(self):
+    def record_cache_miss(self, cache: str = "default"):
         """Record a cache miss."""
-        self._cache_misses += 1
+        CACHE_REQUESTS.inc(cache=cache, result="miss")
     
-    def record_request(self):
+    def record_request(self, route: str = "unmatched", method: str = "GET", status: int = 200, duration: Optional[float] = None):
         """Record an API request."""
-        self._request_count += 1
+        HTTP_REQUESTS.inc(route=route, method=method, status=status)
+        if duration is not None:
+            HTTP_REQUEST_DURATION.observe(duration, route=route, method=method)
+        if status >= 500:
+            self.record_error(route, method)
     
-    def record_error(self):
+    def record_error(self, route: str = "unmatched", method: str = "GET"):
         """Record an error."""
-        self._error_count += 1
+        HTTP_ERRORS.inc(route=route, method=method)
+    
+    def record_provider_call(self, provider: str, outcome: str, duration: float):
+        """Record an AI provider call."""
+        AI_PROVIDER_REQUESTS.inc(provider=provider, outcome=outcome)
+        AI_PROVIDER_DURATION.observe(duration, provider=provider)
+    
+    def render_prometheus(self) -> str:
+        """All registered metrics in Prometheus text format."""
+        PROCESS_UPTIME.set(time.time() - self.start_time)
+        return registry.render()
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """
@@ -189,8 +369,8 @@ def initialize_health_checks(app: FastAPI) -> None:
         app.state.metrics_collector = metrics_collector
         logger.info("MetricsCollector attached to FastAPI app state")
         
-        # Optionally initialize any background tasks for metrics collection
-        # (e.g., periodic metrics refresh, if needed in the future)
+        # Refresh system metrics in the background so requests never sample
+        metrics_collector.start_sampler()
         logger.info("Health checks initialization completed")
     except Exception as e:
         logger.error(f"Failed to initialize health checks: {e}")
@@ -227,21 +407,66 @@ def get_performance_summary() -> Dict[str, Any]:
     return metrics_collector.get_performance_summary()
 
 
-def record_cache_hit():
+def render_prometheus_metrics() -> str:
+    """
+    Get all metrics in Prometheus text exposition format.
+    
+    Returns:
+        str: Metrics for a /metrics scrape
+    """
+    return metrics_collector.render_prometheus()
+
+
+def metrics_access_allowed(
+    client_host: Optional[str],
+    authorization: Optional[str],
+    forwarded_for: Optional[str],
+    token: Optional[str] = None
+) -> bool:
+    """
+    Whether a /metrics request may be served.
+
+    With METRICS_TOKEN set the request must carry it as a bearer token.
+    Otherwise the client must be on a loopback or private address and not
+    have come through the public proxy (which adds X-Forwarded-For).
+    """
+    token = METRICS_TOKEN if token is None else token
+    if token:
+        return hmac.compare_digest((authorization or "").encode(), f"Bearer {token}".encode())
+    if forwarded_for or not client_host:
+        return False
+    try:
+        address = ipaddress.ip_address(client_host)
+    except ValueError:
+        return False
+    return address.is_loopback or address.is_private
+
+
+def shutdown_health_checks() -> None:
+    """Stop the background system metrics sampler."""
+    metrics_collector.stop_sampler()
+
+
+def record_cache_hit(cache: str = "default"):
     """Record a cache hit for metrics."""
-    metrics_collector.record_cache_hit()
+    metrics_collector.record_cache_hit(cache)
 
 
-def record_cache_miss():
+def record_cache_miss(cache: str = "default"):
     """Record a cache miss for metrics."""
-    metrics_collector.record_cache_miss()
+    metrics_collector.record_cache_miss(cache)
 
 
-def record_request():
+def record_request(route: str = "unmatched", method: str = "GET", status: int = 200, duration: Optional[float] = None):
     """Record an API request for metrics."""
-    metrics_collector.record_request()
+    metrics_collector.record_request(route, method, status, duration)
 
 
-def record_error():
+def record_error(route: str = "unmatched", method: str = "GET"):
     """Record an error for metrics."""
-    metrics_collector.record_error()
\ No newline at end of file
+    metrics_collector.record_error(route, method)
+
+
+def record_provider_call(provider: str, outcome: str, duration: float):
+    """Record an AI provider call for metrics."""
+    metrics_collector.record_provider_call(provider, outcome, duration)
\ No newline at end of file
@@ -5,7 +5,7 @@
 """
 Middleware components for CampaignForge Core Infrastructure.
 
-Provides authentication, CORS, rate limiting, and error handling
+Provides authentication, CORS, rate limiting, error handling and metrics
 middleware for the FastAPI application.
 """
 
@@ -13,6 +13,7 @@ from src.users.middleware.auth_middleware import AuthMiddleware
 
 from src.core.middleware.rate_limiting import RateLimitMiddleware
 from src.core.middleware.error_handling import ErrorHandlingMiddleware
+from src.core.middleware.metrics import MetricsMiddleware
 
 from src.core.middleware.cors_middleware import setup_cors
 
@@ -21,4 +22,5 @@ __all__ = [
     "setup_cors",
     "RateLimitMiddleware", 
     "ErrorHandlingMiddleware",
+    "MetricsMiddleware",
 ]
\ No newline at end of file
@@ -5,6 +5,11 @@
 """
 CORS middleware configuration for CampaignForge.
 Handles Cross-Origin Resource Sharing for Vercel frontend integration.
+
+Starlette's CORSMiddleware is already a pure ASGI middleware, like the
+rate limiting and error handling layers, so it adds no per-request task or
+response buffering. Preflight responses are cacheable by browsers for
+max_age seconds.
 """
 
 from fastapi import FastAPI
@@ -25,7 +30,8 @@ def setup_cors(app: FastAPI) -> None:
         allow_credentials=cors_config["allow_credentials"],
         allow_methods=cors_config["allow_methods"],
         allow_headers=cors_config["allow_headers"],
-        expose_headers=["X-Total-Count", "X-Page-Count"],
+        expose_headers=["X-Total-Count", "X-Page-Count", "X-RateLimit-Limit", "X-RateLimit-Remaining", "X-RateLimit-Reset", "Retry-After"],
+        max_age=600,
     )
     
     logger.info(f"CORS configured with origins: {cors_config['allow_origins']}")
\ No newline at end of file
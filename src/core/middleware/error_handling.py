@@ -7,12 +7,14 @@ Global error handling middleware for CampaignForge.
 
 Provides consistent error responses and logging across
 all API endpoints.
+
+Implemented as a pure ASGI middleware rather than BaseHTTPMiddleware, so
+response bodies (including streaming responses) pass straight through.
 """
 
-from fastapi import Request, HTTPException
+from fastapi import HTTPException
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import logging
 from datetime import datetime
 # from typing import Union
@@ -23,30 +25,46 @@ from src.core.shared.responses import ErrorResponse
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """Global error handling middleware."""
-    
-    async def dispatch(self, request: Request, call_next) -> Response:
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with global error handling.
-        
+
         Args:
-            request: HTTP request
-            call_next: Next middleware/endpoint
-            
-        Returns:
-            Response: HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_tracking_start)
         except HTTPException as e:
             # FastAPI HTTP exceptions - pass through
-            logger.info(f"HTTP {e.status_code}: {e.detail} - {request.method} {request.url}")
+            logger.info(f"HTTP {e.status_code}: {e.detail} - {scope['method']} {scope['path']}")
             raise
         except CampaignForgeException as e:
             # Custom application exceptions
             logger.error(f"Application error: {e.error_code} - {e.message}")
-            return JSONResponse(
+            if response_started:
+                # Headers are already sent; nothing sensible left to respond with
+                raise
+            response = JSONResponse(
                 status_code=e.status_code,
                 content={
                     "success": False,
@@ -56,14 +74,18 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
                     "timestamp": datetime.utcnow().isoformat()
                 }
             )
+            await response(scope, receive, send)
         except Exception as e:
             # Unexpected exceptions
             logger.exception(f"Unexpected error: {str(e)}")
-            return JSONResponse(
+            if response_started:
+                raise
+            response = JSONResponse(
                 status_code=500,
                 content=ErrorResponse(
                     message="An unexpected error occurred",
                     error_code="INTERNAL_SERVER_ERROR",
                     details={"error_type": type(e).__name__}
-                ).model_dump()
-            )
\ No newline at end of file
+                ).model_dump(mode="json")
+            )
+            await response(scope, receive, send)
@@ -0,0 +1,55 @@
+# =====================================
+# File: src/core/middleware/metrics.py
+# =====================================
+
+"""
+Request metrics middleware for CampaignForge.
+
+Counts requests and observes their latency per route template (e.g.
+``/api/campaigns/{campaign_id}``, never the raw path, to keep label
+cardinality bounded), method and status.
+
+Implemented as a pure ASGI middleware, like the other core middleware, so
+responses stream through untouched.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.health.metrics import metrics_collector
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """Record per-route request counts and latency."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the (shared) scope
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            metrics_collector.record_request(
+                route=route,
+                method=scope["method"],
+                status=status_code,
+                duration=time.perf_counter() - started
+            )
@@ -5,81 +5,348 @@
 """
 Rate limiting middleware for CampaignForge.
 
-Provides basic rate limiting functionality to prevent abuse
-and protect against excessive API usage.
+Uses GCRA (generic cell rate algorithm): each key stores a single "theoretical
+arrival time", so state is O(1) per client and a check is one read and one
+write. A quota of N calls per period allows bursts of up to N and then one
+call every period / N.
+
+Backends:
+    memory: bounded in-process LRU (per worker)
+    redis:  Lua script, shared by every worker and instance
+
+Clients are keyed by user (JWT subject), API key (only keys listed in
+RATE_LIMIT_API_KEYS) or IP, within route groups that carry their own quotas. Authenticated users get quotas scaled by their
+subscription tier.
+
+Implemented as a pure ASGI middleware: allowed requests pass through with the
+headers appended to the response start message, so streaming responses are
+not buffered and no extra task is spawned per request.
 """
 
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
-import time
-from typing import Dict, List
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Collection, Dict, Mapping, Optional, Sequence, Tuple
+import hashlib
 import logging
+import math
+import os
+import time
 
-# from src.core.config.deployment import deployment_config
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # redis is optional
+    redis_asyncio = None
 
 logger = logging.getLogger(__name__)
 
+EXEMPT_PATH_PREFIXES = ("/health", "/metrics")
+
+# Quota multipliers applied to tier-scaled route groups
+TIER_MULTIPLIERS = {
+    "FREE": 1,
+    "BASIC": 3,
+    "PRO": 10,
+    "ENTERPRISE": 50,
+}
+DEFAULT_TIER = "FREE"
+
+
+def _api_key_digest(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode()).hexdigest()[:32]
+
+
+# Issued API keys (comma-separated); any other X-API-Key value is limited by IP
+API_KEY_DIGESTS = frozenset(
+    _api_key_digest(key.strip()) for key in os.getenv("RATE_LIMIT_API_KEYS", "").split(",") if key.strip()
+)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """``calls`` requests per ``period`` seconds"""
+    calls: int
+    period: float
+
+    @property
+    def emission_interval(self) -> float:
+        return self.period / self.calls
+
+
+@dataclass(frozen=True)
+class RouteGroup:
+    """Paths sharing a quota; ``tier_scaled`` groups multiply it by the caller's tier"""
+    name: str
+    prefixes: Tuple[str, ...]
+    limit: RateLimit
+    tier_scaled: bool = True
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_after: float
+    retry_after: float = 0.0
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+
+def default_route_groups(calls: int = 100, period: int = 60) -> Sequence[RouteGroup]:
     """
-    Simple in-memory rate limiting middleware.
-    
-    Note: In production, consider using Redis for distributed rate limiting.
+    Route groups derived from the base (free tier, default group) quota
+
+    A single catch-all group keeps the existing per-client limit; pass
+    ``route_groups`` to RateLimitMiddleware to give paths their own quotas.
     """
-    
-    def __init__(self, app, calls: int = 100, period: int = 60):
-        super().__init__(app)
+    return (
+        RouteGroup("default", ("/",), RateLimit(calls, period)),
+    )
+
+
+def _gcra_result(allowed: bool, limit: RateLimit, tat_offset: float, retry_after: float = 0.0) -> RateLimitResult:
+    """Build a result from the key's theoretical arrival time relative to now"""
+    # Epsilon absorbs float error, e.g. (1 - 0.2) / 0.2 == 3.9999...
+    remaining = int((limit.period - tat_offset) / limit.emission_interval + 1e-9) if tat_offset < limit.period else 0
+    return RateLimitResult(
+        allowed=allowed,
+        limit=limit.calls,
+        remaining=max(0, min(limit.calls, remaining)),
+        reset_after=max(0.0, tat_offset),
+        retry_after=max(0.0, retry_after)
+    )
+
+
+class InMemoryRateLimitBackend:
+    """Per-process GCRA state in a bounded LRU"""
+
+    def __init__(self, max_keys: Optional[int] = None):
+        self.max_keys = max_keys or int(os.getenv("RATE_LIMIT_MAX_KEYS", 100000))
+        # key -> theoretical arrival time (monotonic clock), least recently used first
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+
+    async def hit(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitResult:
+        now = time.monotonic()
+        tat = max(self._tats.get(key, now), now)
+        new_tat = tat + limit.emission_interval * cost
+        allow_at = new_tat - limit.period
+
+        if now < allow_at:
+            return _gcra_result(False, limit, tat - now, allow_at - now)
+
+        self._tats[key] = new_tat
+        self._tats.move_to_end(key)
+        # An evicted key is either idle or the least recently seen client
+        while len(self._tats) > self.max_keys:
+            self._tats.popitem(last=False)
+        return _gcra_result(True, limit, new_tat - now)
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+
+# Atomic GCRA step on the Redis server clock. Floats are returned as strings
+# because Lua numbers are truncated to integers in replies.
+GCRA_LUA_SCRIPT = """
+local emission = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + emission * cost
+local allow_at = new_tat - period
+if now < allow_at then
+    return {0, tostring(tat - now), tostring(allow_at - now)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return {1, tostring(new_tat - now), '0'}
+"""
+
+
+class RedisRateLimitBackend:
+    """GCRA state shared through Redis; falls back to in-memory limits if Redis fails"""
+
+    def __init__(self, redis_url: str, key_prefix: str = "ratelimit"):
+        if redis_asyncio is None:
+            raise RuntimeError("redis package is required for the Redis rate limit backend")
+        self.key_prefix = key_prefix
+        self._redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+        self._script = self._redis.register_script(GCRA_LUA_SCRIPT)
+        self._fallback = InMemoryRateLimitBackend()
+
+    async def hit(self, key: str, limit: RateLimit, cost: int = 1) -> RateLimitResult:
+        try:
+            allowed, tat_offset, retry_after = await self._script(
+                keys=[f"{self.key_prefix}:{key}"],
+                args=[limit.emission_interval, limit.period, cost]
+            )
+        except Exception as e:
+            logger.warning(f"Redis rate limiter unavailable, using local limits: {e}")
+            return await self._fallback.hit(key, limit, cost)
+        return _gcra_result(bool(int(allowed)), limit, float(tat_offset), float(retry_after))
+
+
+def create_rate_limit_backend(backend: Optional[str] = None):
+    """Backend selected by RATE_LIMIT_BACKEND (memory or redis)"""
+    backend = (backend or os.getenv("RATE_LIMIT_BACKEND", "memory")).lower()
+    if backend == "redis":
+        try:
+            from src.core.config.settings import get_redis_url
+            return RedisRateLimitBackend(get_redis_url())
+        except Exception as e:
+            logger.warning(f"Redis rate limit backend unavailable, using in-memory: {e}")
+    return InMemoryRateLimitBackend()
+
+
+def resolve_client(
+    headers: Mapping[str, str],
+    client_host: Optional[str],
+    api_key_digests: Optional[Collection[str]] = None
+) -> Tuple[str, str]:
+    """
+    Identify the caller for rate limiting.
+
+    An X-API-Key only gets its own bucket when it is a known key; otherwise a
+    client could rotate random header values to get a fresh quota each time.
+
+    Returns:
+        (identity, tier): "user:<id>" with the tier from the access token,
+        "apikey:<digest>" or "ip:<address>" with the default tier
+    """
+    authorization = headers.get("authorization", "")
+    if authorization[:7].lower() == "bearer ":
+        from src.users.services.auth_service import decode_access_token
+        claims = decode_access_token(authorization[7:].strip())
+        if claims and claims.get("sub"):
+            tier = str(claims.get("subscription_tier") or DEFAULT_TIER).upper()
+            return f"user:{claims['sub']}", tier
+
+    api_key = headers.get("x-api-key")
+    if api_key:
+        digest = _api_key_digest(api_key)
+        if digest in (API_KEY_DIGESTS if api_key_digests is None else api_key_digests):
+            return f"apikey:{digest}", DEFAULT_TIER
+
+    return f"ip:{client_host or 'unknown'}", DEFAULT_TIER
+
+
+class RateLimiter:
+    """Maps a request to its route group quota and applies it through a backend"""
+
+    def __init__(
+        self,
+        calls: int = 100,
+        period: int = 60,
+        backend=None,
+        route_groups: Optional[Sequence[RouteGroup]] = None,
+        api_keys: Optional[Collection[str]] = None
+    ):
+        self.backend = backend or create_rate_limit_backend()
+        # None: keys from RATE_LIMIT_API_KEYS
+        self.api_key_digests = None if api_keys is None else frozenset(_api_key_digest(key) for key in api_keys)
+        # Longest prefix first so specific groups win over the catch-all
+        self.route_groups = sorted(
+            route_groups or default_route_groups(calls, period),
+            key=lambda group: max(len(prefix) for prefix in group.prefixes),
+            reverse=True
+        )
+
+    def route_group(self, path: str) -> RouteGroup:
+        for group in self.route_groups:
+            if any(path.startswith(prefix) for prefix in group.prefixes):
+                return group
+        return self.route_groups[-1]
+
+    def quota(self, group: RouteGroup, tier: str) -> RateLimit:
+        if not group.tier_scaled:
+            return group.limit
+        multiplier = TIER_MULTIPLIERS.get(tier, TIER_MULTIPLIERS[DEFAULT_TIER])
+        return RateLimit(group.limit.calls * multiplier, group.limit.period)
+
+    async def check(self, path: str, headers: Mapping[str, str], client_host: Optional[str]) -> Tuple[RateLimitResult, str]:
+        """Apply the quota for a request; returns the result and the limited identity"""
+        group = self.route_group(path)
+        identity, tier = resolve_client(headers, client_host, self.api_key_digests)
+        result = await self.backend.hit(f"{group.name}:{identity}", self.quota(group, tier))
+        return result, identity
+
+
+def rate_limit_headers(result: RateLimitResult) -> Dict[str, str]:
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+        "X-RateLimit-Reset": str(int(time.time() + math.ceil(result.reset_after))),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(1, math.ceil(result.retry_after)))
+    return headers
+
+
+class RateLimitMiddleware:
+    """
+    GCRA rate limiting middleware (pure ASGI).
+
+    ``calls`` per ``period`` is the free-tier quota of the default route
+    group; other groups and tiers are derived from it (see default_route_groups).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        calls: int = 100,
+        period: int = 60,
+        backend=None,
+        route_groups: Optional[Sequence[RouteGroup]] = None,
+        api_keys: Optional[Collection[str]] = None
+    ):
+        self.app = app
         self.calls = calls
         self.period = period
-        self.clients: Dict[str, List[float]] = {}
-    
-    async def dispatch(self, request: Request, call_next) -> Response:
+        self.limiter = RateLimiter(calls, period, backend, route_groups, api_keys)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with rate limiting.
-        
+
         Args:
-            request: HTTP request
-            call_next: Next middleware/endpoint
-            
-        Returns:
-            Response: HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Get client identifier (IP address)
-        client_ip = request.client.host if request.client else "unknown"
-        
-        # Skip rate limiting for health checks
-        if request.url.path == "/health":
-            return await call_next(request)
-        
-        # Check rate limit
-        now = time.time()
-        if client_ip not in self.clients:
-            self.clients[client_ip] = []
-        
-        # Remove old requests outside the period
-        cutoff = now - self.period
-        self.clients[client_ip] = [t for t in self.clients[client_ip] if t > cutoff]
-        
-        # Check if rate limit exceeded
-        if len(self.clients[client_ip]) >= self.calls:
-            logger.warning(f"Rate limit exceeded for client {client_ip}")
-            raise HTTPException(
+        path = scope.get("path", "")
+        # Skip rate limiting for non-HTTP scopes, health checks and CORS preflight
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or path.startswith(EXEMPT_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        result, identity = await self.limiter.check(path, Headers(scope=scope), client[0] if client else None)
+        headers = rate_limit_headers(result)
+
+        if not result.allowed:
+            logger.warning(f"Rate limit exceeded for {identity} on {path}")
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded: {self.calls} requests per {self.period} seconds",
-                headers={"Retry-After": str(self.period)}
+                content={
+                    "success": False,
+                    "message": f"Rate limit exceeded, retry in {math.ceil(result.retry_after)} seconds",
+                    "error_code": "RATE_LIMIT_EXCEEDED",
+                    "details": {"retry_after": math.ceil(result.retry_after)}
+                },
+                headers=headers
             )
-        
-        # Record this request
-        self.clients[client_ip].append(now)
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers
-        remaining = max(0, self.calls - len(self.clients[client_ip]))
-        response.headers["X-RateLimit-Limit"] = str(self.calls)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(now + self.period))
-        
-        return response
\ No newline at end of file
+            await response(scope, receive, send)
+            return
+
+        raw_headers = [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()]
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *raw_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -10,20 +10,18 @@ caching, and performance monitoring.
 """
 
 import functools
+import os
+import threading
 import time
 import asyncio
 import logging
-from typing import Any, Callable, Dict, Optional, Union
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
 import hashlib
 import json
-from datetime import datetime, timedelta
-from unittest import result
 
 logger = logging.getLogger(__name__)
 
-# Simple in-memory cache for demonstration
-_cache: Dict[str, Dict[str, Any]] = {}
-
 
 def retry_on_failure(
     max_retries: int = 3,
@@ -119,37 +117,354 @@ def rate_limit(calls: int = 100, period: int = 60):
     return decorator
 
 
-def cache_result(ttl: int = 300, key_func: Optional[Callable] = None):
+class CacheEntry:
+    """Cached value with its freshness deadlines (wall clock, shared with Redis)"""
+
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class LRUCacheBackend:
+    """Size-bounded in-process LRU of cache entries"""
+
+    def __init__(self, max_entries: int, stats: Dict[str, int]):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = stats
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() >= entry.stale_until:
+                del self._entries[key]
+                self._stats["expirations"] += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
     """
-    Simple caching decorator with TTL.
-    
+    Shared cache tier in Redis.
+
+    Values are stored as JSON, so only JSON-serializable results are shared;
+    anything else stays in the in-process tier.
+    """
+
+    def __init__(self, redis_url: str, prefix: str):
+        import redis.asyncio as redis_asyncio
+        self.prefix = prefix
+        self._redis = redis_asyncio.from_url(redis_url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        payload = await self._redis.get(f"{self.prefix}:{key}")
+        if payload is None:
+            return None
+        data = json.loads(payload)
+        return CacheEntry(data["value"], data["fresh_until"], data["stale_until"])
+
+    async def set(self, key: str, entry: CacheEntry):
+        try:
+            payload = json.dumps({"value": entry.value, "fresh_until": entry.fresh_until, "stale_until": entry.stale_until})
+        except (TypeError, ValueError):
+            return
+        ttl_ms = max(1, int((entry.stale_until - time.time()) * 1000))
+        await self._redis.set(f"{self.prefix}:{key}", payload, px=ttl_ms)
+
+    async def delete(self, key: str):
+        await self._redis.delete(f"{self.prefix}:{key}")
+
+    async def clear(self):
+        async for redis_key in self._redis.scan_iter(match=f"{self.prefix}:*"):
+            await self._redis.delete(redis_key)
+
+
+class ResultCache:
+    """
+    Cache behind one ``cache_result``-decorated function.
+
+    In-process LRU with TTL, optional Redis tier, single-flight loading and
+    stale-while-revalidate.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        stale_ttl: float = 0,
+        max_entries: int = 1024,
+        backend: Optional[str] = None,
+        should_cache: Optional[Callable[[Any], bool]] = None
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.should_cache = should_cache
+        self.stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "remote_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "refreshes": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "errors": 0,
+        }
+        self.local = LRUCacheBackend(max_entries, self.stats)
+        self.remote: Optional[RedisCacheBackend] = None
+        if (backend or os.getenv("CACHE_RESULT_BACKEND", "memory")).lower() == "redis":
+            try:
+                from src.core.config.settings import get_redis_url
+                self.remote = RedisCacheBackend(get_redis_url(), f"cache:{name}")
+            except Exception as e:
+                logger.warning(f"Redis cache backend unavailable for {name}, using in-process cache only: {e}")
+
+        # key -> future of the load in progress (single-flight)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refresh_tasks: set = set()
+
+    def _new_entry(self, value: Any) -> CacheEntry:
+        now = time.time()
+        return CacheEntry(value, now + self.ttl, now + self.ttl + self.stale_ttl)
+
+    def _cacheable(self, value: Any) -> bool:
+        return self.should_cache is None or self.should_cache(value)
+
+    async def get_entry(self, key: str) -> Optional[CacheEntry]:
+        entry = self.local.get(key)
+        if entry is None and self.remote is not None:
+            try:
+                entry = await self.remote.get(key)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Redis cache read failed for {self.name}: {e}")
+            if entry is not None and time.time() < entry.stale_until:
+                self.stats["remote_hits"] += 1
+                self.local.set(key, entry)
+            else:
+                entry = None
+        return entry
+
+    async def store(self, key: str, value: Any):
+        if not self._cacheable(value):
+            return
+        entry = self._new_entry(value)
+        self.local.set(key, entry)
+        if self.remote is not None:
+            try:
+                await self.remote.set(key, entry)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Redis cache write failed for {self.name}: {e}")
+
+    async def load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``loader`` once per key; concurrent callers share its result"""
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        # Retrieve the exception even when nobody else awaited the future
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            value = await loader()
+            await self.store(key, value)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def load_sync(self, key: str, loader: Callable[[], Any]) -> Any:
+        """``load`` for sync callers: in-process tier only, no single-flight"""
+
+        entry = self.local.get(key)
+        if entry is not None and time.time() < entry.fresh_until:
+            self.stats["hits"] += 1
+            return entry.value
+
+        self.stats["misses"] += 1
+        value = loader()
+        if self._cacheable(value):
+            self.local.set(key, self._new_entry(value))
+        return value
+
+    def refresh_in_background(self, key: str, loader: Callable[[], Awaitable[Any]]):
+        """Revalidate a stale entry without making the caller wait"""
+
+        if key in self._inflight:
+            return
+        self.stats["refreshes"] += 1
+
+        async def refresh():
+            try:
+                await self.load(key, loader)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Background refresh failed for {self.name}: {e}")
+
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def invalidate(self, key: str):
+        self.local.delete(key)
+        if self.remote is not None:
+            try:
+                await self.remote.delete(key)
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Redis cache invalidation failed for {self.name}: {e}")
+
+    async def clear(self):
+        self.local.clear()
+        if self.remote is not None:
+            try:
+                await self.remote.clear()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"Redis cache clear failed for {self.name}: {e}")
+
+    def clear_local(self):
+        """Drop the in-process tier only (sync callers)"""
+        self.local.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["stale_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round((self.stats["hits"] + self.stats["stale_hits"]) / lookups, 3) if lookups else 0.0,
+            "entries": len(self.local),
+            "max_entries": self.local.max_entries,
+            "ttl": self.ttl,
+            "stale_ttl": self.stale_ttl,
+            "redis_enabled": self.remote is not None,
+        }
+
+
+# Every cache created by cache_result, by name
+_result_caches: Dict[str, ResultCache] = {}
+
+
+def register_result_cache(cache: ResultCache) -> ResultCache:
+    """Include a directly created ResultCache in get_cache_stats()"""
+    _result_caches[cache.name] = cache
+    return cache
+
+
+def get_result_cache(name: str) -> Optional[ResultCache]:
+    """Cache of a decorated function by name (its namespace)"""
+    return _result_caches.get(name)
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit/miss/eviction metrics of every cache_result cache"""
+    return {name: cache.get_stats() for name, cache in _result_caches.items()}
+
+
+def cache_result(
+    ttl: int = 300,
+    key_func: Optional[Callable] = None,
+    max_entries: int = 1024,
+    stale_ttl: int = 0,
+    namespace: Optional[str] = None,
+    backend: Optional[str] = None,
+    should_cache: Optional[Callable[[Any], bool]] = None
+):
+    """
+    Caching decorator with TTL, LRU bound and stampede protection.
+
+    Concurrent misses for the same key run the function once (single-flight).
+    With ``stale_ttl``, expired entries are still served for that long while
+    one background call refreshes them (stale-while-revalidate). Sync
+    functions use the in-process LRU only.
+
     Args:
         ttl: Time to live in seconds
         key_func: Function to generate cache key, defaults to using args/kwargs
+        max_entries: In-process LRU bound
+        stale_ttl: Seconds an expired entry may be served while refreshing
+        namespace: Cache name, defaults to the function's qualified name
+        backend: "memory" or "redis" (defaults to CACHE_RESULT_BACKEND)
+        should_cache: Predicate on the result; falsy skips caching (e.g. errors)
+
+    The wrapper exposes ``cache`` (the ResultCache) and async
+    ``invalidate(*args, **kwargs)``.
     """
     def decorator(func: Callable) -> Callable:
+        name = namespace or f"{func.__module__}.{func.__qualname__}"
+        cache = register_result_cache(ResultCache(name, ttl, stale_ttl, max_entries, backend, should_cache))
+
+        def make_key(*args, **kwargs) -> str:
+            if key_func:
+                return str(key_func(*args, **kwargs))
+            key_data = repr((args, sorted(kwargs.items())))
+            return hashlib.md5(key_data.encode()).hexdigest()
+
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            # Generate cache key
-            if key_func:
-                cache_key = key_func(*args, **kwargs)
-            else:
-                key_data = {
-                    "func": func.__name__,
-                    "args": str(args),
-                    "kwargs": str(sorted(kwargs.items()))
-                }
-                cache_key = hashlib.md5(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
-            
-            # Check cache
-            if cache_key in _cache:
-                entry = _cache[cache_key]
-                if datetime.now() < entry["expires"]:
-                    logger.debug(f"Cache miss for {func.__name__}, result cached")
-            return result
-        
-        return async_wrapper if asyncio.iscoroutinefunction(func) else async_wrapper
-    
+            cache_key = make_key(*args, **kwargs)
+            entry = await cache.get_entry(cache_key)
+
+            if entry is not None:
+                if time.time() < entry.fresh_until:
+                    cache.stats["hits"] += 1
+                    return entry.value
+                cache.stats["stale_hits"] += 1
+                cache.refresh_in_background(cache_key, lambda: func(*args, **kwargs))
+                return entry.value
+
+            cache.stats["misses"] += 1
+            logger.debug(f"Cache miss for {func.__name__}")
+            return await cache.load(cache_key, lambda: func(*args, **kwargs))
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            return cache.load_sync(make_key(*args, **kwargs), lambda: func(*args, **kwargs))
+
+        async def invalidate(*args, **kwargs):
+            await cache.invalidate(make_key(*args, **kwargs))
+
+        wrapper = async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+        wrapper.cache = cache
+        wrapper.invalidate = invalidate
+        return wrapper
+
     return decorator
 
 
@@ -11,7 +11,7 @@ Enhanced with 3-step intelligence-driven content generation.
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, BackgroundTasks
 from fastapi.security import HTTPBearer
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
@@ -851,9 +851,9 @@ async def generate_campaign_report(
             )
 
         # Import PDF service
-        from src.intelligence.services.pdf_report_service import pdf_report_service
+        from src.intelligence.services.pdf_report_service import pdf_report_service, iter_pdf_chunks
 
-        # Generate PDF report
+        # Generate PDF report (rendered off the event loop, cached per intelligence version)
         pdf_bytes = await pdf_report_service.generate_intelligence_report(
             campaign_id=campaign_id,
             intelligence_data=intelligence_data[0] if isinstance(intelligence_data, list) and intelligence_data else intelligence_data,
@@ -866,9 +866,9 @@ async def generate_campaign_report(
 
         logger.info(f"PDF report generated successfully: {len(pdf_bytes)} bytes")
 
-        # Return PDF as downloadable response
-        return Response(
-            content=pdf_bytes,
+        # Stream the PDF as a download without copying it into another buffer
+        return StreamingResponse(
+            iter_pdf_chunks(pdf_bytes),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}",
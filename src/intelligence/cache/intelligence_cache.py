@@ -45,11 +45,11 @@ class IntelligenceCache:
         
         cached_data = self._get_from_cache("analysis", cache_key)
         if cached_data:
-            record_cache_hit()
+            record_cache_hit("intelligence_analysis")
             logger.debug(f"Analysis cache hit for {url}")
             return cached_data
         
-        record_cache_miss()
+        record_cache_miss("intelligence_analysis")
         logger.debug(f"Analysis cache miss for {url}")
         return None
     
@@ -69,10 +69,10 @@ class IntelligenceCache:
         """Get cached research data."""
         cached_data = self._get_from_cache("research", content_hash)
         if cached_data:
-            record_cache_hit()
+            record_cache_hit("intelligence_research")
             return cached_data
         
-        record_cache_miss()
+        record_cache_miss("intelligence_research")
         return None
     
     def set_research_cache(self, content_hash: str, data: Dict[str, Any]):
@@ -84,10 +84,10 @@ class IntelligenceCache:
         cache_key = f"{provider}:{content_hash}"
         cached_data = self._get_from_cache("provider", cache_key)
         if cached_data:
-            record_cache_hit()
+            record_cache_hit("intelligence_provider")
             return cached_data.get("response")
         
-        record_cache_miss()
+        record_cache_miss("intelligence_provider")
         return None
     
     def set_provider_cache(self, provider: str, content_hash: str, response: str):
@@ -14,6 +14,7 @@ from intelligence.models.email_subject_templates import EmailSubjectPerformance,
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from src.core.crud.subject_template_crud import SubjectTemplateCRUD, SubjectPerformanceCRUD
+from src.intelligence.utils.subject_similarity_index import get_subject_similarity_index
 # from src.core.database.models.email_subject_templates import... # TODO: Fix this import
 import re
 import uuid
@@ -167,7 +168,7 @@ class SelfLearningSubjectService:
             results["evaluated_count"] += 1
             
             # Check if this subject meets storage criteria
-            if await self._should_store_as_template(record):
+            if await self._should_store_as_template(db, record):
                 # Create new template from successful AI-generated subject
                 new_template = await self._store_subject_as_template(db, record)
                 
@@ -210,7 +211,7 @@ class SelfLearningSubjectService:
         result = await db.execute(query)
         return result.scalars().all()
     
-    async def _should_store_as_template(self, performance_record: EmailSubjectPerformance) -> bool:
+    async def _should_store_as_template(self, db: AsyncSession, performance_record: EmailSubjectPerformance) -> bool:
         """Determine if a subject line performance qualifies for template storage"""
         
         # Basic criteria
@@ -227,7 +228,7 @@ class SelfLearningSubjectService:
         )
         
         # Don't store if it's too similar to existing templates
-        if await self._is_too_similar_to_existing(template_version):
+        if await self._is_too_similar_to_existing(db, template_version):
             return False
         
         return True
@@ -257,8 +258,8 @@ class SelfLearningSubjectService:
         psychology_triggers = self._extract_psychology_triggers(performance_record.subject_line)
         keywords = self._extract_keywords(performance_record.subject_line)
         
-        # Create new template
-        new_template = EmailSubjectTemplate(
+        # Create new template (the CRUD adds its MinHash signature and indexes it)
+        new_template = dict(
             template_text=template_text,
             category=performance_record.category_used,
             performance_level=performance_level,
@@ -338,15 +339,18 @@ class SelfLearningSubjectService:
         
         return keywords[:10]  # Limit to top 10 keywords
     
-    async def _is_too_similar_to_existing(self, template_text: str) -> bool:
-        """Check if template is too similar to existing ones"""
-        
-        # Simple similarity check - could be enhanced with more sophisticated algorithms
-        words = set(template_text.lower().split())
-        
-        # For now, just check if it's identical
-        # In production, you might want more sophisticated similarity detection
-        return False  # Allow all for now, but this is where you'd add similarity logic
+    async def _is_too_similar_to_existing(self, db: AsyncSession, template_text: str) -> bool:
+        """Check if a near-duplicate template already exists (MinHash/LSH index lookup)"""
+        
+        similarity_index = get_subject_similarity_index()
+        await similarity_index.sync(db)
+        
+        match = similarity_index.find_similar(template_text)
+        if match:
+            template_id, similarity = match
+            logger.info(f"🔁 Skipping template '{template_text}': {similarity:.0%} similar to template {template_id}")
+            return True
+        return False
     
     def _create_learning_prompt(
         self,
@@ -4,12 +4,11 @@ import asyncio
 import subprocess
 import tempfile
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime, timezone
 import json
 import aiohttp
 import aiofiles
-import base64
 
 # ✅ CRUD MIGRATION IMPORTS
 from src.intelligence.repositories.intelligence_repository import IntelligenceRepository
@@ -19,16 +18,19 @@ from src.core.crud.campaign_crud import CampaignCRUD
 # ✅ STORAGE SYSTEM INTEGRATION
 from src.storage.services.file_service import FileService
 from src.storage.services.media_service import MediaService
+from src.storage.universal_dual_storage import get_storage_manager
 
 # ✅ VIDEO ASSEMBLY PIPELINE INTEGRATION
 from src.content.services.video_assembly_pipeline import (
     create_video_assembly_pipeline,
     VideoScene as AssemblyVideoScene,
-    VideoSpec
+    VideoSpec,
+    CancellationToken
 )
+from .video_batch_scheduler import get_video_batch_scheduler, DEFAULT_BATCH_CONCURRENCY
 
 # ✅ DATABASE SESSION
-from src.core.database import get_async_db
+from src.core.database import get_async_db, AsyncSessionManager
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.intelligence.utils.enum_serializer import EnumSerializerMixin
@@ -90,10 +92,14 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
         # ✅ INITIALIZE STORAGE SYSTEM
         self.file_service = FileService()
         self.media_service = MediaService()
+        self.storage = get_storage_manager()
 
         # ✅ INITIALIZE VIDEO ASSEMBLY PIPELINE
         self.video_assembler = create_video_assembly_pipeline()
         
+        # Stage concurrency limits (image generation, downloads, assembly)
+        self.scheduler = get_video_batch_scheduler()
+        
         self.video_providers = self._initialize_video_providers()
         self.default_settings = {
             "duration_per_slide": 3,
@@ -159,10 +165,15 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
             return False
     
     # ✅ STORAGE QUOTA CHECKING
-    async def _check_storage_quota(self, user_id: str, estimated_file_size: int) -> bool:
+    async def _check_storage_quota(
+        self,
+        user_id: str,
+        estimated_file_size: int,
+        db: Optional[AsyncSession] = None
+    ) -> bool:
         """Check if user has sufficient storage quota"""
         try:
-            return await self.storage.check_quota(user_id, estimated_file_size)
+            return await self.storage.has_quota_for(user_id, estimated_file_size, db)
         except Exception as e:
             logger.error(f"Storage quota check failed: {e}")
             return False
@@ -171,34 +182,32 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
     async def _save_video_to_storage(
         self, 
         user_id: str, 
-        video_data: bytes, 
-        metadata: Dict[str, Any]
-    ) -> Optional[str]:
-        """Save generated video to storage system"""
+        video_path: str, 
+        metadata: Dict[str, Any],
+        campaign_id: Optional[int] = None,
+        db: Optional[AsyncSession] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Save generated video to storage system
+        
+        The assembled file is streamed from disk as a multipart upload, so the
+        video is never held in memory. Quota validation, the storage record and
+        the usage update happen in the storage manager.
+        """
         try:
-            file_size = len(video_data)
-            
-            # Check quota before saving
-            if not await self._check_storage_quota(user_id, file_size):
-                raise Exception("Storage quota exceeded")
-            
-            # Generate filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"slideshow_video_{timestamp}.mp4"
             
-            # Save to storage
-            file_url = await self.storage.upload(
-                user_id=user_id,
-                file_data=video_data,
-                file_type="video",
+            upload_result = await self.storage.upload_path_with_quota_check(
+                video_path,
                 filename=filename,
-                metadata=metadata
+                content_type="video/mp4",
+                user_id=user_id,
+                campaign_id=str(campaign_id) if campaign_id else None,
+                db=db
             )
-            
-            # Update storage usage
-            await self.storage.update_usage(user_id, file_size)
-            
-            return file_url
+            logger.info(f"Video uploaded ({os.path.getsize(video_path) / (1024 * 1024):.1f}MB streamed): {metadata.get('video_type')}")
+            return upload_result
             
         except Exception as e:
             logger.error(f"Failed to save video to storage: {e}")
@@ -211,7 +220,9 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
         preferences: Dict[str, Any] = None,
         user_id: Optional[str] = None,
         campaign_id: Optional[int] = None,
-        db: Optional[AsyncSession] = None
+        db: Optional[AsyncSession] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
     ) -> Dict[str, Any]:
         """Generate slideshow video from campaign images with storage and CRUD integration"""
         
@@ -232,7 +243,7 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
         estimated_size = estimated_duration * 170000  # ~170KB per second
         
         # Check storage quota if user_id provided
-        if user_id and not await self._check_storage_quota(user_id, estimated_size):
+        if user_id and not await self._check_storage_quota(user_id, estimated_size, db):
             raise Exception("Storage quota exceeded. Please upgrade your plan.")
         
         # Generate video script/storyboard
@@ -252,7 +263,9 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
                 
                 if provider["name"] == "ffmpeg_local":
                     video_result = await self._generate_with_ffmpeg(
-                        images, storyboard, settings
+                        images, storyboard, settings,
+                        cancel_token=cancel_token,
+                        progress_callback=progress_callback
                     )
                 elif provider["name"] == "runwayml":
                     video_result = await self._generate_with_runwayml(
@@ -276,8 +289,12 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
             raise Exception("All video generation providers failed")
         
         # ✅ SAVE TO STORAGE IF USER PROVIDED
+        # The video is handed over as a file path and streamed into storage;
+        # the storage manager also creates the tracked storage record
         file_url = None
-        if user_id and isinstance(video_result["video_data"], bytes):
+        file_id = None
+        video_path = video_result.get("video_path")
+        if user_id and video_path and os.path.exists(video_path):
             metadata = {
                 "video_type": "slideshow",
                 "provider": provider_used,
@@ -288,79 +305,24 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
                 "product_name": product_name
             }
             
-            file_url = await self._save_video_to_storage(
+            upload_result = await self._save_video_to_storage(
                 user_id, 
-                video_result["video_data"], 
-                metadata
+                video_path, 
+                metadata,
+                campaign_id=campaign_id,
+                db=db
             )
-        
-        # ✅ SAVE TO DATABASE IF DB SESSION PROVIDED
-        if db and campaign_id:
-            try:
-                # Convert video data to base64 for database storage
-                video_base64 = None
-                if isinstance(video_result["video_data"], bytes):
-                    video_base64 = base64.b64encode(video_result["video_data"]).decode()
-                
-                content_data = {
-                    "campaign_id": campaign_id,
-                    "content_type": "video",
-                    "content_format": "mp4",
-                    "content_data": {
-                        "video_base64": video_base64,
-                        "duration": video_result["duration"],
-                        "storyboard": storyboard,
-                        "provider": provider_used,
-                        "cost": generation_cost,
-                        "file_url": file_url,
-                        "settings": settings
-                    },
-                    "generation_metadata": {
-                        "provider_used": provider_used,
-                        "video_type": "slideshow",
-                        "source_images_count": len(images),
-                        "generation_timestamp": datetime.now().isoformat(),
-                        "product_name": product_name
-                    }
-                }
-                
-                # Save generated video content using file service
-                if video_file_path and os.path.exists(video_file_path):
-                    with open(video_file_path, 'rb') as video_file:
-                        video_data = video_file.read()
-
-                    # Upload video file to storage
-                    upload_result = await self.file_service.upload_file(
-                        db=db,
-                        user_id=user_id,
-                        file_data=video_data,
-                        original_filename=f"slideshow_video_{campaign_id}.mp4",
-                        content_type="video/mp4",
-                        campaign_id=campaign_id,
-                        metadata={
-                            "content_type": "slideshow_video",
-                            "generation_provider": provider,
-                            "video_specs": video_specs,
-                            "generation_cost": total_generation_cost,
-                            "intelligence_id": intelligence_data.get("id"),
-                            "created_via": "slideshow_video_generator"
-                        }
-                    )
-
-                    if upload_result.get("success"):
-                        logger.info(f"Video file uploaded successfully: {upload_result.get('file_id')}")
-                    else:
-                        logger.error(f"Failed to upload video file: {upload_result.get('error')}")
-                
-            except Exception as e:
-                logger.error(f"Failed to save generated video to database: {e}")
-                # Don't fail the entire generation if DB save fails
+            if upload_result:
+                file_url = upload_result.get("url")
+                file_id = upload_result.get("file_id")
         
         # 🔥 APPLY FIX BEFORE RETURNING
         result_data = {
             "success": True,
-            "video_data": video_result["video_data"],
+            "video_path": video_path,
+            "file_size": video_result.get("file_size"),
             "file_url": file_url,
+            "file_id": file_id,
             "duration": video_result["duration"],
             "provider_used": provider_used,
             "cost": generation_cost,
@@ -432,24 +394,41 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
                     f"Call-to-action marketing visual featuring {product_name}"
                 ]
                 
-                for i, prompt in enumerate(image_prompts):
-                    try:
-                        image_result = await image_generator.generate_single_image(
-                            prompt=prompt,
-                            platform="general",
-                            user_id=str(current_user.id),
-                            campaign_id=int(campaign_id),
-                            db=db
-                        )
-                        
-                        if image_result.get("success") and image_result.get("file_url"):
-                            image_urls.append(image_result["file_url"])
-                            image_asset_ids.append(f"generated_{i}")
-                            total_generation_cost += image_result.get("cost", 0)
-                                
-                    except Exception as e:
-                        logger.error(f"Failed to generate slideshow image {i}: {str(e)}")
+                async def generate_image(prompt: str) -> Dict[str, Any]:
+                    async with self.scheduler.stage("image_generation"):
+                        if db is None:
+                            return await image_generator.generate_single_image(
+                                prompt=prompt,
+                                platform="general",
+                                user_id=str(current_user.id),
+                                campaign_id=int(campaign_id),
+                                db=None
+                            )
+                        # The images generate concurrently and an AsyncSession is not
+                        # concurrency-safe, so each one records itself in its own session
+                        async with AsyncSessionManager.get_session() as image_db:
+                            return await image_generator.generate_single_image(
+                                prompt=prompt,
+                                platform="general",
+                                user_id=str(current_user.id),
+                                campaign_id=int(campaign_id),
+                                db=image_db
+                            )
+                
+                image_results = await asyncio.gather(
+                    *[generate_image(prompt) for prompt in image_prompts],
+                    return_exceptions=True
+                )
+                
+                for i, image_result in enumerate(image_results):
+                    if isinstance(image_result, Exception):
+                        logger.error(f"Failed to generate slideshow image {i}: {str(image_result)}")
                         continue
+                    
+                    if image_result.get("success") and image_result.get("file_url"):
+                        image_urls.append(image_result["file_url"])
+                        image_asset_ids.append(f"generated_{i}")
+                        total_generation_cost += image_result.get("cost", 0)
             else:
                 # Fallback: Generate simple text-based scenes from script content if no image generator available
                 try:
@@ -584,9 +563,15 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
         self,
         images: List[str],
         storyboard: Dict[str, Any],
-        settings: Dict[str, Any]
+        settings: Dict[str, Any],
+        cancel_token: Optional[CancellationToken] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
     ) -> Dict[str, Any]:
-        """Generate video using centralized video assembly pipeline"""
+        """Generate video using centralized video assembly pipeline
+        
+        FFmpeg work runs through the pipeline, so it shares the global FFmpeg
+        slot limit with every other assembly in this process.
+        """
 
         try:
             # Create temporary directory for downloaded images
@@ -628,23 +613,22 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
                 output_filename = f"slideshow_{timestamp}.mp4"
 
                 # Use video assembly pipeline to create video
-                assembled_video = await self.video_assembler.assemble_video(
-                    scenes=assembly_scenes,
-                    video_type="slideshow",
-                    brand_config=None,  # No branding for basic slideshow
-                    music_path=None,   # No music for basic slideshow
-                    output_filename=output_filename
-                )
+                async with self.scheduler.stage("assembly"):
+                    assembled_video = await self.video_assembler.assemble_video(
+                        scenes=assembly_scenes,
+                        video_type="slideshow",
+                        brand_config=None,  # No branding for basic slideshow
+                        music_path=None,   # No music for basic slideshow
+                        output_filename=output_filename,
+                        cancel_token=cancel_token,
+                        progress_callback=progress_callback
+                    )
 
                 logger.info(f"Video assembled using pipeline: {assembled_video.video_path}")
 
-                # Read generated video file
-                with open(assembled_video.video_path, "rb") as f:
-                    video_data = f.read()
-
+                # Hand off the file path, not the bytes: storage streams it from disk
                 return {
                     "success": True,
-                    "video_data": video_data,
                     "video_path": assembled_video.video_path,
                     "duration": assembled_video.duration_seconds,
                     "file_size": assembled_video.file_size_mb * 1024 * 1024,  # Convert MB to bytes
@@ -661,30 +645,34 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
     # Note: _create_ffmpeg_input_file method removed - now using centralized video assembly pipeline
     
     async def _download_images_to_temp(self, images: List[str], temp_dir: str) -> List[str]:
-        """Download images to temporary directory"""
+        """Download images to temporary directory concurrently, keeping slide order"""
         
-        image_paths = []
-        
-        async with aiohttp.ClientSession() as session:
-            for i, image_url in enumerate(images):
-                try:
+        async def download(session: aiohttp.ClientSession, i: int, image_url: str) -> Optional[str]:
+            try:
+                async with self.scheduler.stage("download"):
                     async with session.get(image_url) as response:
-                        if response.status == 200:
-                            image_data = await response.read()
-                            
-                            # Save to temp directory
-                            image_path = os.path.join(temp_dir, f"image_{i:03d}.jpg")
-                            async with aiofiles.open(image_path, "wb") as f:
-                                await f.write(image_data)
-                            
-                            image_paths.append(image_path)
-                        else:
+                        if response.status != 200:
                             logger.warning(f"Failed to download image: {image_url}")
-                            
-                except Exception as e:
-                    logger.error(f"Error downloading image {image_url}: {str(e)}")
+                            return None
+                        
+                        # Stream to the temp directory instead of buffering the whole image
+                        image_path = os.path.join(temp_dir, f"image_{i:03d}.jpg")
+                        async with aiofiles.open(image_path, "wb") as f:
+                            async for chunk in response.content.iter_chunked(64 * 1024):
+                                await f.write(chunk)
+                        
+                        return image_path
+                        
+            except Exception as e:
+                logger.error(f"Error downloading image {image_url}: {str(e)}")
+                return None
+        
+        async with aiohttp.ClientSession() as session:
+            image_paths = await asyncio.gather(
+                *[download(session, i, image_url) for i, image_url in enumerate(images)]
+            )
         
-        return image_paths
+        return [path for path in image_paths if path]
     
     async def _generate_with_runwayml(
         self,
@@ -722,40 +710,52 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
         self,
         campaigns: List[Dict[str, Any]],
         batch_preferences: Dict[str, Any] = None,
-        db: Optional[AsyncSession] = None
+        db: Optional[AsyncSession] = None,
+        max_concurrent: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Generate multiple slideshow videos efficiently"""
+        """
+        Generate multiple slideshow videos concurrently
+        
+        Campaigns run in parallel (up to ``max_concurrent``); image generation,
+        downloads and FFmpeg assembly are each throttled by the
+        scheduler's stage limits. A shared database session cannot be used
+        concurrently, so passing ``db`` runs campaigns one at a time.
+        """
+        
+        if db is not None:
+            max_concurrent = 1
+        campaign_slots = asyncio.Semaphore(max(1, max_concurrent or DEFAULT_BATCH_CONCURRENCY))
+        completed = 0
+        
+        async def generate(i: int, campaign: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal completed
+            async with campaign_slots:
+                try:
+                    result = await self.generate_slideshow_video_with_image_generation(
+                        intelligence_data=campaign["intelligence_data"],
+                        campaign_id=campaign["campaign_id"],
+                        current_user=campaign["current_user"],
+                        image_assets=campaign.get("image_assets"),
+                        video_preferences=batch_preferences,
+                        db=db
+                    )
+                except Exception as e:
+                    logger.error(f"Batch video generation failed for campaign {i+1}: {str(e)}")
+                    result = {
+                        "success": False,
+                        "error": str(e),
+                        "campaign_id": campaign.get("campaign_id")
+                    }
+                
+                completed += 1
+                logger.info(f"Generated slideshow video {completed}/{len(campaigns)}")
+                return result
         
-        results = []
-        total_cost = 0
+        with self.scheduler.track_batch() as timings:
+            # Results keep campaign order regardless of completion order
+            results = await asyncio.gather(*[generate(i, c) for i, c in enumerate(campaigns)])
         
-        for i, campaign in enumerate(campaigns):
-            try:
-                result = await self.generate_slideshow_video_with_image_generation(
-                    intelligence_data=campaign["intelligence_data"],
-                    campaign_id=campaign["campaign_id"],
-                    current_user=campaign["current_user"],
-                    image_assets=campaign.get("image_assets"),
-                    video_preferences=batch_preferences,
-                    db=db
-                )
-                results.append(result)
-                
-                if result.get("success"):
-                    total_cost += result.get("cost", 0)
-                
-                # Small delay to avoid overwhelming the system
-                await asyncio.sleep(1)
-                
-                logger.info(f"Generated slideshow video {i+1}/{len(campaigns)}")
-                
-            except Exception as e:
-                logger.error(f"Batch video generation failed for campaign {i+1}: {str(e)}")
-                results.append({
-                    "success": False,
-                    "error": str(e),
-                    "campaign_id": campaign.get("campaign_id")
-                })
+        total_cost = sum(r.get("cost", 0) for r in results if r.get("success"))
         
         return {
             "total_videos": len(campaigns),
@@ -763,6 +763,7 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
             "failed_generations": len([r for r in results if not r.get("success")]),
             "total_cost": total_cost,
             "cost_per_video": total_cost / len(campaigns) if campaigns else 0,
+            "stage_timings": timings.report(),
             "results": results
         }
     
@@ -776,6 +777,7 @@ class SlideshowVideoGenerator(EnumSerializerMixin):
             "supported_formats": ["mp4", "avi", "mov"],
             "supported_resolutions": ["1920x1080", "1280x720", "3840x2160"],
             "ffmpeg_available": self._check_ffmpeg_availability(),
+            "scheduler": self.scheduler.get_status(),
             "crud_integrated": True,
             "storage_integrated": True
         }
@@ -0,0 +1,161 @@
+# src/intelligence/generators/video_batch_scheduler.py
+"""
+Video Batch Scheduler
+Stage-based concurrency limits for slideshow video generation
+
+Video generation mixes network-bound work (image generation, image downloads)
+with CPU-bound FFmpeg assembly. Each stage gets its own limit so a
+batch keeps the network busy while assembly is bounded by the available cores,
+instead of running campaigns strictly one after another.
+
+Stage timings are recorded process-wide and, inside ``track_batch()``, per
+batch so a batch result can report where its time went.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("image_generation", "download", "assembly")
+
+_cpu_count = os.cpu_count() or 1
+
+DEFAULT_STAGE_LIMITS = {
+    "image_generation": int(os.getenv("VIDEO_BATCH_IMAGE_CONCURRENCY", 4)),
+    "download": int(os.getenv("VIDEO_BATCH_DOWNLOAD_CONCURRENCY", 16)),
+    # Each assembly already renders its scenes in parallel, so leave headroom
+    "assembly": int(os.getenv("VIDEO_BATCH_ASSEMBLY_CONCURRENCY", max(1, _cpu_count // 2))),
+}
+
+# Campaigns in flight at once; stage limits do the real throttling
+DEFAULT_BATCH_CONCURRENCY = int(os.getenv("VIDEO_BATCH_CONCURRENCY", max(2, _cpu_count)))
+
+
+class StageTimings:
+    """Per-stage call counts, run time and time spent waiting for a slot"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, Dict[str, float]] = {}
+
+    def record(self, stage: str, wait_seconds: float, run_seconds: float, failed: bool = False):
+        stats = self.stages.setdefault(stage, {
+            "calls": 0,
+            "failed": 0,
+            "run_seconds": 0.0,
+            "wait_seconds": 0.0,
+            "max_run_seconds": 0.0
+        })
+        stats["calls"] += 1
+        stats["failed"] += int(failed)
+        stats["run_seconds"] += run_seconds
+        stats["wait_seconds"] += wait_seconds
+        stats["max_run_seconds"] = max(stats["max_run_seconds"], run_seconds)
+
+    def report(self) -> Dict[str, Any]:
+        stages = {}
+        for stage, stats in self.stages.items():
+            calls = stats["calls"]
+            stages[stage] = {
+                "calls": calls,
+                "failed": stats["failed"],
+                "total_run_seconds": round(stats["run_seconds"], 3),
+                "avg_run_seconds": round(stats["run_seconds"] / calls, 3) if calls else 0.0,
+                "max_run_seconds": round(stats["max_run_seconds"], 3),
+                "total_wait_seconds": round(stats["wait_seconds"], 3),
+            }
+        return {
+            "wall_seconds": round(time.perf_counter() - self.started, 3),
+            "stages": stages
+        }
+
+
+# Timings of the batch the current task belongs to (copied into child tasks)
+_current_batch: contextvars.ContextVar[Optional[StageTimings]] = contextvars.ContextVar(
+    "video_batch_timings", default=None
+)
+
+
+class VideoBatchScheduler:
+    """Per-stage semaphores shared by every video generation in the process"""
+
+    def __init__(self, stage_limits: Optional[Dict[str, int]] = None):
+        self.stage_limits = {**DEFAULT_STAGE_LIMITS, **(stage_limits or {})}
+        # asyncio primitives belong to the loop that first waits on them, so
+        # each event loop gets its own set (like get_ffmpeg_slots)
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._active: Dict[str, int] = {stage: 0 for stage in self.stage_limits}
+        self.timings = StageTimings()
+
+    def _semaphore(self, stage: str) -> asyncio.Semaphore:
+        """Semaphore of ``stage`` for the running event loop"""
+        if stage not in self.stage_limits:
+            raise ValueError(f"Unknown video batch stage: {stage}")
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            semaphores = self._semaphores[loop] = {}
+        if stage not in semaphores:
+            semaphores[stage] = asyncio.Semaphore(max(1, self.stage_limits[stage]))
+        return semaphores[stage]
+
+    @asynccontextmanager
+    async def stage(self, name: str):
+        """Hold a slot of ``name`` for the duration of the block and time it"""
+
+        queued_at = time.perf_counter()
+        async with self._semaphore(name):
+            started = time.perf_counter()
+            self._active[name] = self._active.get(name, 0) + 1
+            failed = False
+            try:
+                yield
+            except BaseException:
+                failed = True
+                raise
+            finally:
+                self._active[name] -= 1
+                finished = time.perf_counter()
+                wait_seconds, run_seconds = started - queued_at, finished - started
+                self.timings.record(name, wait_seconds, run_seconds, failed)
+                batch = _current_batch.get()
+                if batch is not None:
+                    batch.record(name, wait_seconds, run_seconds, failed)
+
+    @contextmanager
+    def track_batch(self) -> Iterator[StageTimings]:
+        """Collect stage timings of every task started inside the block"""
+        timings = StageTimings()
+        token = _current_batch.set(timings)
+        try:
+            yield timings
+        finally:
+            _current_batch.reset(token)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Limits, active slots and lifetime stage timings"""
+        return {
+            "stage_limits": dict(self.stage_limits),
+            "active": dict(self._active),
+            "lifetime": self.timings.report()["stages"]
+        }
+
+
+# Global instance
+_video_batch_scheduler = None
+
+def get_video_batch_scheduler() -> VideoBatchScheduler:
+    """Get global video batch scheduler instance"""
+    global _video_batch_scheduler
+    if _video_batch_scheduler is None:
+        _video_batch_scheduler = VideoBatchScheduler()
+    return _video_batch_scheduler
@@ -62,6 +62,8 @@ class IntelligenceModule(ModuleInterface):
                 logger.error("Database connection failed during Intelligence module initialization")
                 return False
             
+            await self._load_subject_similarity_index()
+            
             # Validate AI provider configuration - check both enabled AND valid API key
             available_providers = [
                 name for name, provider in ai_provider_config.providers.items()
@@ -131,6 +133,18 @@ class IntelligenceModule(ModuleInterface):
             logger.error(f"Database connectivity check failed: {e}")
             return False
     
+    async def _load_subject_similarity_index(self):
+        """Build the near-duplicate index of email subject templates from the database"""
+        try:
+            from src.core.database.session import AsyncSessionManager
+            from src.intelligence.utils.subject_similarity_index import get_subject_similarity_index
+            
+            async with AsyncSessionManager.get_session() as session:
+                await get_subject_similarity_index().sync(session, force=True)
+        except Exception as e:
+            # Loaded on first duplicate check instead
+            logger.warning(f"Subject similarity index not loaded at startup: {e}")
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform health check of the Intelligence Engine module.
@@ -5,7 +5,7 @@ These serve as AI reference patterns, not fallbacks
 """
 
 import re
-from sqlalchemy import Column, Integer, String, Text, Float, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, DateTime, LargeBinary, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 import uuid
@@ -55,6 +55,7 @@ class EmailSubjectTemplate(Base):
     psychology_triggers = Column(JSONB)  # List of psychology triggers used
     keywords = Column(JSONB)             # Key words/phrases in template
     character_count = Column(Integer)    # Length for mobile optimization
+    minhash_signature = Column(LargeBinary)  # Word-shingle MinHash for near-duplicate checks (see subject_similarity_index)
     
     # Classification
     is_active = Column(Boolean, default=True)
@@ -18,6 +18,7 @@ from datetime import datetime
 import uuid
 
 from src.core.database.models import IntelligenceCore, ProductData, MarketData
+from src.core.database.search import text_search
 from src.intelligence.models.intelligence_models import ProductInfo, MarketInfo
 
 logger = logging.getLogger(__name__)
@@ -338,15 +339,16 @@ class EnhancedIntelligenceRepository:
         limit: int = 10,
         session: AsyncSession = None
     ) -> list:
-        """Search intelligence records by product name."""
+        """Search intelligence records by product name, closest names first."""
         try:
+            search = await text_search(session, product_name, IntelligenceCore.product_name)
             result = await session.execute(
                 select(IntelligenceCore)
                 .where(
-                    IntelligenceCore.product_name.ilike(f"%{product_name}%"),
+                    search.condition,
                     IntelligenceCore.user_id == user_id
                 )
-                .order_by(IntelligenceCore.created_at.desc())
+                .order_by(search.rank.desc(), IntelligenceCore.created_at.desc())
                 .limit(limit)
             )
             
@@ -6,21 +6,16 @@ from pydantic import BaseModel
 from typing import Optional, List
 from src.intelligence.services.analytics_service import analytics_service
 from src.core.database.session import get_async_db
-from src.users.services.auth_service import AuthService
+from src.core.auth.dependencies import get_active_user_id, get_current_user_claims
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 security = HTTPBearer()
 
 async def get_current_user_id(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_async_db)
+    claims: dict = Depends(get_current_user_claims)
 ) -> str:
-    """Get current user ID from token"""
-    auth_service = AuthService(db)
-    user = await auth_service.get_current_user(credentials.credentials)
-    if not user:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    return str(user.id)
+    """Get current user ID from the token claims, without a user lookup (read-only endpoints)"""
+    return str(claims["id"])
 
 class RefreshAnalyticsRequest(BaseModel):
     platform: Optional[str] = None  # If None, refresh all platforms
@@ -43,7 +38,7 @@ async def get_user_analytics_dashboard(
 @router.post("/refresh")
 async def refresh_user_analytics(
     body: RefreshAnalyticsRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_active_user_id)
 ):
     """Refresh analytics data from connected platforms"""
     try:
@@ -5,21 +5,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from src.intelligence.services import clickbank_service
 from src.core.database.session import get_async_db
-from src.users.services.auth_service import AuthService
+from src.core.auth.dependencies import get_active_user_id, get_current_user_claims
 
 router = APIRouter(prefix="/clickbank", tags=["ClickBank"])
 security = HTTPBearer()
 
 async def get_current_user_id(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_async_db)
+    claims: dict = Depends(get_current_user_claims)
 ) -> str:
-    """Get current user ID from token"""
-    auth_service = AuthService(db)
-    user = await auth_service.get_current_user(credentials.credentials)
-    if not user:
-        raise HTTPException(status_code=401, detail="Authentication required")
-    return str(user.id)
+    """Get current user ID from the token claims, without a user lookup (read-only endpoints)"""
+    return str(claims["id"])
 
 class ConnectRequest(BaseModel):
     nickname: str
@@ -28,7 +23,7 @@ class ConnectRequest(BaseModel):
 @router.post("/connect")
 async def connect_clickbank(
     body: ConnectRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_active_user_id)
 ):
     print(f"DEBUG: ClickBank connect endpoint called by user_id={user_id}")
     print(f"DEBUG: Request body - nickname={body.nickname}, api_key=***")
@@ -87,6 +82,6 @@ async def get_sales(
     user_id: str = Depends(get_current_user_id)
 ):
     try:
-        return clickbank_service.fetch_sales(user_id, days)
+        return await clickbank_service.fetch_sales_async(user_id, days)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -1,9 +1,7 @@
-import requests
 import asyncio
 from datetime import datetime, timedelta
-from src.platforms.clickbank.services.clickbank_service import get_clickbank_creds
-
-BASE_URL = "https://api.clickbank.com/rest/1.3"
+from src.platforms.clickbank.db.clickbank_repo import get_clickbank_creds
+from src.platforms.clickbank.services.clickbank_client import get_clickbank_client
 
 async def fetch_orders_async(user_id: str, days: int = 30):
     """Fetch individual order data from ClickBank API with product details"""
@@ -12,26 +10,14 @@ async def fetch_orders_async(user_id: str, days: int = 30):
     if not creds:
         raise Exception("ClickBank account not connected")
 
-    headers = {
-        "Authorization": f"Bearer {creds['api_key']}",
-        "Content-Type": "application/json"
-    }
-
     # Calculate date range for orders
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
 
-    params = {
-        "account": creds['nickname'],
-        "startDate": start_date.strftime("%Y-%m-%d"),
-        "endDate": end_date.strftime("%Y-%m-%d")
-    }
-
-    r = requests.get(f"{BASE_URL}/orders2/list", headers=headers, params=params)
-    if r.status_code != 200:
-        raise Exception(f"ClickBank Orders API error: {r.text}")
-
-    return r.json()
+    # Day-granular window, so repeated requests within a day hit the response cache
+    return await get_clickbank_client().fetch_orders(
+        creds['nickname'], creds['api_key'], start_date.date(), end_date.date(), cache=True
+    )
 
 def extract_product_sales_data(orders_data: dict) -> list:
     """Extract product-level sales data from ClickBank orders response"""
@@ -82,10 +68,12 @@ async def get_user_product_performance(user_id: str, days: int = 30) -> dict:
     """Get comprehensive product performance data for a user"""
     try:
         # Fetch both summary analytics and detailed orders
-        from src.platforms.clickbank.services.clickbank_service import fetch_sales_async
+        from src.intelligence.services.clickbank_service import fetch_sales_async
 
-        summary_data = await fetch_sales_async(user_id, days)
-        orders_data = await fetch_orders_async(user_id, days)
+        summary_data, orders_data = await asyncio.gather(
+            fetch_sales_async(user_id, days),
+            fetch_orders_async(user_id, days)
+        )
 
         # Extract product-level data
         product_sales = extract_product_sales_data(orders_data)
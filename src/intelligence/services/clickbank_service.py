@@ -1,9 +1,9 @@
-import requests
 import asyncio
 from src.core.database.clickbank_repo import save_clickbank_creds, get_clickbank_creds
 from src.core.config import settings
-
-BASE_URL = "https://api.clickbank.com/rest/1.3"
+# Credential lookup by user id only (the core repo variant takes a session)
+from src.platforms.clickbank.db.clickbank_repo import get_clickbank_creds as get_account_creds
+from src.platforms.clickbank.services.clickbank_client import ClickBankClient, get_clickbank_client
 
 def save_credentials(user_id: str, nickname: str, api_key: str):
     """Save ClickBank credentials for a user (sync wrapper)"""
@@ -25,56 +25,36 @@ def save_credentials(user_id: str, nickname: str, api_key: str):
 
     return {"status": "success", "message": "ClickBank account connected."}
 
-def fetch_sales(user_id: str, days: int = 30):
-    """Fetch sales data from ClickBank API (sync wrapper)"""
-    # Get credentials using sync wrapper
-    try:
-        loop = asyncio.get_event_loop()
-        creds = loop.run_until_complete(get_clickbank_creds(user_id))
-    except RuntimeError:
-        # Create new loop if none exists
-        creds = asyncio.run(get_clickbank_creds(user_id))
-
-    if not creds:
-        raise Exception("ClickBank account not connected")
-
-    # New ClickBank API format: Use user's API key directly
-    # No more dev key needed as of August 2023
-    headers = {
-        "Authorization": f"Bearer {creds['api_key']}",
-        "Content-Type": "application/json"
-    }
-    params = {
-        "account": creds['nickname'],  # Updated parameter name
-        "days": days
-    }
-
-    r = requests.get(f"{BASE_URL}/analytics/summary", headers=headers, params=params)
-    if r.status_code != 200:
-        raise Exception(f"ClickBank API error: {r.text}")
-
-    return r.json()
-
 async def fetch_sales_async(user_id: str, days: int = 30):
     """Fetch sales data from ClickBank API (async version)"""
-    creds = await get_clickbank_creds(user_id)
+    creds = await get_account_creds(user_id)
 
     if not creds:
         raise Exception("ClickBank account not connected")
 
     # New ClickBank API format: Use user's API key directly
     # No more dev key needed as of August 2023
-    headers = {
-        "Authorization": f"Bearer {creds['api_key']}",
-        "Content-Type": "application/json"
-    }
-    params = {
-        "account": creds['nickname'],  # Updated parameter name
-        "days": days
-    }
+    # Shared pooled client; responses are cached per account and window
+    return await get_clickbank_client().fetch_sales(creds['nickname'], creds['api_key'], days, cache=True)
 
-    r = requests.get(f"{BASE_URL}/analytics/summary", headers=headers, params=params)
-    if r.status_code != 200:
-        raise Exception(f"ClickBank API error: {r.text}")
-
-    return r.json()
\ No newline at end of file
+def fetch_sales(user_id: str, days: int = 30):
+    """
+    Fetch sales data from ClickBank API (sync wrapper for scripts and worker threads)
+
+    Runs the request with asyncio.run on a short-lived client: no pooled
+    connections and no response cache. Called from a running event loop it
+    raises RuntimeError; async code should await fetch_sales_async instead.
+    """
+
+    async def fetch_once():
+        # The global client is bound to the application's event loop
+        client = ClickBankClient()
+        try:
+            creds = await get_account_creds(user_id)
+            if not creds:
+                raise Exception("ClickBank account not connected")
+            return await client.fetch_sales(creds['nickname'], creds['api_key'], days)
+        finally:
+            await client.close()
+
+    return asyncio.run(fetch_once())
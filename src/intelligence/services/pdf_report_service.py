@@ -7,12 +7,23 @@ PDF Report Generation Service for Intelligence Analytics
 
 Generates comprehensive PDF reports containing intelligence insights,
 marketing strategies, and actionable recommendations for campaigns.
+
+reportlab layout is pure-Python CPU work that holds the GIL, so reports are
+rendered in a bounded process pool (PDF_RENDER_WORKERS) rather than on the
+event loop. Finished PDFs are cached by (campaign_id, intelligence version,
+sections), and concurrent requests for the same report render it once.
 """
 
+import asyncio
+import hashlib
 import io
+import json
 import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
@@ -21,16 +32,97 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.platypus.tableofcontents import TableOfContents
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 
+from src.core.shared.decorators import ResultCache, register_result_cache
+from src.core.shared.exceptions import ServiceUnavailableError
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", min(2, os.cpu_count() or 1)))
+DEFAULT_RENDER_MAX_PENDING = int(os.getenv("PDF_RENDER_MAX_PENDING", 16))
+# "process" (default) or "thread" where worker processes are not available
+RENDER_EXECUTOR = os.getenv("PDF_RENDER_EXECUTOR", "process").lower()
+REPORT_CACHE_TTL = int(os.getenv("PDF_REPORT_CACHE_TTL", 3600))
+REPORT_CACHE_MAX_ENTRIES = int(os.getenv("PDF_REPORT_CACHE_ENTRIES", 32))
+
+REPORT_CACHE_NAMESPACE = "pdf_reports"
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Per-process renderer (styles are built once per worker)
+_worker_service = None
+
+
+def _render_in_worker(campaign_id: str, intelligence_data: Dict[str, Any], include_sections: List[str]) -> bytes:
+    """Process pool entry point"""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = PDFReportService(render_workers=0)
+    return _worker_service.render_report(campaign_id, intelligence_data, include_sections)
+
+
+def intelligence_version(intelligence_data: Dict[str, Any]) -> str:
+    """Digest of the intelligence content; changes whenever the analysis does"""
+    canonical = json.dumps(intelligence_data, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def report_cache_key(campaign_id: str, intelligence_data: Dict[str, Any], include_sections: List[str]) -> str:
+    key_data = json.dumps([campaign_id, intelligence_version(intelligence_data), list(include_sections)])
+    return hashlib.sha256(key_data.encode()).hexdigest()
+
+
+def iter_pdf_chunks(pdf_bytes: bytes, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[memoryview]:
+    """Slices of the PDF for a streaming response, without copying it"""
+    view = memoryview(pdf_bytes)
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
 
 class PDFReportService:
     """Service for generating comprehensive PDF reports from intelligence data"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        render_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        executor: Optional[str] = None
+    ):
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
 
+        # 0 renders inline (used inside the worker processes themselves)
+        self.render_workers = DEFAULT_RENDER_WORKERS if render_workers is None else render_workers
+        self.max_pending = max(self.render_workers, max_pending or DEFAULT_RENDER_MAX_PENDING)
+        self.executor_kind = (executor or RENDER_EXECUTOR).lower()
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self._cache: Optional[ResultCache] = None
+
+    def _get_executor(self) -> Executor:
+        # Created on first use so importing the module starts no processes
+        if self._executor is None:
+            if self.executor_kind == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.render_workers, thread_name_prefix="pdf-render")
+            else:
+                # spawn: workers must not inherit the server's threads and sockets
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.render_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+        return self._executor
+
+    def close(self):
+        """Stop the render workers (application shutdown)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_cache(self) -> ResultCache:
+        if self._cache is None:
+            self._cache = register_result_cache(ResultCache(
+                REPORT_CACHE_NAMESPACE, ttl=REPORT_CACHE_TTL, max_entries=REPORT_CACHE_MAX_ENTRIES, backend="memory"
+            ))
+        return self._cache
+
     def _setup_custom_styles(self):
         """Setup custom paragraph styles for the report"""
 
@@ -113,52 +205,91 @@ class PDFReportService:
             PDF bytes
         """
         try:
-            logger.info(f"Generating PDF report for campaign {campaign_id}")
-
-            # Create PDF document
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(
-                buffer,
-                pagesize=letter,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18
+            cache = self._get_cache()
+            cache_key = report_cache_key(campaign_id, intelligence_data, include_sections)
+            entry = await cache.get_entry(cache_key)
+            if entry is not None:
+                cache.stats["hits"] += 1
+                logger.info(f"PDF report for campaign {campaign_id} served from cache")
+                return entry.value
+            cache.stats["misses"] += 1
+
+            return await cache.load(
+                cache_key,
+                lambda: self._render_offloaded(campaign_id, intelligence_data, include_sections)
             )
 
-            # Build content
-            story = []
-
-            # Title page
-            story.extend(self._create_title_page(campaign_id, intelligence_data))
-            story.append(PageBreak())
-
-            # Table of contents placeholder
-            story.append(Paragraph("Table of Contents", self.styles['CustomTitle']))
-            story.append(Spacer(1, 20))
-            story.append(PageBreak())
-
-            # Generate sections based on include_sections
-            for section in include_sections:
-                section_content = self._generate_section(section, intelligence_data)
-                if section_content:
-                    story.extend(section_content)
-                    story.append(PageBreak())
-
-            # Build PDF
-            doc.build(story)
-
-            # Get PDF bytes
-            pdf_bytes = buffer.getvalue()
-            buffer.close()
-
-            logger.info(f"PDF report generated successfully: {len(pdf_bytes)} bytes")
-            return pdf_bytes
-
+        except ServiceUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"PDF report generation failed: {e}")
             raise Exception(f"Failed to generate PDF report: {str(e)}")
 
+    async def _render_offloaded(self, campaign_id: str, intelligence_data: Dict[str, Any], include_sections: List[str]) -> bytes:
+        """Render in the worker pool, rejecting work past the pending cap"""
+
+        if self.render_workers <= 0:
+            return self.render_report(campaign_id, intelligence_data, include_sections)
+        if self._pending >= self.max_pending:
+            raise ServiceUnavailableError(
+                "Too many PDF reports are being generated, please retry shortly",
+                "pdf_reports"
+            )
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), _render_in_worker, campaign_id, intelligence_data, list(include_sections)
+            )
+        finally:
+            self._pending -= 1
+
+    def render_report(self, campaign_id: str, intelligence_data: Dict[str, Any], include_sections: List[str]) -> bytes:
+        """Build the PDF synchronously (CPU-bound; called off the event loop)"""
+
+        logger.info(f"Generating PDF report for campaign {campaign_id}")
+
+        # Create PDF document
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=letter,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18
+        )
+
+        # Build content
+        story = []
+
+        # Title page
+        story.extend(self._create_title_page(campaign_id, intelligence_data))
+        story.append(PageBreak())
+
+        # Table of contents placeholder
+        story.append(Paragraph("Table of Contents", self.styles['CustomTitle']))
+        story.append(Spacer(1, 20))
+        story.append(PageBreak())
+
+        # Generate sections based on include_sections
+        for section in include_sections:
+            section_content = self._generate_section(section, intelligence_data)
+            if section_content:
+                story.extend(section_content)
+                story.append(PageBreak())
+
+        # Build PDF
+        doc.build(story)
+
+        # Get PDF bytes
+        pdf_bytes = buffer.getvalue()
+        buffer.close()
+
+        logger.info(f"PDF report generated successfully: {len(pdf_bytes)} bytes")
+        return pdf_bytes
+
     def _create_title_page(self, campaign_id: str, intelligence_data: Dict[str, Any]) -> List:
         """Create the title page content"""
         content = []
@@ -8,13 +8,14 @@ AI Request Throttling and Provider Failover - FIXED VERSION
 """
 import asyncio
 import time
-import json
 import logging
 import re
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
+from src.intelligence.utils.json_extractor import extract_json, salvage_key_values, try_loads
+
 logger = logging.getLogger(__name__)
 
 # Global rate limiting state
@@ -36,6 +37,17 @@ class ProviderStatus(Enum):
 # PROVIDER HEALTH TRACKING
 # ============================================================================
 
+def _record_provider_call(provider_name: str, outcome: str, duration_seconds: float) -> None:
+    """Export a provider call to /metrics"""
+    try:
+        # Imported on use: the health package pulls in fastapi and psutil
+        from src.core.health.metrics import record_provider_call
+    except ImportError as e:
+        logger.debug(f"Provider metrics unavailable: {e}")
+        return
+    record_provider_call(provider_name, outcome, duration_seconds)
+
+
 def _update_provider_health(provider_name: str, success: bool, error_message: str = None) -> None:
     """Track provider health and automatically disable failing providers"""
     global _provider_health, _provider_failure_counts
@@ -161,6 +173,9 @@ def validate_and_parse_json(response_text: str, provider_name: str = "AI") -> An
     """
     🔥 COMPLETELY FIXED: Handle empty responses from Groq and other providers
     Returns None if parsing fails - no mock data contamination
+
+    Malformed responses go through a single linear scan (json_extractor),
+    so long or pathological outputs cannot make parsing quadratic.
     """
     
     if not response_text or not response_text.strip():
@@ -171,93 +186,29 @@ def validate_and_parse_json(response_text: str, provider_name: str = "AI") -> An
     cleaned = response_text.strip()
     
     # First attempt: Direct JSON parsing
-    try:
-        result = json.loads(cleaned)
+    parsed, result = try_loads(cleaned)
+    if parsed:
         logger.debug(f"✅ JSON parsed successfully from {provider_name}")
         return result
-    except json.JSONDecodeError as e:
-        logger.warning(f"⚠️ JSON parse error from {provider_name}: {str(e)}")
-        
-        # Second attempt: Fix common issues
-        try:
-            # Remove markdown code blocks
-            if "```json" in cleaned:
-                match = re.search(r'```json\s*(.*?)\s*```', cleaned, re.DOTALL)
-                if match:
-                    cleaned = match.group(1).strip()
-            elif "```" in cleaned:
-                match = re.search(r'```\s*(.*?)\s*```', cleaned, re.DOTALL)
-                if match:
-                    cleaned = match.group(1).strip()
-            
-            # Remove common prefixes/suffixes that aren't JSON
-            cleaned = re.sub(r'^[^{\[]*', '', cleaned)  # Remove everything before first { or [
-            cleaned = re.sub(r'[^}\]]*$', '', cleaned)  # Remove everything after last } or ]
-            
-            # Fix common JSON issues
-            cleaned = re.sub(r',\s*}', '}', cleaned)  # Remove trailing commas before }
-            cleaned = re.sub(r',\s*]', ']', cleaned)  # Remove trailing commas before ]
-            cleaned = re.sub(r'}\s*{', '},{', cleaned)  # Fix missing commas between objects
-            
-            # Try parsing the cleaned version
-            result = json.loads(cleaned)
-            logger.info(f"✅ Fixed JSON response from {provider_name}")
-            return result
-            
-        except json.JSONDecodeError:
-            logger.error(f"❌ Could not fix JSON from {provider_name}")
-            
-            # Third attempt: Extract JSON objects from mixed content
-            try:
-                # Look for JSON objects in the text (more aggressive)
-                json_matches = [
-                    r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}',  # Nested objects
-                    r'\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]',  # Nested arrays
-                    r'\{.*?\}',  # Simple objects
-                    r'\[.*?\]'   # Simple arrays
-                ]
-                
-                for pattern in json_matches:
-                    matches = re.findall(pattern, cleaned, re.DOTALL)
-                    for match in matches:
-                        try:
-                            result = json.loads(match)
-                            logger.info(f"✅ Extracted JSON from mixed content ({provider_name})")
-                            return result
-                        except:
-                            continue
-                            
-            except Exception:
-                pass
-            
-            # Fourth attempt: Try to extract key-value pairs manually
-            try:
-                # Look for patterns like "key": "value" or "key": ["value1", "value2"]
-                kv_pattern = r'"([^"]+)":\s*(?:"([^"]+)"|(\[[^\]]+\])|\{[^}]+\})'
-                matches = re.findall(kv_pattern, cleaned)
-                
-                if matches:
-                    result = {}
-                    for match in matches:
-                        key = match[0]
-                        if match[1]:  # String value
-                            result[key] = match[1]
-                        elif match[2]:  # Array or object value
-                            try:
-                                result[key] = json.loads(match[2])
-                            except:
-                                result[key] = match[2]
-                    
-                    if result:
-                        logger.info(f"✅ Extracted key-value pairs from {provider_name}")
-                        return result
-                        
-            except Exception:
-                pass
-            
-            # 🔥 CRITICAL CHANGE: Return None instead of mock data
-            logger.error(f"❌ All JSON parsing attempts failed for {provider_name} - NO MOCK DATA")
-            return None
+    logger.warning(f"⚠️ JSON parse error from {provider_name}")
+    
+    # Second attempt: Locate the outermost JSON value in mixed content, repairing
+    # trailing commas, missing commas between objects and truncation on the way
+    result = extract_json(cleaned)
+    if result is not None:
+        logger.info(f"✅ Fixed JSON response from {provider_name}")
+        return result
+    logger.error(f"❌ Could not fix JSON from {provider_name}")
+    
+    # Third attempt: Extract key-value pairs manually
+    result = salvage_key_values(cleaned)
+    if result:
+        logger.info(f"✅ Extracted key-value pairs from {provider_name}")
+        return result
+    
+    # 🔥 CRITICAL CHANGE: Return None instead of mock data
+    logger.error(f"❌ All JSON parsing attempts failed for {provider_name} - NO MOCK DATA")
+    return None
 
 # ============================================================================
 # 🔥 NEW: STRUCTURED FALLBACK RESPONSES
@@ -400,6 +351,9 @@ async def safe_ai_call(client, provider_name: str, model: str, messages: list, *
     estimated_tokens = prompt_length * 0.3  # Rough estimate
     logger.debug(f"💰 AI Call: {provider_name} | ~{estimated_tokens:.0f} tokens")
     
+    # Latency excludes the throttle wait above
+    started = time.perf_counter()
+    outcome = "error"
     try:
         # Make the API call based on provider type
         response_text = None
@@ -448,6 +402,7 @@ async def safe_ai_call(client, provider_name: str, model: str, messages: list, *
         if not response_text or not response_text.strip():
             logger.error(f"❌ {provider_name}: Empty response returned")
             _update_provider_health(provider_name, False, "Empty response")
+            outcome = "empty_response"
             return create_structured_fallback(provider_name, "empty_response")
         
         # Validate and parse JSON
@@ -455,6 +410,7 @@ async def safe_ai_call(client, provider_name: str, model: str, messages: list, *
         if result is not None:
             logger.debug(f"✅ {provider_name}: Successful API call")
             _update_provider_health(provider_name, True)
+            outcome = "success"
             
             # Return structured success response
             return {
@@ -462,11 +418,12 @@ async def safe_ai_call(client, provider_name: str, model: str, messages: list, *
                 "provider_used": provider_name,
                 "response": result,
                 "estimated_cost": _get_provider_cost(provider_name),
-                "processing_time": 0  # Could add actual timing
+                "processing_time": round(time.perf_counter() - started, 3)
             }
         else:
             logger.error(f"❌ {provider_name}: JSON parsing failed")
             _update_provider_health(provider_name, False, "JSON parsing failed")
+            outcome = "json_parsing_failed"
             
             # 🔥 NEW: Try to extract insights from raw text
             text_insights = _extract_insights_from_text(response_text)
@@ -490,11 +447,17 @@ async def safe_ai_call(client, provider_name: str, model: str, messages: list, *
         # Check if it's a rate limit error
         if "429" in error_message or "rate limit" in error_message.lower():
             logger.warning(f"🚨 Rate limit hit for {provider_name}")
+            outcome = "rate_limited"
+            _record_provider_call(provider_name, outcome, time.perf_counter() - started)
             await asyncio.sleep(10)
             return create_structured_fallback(provider_name, "rate_limit")
         
         # 🔥 CRITICAL CHANGE: Return structured fallback instead of None
         return create_structured_fallback(provider_name, error_message)
+    finally:
+        # Rate-limited calls were recorded before the back-off sleep
+        if outcome != "rate_limited":
+            _record_provider_call(provider_name, outcome, time.perf_counter() - started)
 
 # ============================================================================
 # MONITORING AND STATISTICS
@@ -0,0 +1,264 @@
+# Embedding generation for the research knowledge base
+# File: src/intelligence/utils/embedding_service.py
+
+"""
+Batched, cached text embeddings.
+
+Embeddings are cached by (model, input type, content hash), so a chunk is
+embedded once no matter how many documents or requests contain it. Misses
+are sent to the provider in batches of at most ``max_batch_size`` texts,
+with at most EMBEDDING_MAX_CONCURRENCY batches in flight. Concurrent
+requests for the same text share one provider call.
+
+A text that could not be embedded comes back as ``None`` instead of a zero
+vector, so it is never indexed or matched in similarity search.
+
+Backends (EMBEDDING_BACKEND):
+    cohere   Cohere embed API (default)
+    hashing  local, deterministic feature hashing; no network, for tests and
+             offline development (not semantically comparable to cohere)
+"""
+
+import asyncio
+import base64
+import hashlib
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.core.shared.decorators import ResultCache, register_result_cache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COHERE_MODEL = "embed-english-v3.0"
+DEFAULT_DIMENSION = 1024
+
+EMBEDDING_CACHE_NAMESPACE = "embeddings"
+# Embeddings of a given model never change, so entries only leave by LRU
+EMBEDDING_CACHE_TTL = int(os.getenv("EMBEDDING_CACHE_TTL", 30 * 24 * 3600))
+EMBEDDING_CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", 20000))
+EMBEDDING_MAX_CONCURRENCY = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", 4))
+EMBEDDING_MAX_RETRIES = int(os.getenv("EMBEDDING_MAX_RETRIES", 2))
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class CohereEmbeddingBackend:
+    """Cohere embed API"""
+
+    name = "cohere"
+    # Cohere accepts at most 96 texts per embed call
+    max_batch_size = 96
+
+    def __init__(self, client: Any = None, model: str = DEFAULT_COHERE_MODEL):
+        if client is None:
+            import cohere
+            client = cohere.AsyncClient(api_key=os.getenv("COHERE_API_KEY"))
+        self.client = client
+        self.model = model
+
+    async def embed(self, texts: List[str], input_type: str) -> List[List[float]]:
+        response = await self.client.embed(texts=texts, model=self.model, input_type=input_type)
+        return response.embeddings
+
+
+class HashingEmbeddingBackend:
+    """
+    Deterministic local embeddings from hashed word unigrams and bigrams
+
+    Texts sharing vocabulary get similar vectors, which is enough for
+    retrieval tests without a provider. Hashes come from blake2b, so vectors
+    are identical across processes and runs.
+    """
+
+    name = "hashing"
+    max_batch_size = 1024
+
+    def __init__(self, dimension: int = DEFAULT_DIMENSION):
+        self.dimension = dimension
+        self.model = f"hashing-{dimension}"
+
+    def _embed_one(self, text: str) -> List[float]:
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for feature in features:
+            digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+            # Low bits pick the dimension, the top bit the sign
+            vector[digest % self.dimension] += 1.0 if digest >> 63 else -1.0
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
+
+    async def embed(self, texts: List[str], input_type: str) -> List[List[float]]:
+        return [self._embed_one(text) for text in texts]
+
+
+def _encode_vector(vector: List[float]) -> str:
+    """Compact, JSON-safe cache value (float32 bytes as base64)"""
+    return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode("ascii")
+
+
+def _decode_vector(value: str) -> List[float]:
+    return np.frombuffer(base64.b64decode(value), dtype=np.float32).tolist()
+
+
+class EmbeddingService:
+    """Embeds texts through a backend with caching, batching and bounded concurrency"""
+
+    def __init__(
+        self,
+        backend: Any,
+        max_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
+        max_retries: int = EMBEDDING_MAX_RETRIES,
+        cache: Optional[ResultCache] = None
+    ):
+        self.backend = backend
+        self.max_retries = max_retries
+        self.cache = cache or register_result_cache(ResultCache(
+            EMBEDDING_CACHE_NAMESPACE,
+            ttl=EMBEDDING_CACHE_TTL,
+            max_entries=EMBEDDING_CACHE_MAX_ENTRIES,
+            should_cache=lambda value: value is not None
+        ))
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # cache key -> future of the provider call in progress
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.stats = {
+            "texts": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "coalesced": 0,
+            "provider_calls": 0,
+            "provider_texts": 0,
+            "failed_texts": 0,
+            "retries": 0,
+        }
+
+    @property
+    def model(self) -> str:
+        return self.backend.model
+
+    def cache_key(self, text: str, input_type: str) -> str:
+        content_hash = hashlib.sha256(text.encode()).hexdigest()
+        return f"{self.backend.model}:{input_type}:{content_hash}"
+
+    async def embed(self, texts: List[str], input_type: str = "search_document") -> List[Optional[List[float]]]:
+        """
+        Embed texts, in order
+
+        Returns:
+            One vector per text, or ``None`` where embedding failed
+        """
+
+        self.stats["texts"] += len(texts)
+        keys = [self.cache_key(text, input_type) for text in texts]
+        vectors: Dict[str, Optional[List[float]]] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        missing: Dict[str, str] = {}
+
+        for key, text in zip(keys, texts):
+            if key in vectors or key in waiting or key in missing:
+                continue
+            entry = await self.cache.get_entry(key)
+            if entry is not None:
+                self.stats["cache_hits"] += 1
+                vectors[key] = _decode_vector(entry.value)
+            elif key in self._inflight:
+                self.stats["coalesced"] += 1
+                waiting[key] = self._inflight[key]
+            else:
+                self.stats["cache_misses"] += 1
+                missing[key] = text
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            futures = {key: loop.create_future() for key in missing}
+            self._inflight.update(futures)
+            batch_size = self.backend.max_batch_size
+            items = [(key, text, futures[key]) for key, text in missing.items()]
+            batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+            try:
+                await asyncio.gather(*(self._embed_batch(batch, input_type) for batch in batches))
+            finally:
+                for key, future in futures.items():
+                    if self._inflight.get(key) is future:
+                        del self._inflight[key]
+                    if not future.done():
+                        future.set_result(None)
+                    vectors[key] = future.result()
+
+        for key, future in waiting.items():
+            vectors[key] = await asyncio.shield(future)
+
+        return [vectors[key] for key in keys]
+
+    async def embed_query(self, text: str) -> Optional[List[float]]:
+        """Embed a search query (Cohere's ``search_query`` input type)"""
+        return (await self.embed([text], input_type="search_query"))[0]
+
+    async def _embed_batch(self, batch: List[tuple], input_type: str):
+        """One provider call for a batch of (cache key, text, future); resolves the futures"""
+
+        texts = [text for _, text, _ in batch]
+        embeddings = None
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    self.stats["provider_calls"] += 1
+                    embeddings = await self.backend.embed(texts, input_type)
+                    break
+                except Exception as e:
+                    if attempt == self.max_retries:
+                        logger.error(f"Embedding generation failed for {len(texts)} texts: {e}")
+                        break
+                    self.stats["retries"] += 1
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+        self.stats["provider_texts"] += len(texts)
+
+        for i, (key, _, future) in enumerate(batch):
+            vector = embeddings[i] if embeddings is not None and i < len(embeddings) else None
+            # A zero vector has no direction; treat it as a failure rather than a match for nothing
+            if vector is not None and not np.any(np.asarray(vector, dtype=np.float32)):
+                vector = None
+            if vector is None:
+                self.stats["failed_texts"] += 1
+            else:
+                await self.cache.store(key, _encode_vector(vector))
+            # The caller may already have given up on this batch and resolved it
+            if not future.done():
+                future.set_result(vector)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend.name,
+            "model": self.backend.model,
+            **self.stats,
+            "cache": self.cache.get_stats(),
+        }
+
+
+def create_embedding_backend(name: Optional[str] = None, client: Any = None):
+    """Backend from EMBEDDING_BACKEND (cohere or hashing)"""
+
+    name = (name or os.getenv("EMBEDDING_BACKEND", "cohere")).lower()
+    if name == "hashing":
+        return HashingEmbeddingBackend(int(os.getenv("EMBEDDING_DIMENSION", DEFAULT_DIMENSION)))
+    if name == "cohere":
+        return CohereEmbeddingBackend(client, os.getenv("COHERE_EMBED_MODEL", DEFAULT_COHERE_MODEL))
+    raise ValueError(f"Unknown embedding backend {name}, expected cohere or hashing")
+
+
+# Global instance
+_embedding_service = None
+
+def get_embedding_service() -> EmbeddingService:
+    """Get global embedding service instance"""
+    global _embedding_service
+    if _embedding_service is None:
+        _embedding_service = EmbeddingService(create_embedding_backend())
+    return _embedding_service
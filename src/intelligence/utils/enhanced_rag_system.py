@@ -8,27 +8,41 @@ import os
 import uuid
 import numpy as np
 from typing import List, Dict, Any, Optional
-import cohere
-from sklearn.metrics.pairwise import cosine_similarity
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 import logging
 
 from src.intelligence.repositories.intelligence_repository import IntelligenceRepository
+from src.intelligence.utils.embedding_service import EmbeddingService, get_embedding_service
+from src.intelligence.utils.research_vector_store import ResearchVectorStore, get_research_vector_store
 
 logger = logging.getLogger(__name__)
 
+# Minimum cosine similarity for a chunk to count as relevant
+RELEVANCE_THRESHOLD = float(os.getenv("RAG_RELEVANCE_THRESHOLD", 0.7))
+
 class IntelligenceRAGSystem:
     """
     Enhanced RAG system optimized for CampaignForge intelligence gathering
     Updated to work with new 6-table intelligence schema
     """
     
-    def __init__(self, db: AsyncSession = None):
-        self.cohere_client = cohere.AsyncClient(api_key=os.getenv("COHERE_API_KEY"))
-        self.document_embeddings = {}
-        self.document_chunks = {}
+    def __init__(
+        self,
+        db: AsyncSession = None,
+        vector_store: Optional[ResearchVectorStore] = None,
+        embedding_service: Optional[EmbeddingService] = None
+    ):
+        self.embedding_service = embedding_service or get_embedding_service()
+        # Database-backed instances share the persistent research index;
+        # without a database, documents stay private to this instance
+        self.vector_store = vector_store or (get_research_vector_store() if db is not None else ResearchVectorStore(backend="memory"))
         self.db = db
+    
+    @property
+    def document_chunks(self) -> Dict[str, Dict[str, Any]]:
+        """Chunks, metadata and content type per document"""
+        return self.vector_store.documents
         
     def set_database_connection(self, db: AsyncSession):
         """Set database connection for RAG system"""
@@ -41,16 +55,19 @@ class IntelligenceRAGSystem:
             # Smart chunking for research content
             chunks = self._intelligent_chunk_research_content(content)
             
-            # Generate embeddings using Cohere (best for research)
+            # Generate embeddings (cached per chunk; failed chunks come back as None)
             embeddings = await self._generate_embeddings(chunks)
             
-            # Store with metadata
-            self.document_embeddings[doc_id] = embeddings
-            self.document_chunks[doc_id] = {
-                'chunks': chunks,
-                'metadata': metadata or {},
-                'content_type': self._classify_content_type(content)
-            }
+            # Store with metadata and index the vectors
+            await self.vector_store.add_document(
+                doc_id,
+                chunks,
+                embeddings,
+                metadata=metadata,
+                content_type=self._classify_content_type(content),
+                model=self.embedding_service.model,
+                db=self.db
+            )
             
             logger.info(f"Added research document {doc_id} with {len(chunks)} chunks")
             return True
@@ -59,16 +76,38 @@ class IntelligenceRAGSystem:
             logger.error(f"Failed to add research document {doc_id}: {str(e)}")
             return False
     
-    async def add_research_document_to_db(self, doc_id: str, content: str, research_type: str, metadata: Dict[str, Any] = None):
-        """Add research document to both RAG system and knowledge_base table"""
+    async def add_research_document_to_db(
+        self,
+        doc_id: str,
+        content: str,
+        research_type: str,
+        metadata: Dict[str, Any] = None
+    ) -> Optional[str]:
+        """
+        Add research document to both RAG system and knowledge_base table
+
+        Returns:
+            Id the content is stored under: ``doc_id``, or the id of the
+            knowledge_base row that already holds this content. None on failure.
+        """
         
         try:
-            # Add to RAG system (existing method)
-            success = await self.add_research_document(doc_id, content, metadata)
+            content_hash = hashlib.sha256(content.encode()).hexdigest()
+            
+            # Identical content already in the knowledge base keeps its id,
+            # and its embeddings when its chunks are in the vector store
+            existing_id = await self._find_research_id(content_hash)
+            if existing_id:
+                doc_id = existing_id
+            if existing_id and await self.vector_store.has_document(existing_id, self.db):
+                logger.info(f"Research content already embedded as {existing_id}, skipping embedding")
+                success = True
+            else:
+                # Add to RAG system (existing method)
+                success = await self.add_research_document(doc_id, content, metadata)
             
             if success and self.db:
                 # Store in new knowledge_base table
-                content_hash = hashlib.sha256(content.encode()).hexdigest()
                 
                 query = text("""
                     INSERT INTO knowledge_base (id, content_hash, content, research_type, source_metadata, created_at)
@@ -89,11 +128,28 @@ class IntelligenceRAGSystem:
                 await self.db.commit()
                 logger.info(f"Stored research document {doc_id} in knowledge_base")
             
-            return success
+            return doc_id if success else None
             
         except Exception as e:
             logger.error(f"Failed to add research document to database: {str(e)}")
-            return False
+            return None
+
+    async def _find_research_id(self, content_hash: str) -> Optional[str]:
+        """Knowledge base id of this content, if it is already stored"""
+        
+        if not self.db:
+            return None
+        try:
+            result = await self.db.execute(
+                text("SELECT id FROM knowledge_base WHERE content_hash = :content_hash"),
+                {"content_hash": content_hash}
+            )
+            row = result.first()
+            if row:
+                return str(row.id)
+        except Exception as e:
+            logger.warning(f"Knowledge base lookup failed: {str(e)}")
+        return None
 
     async def link_intelligence_to_research(self, intelligence_id: str, research_ids: List[str], relevance_scores: List[float]):
         """Link intelligence analysis to research documents in intelligence_research table"""
@@ -203,37 +259,32 @@ class IntelligenceRAGSystem:
             logger.error(f"Failed to retrieve research from knowledge base: {str(e)}")
             return []
     
-    async def intelligent_research_query(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    async def intelligent_research_query(
+        self,
+        query: str,
+        top_k: int = 5,
+        min_similarity: float = RELEVANCE_THRESHOLD,
+        doc_ids: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Intelligent research query with context-aware retrieval
         Optimized for competitive intelligence and market research
+
+        The vector store is shared across users; ``doc_ids`` limits the
+        search to the caller's own research documents.
         """
         
         try:
             # Generate query embedding
-            query_embedding = await self._generate_embeddings([query])
-            query_vec = query_embedding[0]
-            
-            # Find most relevant chunks across all documents
-            relevant_chunks = []
+            query_vec = await self.embedding_service.embed_query(query)
+            if query_vec is None:
+                logger.warning("Research query could not be embedded")
+                return []
             
-            for doc_id, embeddings in self.document_embeddings.items():
-                similarities = cosine_similarity([query_vec], embeddings)[0]
-                doc_chunks = self.document_chunks[doc_id]['chunks']
-                
-                for i, similarity in enumerate(similarities):
-                    if similarity > 0.7:  # Threshold for relevance
-                        relevant_chunks.append({
-                            'doc_id': doc_id,
-                            'chunk_index': i,
-                            'content': doc_chunks[i],
-                            'similarity': float(similarity),
-                            'metadata': self.document_chunks[doc_id]['metadata']
-                        })
-            
-            # Sort by relevance and return top_k
-            relevant_chunks.sort(key=lambda x: x['similarity'], reverse=True)
-            return relevant_chunks[:top_k]
+            # Top-k most relevant chunks of the given documents, best first
+            return await self.vector_store.search(
+                query_vec, top_k=top_k, min_similarity=min_similarity, db=self.db, doc_ids=doc_ids
+            )
             
         except Exception as e:
             logger.error(f"Research query failed: {str(e)}")
@@ -323,21 +374,10 @@ class IntelligenceRAGSystem:
         
         return chunks
 
-    async def _generate_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings using Cohere (optimal for research)"""
+    async def _generate_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Generate document embeddings; None marks chunks that could not be embedded"""
         
-        try:
-            response = await self.cohere_client.embed(
-                texts=texts,
-                model="embed-english-v3.0",
-                input_type="search_document"
-            )
-            return response.embeddings
-            
-        except Exception as e:
-            logger.error(f"Embedding generation failed: {str(e)}")
-            # Fallback to basic embeddings
-            return [[0.0] * 1024 for _ in texts]
+        return await self.embedding_service.embed(texts, input_type="search_document")
     
     def _classify_content_type(self, content: str) -> str:
         """Classify research content type for optimal processing"""
@@ -445,22 +485,25 @@ class EnhancedSalesPageAnalyzer:
                     research_id = f"research_doc_{uuid.uuid4().hex[:8]}"
                     research_type = self.rag_system._classify_research_type(doc_content)
                     
-                    success = await self.rag_system.add_research_document_to_db(
+                    stored_id = await self.rag_system.add_research_document_to_db(
                         research_id, 
                         doc_content, 
                         research_type,
                         {'source': 'user_provided', 'index': i}
                     )
                     
-                    if success:
-                        research_ids.append(research_id)
+                    # Duplicate content is linked under its existing id
+                    if stored_id and stored_id not in research_ids:
+                        research_ids.append(stored_id)
                         relevance_scores.append(0.8 - (i * 0.1))  # Decreasing relevance
                 
                 # Query for relevant context
                 product_name = base_analysis.get('product_name', 'Product')
                 research_query = f"competitive analysis market research {product_name}"
                 
-                relevant_chunks = await self.rag_system.intelligent_research_query(research_query)
+                relevant_chunks = await self.rag_system.intelligent_research_query(
+                    research_query, doc_ids=research_ids
+                )
                 
                 if relevant_chunks:
                     # Generate enhanced intelligence
@@ -520,15 +563,18 @@ class RAGIntelligenceIntegration:
                 query = f"detailed analysis {product_name} competitive intelligence"
                 
                 # Add research to RAG system
+                doc_ids = []
                 for i, doc in enumerate(research_docs):
-                    await self.rag_system.add_research_document(
-                        f"existing_research_{i}",
+                    doc_id = f"{intelligence_id}_research_{i}"
+                    if await self.rag_system.add_research_document(
+                        doc_id,
                         doc['content'],
                         doc.get('metadata', {})
-                    )
+                    ):
+                        doc_ids.append(doc_id)
                 
-                # Query for insights
-                relevant_chunks = await self.rag_system.intelligent_research_query(query)
+                # Query for insights from this intelligence's research only
+                relevant_chunks = await self.rag_system.intelligent_research_query(query, doc_ids=doc_ids)
                 
                 if relevant_chunks:
                     enhanced_analysis = await self.rag_system.generate_enhanced_intelligence(
@@ -587,8 +633,10 @@ class RAGIntelligenceIntegration:
                     "enhanced_intelligence": link_stats[1] if link_stats else 0,
                     "avg_relevance": round(float(link_stats[2]), 2) if link_stats and link_stats[2] else 0.0
                 },
-                "in_memory_documents": len(self.rag_system.document_embeddings),
-                "system_status": "operational" if len(self.rag_system.document_embeddings) > 0 else "empty"
+                "vector_index": self.rag_system.vector_store.get_stats(),
+                "embeddings": self.rag_system.embedding_service.get_stats(),
+                "in_memory_documents": len(self.rag_system.document_chunks),
+                "system_status": "operational" if len(self.rag_system.vector_store.index) > 0 else "empty"
             }
             
         except Exception as e:
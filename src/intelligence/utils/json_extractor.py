@@ -0,0 +1,293 @@
+# src/intelligence/utils/json_extractor.py
+"""
+Single-pass JSON extraction from AI provider responses.
+
+Model output often wraps the JSON in prose or markdown fences, leaves
+trailing commas, drops the commas between objects in an array, or is cut
+off at the token limit. ``extract_json`` handles all of that in one
+left-to-right scan. The scan tracks bracket and string state, so braces
+inside strings and in the surrounding prose never confuse it.
+
+- Outside a value, the scan jumps straight to the next ``{`` or ``[``.
+- Inside a value, it visits only the structural tokens: strings, brackets
+  and commas.
+- Repairs (dropped trailing commas, inserted missing commas) are recorded
+  as edits while scanning and applied only to the candidate being parsed.
+- The first balanced top-level value that parses is returned.
+- A truncated value is closed (or cut back to its last complete element)
+  before giving up.
+
+Every candidate is disjoint from the others, so the total work is linear
+in the response length. No regex here backtracks.
+
+Parsing uses orjson when it is installed and falls back to ``json``,
+which also accepts ``NaN``/``Infinity`` and lone surrogates.
+"""
+
+import json
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+_CLOSERS = {"{": "}", "[": "]"}
+_VALUE_START = re.compile(r'[{\[]')
+# A JSON string (group 1 is the closing quote, absent if unterminated), a run of
+# opening or of closing brackets, or a comma. Leading with one character class
+# lets the regex engine skip non-structural text without trying each branch.
+_TOKEN = re.compile(
+    r'["{}\[\],]'
+    r'(?:(?<=")(?:[^"\\]|\\.)*(")?|(?<=[{\[])[{\[]*|(?<=[}\]])[}\]]*|)',
+    re.DOTALL
+)
+# Values nested deeper than this cannot be parsed by orjson or json anyway
+MAX_DEPTH = 512
+_KEY = re.compile(r'"([^"\\]+)"\s*:\s*')
+
+# Edit kinds
+_DROP = 0          # drop the character at the index (a trailing comma)
+_INSERT_COMMA = 1  # insert "," before the index (between adjacent values)
+
+
+def loads(text: str) -> Any:
+    """
+    Parse a JSON document, with orjson when available
+
+    Raises:
+        ValueError: The text is not valid JSON (json.JSONDecodeError and
+            orjson.JSONDecodeError are both ValueErrors)
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # json is more lenient (NaN, Infinity, lone surrogates, huge integers)
+            pass
+    return json.loads(text)
+
+
+def try_loads(text: str) -> Tuple[bool, Any]:
+    """(True, value) if ``text`` parses, else (False, None); never raises"""
+    try:
+        return True, loads(text)
+    except (ValueError, RecursionError):
+        return False, None
+
+
+def _is_blank(text: str, start: int, end: int) -> bool:
+    return start >= end or text[start:end].isspace()
+
+
+class _Scan:
+    """State of one extraction scan over ``text``"""
+
+    def __init__(self, text: str):
+        self.text = text
+        # (opener, index, index of its last direct comma or -1)
+        self.stack: List[List[Any]] = []
+        # (index, kind), in index order
+        self.edits: List[Tuple[int, int]] = []
+        # Complete values inside still-open containers, outermost only, in order
+        self.completed: List[Tuple[int, int]] = []
+        self.in_string = False
+
+    def render(self, start: int, end: int, suffix: str = "") -> str:
+        """text[start:end] with the recorded repairs applied"""
+        parts = []
+        cursor = start
+        first = bisect_left(self.edits, (start, -1))
+        for index, kind in self.edits[first:]:
+            if index >= end:
+                break
+            parts.append(self.text[cursor:index])
+            if kind == _DROP:
+                cursor = index + 1
+            else:
+                parts.append(",")
+                cursor = index
+        parts.append(self.text[cursor:end])
+        parts.append(suffix)
+        return "".join(parts)
+
+    def parse(self, start: int, end: int, suffix: str = "") -> Tuple[bool, Any]:
+        return try_loads(self.render(start, end, suffix))
+
+    def try_completed(self) -> Tuple[bool, Any]:
+        """Parse the complete values found inside abandoned containers"""
+        completed, self.completed = self.completed, []
+        for start, end in completed:
+            parsed, value = self.parse(start, end)
+            if parsed:
+                return True, value
+        return False, None
+
+    def close_truncated(self, prev: str, prev_end: int) -> Tuple[bool, Any]:
+        """Close a value cut off mid-way, first as is, then at its last complete element"""
+        if not self.stack:
+            return False, None
+        text = self.text
+        start = self.stack[0][1]
+        closers = "".join(_CLOSERS[opener] for opener, _, _ in reversed(self.stack))
+
+        # A bare trailing { or [ holds nothing; closing it would invent an
+        # empty container, so only earlier complete elements are kept
+        bare_opener = not self.in_string and _is_blank(text, self.stack[-1][1] + 1, len(text))
+        if bare_opener and len(self.stack) == 1:
+            return False, None
+
+        suffix = ('"' if self.in_string else "") + closers
+        end = len(text)
+        if prev == "," and not self.in_string and _is_blank(text, prev_end, end):
+            end = prev_end - 1
+        if not bare_opener:
+            parsed, value = self.parse(start, end, suffix)
+            if parsed:
+                return True, value
+
+        # Cut back to the innermost container that has a complete element
+        for depth in range(len(self.stack) - 1, -1, -1):
+            last_comma = self.stack[depth][2]
+            if last_comma >= 0:
+                closers = "".join(_CLOSERS[opener] for opener, _, _ in reversed(self.stack[:depth + 1]))
+                parsed, value = self.parse(start, last_comma, closers)
+                if parsed:
+                    return True, value
+                break
+        return False, None
+
+    def run(self) -> Tuple[bool, Any]:
+        text = self.text
+        stack = self.stack
+        edits = self.edits
+        pos = 0
+
+        while True:
+            match = _VALUE_START.search(text, pos)
+            if match is None:
+                return False, None
+            stack.append([match.group(), match.start(), -1])
+            prev, prev_end = match.group(), match.end()
+            truncated = True
+
+            for match in _TOKEN.finditer(text, prev_end):
+                token = match.group()
+                char = token[0]
+                index, pos = match.start(), match.end()
+
+                if char == '"':
+                    if match.group(1) is None:
+                        # Unterminated string: the value was cut off
+                        self.in_string = True
+                        break
+                elif char == ",":
+                    stack[-1][2] = index
+                elif char in _CLOSERS:
+                    if prev in "}]" and stack[-1][0] == "[" and _is_blank(text, prev_end, index):
+                        edits.append((index, _INSERT_COMMA))
+                    if len(stack) + len(token) > MAX_DEPTH:
+                        # Deeper than either parser accepts: abandon this value
+                        truncated = False
+                        break
+                    if len(token) == 1:
+                        stack.append([char, index, -1])
+                    else:
+                        stack.extend([opener, index + offset, -1] for offset, opener in enumerate(token))
+                else:
+                    done = self._close(token, index, prev, prev_end)
+                    if done is not None:
+                        parsed, value = done
+                        if parsed:
+                            return True, value
+                        truncated = False
+                        break
+
+                prev, prev_end = token[-1], pos
+
+            if truncated:
+                # The text ended inside a value
+                parsed, value = self.close_truncated(prev, prev_end)
+                if parsed:
+                    return True, value
+                return self.try_completed()
+
+            # Abandoned or unparseable value: look for the next one after it
+            stack.clear()
+            parsed, value = self.try_completed()
+            if parsed:
+                return True, value
+
+    def _close(self, token: str, index: int, prev: str, prev_end: int) -> Optional[Tuple[bool, Any]]:
+        """
+        Apply a run of closing brackets
+
+        Returns:
+            None while the value stays open, else the parse result of the
+            finished top-level value ((False, None) when the brackets do
+            not match it)
+        """
+        text = self.text
+        stack = self.stack
+        for offset, closer in enumerate(token):
+            opener, start, _ = stack[-1]
+            if _CLOSERS[opener] != closer:
+                return False, None
+            if offset == 0 and prev == "," and _is_blank(text, prev_end, index):
+                self.edits.append((prev_end - 1, _DROP))
+            stack.pop()
+            end = index + offset + 1
+            if not stack:
+                self.completed = []
+                return self.parse(start, end)
+            while self.completed and self.completed[-1][0] > start:
+                self.completed.pop()
+            self.completed.append((start, end))
+        return None
+
+
+def extract_json(text: str) -> Optional[Any]:
+    """
+    First JSON object or array embedded in ``text``, repaired if needed
+
+    Returns:
+        The parsed value, or None if the text contains no recoverable
+        object or array
+    """
+    if not text:
+        return None
+    parsed, value = _Scan(text).run()
+    return value if parsed else None
+
+
+def salvage_key_values(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Collect ``"key": "string"`` and ``"key": [array]`` pairs from text that
+    holds no parseable JSON value, or None if there are none
+    """
+    result: Dict[str, Any] = {}
+    next_close = -1
+    for match in _KEY.finditer(text):
+        key, index = match.group(1), match.end()
+        if index >= len(text):
+            break
+        char = text[index]
+        if char == '"':
+            string = _TOKEN.match(text, index)
+            if string.group(1) is not None and string.end() - index > 2:
+                parsed, value = try_loads(string.group())
+                result[key] = value if parsed else string.group()[1:-1]
+        elif char == "[":
+            if next_close < index:
+                next_close = text.find("]", index)
+                if next_close < 0:
+                    next_close = len(text)
+            if index + 1 < next_close < len(text):
+                raw = text[index:next_close + 1]
+                parsed, value = try_loads(raw)
+                result[key] = value if parsed else raw
+    return result or None
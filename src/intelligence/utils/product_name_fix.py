@@ -9,76 +9,153 @@ UNIVERSAL Product Name Extraction System - COMPLETELY FIXED VERSION
 """
 
 import re
+import os
+import json
+import hashlib
 import logging
 from typing import Dict, List, Any, Optional, Set, Tuple
 from urllib.parse import urlparse
 from collections import Counter, defaultdict
+from functools import lru_cache
+
+from src.core.shared.decorators import ResultCache, register_result_cache
 
 logger = logging.getLogger(__name__)
 
+# CRITICAL FIX: Enhanced patterns specifically for compound product names
+UNIVERSAL_PATTERNS = [
+    # PRIORITY 1: Exact compound product names (AquaSculpt pattern)
+    r'\b(AquaSculpt)\b',
+    r'\b(LiverPure)\b',
+    r'\b(MetaboFlex)\b',
+    r'\b(ProstaStream)\b',
+    r'\b(MetaboFix)\b',
+    r'\b(GlucoTrust)\b',
+    r'\b(ProDentim)\b',
+
+    # PRIORITY 2: CamelCase product patterns
+    r'\b([A-Z][a-z]+[A-Z][a-z]+(?:[A-Z][a-z]+)?)\b',
+
+    # PRIORITY 3: Direct mentions with action words (improved)
+    r'(?:try|get|use|discover|introducing|meet|welcome\s+to|buy|order|download)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
+
+    # PRIORITY 4: Product helps/supports patterns
+    r'([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})\s+(?:helps?|supports?|provides?|delivers?|works?|offers?|gives?|may\s+make)',
+
+    # PRIORITY 5: Difference/benefits patterns (for "The Difference AquaSculpt May Make")
+    r'(?:difference|benefits?|power\s+of|magic\s+of|secret\s+of)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
+
+    # PRIORITY 6: Possessive and descriptive patterns
+    r'(?:with|using|from|about)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
+
+    # PRIORITY 7: Trademark and quoted patterns
+    r'([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})\s*[™®©]',
+    r'"([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})"',
+    r"'([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})'",
+
+    # PRIORITY 8: Business/program patterns
+    r'([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})\s+(?:program|system|method|course|training|formula|solution|protocol)',
+
+    # PRIORITY 9: Results/testimonial patterns
+    r'(?:thanks\s+to|because\s+of|after\s+using)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
+
+    # PRIORITY 10: Call-to-action patterns
+    r'(?:click|tap)\s+(?:here\s+)?(?:to\s+)?(?:get|try|order|access|download)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})'
+]
+
+# Enhanced product suffixes
+PRODUCT_SUFFIXES = [
+    # Health/supplement suffixes
+    'Pure', 'Max', 'Plus', 'Pro', 'Ultra', 'Advanced', 'Complete', 'Elite', 'Premium',
+    'Sculpt', 'Burn', 'Boost', 'Guard', 'Shield', 'Force', 'Power', 'Flow',
+    'Cleanse', 'Detox', 'Restore', 'Repair', 'Renew', 'Revive', 'Trust', 'Fix',
+
+    # Business/software suffixes
+    'Pro', 'Suite', 'Master', 'Academy', 'University', 'Blueprint', 'Secrets',
+    'Method', 'System', 'Formula', 'Protocol', 'Strategy', 'Mastery',
+
+    # Course/training suffixes
+    'Course', 'Training', 'Bootcamp', 'Workshop', 'Masterclass', 'Program',
+
+    # Generic premium suffixes
+    'Gold', 'Platinum', 'Diamond', 'VIP', 'Executive', 'Deluxe'
+]
+
+# Company-specific patterns
+COMPANY_PATTERNS = [
+    r'(?:from|by|created by|made by|developed by)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
+    r'([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})\s+(?:Inc|LLC|Corp|Limited|Company)',
+    r'©\s*(?:\d{4}\s+)?([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
+    r'(?:contact|about)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})'
+]
+
+# Extraction results, memoized by a hash of the intelligence fields they read
+EXTRACTION_CACHE_NAMESPACE = "product_extraction"
+EXTRACTION_CACHE_TTL = int(os.getenv("PRODUCT_EXTRACTION_CACHE_TTL", "86400"))
+EXTRACTION_CACHE_MAX_ENTRIES = int(os.getenv("PRODUCT_EXTRACTION_CACHE_MAX_ENTRIES", "2048"))
+CANDIDATE_CACHE_MAX_ENTRIES = 10000
+
+# Every intelligence field product and company extraction look at
+EXTRACTION_FIELDS = (
+    "salespage_url", "url", "raw_content", "content", "page_title", "source_title", "title",
+    "product_name", "extracted_product_name", "brand_name", "skip_product_extraction",
+    "offer_intelligence", "psychology_intelligence", "content_intelligence",
+    "brand_intelligence", "scientific_intelligence",
+)
+
+
+class ExtractionPatterns:
+    """Every regex used by product and company extraction, compiled once at import time"""
+
+    universal = tuple(re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in UNIVERSAL_PATTERNS)
+    # (suffix, pattern) in PRODUCT_SUFFIXES order; suffix matching is case-sensitive
+    suffixes = tuple(
+        (suffix, re.compile(rf'\b([A-Z][a-zA-Z]{{2,15}}{re.escape(suffix)})\b'))
+        for suffix in PRODUCT_SUFFIXES
+    )
+    company = tuple(re.compile(pattern, re.IGNORECASE) for pattern in COMPANY_PATTERNS)
+
+    non_name_chars = re.compile(r'[^\w\s\-]')
+    whitespace = re.compile(r'\s+')
+    camel_case = re.compile(r'[a-z][A-Z]')
+    letter = re.compile(r'[a-zA-Z]')
+    non_letters = re.compile(r'[^a-zA-Z]')
+    word = re.compile(r'\w+')
+
+    url_get_prefix = re.compile(r'^get')
+    url_now_tld = re.compile(r'now\.(net|com|org)')
+    url_tld = re.compile(r'\.(net|com|org)$')
+
+
+class MentionIndex:
+    """
+    Case-insensitive whole-word mention counts for any phrase, from a single
+    tokenization pass over the text
+    """
+
+    def __init__(self, text: str):
+        self.tokens = ExtractionPatterns.word.findall(text.lower())
+        self.positions: Dict[str, List[int]] = defaultdict(list)
+        for position, token in enumerate(self.tokens):
+            self.positions[token].append(position)
+
+    def count(self, phrase: str) -> int:
+        words = ExtractionPatterns.word.findall(phrase.lower())
+        if not words:
+            return 0
+        starts = self.positions.get(words[0], ())
+        if len(words) == 1:
+            return len(starts)
+        return sum(1 for start in starts if self.tokens[start:start + len(words)] == words)
+
+
 class UniversalProductExtractor:
     """Universal product name extractor for any sales page - FIXED VERSION"""
     
     def __init__(self):
-        # CRITICAL FIX: Enhanced patterns specifically for compound product names
-        self.universal_patterns = [
-            # PRIORITY 1: Exact compound product names (AquaSculpt pattern)
-            r'\b(AquaSculpt)\b',
-            r'\b(LiverPure)\b',
-            r'\b(MetaboFlex)\b', 
-            r'\b(ProstaStream)\b',
-            r'\b(MetaboFix)\b',
-            r'\b(GlucoTrust)\b',
-            r'\b(ProDentim)\b',
-            
-            # PRIORITY 2: CamelCase product patterns
-            r'\b([A-Z][a-z]+[A-Z][a-z]+(?:[A-Z][a-z]+)?)\b',
-            
-            # PRIORITY 3: Direct mentions with action words (improved)
-            r'(?:try|get|use|discover|introducing|meet|welcome\s+to|buy|order|download)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
-            
-            # PRIORITY 4: Product helps/supports patterns
-            r'([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})\s+(?:helps?|supports?|provides?|delivers?|works?|offers?|gives?|may\s+make)',
-            
-            # PRIORITY 5: Difference/benefits patterns (for "The Difference AquaSculpt May Make")
-            r'(?:difference|benefits?|power\s+of|magic\s+of|secret\s+of)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
-            
-            # PRIORITY 6: Possessive and descriptive patterns
-            r'(?:with|using|from|about)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
-            
-            # PRIORITY 7: Trademark and quoted patterns
-            r'([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})\s*[™®©]',
-            r'"([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})"',
-            r"'([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})'",
-            
-            # PRIORITY 8: Business/program patterns
-            r'([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})\s+(?:program|system|method|course|training|formula|solution|protocol)',
-            
-            # PRIORITY 9: Results/testimonial patterns
-            r'(?:thanks\s+to|because\s+of|after\s+using)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
-            
-            # PRIORITY 10: Call-to-action patterns
-            r'(?:click|tap)\s+(?:here\s+)?(?:to\s+)?(?:get|try|order|access|download)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})'
-        ]
-        
-        # Enhanced product suffixes
-        self.product_suffixes = [
-            # Health/supplement suffixes
-            'Pure', 'Max', 'Plus', 'Pro', 'Ultra', 'Advanced', 'Complete', 'Elite', 'Premium',
-            'Sculpt', 'Burn', 'Boost', 'Guard', 'Shield', 'Force', 'Power', 'Flow',
-            'Cleanse', 'Detox', 'Restore', 'Repair', 'Renew', 'Revive', 'Trust', 'Fix',
-            
-            # Business/software suffixes  
-            'Pro', 'Suite', 'Master', 'Academy', 'University', 'Blueprint', 'Secrets',
-            'Method', 'System', 'Formula', 'Protocol', 'Strategy', 'Mastery',
-            
-            # Course/training suffixes
-            'Course', 'Training', 'Bootcamp', 'Workshop', 'Masterclass', 'Program',
-            
-            # Generic premium suffixes
-            'Gold', 'Platinum', 'Diamond', 'VIP', 'Executive', 'Deluxe'
-        ]
-        
+        self.universal_patterns = UNIVERSAL_PATTERNS
+        self.product_suffixes = PRODUCT_SUFFIXES
+
         # CRITICAL FIX: More specific false positive filters
         self.false_positives = {
             # Generic words that appear in many contexts
@@ -118,6 +195,9 @@ class UniversalProductExtractor:
             'alpilean': 'Alpilean'
         }
 
+        # Raw pattern match -> formatted name, or None if invalid; pages repeat the same words a lot
+        self._candidate_cache: Dict[str, Optional[str]] = {}
+
     def extract_product_name(self, intelligence: Dict[str, Any]) -> str:
         """
         FIXED Universal product name extraction with priority ordering
@@ -222,9 +302,9 @@ class UniversalProductExtractor:
             if 'get' in domain and ('now' in domain or 'net' in domain):
                 # Extract middle part: getaquasculptnow.net -> aquasculpt
                 middle = domain
-                middle = re.sub(r'^get', '', middle)
-                middle = re.sub(r'now\.(net|com|org)', '', middle)
-                middle = re.sub(r'\.(net|com|org)$', '', middle)
+                middle = ExtractionPatterns.url_get_prefix.sub('', middle)
+                middle = ExtractionPatterns.url_now_tld.sub('', middle)
+                middle = ExtractionPatterns.url_tld.sub('', middle)
                 
                 if len(middle) > 4:
                     formatted = self._format_product_name_fixed(middle)
@@ -243,7 +323,7 @@ class UniversalProductExtractor:
             # Extract from path
             path_parts = [p for p in parsed.path.split('/') if p and len(p) > 3]
             for part in path_parts:
-                clean_part = re.sub(r'[^a-zA-Z]', '', part)
+                clean_part = ExtractionPatterns.non_letters.sub('', part)
                 if len(clean_part) > 4:
                     formatted = self._format_product_name_fixed(clean_part)
                     if formatted and self._is_valid_product_name_fixed(formatted):
@@ -262,16 +342,16 @@ class UniversalProductExtractor:
         candidates = []
         
         # CRITICAL FIX: Apply patterns in priority order
-        for i, pattern in enumerate(self.universal_patterns):
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
+        for i, pattern in enumerate(ExtractionPatterns.universal):
+            matches = pattern.findall(content)
             for match in matches:
                 if isinstance(match, tuple):
                     match = match[0]
                 
-                cleaned = self._format_product_name_fixed(match.strip())
-                if cleaned and self._is_valid_product_name_fixed(cleaned):
+                cleaned = self._clean_candidate(match.strip())
+                if cleaned:
                     # Add priority weight based on pattern order
-                    priority_weight = len(self.universal_patterns) - i
+                    priority_weight = len(ExtractionPatterns.universal) - i
                     for _ in range(priority_weight):
                         candidates.append(cleaned)
                     
@@ -281,12 +361,12 @@ class UniversalProductExtractor:
                             candidates.append(self.known_products[cleaned.lower().replace(' ', '')])
         
         # Look for branded product patterns with suffixes
-        for suffix in self.product_suffixes:
-            pattern = rf'\b([A-Z][a-zA-Z]{{2,15}}{re.escape(suffix)})\b'
-            matches = re.findall(pattern, content)
-            for match in matches:
-                cleaned = self._format_product_name_fixed(match)
-                if cleaned and self._is_valid_product_name_fixed(cleaned):
+        for suffix, pattern in ExtractionPatterns.suffixes:
+            if suffix not in content:
+                continue
+            for match in pattern.findall(content):
+                cleaned = self._clean_candidate(match)
+                if cleaned:
                     candidates.append(cleaned)
         
         return candidates
@@ -392,8 +472,8 @@ class UniversalProductExtractor:
             return ""
         
         # Remove extra whitespace and special characters
-        name = re.sub(r'[^\w\s\-]', '', name)
-        name = re.sub(r'\s+', ' ', name).strip()
+        name = ExtractionPatterns.non_name_chars.sub('', name)
+        name = ExtractionPatterns.whitespace.sub(' ', name).strip()
         
         # CRITICAL FIX: Check known products first
         name_lower = name.lower().replace(' ', '').replace('-', '')
@@ -403,7 +483,7 @@ class UniversalProductExtractor:
         # Handle compound words intelligently
         if len(name) > 6 and not ' ' in name:
             # Check for CamelCase pattern
-            if re.search(r'[a-z][A-Z]', name):
+            if ExtractionPatterns.camel_case.search(name):
                 return name.title().replace(' ', '')
             
             # Check for common compound patterns
@@ -449,7 +529,7 @@ class UniversalProductExtractor:
             return False
         
         # Must contain letters
-        if not re.search(r'[a-zA-Z]', name):
+        if not ExtractionPatterns.letter.search(name):
             return False
         
         # Length constraints
@@ -464,7 +544,7 @@ class UniversalProductExtractor:
             positive_score += 10
         
         # CamelCase or compound structure (AquaSculpt pattern)
-        if re.search(r'[a-z][A-Z]', name):
+        if ExtractionPatterns.camel_case.search(name):
             positive_score += 3
         
         # Reasonable length
@@ -482,12 +562,27 @@ class UniversalProductExtractor:
         
         return positive_score >= 2
 
+    def _clean_candidate(self, match: str) -> Optional[str]:
+        """Formatted product name for a raw pattern match, or None if it is not a valid one"""
+        if match in self._candidate_cache:
+            return self._candidate_cache[match]
+
+        cleaned = self._format_product_name_fixed(match)
+        if not (cleaned and self._is_valid_product_name_fixed(cleaned)):
+            cleaned = None
+
+        if len(self._candidate_cache) >= CANDIDATE_CACHE_MAX_ENTRIES:
+            self._candidate_cache.clear()
+        self._candidate_cache[match] = cleaned
+        return cleaned
+
     def _filter_candidates_fixed(self, candidates: List[str]) -> List[str]:
         """FIXED candidate filtering"""
         filtered = []
         seen = set()
         
-        for candidate in candidates:
+        # Candidates repeat (weighted by pattern priority); each distinct one is formatted once
+        for candidate in dict.fromkeys(candidates):
             if not candidate:
                 continue
             
@@ -534,6 +629,7 @@ class UniversalProductExtractor:
         
         # CRITICAL FIX: Content-based scoring enhancements
         raw_content = intelligence.get("raw_content", "")
+        mentions = MentionIndex(raw_content) if raw_content else None
         for candidate in candidate_scores:
             
             # CRITICAL FIX: Massive bonus for known products
@@ -541,8 +637,8 @@ class UniversalProductExtractor:
                 candidate_scores[candidate] += 20.0
             
             # Frequency in raw content bonus
-            if raw_content:
-                content_mentions = len(re.findall(re.escape(candidate), raw_content, re.IGNORECASE))
+            if mentions is not None:
+                content_mentions = mentions.count(candidate)
                 candidate_scores[candidate] += min(content_mentions * 1.0, 5.0)
             
             # Length bonus (optimal product name length)
@@ -556,7 +652,7 @@ class UniversalProductExtractor:
                 candidate_scores[candidate] += 3.0
             
             # CamelCase bonus (AquaSculpt pattern)
-            if re.search(r'[a-z][A-Z]', candidate):
+            if ExtractionPatterns.camel_case.search(candidate):
                 candidate_scores[candidate] += 4.0
             
             # CRITICAL FIX: Heavy penalty for AI hallucinations
@@ -616,22 +712,51 @@ class UniversalProductExtractor:
 # Global instance for easy access
 _universal_extractor = UniversalProductExtractor()
 
+_extraction_cache = register_result_cache(ResultCache(
+    EXTRACTION_CACHE_NAMESPACE,
+    ttl=EXTRACTION_CACHE_TTL,
+    max_entries=EXTRACTION_CACHE_MAX_ENTRIES,
+    backend="memory"
+))
+
+
+def _extraction_key(kind: str, intelligence: Dict[str, Any]) -> Optional[str]:
+    """Content hash of the fields extraction reads, or None if they cannot be serialized"""
+    fields = {field: intelligence.get(field) for field in EXTRACTION_FIELDS}
+    try:
+        payload = json.dumps(fields, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return f"{kind}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+def _memoized_extraction(kind: str, intelligence: Dict[str, Any], extract) -> str:
+    """Run ``extract`` once per distinct content; repeats are served from the cache"""
+    key = _extraction_key(kind, intelligence)
+    if key is None:
+        return extract(intelligence)
+
+    return _extraction_cache.load_sync(key, lambda: extract(intelligence))
+
+
+def clear_extraction_cache():
+    """Forget memoized product and company names"""
+    _extraction_cache.clear_local()
+
+
 def extract_company_name_from_intelligence(intelligence: Dict[str, Any]) -> str:
-    """FIXED company name extraction"""
-    
-    # Company-specific patterns
-    company_patterns = [
-        r'(?:from|by|created by|made by|developed by)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
-        r'([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})\s+(?:Inc|LLC|Corp|Limited|Company)',
-        r'©\s*(?:\d{4}\s+)?([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})',
-        r'(?:contact|about)\s+([A-Z][a-zA-Z]{3,20}(?:\s+[A-Z][a-zA-Z]{2,15}){0,2})'
-    ]
-    
+    """FIXED company name extraction (memoized by content hash)"""
+    return _memoized_extraction("company", intelligence, _extract_company_name)
+
+
+def _extract_company_name(intelligence: Dict[str, Any]) -> str:
+    """Company name from raw content, brand intelligence, the sales page domain or the product name"""
+
     # Check raw content for company mentions
     raw_content = intelligence.get("raw_content", "")
     if raw_content:
-        for pattern in company_patterns:
-            matches = re.findall(pattern, raw_content, re.IGNORECASE)
+        for pattern in ExtractionPatterns.company:
+            matches = pattern.findall(raw_content)
             if matches:
                 company_name = matches[0] if isinstance(matches[0], str) else matches[0][0]
                 cleaned = _universal_extractor._format_product_name_fixed(company_name)
@@ -644,8 +769,8 @@ def extract_company_name_from_intelligence(intelligence: Dict[str, Any]) -> str:
     if isinstance(brand_intel, dict):
         brand_positioning = brand_intel.get("brand_positioning", "")
         if isinstance(brand_positioning, str) and len(brand_positioning) > 10:
-            for pattern in company_patterns:
-                matches = re.findall(pattern, brand_positioning, re.IGNORECASE)
+            for pattern in ExtractionPatterns.company:
+                matches = pattern.findall(brand_positioning)
                 if matches:
                     company_name = matches[0] if isinstance(matches[0], str) else matches[0][0]
                     cleaned = _universal_extractor._format_product_name_fixed(company_name)
@@ -710,21 +835,16 @@ def extract_product_name_from_intelligence(intelligence: Dict[str, Any]) -> str:
         logger.info(f"🎯 Using existing product name: '{existing_name}' (found in intelligence)")
         return existing_name
     
-    # If no pre-extracted name or skip flag not set, run full extraction
-    logger.info("🔍 Starting FIXED universal product name extraction...")
-    return _universal_extractor.extract_product_name(intelligence)
+    # If no pre-extracted name or skip flag not set, run full extraction (once per distinct content)
+    return _memoized_extraction("product", intelligence, _universal_extractor.extract_product_name)
 
-def substitute_product_placeholders(content: str, product_name: str, company_name: str = None) -> str:
-    """FIXED Universal placeholder substitution system"""
-    if not isinstance(content, str) or not product_name:
-        return content
-    
-    # CRITICAL FIX: Don't substitute if product_name is obviously wrong
-    if product_name.lower() in ['island', 'solution', 'system', 'formula', 'method']:
-        logger.warning(f"⚠️ Skipping placeholder substitution for suspicious product name: '{product_name}'")
-        return content
-    
-    placeholders = {
+# Product names that are really generic words; substitution is skipped for them
+SUSPICIOUS_PRODUCT_NAMES = {'island', 'solution', 'system', 'formula', 'method'}
+
+
+def _placeholder_table(product_name: str, company_name: str = None) -> Dict[str, str]:
+    """Placeholders in the order the sequential substitution applies them"""
+    return {
         "PRODUCT": product_name, "Product": product_name, "product": product_name,
         "[PRODUCT]": product_name, "[Product]": product_name, "[Product Name]": product_name,
         "[PRODUCT_NAME]": product_name, "Your Product": product_name, "Your product": product_name,
@@ -736,36 +856,143 @@ def substitute_product_placeholders(content: str, product_name: str, company_nam
         "Your Company": company_name or product_name, "Your company": company_name or product_name,
         "your company": company_name or product_name, "Your ": f"{product_name} ", "your ": f"{product_name} ",
     }
-    
+
+
+def _substitute_sequential(content: str, product_name: str, company_name: str = None) -> str:
+    """Reference implementation: one replace pass per placeholder, in table order"""
     result = content
-    for placeholder, replacement in placeholders.items():
+    for placeholder, replacement in _placeholder_table(product_name, company_name).items():
         if replacement:
             if placeholder.endswith(" "):
                 pattern = r'\b' + re.escape(placeholder.strip()) + r'\b'
                 result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
             else:
                 result = result.replace(placeholder, replacement)
+    return result
+
+
+# Literals a replacement could complete in the sequential passes that follow it
+_FORMABLE_LITERALS = ("Product", "product", "COMPANY", "Company", "Your company", "your company")
+_WORD_CHAR = re.compile(r'\w')
+
+
+def _is_inert_replacement(name: str) -> bool:
+    """
+    True if inserting ``name`` can never create or alter a later placeholder
+    match, i.e. the sequential passes only ever match original text.
+
+    The name must not contain placeholder words, must not start with the
+    tail or end with the head of a placeholder (which the neighbouring text
+    could complete), and must start and end with word characters so the
+    \\byour\\b boundaries around it are unchanged.
+    """
+    if not name or "\\" in name:
+        return False
+    lowered = name.lower()
+    if "product" in lowered or "company" in lowered or lowered in "your" or re.search(r'\byour', lowered):
+        return False
+    if not (_WORD_CHAR.match(name[0]) and _WORD_CHAR.match(name[-1])):
+        return False
+    # Partial "your" at a word edge, e.g. "Be You" followed by "r"
+    first_word, last_word = re.match(r'\w+', lowered).group(), re.search(r'\w+$', lowered).group()
+    if first_word in ("r", "ur", "our") or last_word in ("y", "yo", "you"):
+        return False
+    for literal in _FORMABLE_LITERALS:
+        if name in literal:
+            return False
+        for split in range(1, len(literal)):
+            if name.startswith(literal[split:]) or name.endswith(literal[:split]):
+                return False
+    return True
+
+
+class PlaceholderSubstitution:
+    """
+    Placeholder substitution for one (product, company) pair, compiled once.
+
+    Applying the placeholder table in order is equivalent to one
+    leftmost-first pass of a single alternation, as long as the replacement
+    names are inert (see ``_is_inert_replacement``): every bracketed and
+    "the/this/your product" placeholder has already lost its PRODUCT /
+    Product / product part to an earlier entry, and "Your Company" its
+    Company part, so only these alternatives can still match. Names that
+    are not inert use the sequential reference implementation.
+    """
+
+    def __init__(self, product_name: str, company_name: str = None):
+        self.product_name = product_name
+        self.company_replacement = company_name or product_name
+        self.single_pass = _is_inert_replacement(product_name) and _is_inert_replacement(self.company_replacement)
+        if self.single_pass:
+            self._replacements = {
+                "PRODUCT": product_name, "Product": product_name, "product": product_name,
+                "COMPANY": self.company_replacement, "Company": self.company_replacement,
+                "Your company": self.company_replacement, "your company": self.company_replacement,
+            }
+            # Equivalent to PRODUCT|Product|product|COMPANY|Company|Your company|
+            # your company|\byour\b (case-insensitive "your"), written to start
+            # with a character class so the regex engine can skip ahead to
+            # candidate characters instead of trying every alternative at every
+            # position. "Your company" precedes the generic "your" so it wins.
+            self._pattern = re.compile(
+                r'[PpCYy](?:(?<=P)(?:RODUCT|roduct)|(?<=p)roduct|(?<=C)(?:OMPANY|ompany)'
+                r'|(?<=[Yy])(?:our company|(?<!\w[Yy])(?i:our)(?!\w)))'
+            )
+            self._your_replacement = f"{product_name} "
+
+    def _replace(self, match: re.Match) -> str:
+        return self._replacements.get(match.group(), self._your_replacement)
+
+    def apply(self, content: str) -> str:
+        if not self.product_name:
+            return content
+        if not self.single_pass:
+            return _substitute_sequential(content, self.product_name, self.company_replacement)
+        return self._pattern.sub(self._replace, content)
+
+
+@lru_cache(maxsize=256)
+def get_placeholder_substitution(product_name: str, company_name: str = None) -> PlaceholderSubstitution:
+    """Compiled substitution for a (product, company) pair, cached"""
+    return PlaceholderSubstitution(product_name, company_name)
+
+
+def substitute_product_placeholders(content: str, product_name: str, company_name: str = None) -> str:
+    """FIXED Universal placeholder substitution system"""
+    if not isinstance(content, str) or not product_name:
+        return content
+    
+    # CRITICAL FIX: Don't substitute if product_name is obviously wrong
+    if product_name.lower() in SUSPICIOUS_PRODUCT_NAMES:
+        logger.warning(f"⚠️ Skipping placeholder substitution for suspicious product name: '{product_name}'")
+        return content
+    
+    result = get_placeholder_substitution(product_name, company_name).apply(content)
     
     if result != content:
         logger.info(f"🔄 Placeholder substitution: Applied {product_name} replacements")
     
     return result
 
+def _substitute_in_data(data: Any, substitution: PlaceholderSubstitution) -> Any:
+    if isinstance(data, dict):
+        return {k: _substitute_in_data(v, substitution) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [_substitute_in_data(item, substitution) for item in data]
+    elif isinstance(data, str):
+        return substitution.apply(data)
+    else:
+        return data
+
 def substitute_placeholders_in_data(data: Any, product_name: str, company_name: str = None) -> Any:
     """FIXED Recursive placeholder substitution for complex data structures"""
     # CRITICAL FIX: Don't substitute if product name is suspicious
-    if product_name.lower() in ['island', 'solution', 'system', 'formula', 'method']:
+    if product_name.lower() in SUSPICIOUS_PRODUCT_NAMES:
         logger.warning(f"⚠️ Skipping data substitution for suspicious product name: '{product_name}'")
         return data
     
-    if isinstance(data, dict):
-        return {k: substitute_placeholders_in_data(v, product_name, company_name) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [substitute_placeholders_in_data(item, product_name, company_name) for item in data]
-    elif isinstance(data, str):
-        return substitute_product_placeholders(data, product_name, company_name)
-    else:
-        return data
+    # One compiled pattern for the whole structure
+    return _substitute_in_data(data, get_placeholder_substitution(product_name, company_name))
 
 def validate_no_placeholders(content: str, product_name: str) -> bool:
     """FIXED Validate that no placeholders remain in content"""
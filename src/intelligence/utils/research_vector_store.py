@@ -0,0 +1,430 @@
+# Persistent, shared vector store for research chunks
+# File: src/intelligence/utils/research_vector_store.py
+
+"""
+Research chunk embeddings shared by every worker and kept across restarts.
+
+Backends (RAG_VECTOR_BACKEND):
+    postgres  rows in ``research_chunk_embeddings`` (REAL[] embeddings); each
+              worker mirrors them into an in-process VectorIndex and pulls
+              new rows incrementally by sequence number
+    pgvector  same table, searched in SQL through the pgvector column and
+              its HNSW index (requires the ``vector`` extension)
+    mmap      VectorIndex snapshots on disk (RAG_VECTOR_INDEX_DIR), loaded
+              memory-mapped and reloaded when another worker writes one;
+              writers merge into the latest snapshot under a file lock
+    memory    in-process only
+
+postgres is used when a database session is available, memory otherwise.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.intelligence.utils.vector_index import SNAPSHOT_MANIFEST, VectorIndex
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; snapshot writers are then unlocked
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+VECTOR_BACKENDS = ("postgres", "pgvector", "mmap", "memory")
+
+DEFAULT_INDEX_DIR = os.getenv("RAG_VECTOR_INDEX_DIR", os.path.join(os.getcwd(), "data", "research_index"))
+# How often a worker checks for rows written by other workers
+SYNC_INTERVAL_SECONDS = float(os.getenv("RAG_VECTOR_SYNC_SECONDS", 30))
+# Sequence numbers are taken at insert, not at commit, so a slow transaction
+# can commit rows below the highest seq already synced. Each sync re-scans
+# this many seqs back; documents whose rows did not change are skipped.
+SYNC_SEQ_OVERLAP = int(os.getenv("RAG_VECTOR_SYNC_SEQ_OVERLAP", 1000))
+# Size of the embedding_vec column created by migration 009
+PGVECTOR_DIMENSION = 1024
+
+SNAPSHOT_DOCUMENTS = "documents.json"
+SNAPSHOT_LOCK = ".lock"
+
+
+class ResearchVectorStore:
+    """Chunk texts, metadata and embeddings with top-k similarity search"""
+
+    def __init__(self, backend: Optional[str] = None, index_dir: Optional[str] = None):
+        backend = (backend or os.getenv("RAG_VECTOR_BACKEND", "")).lower() or None
+        if backend and backend not in VECTOR_BACKENDS:
+            raise ValueError(f"Unknown vector backend {backend}, expected one of {VECTOR_BACKENDS}")
+        self.backend = backend
+        self.index_dir = index_dir or DEFAULT_INDEX_DIR
+
+        self.index = VectorIndex()
+        # doc_id -> {'chunks', 'metadata', 'content_type'}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+
+        self._last_seq = 0
+        # doc_id -> highest seq of its rows when last indexed from the database
+        self._doc_seqs: Dict[str, int] = {}
+        self._last_sync = 0.0
+        self._snapshot_mtime = 0
+        # mmap: documents added here and not yet in the shared snapshot,
+        # doc_id -> (document, vectors or None when removed, chunk indexes)
+        self._pending: Dict[str, Tuple[Dict[str, Any], Optional[np.ndarray], List[int]]] = {}
+        self._sync_lock = asyncio.Lock()
+        self._write_lock = threading.RLock()
+
+        if self._backend() == "mmap":
+            self._reload_snapshot()
+
+    def _backend(self, db: Optional[AsyncSession] = None) -> str:
+        if self.backend:
+            return self.backend
+        return "postgres" if db is not None else "memory"
+
+    async def add_document(
+        self,
+        doc_id: str,
+        chunks: List[str],
+        embeddings: List[Optional[List[float]]],
+        metadata: Optional[Dict[str, Any]] = None,
+        content_type: Optional[str] = None,
+        model: Optional[str] = None,
+        db: Optional[AsyncSession] = None
+    ) -> int:
+        """
+        Store and index a document's chunks, replacing a previous version
+
+        ``None`` embeddings (chunks that could not be embedded) are kept as
+        text but never indexed. Database rows are written in the caller's
+        transaction; committing it is left to the caller.
+
+        Returns:
+            Number of chunks indexed
+        """
+
+        backend = self._backend(db)
+        indexed = [i for i, vector in enumerate(embeddings) if vector is not None]
+        if backend == "pgvector":
+            for i in indexed:
+                _check_pgvector_dimension(embeddings[i])
+
+        document = {
+            'chunks': chunks,
+            'metadata': metadata or {},
+            'content_type': content_type
+        }
+        self.documents[doc_id] = document
+        vectors = np.asarray([embeddings[i] for i in indexed], dtype=np.float32) if indexed else None
+        if vectors is not None:
+            added = await asyncio.to_thread(self.index.add, doc_id, vectors, indexed)
+        else:
+            added = 0
+            self.index.remove(doc_id)
+
+        if backend in ("postgres", "pgvector") and db is not None:
+            await self._persist_rows(db, doc_id, chunks, embeddings, metadata, content_type, model, backend == "pgvector")
+        elif backend == "mmap":
+            self._pending[doc_id] = (document, vectors, indexed)
+            await asyncio.to_thread(self._write_snapshot)
+
+        return added
+
+    async def has_document(self, doc_id: str, db: Optional[AsyncSession] = None) -> bool:
+        """Whether a document's chunks are already stored (locally or by another worker)"""
+
+        if doc_id in self.documents:
+            return True
+        if self._backend(db) in ("postgres", "pgvector") and db is not None:
+            result = await db.execute(
+                text("SELECT 1 FROM research_chunk_embeddings WHERE doc_id = :doc_id LIMIT 1"),
+                {"doc_id": doc_id}
+            )
+            return result.first() is not None
+        return False
+
+    async def search(
+        self,
+        query_embedding: List[float],
+        top_k: int = 5,
+        min_similarity: Optional[float] = None,
+        db: Optional[AsyncSession] = None,
+        doc_ids: Optional[Collection[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Top-k chunks by cosine similarity, best first
+
+        The index is shared by every user: pass ``doc_ids`` to search only
+        the documents the caller owns.
+        """
+
+        if doc_ids is not None:
+            doc_ids = list(set(doc_ids))
+            if not doc_ids:
+                return []
+
+        backend = self._backend(db)
+        if backend == "pgvector" and db is not None:
+            return await self._search_pgvector(db, query_embedding, top_k, min_similarity, doc_ids)
+
+        await self.sync(db)
+        matches = await asyncio.to_thread(self.index.search, query_embedding, top_k, min_similarity, doc_ids)
+
+        results = []
+        for doc_id, chunk_index, similarity in matches:
+            document = self.documents.get(doc_id)
+            if not document or chunk_index >= len(document['chunks']):
+                continue
+            results.append({
+                'doc_id': doc_id,
+                'chunk_index': chunk_index,
+                'content': document['chunks'][chunk_index],
+                'similarity': similarity,
+                'metadata': document['metadata']
+            })
+        return results
+
+    async def sync(self, db: Optional[AsyncSession] = None, force: bool = False):
+        """Pull chunks written by other workers (at most every RAG_VECTOR_SYNC_SECONDS)"""
+
+        if not force and time.monotonic() - self._last_sync < SYNC_INTERVAL_SECONDS:
+            return
+        backend = self._backend(db)
+        async with self._sync_lock:
+            self._last_sync = time.monotonic()
+            try:
+                if backend == "postgres" and db is not None:
+                    await self._load_new_rows(db)
+                elif backend == "mmap":
+                    await asyncio.to_thread(self._reload_snapshot)
+            except Exception as e:
+                logger.warning(f"Vector store sync failed ({backend}): {e}")
+
+    async def _persist_rows(
+        self,
+        db: AsyncSession,
+        doc_id: str,
+        chunks: List[str],
+        embeddings: List[Optional[List[float]]],
+        metadata: Optional[Dict[str, Any]],
+        content_type: Optional[str],
+        model: Optional[str],
+        with_pgvector: bool
+    ):
+        await db.execute(text("DELETE FROM research_chunk_embeddings WHERE doc_id = :doc_id"), {"doc_id": doc_id})
+
+        rows = [
+            {
+                "doc_id": doc_id,
+                "chunk_index": i,
+                "content": chunk,
+                "embedding": [float(x) for x in embeddings[i]],
+                "model": model,
+                "metadata": json.dumps(metadata or {}),
+                "content_type": content_type
+            }
+            for i, chunk in enumerate(chunks)
+            if embeddings[i] is not None
+        ]
+        if with_pgvector:
+            for row in rows:
+                row["embedding_text"] = _vector_literal(row["embedding"])
+        if rows:
+            vector_column = ", embedding_vec" if with_pgvector else ""
+            vector_value = ", CAST(:embedding_text AS vector)" if with_pgvector else ""
+            await db.execute(text(f"""
+                INSERT INTO research_chunk_embeddings
+                    (doc_id, chunk_index, content, embedding, model, metadata, content_type{vector_column})
+                VALUES
+                    (:doc_id, :chunk_index, :content, :embedding, :model, CAST(:metadata AS JSONB), :content_type{vector_value})
+            """), rows)
+
+    async def _load_new_rows(self, db: AsyncSession):
+        """Re-index documents with rows newer than the last sync (less SYNC_SEQ_OVERLAP)"""
+
+        result = await db.execute(text("""
+            SELECT doc_id, MAX(seq) AS max_seq
+            FROM research_chunk_embeddings
+            WHERE seq > :since
+            GROUP BY doc_id
+        """), {"since": max(0, self._last_seq - SYNC_SEQ_OVERLAP)})
+        changed = [row.doc_id for row in result.fetchall() if self._doc_seqs.get(row.doc_id) != row.max_seq]
+        if not changed:
+            return
+
+        result = await db.execute(text("""
+            SELECT seq, doc_id, chunk_index, content, embedding, metadata, content_type
+            FROM research_chunk_embeddings
+            WHERE doc_id = ANY(:doc_ids)
+            ORDER BY doc_id, chunk_index
+        """), {"doc_ids": changed})
+
+        documents: Dict[str, Dict[str, Any]] = {}
+        for row in result.fetchall():
+            document = documents.setdefault(row.doc_id, {
+                "chunks": {}, "vectors": {}, "metadata": row.metadata or {}, "content_type": row.content_type
+            })
+            document["chunks"][row.chunk_index] = row.content
+            document["vectors"][row.chunk_index] = row.embedding
+            self._doc_seqs[row.doc_id] = max(self._doc_seqs.get(row.doc_id, 0), row.seq)
+            self._last_seq = max(self._last_seq, row.seq)
+
+        for doc_id, document in documents.items():
+            size = max(document["chunks"]) + 1
+            chunks = [document["chunks"].get(i, "") for i in range(size)]
+            indexes = sorted(document["vectors"])
+            self.documents[doc_id] = {
+                'chunks': chunks,
+                'metadata': document["metadata"],
+                'content_type': document["content_type"]
+            }
+            vectors = np.asarray([document["vectors"][i] for i in indexes], dtype=np.float32)
+            await asyncio.to_thread(self.index.add, doc_id, vectors, indexes)
+
+        if documents:
+            logger.info(f"Vector store synced {len(documents)} documents from database")
+
+    async def _search_pgvector(
+        self,
+        db: AsyncSession,
+        query_embedding: List[float],
+        top_k: int,
+        min_similarity: Optional[float],
+        doc_ids: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        _check_pgvector_dimension(query_embedding)
+        params = {"query": _vector_literal(query_embedding), "top_k": top_k}
+        doc_filter = ""
+        if doc_ids is not None:
+            doc_filter = "AND doc_id = ANY(:doc_ids)"
+            params["doc_ids"] = doc_ids
+
+        result = await db.execute(text(f"""
+            SELECT doc_id, chunk_index, content, metadata,
+                   1 - (embedding_vec <=> CAST(:query AS vector)) AS similarity
+            FROM research_chunk_embeddings
+            WHERE embedding_vec IS NOT NULL {doc_filter}
+            ORDER BY embedding_vec <=> CAST(:query AS vector)
+            LIMIT :top_k
+        """), params)
+
+        return [
+            {
+                'doc_id': row.doc_id,
+                'chunk_index': row.chunk_index,
+                'content': row.content,
+                'similarity': float(row.similarity),
+                'metadata': row.metadata or {}
+            }
+            for row in result.fetchall()
+            if min_similarity is None or row.similarity >= min_similarity
+        ]
+
+    def _write_snapshot(self):
+        """
+        Merge this worker's pending documents into the shared snapshot
+
+        Every worker writes the same directory, so under an exclusive file
+        lock the latest snapshot is reloaded first and the pending documents
+        applied on top of it; no writer drops another's documents.
+        """
+
+        with self._write_lock, _snapshot_lock(self.index_dir, exclusive=True):
+            written = dict(self._pending)
+            self._load_snapshot()
+
+            documents_path = os.path.join(self.index_dir, SNAPSHOT_DOCUMENTS)
+            with open(f"{documents_path}.tmp", "w") as f:
+                json.dump(self.documents, f)
+            os.replace(f"{documents_path}.tmp", documents_path)
+            # The manifest is written last and marks the snapshot complete
+            self.index.save(self.index_dir)
+            self._snapshot_mtime = os.stat(os.path.join(self.index_dir, SNAPSHOT_MANIFEST)).st_mtime_ns
+
+            # Documents re-added meanwhile stay pending for the next write
+            for doc_id, entry in written.items():
+                if self._pending.get(doc_id) is entry:
+                    del self._pending[doc_id]
+
+    def _reload_snapshot(self):
+        if not os.path.exists(os.path.join(self.index_dir, SNAPSHOT_MANIFEST)):
+            return
+        with self._write_lock, _snapshot_lock(self.index_dir, exclusive=False):
+            self._load_snapshot()
+
+    def _load_snapshot(self):
+        """Load the snapshot if another worker wrote a newer one, keeping pending documents"""
+
+        manifest = os.path.join(self.index_dir, SNAPSHOT_MANIFEST)
+        try:
+            mtime = os.stat(manifest).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self._snapshot_mtime:
+            return
+        with open(os.path.join(self.index_dir, SNAPSHOT_DOCUMENTS)) as f:
+            documents = json.load(f)
+        index = VectorIndex.load(self.index_dir, mmap=True)
+
+        for doc_id, (document, vectors, indexes) in list(self._pending.items()):
+            documents[doc_id] = document
+            if vectors is None:
+                index.remove(doc_id)
+            else:
+                index.add(doc_id, vectors, indexes)
+
+        self.index, self.documents = index, documents
+        self._snapshot_mtime = mtime
+        logger.info(f"Loaded research vector snapshot: {len(self.index)} vectors")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend or "auto",
+            "documents": len(self.documents),
+            **self.index.get_stats()
+        }
+
+
+@contextmanager
+def _snapshot_lock(directory: str, exclusive: bool):
+    """File lock shared by every process using a snapshot directory"""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, SNAPSHOT_LOCK), "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _check_pgvector_dimension(vector: List[float]):
+    if len(vector) != PGVECTOR_DIMENSION:
+        raise ValueError(
+            f"pgvector column holds {PGVECTOR_DIMENSION}-dimensional embeddings, got {len(vector)}; "
+            f"the embedding model does not match migration 009"
+        )
+
+
+def _vector_literal(vector: List[float]) -> str:
+    """pgvector text format: [x1,x2,...]"""
+    return "[" + ",".join(f"{float(x):.7g}" for x in vector) + "]"
+
+
+# Global instance
+_research_vector_store = None
+
+def get_research_vector_store() -> ResearchVectorStore:
+    """Get global research vector store instance"""
+    global _research_vector_store
+    if _research_vector_store is None:
+        _research_vector_store = ResearchVectorStore()
+    return _research_vector_store
@@ -0,0 +1,366 @@
+# src/intelligence/utils/subject_similarity_index.py
+"""
+Near-duplicate detection for email subject templates.
+
+Each template is reduced to a MinHash signature of its word shingles (single
+words and word pairs). The signature has SUBJECT_MINHASH_PERMUTATIONS
+32-bit values and is stored with the template in
+``email_subject_templates.minhash_signature``.
+
+Signatures are cut into SUBJECT_LSH_BANDS bands. Each band is hashed into a
+locality-sensitive bucket key, and templates with a high Jaccard
+similarity share at least one bucket with high probability. A duplicate
+check therefore looks only at the templates in the new subject's buckets
+and confirms each one with the exact Jaccard similarity. It does not
+compare against every template.
+
+The buckets are kept in memory as one sorted array of (band, key) pairs,
+searched with a single vectorized binary search per lookup. They are:
+
+- built from the database when the intelligence module starts (or on
+  first use)
+- extended as this worker creates templates
+- synced with templates created by other workers every
+  SUBJECT_INDEX_SYNC_SECONDS
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.intelligence.models.email_subject_templates import EmailSubjectTemplate
+
+logger = logging.getLogger(__name__)
+
+NUM_PERMUTATIONS = int(os.getenv("SUBJECT_MINHASH_PERMUTATIONS", 128))
+LSH_BANDS = int(os.getenv("SUBJECT_LSH_BANDS", 32))
+# Jaccard similarity of word shingles at which a subject counts as a duplicate
+SIMILARITY_THRESHOLD = float(os.getenv("SUBJECT_SIMILARITY_THRESHOLD", 0.6))
+SYNC_INTERVAL_SECONDS = float(os.getenv("SUBJECT_INDEX_SYNC_SECONDS", 60))
+
+# Permutations must be identical in every worker and across restarts,
+# because signatures are stored in the database
+MINHASH_SEED = 1
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_SHIFT = np.uint64(32)
+# Rows added since the last sort are scanned linearly until there are this many
+MIN_PENDING_BEFORE_REBUILD = 1024
+
+_WORD = re.compile(r"\{product\}|[a-z0-9]+(?:'[a-z]+)?")
+
+
+def shingles(text: str) -> Set[str]:
+    """Lowercased words and adjacent word pairs; ``{product}`` is one word"""
+    words = _WORD.findall(text.lower())
+    return set(words) | {f"{first} {second}" for first, second in zip(words, words[1:])}
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    if not first or not second:
+        return 0.0
+    shared = len(first & second)
+    return shared / (len(first) + len(second) - shared)
+
+
+def _shingle_hash(shingle: str) -> int:
+    """32-bit hash that is stable across processes (unlike hash())"""
+    return zlib.crc32(shingle.encode("utf-8"))
+
+
+def _ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenation of arange(start, start + count) for each pair"""
+    ends = np.cumsum(counts)
+    return np.arange(ends[-1]) + np.repeat(starts - (ends - counts), counts)
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    """np.unique for the short arrays used here (np.unique's hash path is slower)"""
+    values = np.sort(values)
+    if len(values) > 1:
+        values = values[np.concatenate(([True], values[1:] != values[:-1]))]
+    return values
+
+
+def shingle_hashes(text: str) -> np.ndarray:
+    """Sorted, unique 32-bit hashes of the text's word shingles"""
+    text_shingles = shingles(text)
+    hashes = np.fromiter((_shingle_hash(s) for s in text_shingles), dtype=np.uint32, count=len(text_shingles))
+    return _sorted_unique(hashes)
+
+
+class SubjectSimilarityIndex:
+    """MinHash/LSH index of subject templates for near-duplicate lookups"""
+
+    def __init__(
+        self,
+        num_perm: int = NUM_PERMUTATIONS,
+        bands: int = LSH_BANDS,
+        threshold: float = SIMILARITY_THRESHOLD
+    ):
+        if num_perm % bands:
+            raise ValueError(f"{num_perm} permutations cannot be split into {bands} bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.threshold = threshold
+
+        rng = np.random.RandomState(MINHASH_SEED)
+        # Multiply-shift hash functions: odd 64-bit multipliers and offsets
+        self._a = rng.randint(0, 1 << 63, num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.randint(0, 1 << 63, num_perm, dtype=np.uint64)
+        # Odd multipliers that fold one band's values into a single key
+        self._band_mix = rng.randint(0, 1 << 62, self.rows_per_band, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        # Band number in the high half of the sorted (band, key) values
+        self._band_tags = np.arange(bands, dtype=np.uint64) << _SHIFT
+
+        # Per row: template id (None once removed), band keys, and the
+        # template's shingle hashes as a slice of _hashes
+        self._ids: List[Optional[str]] = []
+        self._row_of: Dict[str, int] = {}
+        self._keys = np.empty((1024, bands), dtype=np.uint64)
+        self._starts = np.empty(1024, dtype=np.int64)
+        self._lengths = np.zeros(1024, dtype=np.int64)
+        self._hashes = np.empty(16384, dtype=np.uint32)
+        self._hash_count = 0
+        # Rows below _sorted_count are in the sorted (band, key) arrays
+        self._sorted_values = np.empty(0, dtype=np.uint64)
+        self._sorted_rows = np.empty(0, dtype=np.int64)
+        self._sorted_count = 0
+
+        self._loaded = False
+        self._last_sync = 0.0
+        self._last_created_at = None
+        self._sync_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    # ------------------------------------------------------------------
+    # Signatures
+    # ------------------------------------------------------------------
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature (num_perm uint32 values) of the text's word shingles"""
+        return self._signature_of(shingle_hashes(text))
+
+    def _signature_of(self, hashes: np.ndarray) -> np.ndarray:
+        if not len(hashes):
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        # ((a * x + b) mod 2^64) >> 32 per hash function, minimum over shingles
+        values = (np.outer(hashes.astype(np.uint64), self._a) + self._b) >> _SHIFT
+        return values.min(axis=0).astype(np.uint32)
+
+    def signature_bytes(self, text: str) -> bytes:
+        """Signature in the form stored in ``minhash_signature``"""
+        return self.signature(text).astype("<u4").tobytes()
+
+    def _decode(self, stored: Optional[bytes]) -> Optional[np.ndarray]:
+        """Stored signature, or None if missing or made with other settings"""
+        if not stored or len(stored) != self.num_perm * 4:
+            return None
+        return np.frombuffer(stored, dtype="<u4").astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> np.ndarray:
+        mixed = (signature.reshape(self.bands, self.rows_per_band).astype(np.uint64) * self._band_mix).sum(axis=1)
+        return (mixed ^ (mixed >> _SHIFT)) & _MAX_HASH
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def add(self, template_id: Any, text: str, signature: Optional[np.ndarray] = None, rebuild: bool = True):
+        """
+        Index a template, replacing an earlier entry with the same id
+
+        Args:
+            signature: Stored signature of ``text``, if there is one
+            rebuild: Re-sort the buckets once enough rows are pending (bulk
+                loads pass False and call ``_rebuild`` at the end)
+        """
+        template_id = str(template_id)
+        self.remove(template_id)
+        hashes = shingle_hashes(text)
+        if signature is None or len(signature) != self.num_perm:
+            signature = self._signature_of(hashes)
+
+        row = len(self._ids)
+        if row == len(self._keys):
+            self._keys = np.resize(self._keys, (row * 2, self.bands))
+            self._starts = np.resize(self._starts, row * 2)
+            self._lengths = np.resize(self._lengths, row * 2)
+        if self._hash_count + len(hashes) > len(self._hashes):
+            self._hashes = np.resize(self._hashes, 2 * (self._hash_count + len(hashes)))
+
+        self._keys[row] = self._band_keys(signature)
+        self._starts[row] = self._hash_count
+        self._lengths[row] = len(hashes)
+        self._hashes[self._hash_count:self._hash_count + len(hashes)] = hashes
+        self._hash_count += len(hashes)
+        self._ids.append(template_id)
+        self._row_of[template_id] = row
+
+        pending = len(self._ids) - self._sorted_count
+        if rebuild and pending >= max(MIN_PENDING_BEFORE_REBUILD, self._sorted_count // 8):
+            self._rebuild()
+
+    def remove(self, template_id: Any):
+        row = self._row_of.pop(str(template_id), None)
+        if row is not None:
+            self._ids[row] = None
+            self._lengths[row] = 0
+
+    def _rebuild(self):
+        """Sort every row's (band, key) values for binary search"""
+        size = len(self._ids)
+        values = (self._keys[:size] | self._band_tags).ravel()
+        order = np.argsort(values, kind="stable")
+        self._sorted_values = values[order]
+        self._sorted_rows = order // self.bands
+        self._sorted_count = size
+
+    def _candidates(self, keys: np.ndarray) -> np.ndarray:
+        """Live rows sharing at least one band key with ``keys``"""
+        found = []
+        if self._sorted_count:
+            values = keys | self._band_tags
+            starts = np.searchsorted(self._sorted_values, values, side="left")
+            counts = np.searchsorted(self._sorted_values, values, side="right") - starts
+            if counts.any():
+                found.append(self._sorted_rows[_ranges(starts, counts)])
+        pending = self._keys[self._sorted_count:len(self._ids)]
+        if len(pending):
+            found.append(np.flatnonzero((pending == keys).any(axis=1)) + self._sorted_count)
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        rows = _sorted_unique(np.concatenate(found))
+        return rows[self._lengths[rows] > 0]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def find_similar(self, text: str, threshold: Optional[float] = None) -> Optional[Tuple[str, float]]:
+        """
+        Most similar indexed template at or above ``threshold``
+
+        Returns:
+            (template id, Jaccard similarity of word shingles), or None
+        """
+        threshold = self.threshold if threshold is None else threshold
+        query = shingle_hashes(text)
+        if not len(query):
+            return None
+        rows = self._candidates(self._band_keys(self._signature_of(query)))
+        if not len(rows):
+            return None
+
+        # Exact Jaccard against every candidate at once: look each candidate
+        # shingle up in the (sorted) query shingles and count hits per row
+        lengths = self._lengths[rows]
+        values = self._hashes[_ranges(self._starts[rows], lengths)]
+        positions = np.minimum(np.searchsorted(query, values), len(query) - 1)
+        row_offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        shared = np.add.reduceat((query[positions] == values).astype(np.int64), row_offsets)
+        similarity = shared / (lengths + len(query) - shared)
+
+        best = int(np.argmax(similarity))
+        if similarity[best] < threshold:
+            return None
+        return self._ids[rows[best]], float(similarity[best])
+
+    def is_near_duplicate(self, text: str) -> bool:
+        return self.find_similar(text) is not None
+
+    # ------------------------------------------------------------------
+    # Database
+    # ------------------------------------------------------------------
+
+    async def sync(self, db: AsyncSession, force: bool = False):
+        """Load the index on first use, then pull new templates every SUBJECT_INDEX_SYNC_SECONDS"""
+        if self._loaded and not force and time.monotonic() - self._last_sync < SYNC_INTERVAL_SECONDS:
+            return
+        async with self._sync_lock:
+            if self._loaded and not force and time.monotonic() - self._last_sync < SYNC_INTERVAL_SECONDS:
+                return
+            self._last_sync = time.monotonic()
+            try:
+                await self._load_templates(db)
+            except Exception as e:
+                logger.warning(f"⚠️ Subject similarity index sync failed: {e}")
+
+    async def _load_templates(self, db: AsyncSession):
+        """Index active templates created since the last load, storing missing signatures"""
+        query = select(
+            EmailSubjectTemplate.id,
+            EmailSubjectTemplate.template_text,
+            EmailSubjectTemplate.minhash_signature,
+            EmailSubjectTemplate.created_at
+        ).where(EmailSubjectTemplate.is_active == True)
+        if self._last_created_at is not None:
+            # >= so templates sharing the last seen timestamp are not skipped;
+            # the ones already indexed are filtered out below
+            query = query.where(EmailSubjectTemplate.created_at >= self._last_created_at)
+        rows = (await db.execute(query)).all()
+
+        backfill = []
+        for row in rows:
+            if str(row.id) in self._row_of:
+                continue
+            signature = self._decode(row.minhash_signature)
+            if signature is None:
+                signature = self.signature(row.template_text)
+                backfill.append({"id": row.id, "minhash_signature": signature.astype("<u4").tobytes()})
+            self.add(row.id, row.template_text, signature, rebuild=False)
+            if row.created_at and (self._last_created_at is None or row.created_at > self._last_created_at):
+                self._last_created_at = row.created_at
+        if len(self._ids) > self._sorted_count:
+            self._rebuild()
+
+        if backfill:
+            await self._store_signatures(backfill)
+        if not self._loaded:
+            self._loaded = True
+            logger.info(f"🔎 Subject similarity index loaded: {len(self)} templates")
+
+    async def _store_signatures(self, backfill: List[Dict[str, Any]]):
+        """Save backfilled signatures in a session of their own, never the caller's transaction"""
+        from src.core.database.session import AsyncSessionManager
+
+        try:
+            async with AsyncSessionManager.get_session() as session:
+                await session.execute(update(EmailSubjectTemplate), backfill)
+                await session.commit()
+            logger.info(f"🔏 Stored MinHash signatures for {len(backfill)} subject templates")
+        except Exception as e:
+            # The index already holds them; the next load computes them again
+            logger.warning(f"⚠️ Could not store MinHash signatures: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "templates": len(self),
+            "rows": len(self._ids),
+            "pending_rows": len(self._ids) - self._sorted_count,
+            "permutations": self.num_perm,
+            "bands": self.bands,
+            "threshold": self.threshold,
+            "loaded": self._loaded
+        }
+
+
+# Global instance
+_subject_similarity_index = None
+
+def get_subject_similarity_index() -> SubjectSimilarityIndex:
+    """Get global subject similarity index instance"""
+    global _subject_similarity_index
+    if _subject_similarity_index is None:
+        _subject_similarity_index = SubjectSimilarityIndex()
+    return _subject_similarity_index
@@ -612,8 +612,10 @@ class UserSpecificRAGSystem:
         
         try:
             # Add all intelligence context to RAG system
+            doc_ids = []
             for i, intel in enumerate(intelligence_context):
                 doc_id = f"{self.user_type}_intel_{i}_{datetime.now().strftime('%Y%m%d_%H%M')}"
+                doc_ids.append(doc_id)
                 await self.rag_system.add_research_document(
                     doc_id=doc_id,
                     content=intel['content'],
@@ -635,7 +637,7 @@ class UserSpecificRAGSystem:
             for query_type, query in queries.items():
                 try:
                     relevant_chunks = await self.rag_system.intelligent_research_query(
-                        query, top_k=5
+                        query, top_k=5, doc_ids=doc_ids
                     )
                     
                     if relevant_chunks:
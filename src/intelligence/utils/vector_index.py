@@ -0,0 +1,330 @@
+# In-process vector index for research chunk embeddings
+# File: src/intelligence/utils/vector_index.py
+
+"""
+Cosine-similarity vector index over one contiguous float32 matrix.
+
+Rows are L2-normalized on insert, so a query is a single matrix-vector
+product, and the top k come from ``argpartition`` (linear time) with only
+those k sorted. Zero vectors cannot be normalized and are never indexed.
+
+For large corpora an IVF (inverted file) layer can be built: rows are
+clustered with spherical k-means and a query only scans the ``ivf_probes``
+closest clusters plus any rows added since the last build.
+
+Snapshots are written as ``.npy`` files and loaded memory-mapped, so several
+worker processes share the same pages.
+"""
+
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Below this many vectors brute force is fast enough that IVF is not built
+DEFAULT_IVF_MIN_VECTORS = int(os.getenv("RAG_IVF_MIN_VECTORS", 50000))
+DEFAULT_IVF_PROBES = int(os.getenv("RAG_IVF_PROBES", 8))
+
+# Rows scored per block while assigning clusters, bounds temporary memory
+_ASSIGN_BLOCK = 65536
+
+SNAPSHOT_MATRIX = "vectors.npy"
+SNAPSHOT_MANIFEST = "manifest.json"
+
+
+def normalize_rows(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """L2-normalize rows as float32; returns (normalized, mask of non-zero rows)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[np.newaxis, :]
+    norms = np.linalg.norm(vectors, axis=1)
+    valid = norms > 1e-12
+    normalized = np.zeros_like(vectors)
+    normalized[valid] = vectors[valid] / norms[valid, np.newaxis]
+    return normalized, valid
+
+
+class VectorIndex:
+    """Normalized float32 matrix with top-k cosine search and an optional IVF layer"""
+
+    def __init__(
+        self,
+        dim: Optional[int] = None,
+        ivf_min_vectors: Optional[int] = None,
+        ivf_probes: Optional[int] = None
+    ):
+        self.dim = dim
+        self.ivf_min_vectors = ivf_min_vectors or DEFAULT_IVF_MIN_VECTORS
+        self.ivf_probes = ivf_probes or DEFAULT_IVF_PROBES
+
+        self._matrix = np.zeros((0, dim or 0), dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._deleted = 0
+        # row -> (doc_id, chunk_index)
+        self._keys: List[Tuple[str, int]] = []
+        self._doc_rows: Dict[str, List[int]] = {}
+
+        # IVF layer: centroids, rows grouped by cluster, offsets into that grouping
+        self._centroids: Optional[np.ndarray] = None
+        self._ivf_rows: Optional[np.ndarray] = None
+        self._ivf_offsets: Optional[np.ndarray] = None
+        self._ivf_size = 0
+
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return self._size - self._deleted
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_rows
+
+    def _reserve(self, extra: int):
+        """Grow the matrix geometrically so appends are amortized O(1)"""
+        needed = self._size + extra
+        capacity = self._matrix.shape[0]
+        if needed <= capacity and self._matrix.flags.writeable:
+            return
+        new_capacity = max(needed, capacity * 2, 1024)
+        matrix = np.zeros((new_capacity, self.dim), dtype=np.float32)
+        matrix[:self._size] = self._matrix[:self._size]
+        live = np.zeros(new_capacity, dtype=bool)
+        live[:self._size] = self._live[:self._size]
+        self._matrix, self._live = matrix, live
+
+    def add(self, doc_id: str, vectors: Any, chunk_indexes: Optional[List[int]] = None) -> int:
+        """
+        Index a document's chunk vectors, replacing any previous version
+
+        Returns:
+            Number of rows indexed (zero vectors are skipped)
+        """
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors[np.newaxis, :]
+        if chunk_indexes is None:
+            chunk_indexes = list(range(len(vectors)))
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                self._matrix = np.zeros((0, self.dim), dtype=np.float32)
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Vector dimension {vectors.shape[1]} does not match index dimension {self.dim}")
+
+            self.remove(doc_id)
+            normalized, valid = normalize_rows(vectors)
+            rows = normalized[valid]
+            if not len(rows):
+                return 0
+
+            self._reserve(len(rows))
+            start = self._size
+            self._matrix[start:start + len(rows)] = rows
+            self._live[start:start + len(rows)] = True
+            self._size += len(rows)
+            self._keys.extend((doc_id, chunk_indexes[i]) for i in np.flatnonzero(valid))
+            self._doc_rows[doc_id] = list(range(start, self._size))
+            return len(rows)
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop a document's rows (tombstoned until the next compaction)"""
+        with self._lock:
+            rows = self._doc_rows.pop(doc_id, None)
+            if not rows:
+                return False
+            self._live[rows] = False
+            self._deleted += len(rows)
+            # Compact once tombstones make up a quarter of the matrix
+            if self._deleted > max(1024, self._size // 4):
+                self.compact()
+            return True
+
+    def compact(self):
+        """Rewrite the matrix without removed rows (drops the IVF layer)"""
+        with self._lock:
+            keep = np.flatnonzero(self._live[:self._size])
+            self._matrix = np.ascontiguousarray(self._matrix[keep])
+            self._live = np.ones(len(keep), dtype=bool)
+            self._keys = [self._keys[i] for i in keep]
+            self._size, self._deleted = len(keep), 0
+            self._doc_rows = {}
+            for row, (doc_id, _) in enumerate(self._keys):
+                self._doc_rows.setdefault(doc_id, []).append(row)
+            self._drop_ivf()
+
+    def _drop_ivf(self):
+        self._centroids = self._ivf_rows = self._ivf_offsets = None
+        self._ivf_size = 0
+
+    def build_ivf(self, n_lists: Optional[int] = None, iterations: int = 10, seed: int = 0):
+        """Cluster rows with spherical k-means so searches only scan nearby clusters"""
+
+        with self._lock:
+            if self._deleted:
+                self.compact()
+            size = self._size
+            if size == 0:
+                return
+            matrix = self._matrix[:size]
+            n_lists = n_lists or max(1, int(np.sqrt(size)))
+            rng = np.random.default_rng(seed)
+
+            # Train on a sample; k-means converges long before it sees every row
+            sample = matrix[rng.choice(size, size=min(size, n_lists * 256), replace=False)]
+            centroids = sample[rng.choice(len(sample), size=min(n_lists, len(sample)), replace=False)].copy()
+            for _ in range(iterations):
+                assignment = np.argmax(sample @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, assignment, sample)
+                empty = np.bincount(assignment, minlength=len(centroids)) == 0
+                # Re-seed empty clusters from random sample rows
+                sums[empty] = sample[rng.choice(len(sample), size=int(empty.sum()))]
+                centroids, _ = normalize_rows(sums)
+
+            assignment = np.empty(size, dtype=np.int64)
+            for start in range(0, size, _ASSIGN_BLOCK):
+                block = matrix[start:start + _ASSIGN_BLOCK]
+                assignment[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+
+            self._centroids = centroids
+            self._ivf_rows = np.argsort(assignment, kind="stable")
+            self._ivf_offsets = np.concatenate(([0], np.cumsum(np.bincount(assignment, minlength=len(centroids)))))
+            self._ivf_size = size
+            logger.info(f"Built IVF index: {size} vectors in {len(centroids)} lists")
+
+    def _maybe_build_ivf(self):
+        live = len(self)
+        if live < self.ivf_min_vectors:
+            return
+        # Rebuild when rows added since the last build exceed a fifth of the index
+        if self._centroids is None or (self._size - self._ivf_size) > self._ivf_size // 5:
+            self.build_ivf()
+
+    def _candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Rows to score under IVF, or None for a full scan"""
+        if self._centroids is None:
+            return None
+        probes = min(self.ivf_probes, len(self._centroids))
+        centroid_scores = self._centroids @ query
+        nearest = np.argpartition(-centroid_scores, probes - 1)[:probes]
+        parts = [self._ivf_rows[self._ivf_offsets[c]:self._ivf_offsets[c + 1]] for c in nearest]
+        # Rows appended after the build are not clustered yet; always scan them
+        parts.append(np.arange(self._ivf_size, self._size))
+        return np.concatenate(parts)
+
+    def search(
+        self,
+        query: Any,
+        top_k: int = 5,
+        min_score: Optional[float] = None,
+        doc_ids: Optional[Collection[str]] = None
+    ) -> List[Tuple[str, int, float]]:
+        """
+        Top-k rows by cosine similarity
+
+        ``doc_ids`` restricts the search to those documents' rows (an exact
+        scan of just those rows, IVF is not used).
+
+        Returns:
+            (doc_id, chunk_index, similarity) tuples, best first
+        """
+
+        query, valid = normalize_rows(query)
+        if not valid[0] or top_k <= 0:
+            return []
+        query = query[0]
+
+        with self._lock:
+            if self._size == 0:
+                return []
+
+            if doc_ids is not None:
+                rows = np.asarray(
+                    [row for doc_id in set(doc_ids) for row in self._doc_rows.get(doc_id, ())],
+                    dtype=np.int64
+                )
+            else:
+                self._maybe_build_ivf()
+                rows = self._candidate_rows(query)
+            if rows is None:
+                scores = self._matrix[:self._size] @ query
+                live = self._live[:self._size]
+            else:
+                scores = self._matrix[rows] @ query
+                live = self._live[rows]
+            # No documents matched, or the probed IVF lists were all empty
+            if not len(scores):
+                return []
+            if self._deleted:
+                scores = np.where(live, scores, -np.inf)
+
+            k = min(top_k, len(scores))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+
+            results = []
+            for position in top:
+                score = float(scores[position])
+                if score == -np.inf or (min_score is not None and score < min_score):
+                    break
+                row = int(rows[position]) if rows is not None else int(position)
+                doc_id, chunk_index = self._keys[row]
+                results.append((doc_id, chunk_index, score))
+            return results
+
+    def save(self, directory: str):
+        """Write a snapshot (compacted) atomically for memory-mapped loading"""
+
+        with self._lock:
+            if self._deleted:
+                self.compact()
+            os.makedirs(directory, exist_ok=True)
+            suffix = uuid.uuid4().hex
+            matrix_tmp = os.path.join(directory, f".{SNAPSHOT_MATRIX}.{suffix}.tmp")
+            manifest_tmp = os.path.join(directory, f".{SNAPSHOT_MANIFEST}.{suffix}.tmp")
+            with open(matrix_tmp, "wb") as f:
+                np.save(f, np.ascontiguousarray(self._matrix[:self._size]))
+            with open(manifest_tmp, "w") as f:
+                json.dump({"dim": self.dim, "keys": self._keys}, f)
+            # Matrix first: a manifest never points at a shorter matrix
+            os.replace(matrix_tmp, os.path.join(directory, SNAPSHOT_MATRIX))
+            os.replace(manifest_tmp, os.path.join(directory, SNAPSHOT_MANIFEST))
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True, **kwargs) -> "VectorIndex":
+        """Load a snapshot; with ``mmap`` the matrix pages are shared between processes"""
+
+        with open(os.path.join(directory, SNAPSHOT_MANIFEST)) as f:
+            manifest = json.load(f)
+        matrix = np.load(os.path.join(directory, SNAPSHOT_MATRIX), mmap_mode="r" if mmap else None)
+        keys = [(doc_id, int(chunk_index)) for doc_id, chunk_index in manifest["keys"]]
+        if len(keys) > len(matrix):
+            raise ValueError("Vector snapshot manifest does not match its matrix")
+
+        index = cls(dim=manifest["dim"], **kwargs)
+        index._matrix = matrix
+        index._size = len(keys)
+        index._live = np.ones(len(keys), dtype=bool)
+        index._keys = keys
+        for row, (doc_id, _) in enumerate(keys):
+            index._doc_rows.setdefault(doc_id, []).append(row)
+        return index
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "vectors": len(self),
+            "documents": len(self._doc_rows),
+            "dim": self.dim,
+            "deleted_rows": self._deleted,
+            "memory_mb": round(self._matrix.nbytes / (1024 * 1024), 2),
+            "memory_mapped": not self._matrix.flags.writeable,
+            "ivf_lists": len(self._centroids) if self._centroids is not None else 0,
+        }
@@ -23,14 +23,22 @@ if app_path not in sys.path:
 # MODULAR IMPORTS
 # ============================================================================
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 # Core Infrastructure
 from src.core.config import deployment_config
-from src.core.middleware import setup_cors, ErrorHandlingMiddleware, RateLimitMiddleware
+from src.core.middleware import setup_cors, ErrorHandlingMiddleware, RateLimitMiddleware, MetricsMiddleware
 from src.core.database import test_database_connection
-from src.core.health import get_health_status
+from src.core.health import (
+    get_health_status,
+    initialize_health_checks,
+    metrics_access_allowed,
+    render_prometheus_metrics,
+    shutdown_health_checks,
+    PROMETHEUS_CONTENT_TYPE,
+)
+from src.utils.json_utils import CampaignForgeJSONResponse
 
 # Module Imports
 from src.intelligence.intelligence_module import intelligence_module
@@ -74,7 +82,8 @@ async def create_campaignforge_app() -> FastAPI:
         description="Complete modular AI-powered marketing campaign platform - Session 6 Complete",
         version="3.0.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=CampaignForgeJSONResponse
     )
 
     # Phase 1: Configure CORS middleware
@@ -85,6 +94,8 @@ async def create_campaignforge_app() -> FastAPI:
     logger.info("Phase 2: Adding middleware...")
     app.add_middleware(ErrorHandlingMiddleware)
     app.add_middleware(RateLimitMiddleware, calls=100, period=60)
+    # Outermost, so rate-limited and error responses are counted too
+    app.add_middleware(MetricsMiddleware)
 
     # Phase 3: Initialize all modules
     logger.info("Phase 3: Initializing modules...")
@@ -161,6 +172,7 @@ async def create_campaignforge_app() -> FastAPI:
 
     # Phase 4: Add core health endpoints
     logger.info("Phase 4: Adding core endpoints...")
+    initialize_health_checks(app)
 
     @app.get("/health")
     async def health_check():
@@ -204,6 +216,23 @@ async def create_campaignforge_app() -> FastAPI:
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
 
+    @app.get("/metrics", include_in_schema=False)
+    async def prometheus_metrics(request: Request):
+        """
+        Prometheus scrape endpoint. Reads the latest background sample and
+        counters only, so it never measures anything itself.
+
+        Exempt from rate limiting, so it is restricted to METRICS_TOKEN
+        holders or, without a token, to the internal network.
+        """
+        if not metrics_access_allowed(
+            request.client.host if request.client else None,
+            request.headers.get("authorization"),
+            request.headers.get("x-forwarded-for")
+        ):
+            return Response(status_code=403)
+        return Response(render_prometheus_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
     @app.get("/")
     async def root():
         """Root endpoint - API information"""
@@ -219,6 +248,7 @@ async def create_campaignforge_app() -> FastAPI:
             "module_health": f"{healthy_count}/{total_count}",
             "docs": "/docs",
             "health": "/health",
+            "metrics": "/metrics",
             "features": [
                 "AI Content Generation",
                 "Campaign Management",
@@ -329,6 +359,12 @@ async def shutdown_modules():
         await campaigns_module.shutdown()
         await content_module.shutdown()
         await storage_module.shutdown()
+
+        from src.platforms.clickbank.services.clickbank_client import close_clickbank_client
+        await close_clickbank_client()
+        shutdown_health_checks()
+        from src.intelligence.services.pdf_report_service import pdf_report_service
+        pdf_report_service.close()
         logger.info("All modules shutdown complete")
     except Exception as e:
         logger.error(f"Module shutdown error: {e}")
@@ -22,8 +22,8 @@ def connect_clickbank(body: ConnectRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/sales")
-def get_sales(user_id: int, days: int = 30):
+async def get_sales(user_id: int, days: int = 30):
     try:
-        return clickbank_service.fetch_sales(user_id, days)
+        return await clickbank_service.fetch_sales(user_id, days)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,184 @@
+# clickbank_module/services/clickbank_client.py
+"""
+Async ClickBank API client.
+
+All requests share one pooled httpx.AsyncClient (keep-alive connections,
+bounded pool, timeouts). Rate limiting (429), server errors and network
+failures are retried with exponential backoff and full jitter, honouring
+Retry-After when ClickBank sends it.
+
+Requests made with ``cache=True`` are cached per endpoint, account and date
+window for CLICKBANK_CACHE_TTL seconds, and concurrent identical requests
+share one API call. The bulk sync does not cache.
+"""
+
+import asyncio
+import copy
+import hashlib
+import logging
+import os
+import random
+from datetime import date
+from typing import Any, Dict, Optional
+
+import httpx
+
+from src.core.shared.decorators import ResultCache, register_result_cache
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = os.getenv("CLICKBANK_API_URL", "https://api.clickbank.com/rest/1.3")
+MAX_CONNECTIONS = int(os.getenv("CLICKBANK_MAX_CONNECTIONS", 50))
+TIMEOUT_SECONDS = float(os.getenv("CLICKBANK_TIMEOUT_SECONDS", 30))
+MAX_RETRIES = int(os.getenv("CLICKBANK_MAX_RETRIES", 3))
+CACHE_TTL_SECONDS = int(os.getenv("CLICKBANK_CACHE_TTL", 300))
+
+RESPONSE_CACHE_NAMESPACE = "clickbank_responses"
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class ClickBankAPIError(Exception):
+    """ClickBank request failed (status_code is None for network errors)"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ClickBankClient:
+    """Pooled async client for the ClickBank REST API"""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        timeout: float = TIMEOUT_SECONDS,
+        max_retries: int = MAX_RETRIES,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0
+    ):
+        self.base_url = base_url or BASE_URL
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._client: Optional[httpx.AsyncClient] = None
+        self._cache: Optional[ResultCache] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, connect=min(self.timeout, 10.0)),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+        return self._client
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full jitter: uniform in [0, base * 2^attempt], at least Retry-After"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+    def _get_cache(self) -> ResultCache:
+        if self._cache is None:
+            self._cache = register_result_cache(ResultCache(RESPONSE_CACHE_NAMESPACE, ttl=CACHE_TTL_SECONDS, max_entries=2048))
+        return self._cache
+
+    async def request(self, path: str, api_key: str, params: Dict[str, Any], cache: bool = False) -> Dict[str, Any]:
+        """GET a ClickBank endpoint as JSON, retrying transient failures"""
+
+        if not cache:
+            return await self._request(path, api_key, params)
+
+        response_cache = self._get_cache()
+        # The key hash keeps accounts sharing a nickname but not a key apart
+        key_hash = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        cache_key = f"{path}:{key_hash}:{sorted(params.items())}"
+        entry = await response_cache.get_entry(cache_key)
+        if entry is not None:
+            response_cache.stats["hits"] += 1
+            value = entry.value
+        else:
+            response_cache.stats["misses"] += 1
+            value = await response_cache.load(cache_key, lambda: self._request(path, api_key, params))
+        # The cached response is shared; callers get their own copy to modify
+        return copy.deepcopy(value)
+
+    async def _request(self, path: str, api_key: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Accept": "application/json"
+        }
+        client = self._get_client()
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                response = await client.get(path, headers=headers, params=params)
+            except httpx.TransportError as e:
+                error = ClickBankAPIError(f"ClickBank request failed: {type(e).__name__}: {e}")
+            else:
+                if response.status_code == 200:
+                    return response.json()
+                error = ClickBankAPIError(f"ClickBank API error: {response.text}", response.status_code)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    raise error
+                try:
+                    retry_after = float(response.headers.get("Retry-After", ""))
+                except ValueError:
+                    retry_after = None
+
+            if attempt == self.max_retries:
+                raise error
+            delay = self._backoff(attempt, retry_after)
+            logger.debug(f"Retrying ClickBank {path} in {delay:.2f}s after: {error}")
+            await asyncio.sleep(delay)
+
+    async def fetch_sales(self, nickname: str, api_key: str, days: int = 30, cache: bool = False) -> Dict[str, Any]:
+        """Sales summary and transactions of an account for the last ``days`` days"""
+        return await self.request("/analytics/summary", api_key, {"account": nickname, "days": days}, cache=cache)
+
+    async def fetch_orders(
+        self,
+        nickname: str,
+        api_key: str,
+        start_date: date,
+        end_date: date,
+        cache: bool = False
+    ) -> Dict[str, Any]:
+        """Individual orders (with line items) of an account in a date window"""
+        params = {
+            "account": nickname,
+            "startDate": start_date.strftime("%Y-%m-%d"),
+            "endDate": end_date.strftime("%Y-%m-%d")
+        }
+        return await self.request("/orders2/list", api_key, params, cache=cache)
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+# Global instance
+_clickbank_client = None
+
+def get_clickbank_client() -> ClickBankClient:
+    """Get global ClickBank client instance (shared connection pool)"""
+    global _clickbank_client
+    if _clickbank_client is None:
+        _clickbank_client = ClickBankClient()
+    return _clickbank_client
+
+
+async def close_clickbank_client():
+    """Close the global client's connections (application shutdown)"""
+    if _clickbank_client is not None:
+        await _clickbank_client.close()
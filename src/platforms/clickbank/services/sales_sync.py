@@ -0,0 +1,360 @@
+# clickbank_module/services/sales_sync.py
+"""
+Incremental, bulk ClickBank sales sync.
+
+Accounts are fetched concurrently through one pooled ClickBankClient. Each
+account only asks for the days since its high-water mark (the newest
+transaction already stored). Fetched rows are handed to a single writer
+that flushes every ``flush_rows`` rows in one transaction:
+
+    COPY rows into a temporary staging table (asyncpg), or multi-row
+    INSERT ... VALUES on other drivers
+    INSERT INTO clickbank_sales SELECT ... FROM staging ON CONFLICT DO NOTHING
+    upsert clickbank_sync_state for every account in the flush
+
+so a high-water mark only moves once that account's rows are committed.
+Accounts that fail are retried on later runs with exponential backoff
+(``next_attempt_at``) instead of on every run.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.platforms.clickbank.services.clickbank_client import ClickBankClient
+
+logger = logging.getLogger(__name__)
+
+SYNC_CONCURRENCY = int(os.getenv("CLICKBANK_SYNC_CONCURRENCY", 20))
+SYNC_FLUSH_ROWS = int(os.getenv("CLICKBANK_SYNC_FLUSH_ROWS", 5000))
+# Window for accounts that have never been synced
+INITIAL_SYNC_DAYS = int(os.getenv("CLICKBANK_INITIAL_SYNC_DAYS", 30))
+MAX_SYNC_DAYS = int(os.getenv("CLICKBANK_MAX_SYNC_DAYS", 90))
+# Failed accounts wait base * 2^(failures - 1) seconds, capped
+BACKOFF_BASE_SECONDS = int(os.getenv("CLICKBANK_SYNC_BACKOFF_SECONDS", 900))
+BACKOFF_MAX_SECONDS = int(os.getenv("CLICKBANK_SYNC_BACKOFF_MAX_SECONDS", 24 * 3600))
+
+SALES_COLUMNS = ("user_id", "transaction_id", "product_title", "amount", "commission", "transaction_date", "type")
+
+# Rows per multi-row INSERT; keeps the statement under the driver's parameter limit
+INSERT_CHUNK_ROWS = 1000
+
+
+@dataclass
+class AccountSync:
+    """Outcome of fetching one account"""
+    user_id: str
+    rows: List[Tuple] = field(default_factory=list)
+    high_water_mark: Optional[datetime] = None
+    failures: int = 0
+    error: Optional[str] = None
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        parsed = value
+    elif value:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _parse_amount(value: Any) -> Optional[Decimal]:
+    try:
+        return Decimal(str(value)) if value is not None else None
+    except InvalidOperation:
+        return None
+
+
+def _sale_row(user_id: str, sale: Dict[str, Any]) -> Tuple:
+    """clickbank_sales row (SALES_COLUMNS order) of one API transaction"""
+    transaction_id = sale["transaction_id"]
+    if transaction_id in (None, ""):
+        raise ValueError("transaction has an empty transaction_id")
+    return (
+        user_id,
+        str(transaction_id),
+        sale.get("product_title"),
+        _parse_amount(sale.get("amount")),
+        _parse_amount(sale.get("commission")),
+        _parse_datetime(sale.get("transaction_date")),
+        sale.get("type"),
+    )
+
+
+def sync_window_days(high_water_mark: Optional[datetime], now: datetime) -> int:
+    """Days to request so the window reaches back to the high-water mark"""
+    if high_water_mark is None:
+        return INITIAL_SYNC_DAYS
+    elapsed_days = (now - high_water_mark).total_seconds() / 86400
+    return max(1, min(MAX_SYNC_DAYS, math.ceil(elapsed_days)))
+
+
+def backoff_until(failures: int, now: datetime) -> datetime:
+    delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** max(0, failures - 1))
+    return now + timedelta(seconds=delay)
+
+
+class ClickBankSalesSync:
+    """Fetches every connected account concurrently and bulk-writes new sales"""
+
+    def __init__(
+        self,
+        client: Optional[ClickBankClient] = None,
+        session_factory: Optional[Callable[[], AsyncContextManager[AsyncSession]]] = None,
+        concurrency: int = SYNC_CONCURRENCY,
+        flush_rows: int = SYNC_FLUSH_ROWS,
+        use_copy: Optional[bool] = None
+    ):
+        self._owns_client = client is None
+        self.client = client or ClickBankClient()
+        self.session_factory = session_factory or _default_transaction
+        self.concurrency = concurrency
+        self.flush_rows = flush_rows
+        # None: COPY when the driver is asyncpg, multi-row INSERT otherwise
+        self.use_copy = use_copy
+        self.stats = {
+            "accounts": 0,
+            "skipped_backoff": 0,
+            "failed": 0,
+            "fetched_rows": 0,
+            "skipped_rows": 0,
+            "inserted_rows": 0,
+            "flushes": 0,
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        """Sync all due accounts; returns run statistics"""
+
+        started = time.perf_counter()
+        try:
+            accounts = await self._load_accounts()
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+            writer = asyncio.create_task(self._write(queue))
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def fetch(account: Dict[str, Any]):
+                async with semaphore:
+                    result = await self._fetch_account(account)
+                await queue.put(result)
+
+            fetches = asyncio.ensure_future(asyncio.gather(*(fetch(account) for account in accounts)))
+            try:
+                done, _ = await asyncio.wait({fetches, writer}, return_when=asyncio.FIRST_COMPLETED)
+                if writer in done:
+                    # The writer only stops early when a flush failed; fetchers would block on the full queue
+                    writer.result()
+                await fetches
+                # A flush can still fail with the queue full; don't wait on put() after the writer is gone
+                end_marker = asyncio.ensure_future(queue.put(None))
+                try:
+                    await asyncio.wait({end_marker, writer}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    end_marker.cancel()
+                await writer
+            finally:
+                fetches.cancel()
+                writer.cancel()
+        finally:
+            if self._owns_client:
+                await self.client.close()
+
+        self.stats["duration_seconds"] = round(time.perf_counter() - started, 2)
+        logger.info(f"ClickBank sales sync finished: {self.stats}")
+        return self.stats
+
+    async def _load_accounts(self) -> List[Dict[str, Any]]:
+        async with self.session_factory() as session:
+            result = await session.execute(text("""
+                SELECT a.user_id, a.nickname, a.api_key,
+                       s.last_transaction_at, s.failures, s.next_attempt_at
+                FROM clickbank_accounts a
+                LEFT JOIN clickbank_sync_state s ON s.user_id = a.user_id
+            """))
+            rows = result.fetchall()
+
+        now = datetime.now(timezone.utc)
+        accounts = []
+        for row in rows:
+            if row.next_attempt_at is not None and row.next_attempt_at > now:
+                self.stats["skipped_backoff"] += 1
+                continue
+            accounts.append(dict(row._mapping))
+        self.stats["accounts"] = len(accounts)
+        return accounts
+
+    async def _fetch_account(self, account: Dict[str, Any]) -> AccountSync:
+        user_id = str(account["user_id"])
+        high_water_mark = account["last_transaction_at"]
+        days = sync_window_days(high_water_mark, datetime.now(timezone.utc))
+
+        try:
+            data = await self.client.fetch_sales(account["nickname"], account["api_key"], days=days)
+            transactions = data.get("transactions", [])
+        except Exception as e:
+            return self._account_failed(account, e)
+
+        result = AccountSync(user_id, high_water_mark=high_water_mark)
+        try:
+            for sale in transactions:
+                try:
+                    row = _sale_row(user_id, sale)
+                except (KeyError, TypeError, ValueError, AttributeError) as e:
+                    # One malformed transaction must not cost the account (or the run) its sync
+                    self.stats["skipped_rows"] += 1
+                    logger.warning(f"Skipping malformed ClickBank transaction for user {user_id}: {e!r}")
+                    continue
+                transaction_date = row[5]
+                # Rows at the mark itself are re-sent; the merge drops duplicates
+                if high_water_mark is not None and transaction_date is not None and transaction_date < high_water_mark:
+                    continue
+                result.rows.append(row)
+                if transaction_date is not None and (result.high_water_mark is None or transaction_date > result.high_water_mark):
+                    result.high_water_mark = transaction_date
+        except Exception as e:
+            return self._account_failed(account, e)
+
+        self.stats["fetched_rows"] += len(result.rows)
+        return result
+
+    def _account_failed(self, account: Dict[str, Any], error: Exception) -> AccountSync:
+        user_id = str(account["user_id"])
+        self.stats["failed"] += 1
+        logger.warning(f"ClickBank sync failed for user {user_id}: {error}")
+        return AccountSync(user_id, failures=(account["failures"] or 0) + 1, error=str(error)[:500])
+
+    async def _write(self, queue: asyncio.Queue):
+        """Single writer: buffers account results and flushes them in bulk"""
+
+        pending: List[AccountSync] = []
+        pending_rows = 0
+        while True:
+            result = await queue.get()
+            if result is None:
+                break
+            pending.append(result)
+            pending_rows += len(result.rows)
+            if pending_rows >= self.flush_rows:
+                await self._flush(pending)
+                pending, pending_rows = [], 0
+        if pending:
+            await self._flush(pending)
+
+    async def _flush(self, results: List[AccountSync]):
+        rows = [row for result in results for row in result.rows]
+        async with self.session_factory() as session:
+            if rows:
+                driver = await self._asyncpg_connection(session)
+                if driver is not None:
+                    inserted = await self._merge_with_copy(session, driver, rows)
+                else:
+                    inserted = await self._merge_with_insert(session, rows)
+                self.stats["inserted_rows"] += inserted
+            await self._save_state(session, results)
+        self.stats["flushes"] += 1
+
+    async def _asyncpg_connection(self, session: AsyncSession):
+        """The asyncpg connection behind the session, when COPY is usable"""
+        if self.use_copy is False:
+            return None
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        driver = getattr(raw, "driver_connection", None)
+        if hasattr(driver, "copy_records_to_table"):
+            return driver
+        if self.use_copy:
+            raise RuntimeError("COPY requested but the database driver is not asyncpg")
+        return None
+
+    async def _merge_with_copy(self, session: AsyncSession, driver: Any, rows: List[Tuple]) -> int:
+        await session.execute(text("""
+            CREATE TEMP TABLE IF NOT EXISTS clickbank_sales_staging (
+                user_id VARCHAR(36),
+                transaction_id VARCHAR,
+                product_title TEXT,
+                amount NUMERIC(12, 2),
+                commission NUMERIC(12, 2),
+                transaction_date TIMESTAMPTZ,
+                type VARCHAR
+            ) ON COMMIT DELETE ROWS
+        """))
+        await driver.copy_records_to_table("clickbank_sales_staging", records=rows, columns=list(SALES_COLUMNS))
+        columns = ", ".join(SALES_COLUMNS)
+        result = await session.execute(text(f"""
+            INSERT INTO clickbank_sales ({columns})
+            SELECT {columns} FROM clickbank_sales_staging
+            ON CONFLICT (transaction_id) DO NOTHING
+        """))
+        return result.rowcount
+
+    async def _merge_with_insert(self, session: AsyncSession, rows: List[Tuple]) -> int:
+        inserted = 0
+        columns = ", ".join(SALES_COLUMNS)
+        for start in range(0, len(rows), INSERT_CHUNK_ROWS):
+            chunk = rows[start:start + INSERT_CHUNK_ROWS]
+            params: Dict[str, Any] = {}
+            values = []
+            for i, row in enumerate(chunk):
+                values.append("(" + ", ".join(f":{column}_{i}" for column in SALES_COLUMNS) + ")")
+                params.update({f"{column}_{i}": value for column, value in zip(SALES_COLUMNS, row)})
+            result = await session.execute(text(f"""
+                INSERT INTO clickbank_sales ({columns})
+                VALUES {", ".join(values)}
+                ON CONFLICT (transaction_id) DO NOTHING
+            """), params)
+            inserted += result.rowcount
+        return inserted
+
+    async def _save_state(self, session: AsyncSession, results: List[AccountSync]):
+        now = datetime.now(timezone.utc)
+        states = [
+            {
+                "user_id": result.user_id,
+                "last_transaction_at": result.high_water_mark,
+                "synced_at": now if result.error is None else None,
+                "failures": result.failures,
+                "next_attempt_at": backoff_until(result.failures, now) if result.error else None,
+                "last_error": result.error,
+            }
+            for result in results
+        ]
+        # The high-water mark never moves backwards; a failed run leaves it unchanged
+        await session.execute(text("""
+            INSERT INTO clickbank_sync_state
+                (user_id, last_transaction_at, last_synced_at, failures, next_attempt_at, last_error)
+            VALUES
+                (:user_id, :last_transaction_at, :synced_at, :failures, :next_attempt_at, :last_error)
+            ON CONFLICT (user_id) DO UPDATE SET
+                last_transaction_at = GREATEST(clickbank_sync_state.last_transaction_at, EXCLUDED.last_transaction_at),
+                last_synced_at = COALESCE(EXCLUDED.last_synced_at, clickbank_sync_state.last_synced_at),
+                failures = EXCLUDED.failures,
+                next_attempt_at = EXCLUDED.next_attempt_at,
+                last_error = EXCLUDED.last_error
+        """), states)
+
+
+@asynccontextmanager
+async def _default_transaction():
+    from src.core.database.session import AsyncSessionManager
+    async with AsyncSessionManager.get_transaction() as session:
+        yield session
+
+
+async def sync_all_clickbank_sales(**kwargs) -> Dict[str, Any]:
+    """Run one incremental sync of every connected ClickBank account"""
+    return await ClickBankSalesSync(**kwargs).run()
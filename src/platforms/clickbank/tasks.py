@@ -1,39 +1,16 @@
 # clickbank_module/tasks.py
+import asyncio
+
 from worker import celery
-from src.platforms.clickbank.services import clickbank_service
-from src.core.database.session import database
+from src.platforms.clickbank.services.sales_sync import sync_all_clickbank_sales
 
 @celery.task(name="tasks.sync_clickbank_sales")
 def sync_clickbank_sales():
     """
-    Nightly job: fetches sales for all connected ClickBank accounts
+    Nightly job: fetches new sales for all connected ClickBank accounts
     and stores them in the DB.
+
+    Accounts are fetched concurrently and written in bulk; each account only
+    requests the days since its last stored transaction (see sales_sync).
     """
-    # Get all users with ClickBank connected
-    rows = database.fetch_all("SELECT user_id FROM clickbank_accounts")
-    for row in rows:
-        user_id = row["user_id"]
-        try:
-            sales = clickbank_service.fetch_sales(user_id, days=1)
-            # Store each transaction in sales table
-            for s in sales.get("transactions", []):
-                database.execute(
-                    """
-                    INSERT INTO clickbank_sales
-                        (user_id, transaction_id, product_title, amount, commission, transaction_date, type)
-                    VALUES
-                        (:user_id, :transaction_id, :product_title, :amount, :commission, :transaction_date, :type)
-                    ON CONFLICT (transaction_id) DO NOTHING
-                    """,
-                    {
-                        "user_id": user_id,
-                        "transaction_id": s["transaction_id"],
-                        "product_title": s["product_title"],
-                        "amount": s["amount"],
-                        "commission": s["commission"],
-                        "transaction_date": s["transaction_date"],
-                        "type": s["type"],
-                    },
-                )
-        except Exception as e:
-            print(f"Error syncing user {user_id}: {e}")
+    return asyncio.run(sync_all_clickbank_sales())
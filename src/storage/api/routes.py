@@ -94,6 +94,29 @@ async def delete_file(
     
     return result
 
+@router.get("/images/derivatives")
+async def get_image_derivatives(
+    path: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user)
+):
+    """Get responsive derivative manifest for a stored image, generating it on first request"""
+    
+    from src.storage.universal_dual_storage import get_storage_manager
+    
+    storage_manager = get_storage_manager()
+    record = await storage_manager.get_storage_record(path, db)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Image not found or derivatives unavailable")
+    if str(record.user_id) != str(current_user["id"]):
+        raise HTTPException(status_code=403, detail="Access denied to this file")
+    
+    manifest = await storage_manager.get_image_derivatives(path, db=db)
+    if not manifest:
+        raise HTTPException(status_code=404, detail="Image not found or derivatives unavailable")
+    
+    return manifest
+
 @router.post("/generate/images")
 async def generate_campaign_images(
     campaign_id: str = Form(...),
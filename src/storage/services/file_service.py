@@ -138,6 +138,14 @@ class FileService:
                 user_id=user_id
             )
             
+            # Responsive image derivatives go with the original; their bytes
+            # are part of the record's file_size
+            if delete_result["derivative_keys"]:
+                from src.storage.universal_dual_storage import get_storage_manager
+                await get_storage_manager().delete_image_derivatives(
+                    delete_result["file_path"], delete_result["derivative_keys"]
+                )
+            
             return {
                 "success": True,
                 "file_id": file_id,
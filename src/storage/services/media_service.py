@@ -192,8 +192,23 @@ class MediaService:
             if not video_result.get("success"):
                 return video_result
             
-            # Store video if not already stored
-            if isinstance(video_result.get("video_data"), bytes) and not video_result.get("file_url"):
+            # Store video if not already stored - stream it from disk when we have a path
+            if video_result.get("video_path") and not video_result.get("file_url"):
+                from src.storage.universal_dual_storage import get_storage_manager
+                
+                upload_result = await get_storage_manager().upload_path_with_quota_check(
+                    video_result["video_path"],
+                    filename=f"campaign_{campaign_id}_slideshow_video.mp4",
+                    content_type="video/mp4",
+                    user_id=user_id,
+                    campaign_id=campaign_id,
+                    db=db
+                )
+                
+                if upload_result.get("success"):
+                    video_result["file_url"] = upload_result["url"]
+                    video_result["file_id"] = upload_result["file_id"]
+            elif isinstance(video_result.get("video_data"), bytes) and not video_result.get("file_url"):
                 filename = f"campaign_{campaign_id}_slideshow_video.mp4"
                 
                 upload_result = await self.file_service.upload_file(
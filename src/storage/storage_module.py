@@ -74,6 +74,8 @@ class StorageModule(ModuleInterface):
         """Clean shutdown of the module"""
         try:
             # Clean shutdown logic here
+            from src.storage.utils.image_executor import shutdown_image_executor
+            shutdown_image_executor(wait=False)
             self._initialized = False
             logger.info("Storage module shutdown complete")
         except Exception as e:
@@ -90,11 +92,13 @@ class StorageModule(ModuleInterface):
     
     async def get_metrics(self) -> Dict[str, Any]:
         """Get module performance metrics"""
+        from src.storage.utils.image_executor import get_image_executor
         return {
             "module": "storage",
             "initialized": self._initialized,
             "api_routes": len(self._router.routes),
-            "status": "operational" if self._initialized else "not_initialized"
+            "status": "operational" if self._initialized else "not_initialized",
+            "image_processing": get_image_executor().get_metrics()
         }
 
 # Export the module instance
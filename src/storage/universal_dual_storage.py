@@ -11,13 +11,16 @@
 import asyncio
 import aiohttp
 import boto3
+from boto3.s3.transfer import TransferConfig
 import logging
 import hashlib
 import mimetypes
 import os
 import io
+import json
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, List, Any, Optional, Tuple, Union, BinaryIO
 from dataclasses import dataclass
 from uuid import uuid4
 
@@ -28,6 +31,19 @@ from sqlalchemy.orm import selectinload
 
 logger = logging.getLogger(__name__)
 
+# Large files (videos) are streamed from disk in parts instead of loaded into memory;
+# peak memory per upload is roughly chunk size x concurrency
+MULTIPART_CHUNK_BYTES = int(os.getenv("STORAGE_MULTIPART_CHUNK_MB", 8)) * 1024 * 1024
+MULTIPART_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_CHUNK_BYTES,
+    multipart_chunksize=MULTIPART_CHUNK_BYTES,
+    max_concurrency=int(os.getenv("STORAGE_MULTIPART_CONCURRENCY", 4)),
+    use_threads=True
+)
+
+# What can be uploaded: bytes in memory, a local file path, or a readable binary file object
+UploadSource = Union[bytes, str, os.PathLike, BinaryIO]
+
 # 🆕 NEW: Custom exceptions for quota management
 class UserQuotaExceeded(Exception):
     """Raised when user exceeds storage quota"""
@@ -71,6 +87,10 @@ class UniversalDualStorageManager:
         self.providers = self._initialize_providers()
         self.health_cache = {}
         self.sync_queue = asyncio.Queue()
+        self.derivative_manifests: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_cached_manifests = 1024
+        # original key -> lazy derivative generation in progress
+        self._derivative_jobs: Dict[str, asyncio.Future] = {}
         self.supported_types = {
             "image": {
                 "extensions": [".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg"],
@@ -332,6 +352,59 @@ class UniversalDualStorageManager:
                 campaign_id
             )
         
+        return await self._upload_with_quota_check(
+            file_content, len(file_content), filename, content_type, user_id, campaign_id, db
+        )
+    
+    async def upload_path_with_quota_check(
+        self,
+        source: Union[str, os.PathLike, BinaryIO],
+        filename: str,
+        content_type: str,
+        user_id: str,
+        campaign_id: Optional[str] = None,
+        db: Optional[AsyncSession] = None
+    ) -> Dict[str, Any]:
+        """
+        Quota-checked upload streamed from a local file path or binary file object
+        
+        Same validation, records and response as upload_file_with_quota_check,
+        but the file is never loaded into memory: it is sent as a multipart
+        upload straight from disk. Use for videos and other large media.
+        """
+        file_size = _source_size(source)
+        
+        try:
+            from src.core.database import get_async_db
+            from src.users.models.user import User
+            from src.users.models.user_storage import UserStorageUsage
+        except ImportError as e:
+            logger.error(f"Database dependencies not available: {e}")
+            return await self.save_file_dual_storage(
+                source,
+                self._get_content_type_from_filename(content_type, filename),
+                filename,
+                user_id,
+                campaign_id
+            )
+        
+        return await self._upload_with_quota_check(
+            source, file_size, filename, content_type, user_id, campaign_id, db
+        )
+    
+    async def _upload_with_quota_check(
+        self,
+        source: UploadSource,
+        file_size: int,
+        filename: str,
+        content_type: str,
+        user_id: str,
+        campaign_id: Optional[str],
+        db: Optional[AsyncSession]
+    ) -> Dict[str, Any]:
+        """Shared quota-checked upload for in-memory and streamed sources"""
+        from src.core.database import get_async_db
+        
         # Get database session
         if db is None:
             async for session in get_async_db():
@@ -345,8 +418,7 @@ class UniversalDualStorageManager:
                 raise ValueError(f"User {user_id} not found")
             
             # Step 2: Validate file against user tier
-            file_size = len(file_content)
-            await self._validate_file_against_tier(file_content, content_type, user, filename)
+            await self._validate_file_size_against_tier(file_size, content_type, user, filename)
             
             # Step 3: Check storage quota
             await self._check_user_quota(user, file_size)
@@ -356,7 +428,7 @@ class UniversalDualStorageManager:
             
             # Step 5: Use existing dual storage upload
             upload_result = await self._upload_to_r2_with_metadata(
-                file_content, file_path, content_type, {
+                source, file_path, content_type, {
                     "user_id": user_id,
                     "campaign_id": campaign_id or "general",
                     "original_filename": filename,
@@ -368,19 +440,31 @@ class UniversalDualStorageManager:
             if not upload_result.get("success"):
                 raise Exception(f"Upload failed: {upload_result.get('error', 'Unknown error')}")
             
-            # Step 6: Create storage usage record
+            # Step 5b: Responsive image derivatives, charged to the same quota
+            derivatives, derivative_bytes = None, 0
+            if isinstance(source, bytes) and self._supports_derivatives(content_type):
+                derivatives = await self.create_image_derivatives(
+                    file_path, source, upload_result.get("url")
+                )
+                derivatives, derivative_bytes = await self._charge_derivatives(
+                    user, file_size, file_path, derivatives
+                )
+            
+            # Step 6: Create storage usage record (file_size covers the original
+            # and its derivatives, so deleting it frees both)
             storage_record = await self._create_storage_record(
                 user_id=user_id,
                 file_path=file_path,
                 filename=filename,
-                file_size=file_size,
+                file_size=file_size + derivative_bytes,
                 content_type=content_type,
                 campaign_id=campaign_id,
-                db=db
+                db=db,
+                metadata=self._derivative_metadata(derivatives)
             )
             
             # Step 7: Update user storage usage
-            await self._update_user_storage_usage(user_id, file_size, db)
+            await self._update_user_storage_usage(user_id, file_size + derivative_bytes, db)
             
             # Step 8: Prepare response
             return {
@@ -396,7 +480,8 @@ class UniversalDualStorageManager:
                 "url": upload_result.get("url"),
                 "user_storage": await self._get_user_storage_summary(user_id, db),
                 "providers": upload_result.get("providers", {}),
-                "storage_status": upload_result.get("storage_status", "unknown")
+                "storage_status": upload_result.get("storage_status", "unknown"),
+                "derivatives": derivatives
             }
             
         except (UserQuotaExceeded, FileSizeExceeded, ContentTypeNotAllowed) as e:
@@ -407,7 +492,7 @@ class UniversalDualStorageManager:
             raise Exception(f"Upload failed: {str(e)}")
     
     # 🆕 NEW: Helper method for R2 upload with metadata
-    async def _upload_to_r2_with_metadata(self, file_content: bytes, file_path: str, content_type: str, metadata: dict) -> Dict[str, Any]:
+    async def _upload_to_r2_with_metadata(self, file_content: UploadSource, file_path: str, content_type: str, metadata: dict) -> Dict[str, Any]:
         """Upload to R2 with metadata using existing provider system"""
         if not self.providers:
             raise Exception("No storage providers available")
@@ -420,14 +505,17 @@ class UniversalDualStorageManager:
                 raise ValueError("CLOUDFLARE_R2_BUCKET_NAME not configured")
             
             # Upload using existing method
-            primary_provider.client.put_object(
-                Bucket=bucket_name,
-                Key=file_path,
-                Body=file_content,
-                ContentType=content_type,
-                Metadata={k: str(v) for k, v in metadata.items()},
-                CacheControl='public, max-age=31536000',
-                ContentDisposition=f'inline; filename="{os.path.basename(file_path)}"'
+            await self._put_object(
+                primary_provider,
+                bucket_name,
+                file_path,
+                file_content,
+                {
+                    "ContentType": content_type,
+                    "Metadata": {k: str(v) for k, v in metadata.items()},
+                    "CacheControl": 'public, max-age=31536000',
+                    "ContentDisposition": f'inline; filename="{os.path.basename(file_path)}"'
+                }
             )
             
             # Generate URL
@@ -474,7 +562,10 @@ class UniversalDualStorageManager:
     
     async def _validate_file_against_tier(self, file_content: bytes, content_type: str, user, filename: str):
         """Validate file against user's tier restrictions"""
-        file_size = len(file_content)
+        await self._validate_file_size_against_tier(len(file_content), content_type, user, filename)
+    
+    async def _validate_file_size_against_tier(self, file_size: int, content_type: str, user, filename: str):
+        """Validate file type and size against user's tier restrictions"""
         
         # Ensure content type is set
         if not content_type or content_type == "application/octet-stream":
@@ -500,6 +591,19 @@ class UniversalDualStorageManager:
                 tier=user.storage_tier
             )
     
+    async def has_quota_for(self, user_id: str, additional_bytes: int, db: Optional[AsyncSession] = None) -> bool:
+        """Whether the user can store ``additional_bytes`` more (False if the user is unknown)"""
+        if db is None:
+            from src.core.database import get_async_db
+            async for session in get_async_db():
+                db = session
+                break
+        
+        user = await self._get_user_with_storage_info(user_id, db)
+        if not user:
+            return False
+        return user.has_storage_available(additional_bytes)
+    
     async def _check_user_quota(self, user, additional_bytes: int):
         """Check if user has enough quota for additional storage"""
         if not user.has_storage_available(additional_bytes):
@@ -519,7 +623,7 @@ class UniversalDualStorageManager:
         clean_filename = "".join(c for c in filename if c.isalnum() or c in "._-")
         return f"users/{user_id}/{category}s/{timestamp}_{file_uuid}_{clean_filename}"
     
-    async def _create_storage_record(self, user_id: str, file_path: str, filename: str, file_size: int, content_type: str, campaign_id: Optional[str], db: AsyncSession):
+    async def _create_storage_record(self, user_id: str, file_path: str, filename: str, file_size: int, content_type: str, campaign_id: Optional[str], db: AsyncSession, metadata: Optional[Dict[str, Any]] = None):
         """Create storage usage record"""
         try:
             from src.users.models.user_storage import UserStorageUsage
@@ -531,6 +635,7 @@ class UniversalDualStorageManager:
                 content_type=content_type,
                 content_category=self.storage_tiers['get_content_category'](content_type),
                 campaign_id=campaign_id,
+                file_metadata=json.dumps(metadata) if metadata else None,
                 upload_date=datetime.now(timezone.utc)
             )
             
@@ -592,9 +697,16 @@ class UniversalDualStorageManager:
         filename: str,
         user_id: str,
         campaign_id: Optional[str] = None,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        generate_derivatives: bool = False
     ) -> Dict[str, Any]:
-        """Universal save method for all content types with enhanced error handling"""
+        """
+        Universal save method for all content types with enhanced error handling
+
+        Nothing saved here is charged to a storage quota, derivatives included,
+        so ``generate_derivatives`` is off unless the caller accounts for them.
+        Quota-tracked uploads go through upload_file_with_quota_check.
+        """
         
         # Validate content type
         if content_type not in self.supported_types:
@@ -719,11 +831,114 @@ class UniversalDualStorageManager:
             results["storage_status"] = "failed"
             raise Exception("All storage providers failed")
         
+        # Responsive derivatives are built from the original upload, not the re-encoded copy
+        if generate_derivatives and primary_success and self._supports_derivatives(mime_type):
+            results["derivatives"] = await self.create_image_derivatives(
+                unique_filename, content_data, results["providers"]["primary"]["url"], primary_provider
+            )
+        
         # Add cost analysis
         results["cost_analysis"] = self._calculate_storage_costs(results, len(optimized_content))
         
         return results
     
+    async def save_file_dual_storage(
+        self,
+        source: Union[str, os.PathLike, BinaryIO],
+        content_type: str,
+        filename: str,
+        user_id: str,
+        campaign_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Streaming counterpart of save_content_dual_storage for large media
+        
+        ``source`` is a local file path or a seekable binary file object. The
+        content is hashed and uploaded in chunks, so memory stays flat no
+        matter how large the file is. No optimization pass is applied.
+        """
+        
+        if content_type not in self.supported_types:
+            raise ValueError(f"Unsupported content type: {content_type}")
+        
+        file_size = _source_size(source)
+        content_size_mb = file_size / (1024 * 1024)
+        max_size = self.supported_types[content_type]["max_size_mb"]
+        if content_size_mb > max_size:
+            raise ValueError(f"File too large: {content_size_mb:.1f}MB > {max_size}MB")
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        content_hash = (await asyncio.to_thread(_hash_source, source))[:8]
+        file_extension = self._get_file_extension(filename)
+        unique_filename = f"{content_type}s/{user_id}/{campaign_id or 'general'}/{timestamp}_{content_hash}{file_extension}"
+        
+        mime_type = mimetypes.guess_type(filename)[0] or f"{content_type}/octet-stream"
+        
+        enhanced_metadata = {
+            "user_id": user_id,
+            "campaign_id": campaign_id,
+            "content_type": content_type,
+            "original_filename": filename,
+            "file_size": file_size,
+            "mime_type": mime_type,
+            "upload_timestamp": datetime.now(timezone.utc),
+            "content_hash": content_hash,
+            "optimization_applied": False,
+            **(metadata or {})
+        }
+        
+        results = {
+            "filename": unique_filename,
+            "content_type": content_type,
+            "file_size": file_size,
+            "original_size": file_size,
+            "providers": {},
+            "storage_status": "pending",
+            "metadata": enhanced_metadata
+        }
+        
+        if not self.providers:
+            raise Exception("No storage providers available - check R2 configuration")
+        
+        for role, provider in zip(("primary", "backup"), self.providers[:2]):
+            try:
+                url = await self._upload_to_provider(
+                    provider, unique_filename, source, mime_type, enhanced_metadata
+                )
+                results["providers"][role] = {
+                    "provider": provider.name,
+                    "url": url,
+                    "status": "success",
+                    "cost_per_gb": provider.cost_per_gb
+                }
+                logger.info(f"✅ Streamed to {role} ({provider.name}): {unique_filename}")
+            except Exception as e:
+                results["providers"][role] = {
+                    "provider": provider.name,
+                    "url": None,
+                    "status": "failed",
+                    "error": str(e)
+                }
+                logger.error(f"❌ {role.capitalize()} storage failed: {str(e)}")
+        
+        primary_success = results["providers"].get("primary", {}).get("status") == "success"
+        backup_success = results["providers"].get("backup", {}).get("status") == "success"
+        
+        if primary_success and backup_success:
+            results["storage_status"] = "fully_redundant"
+        elif primary_success:
+            results["storage_status"] = "primary_success"
+        elif backup_success:
+            results["storage_status"] = "backup_only"
+        else:
+            results["storage_status"] = "failed"
+            raise Exception("All storage providers failed")
+        
+        results["cost_analysis"] = self._calculate_storage_costs(results, file_size)
+        
+        return results
+    
     async def get_content_url_with_failover(
         self,
         primary_url: str,
@@ -766,13 +981,74 @@ class UniversalDualStorageManager:
         self,
         provider: StorageProvider,
         filename: str,
-        content: bytes,
+        content: UploadSource,
         mime_type: str,
         metadata: Dict[str, Any]
     ) -> str:
         """🔥 FIXED: Upload content to specific provider with proper bucket handling"""
         
         # 🔥 FIXED: Get appropriate bucket name using exact Railway variables
+        bucket_name = self._get_bucket_name(provider)
+        
+        logger.info(f"🔍 Uploading to {provider.name} bucket: {bucket_name}")
+        
+        try:
+            # Upload with metadata
+            await self._put_object(
+                provider,
+                bucket_name,
+                filename,
+                content,
+                {
+                    "ContentType": mime_type,
+                    "Metadata": {k: str(v) for k, v in metadata.items()},
+                    # Add cache control and other optimizations
+                    "CacheControl": 'public, max-age=31536000',  # 1 year cache
+                    "ContentDisposition": f'inline; filename="{os.path.basename(filename)}"'
+                }
+            )
+            
+            # 🔥 FIXED: Return appropriate public URL
+            return self._get_public_url(provider, bucket_name, filename)
+                    
+        except Exception as e:
+            logger.error(f"Upload to {provider.name} failed: {str(e)}")
+            raise
+    
+    async def _put_object(
+        self,
+        provider: StorageProvider,
+        bucket_name: str,
+        key: str,
+        content: UploadSource,
+        extra_args: Dict[str, Any]
+    ):
+        """
+        Write one object: bytes go through put_object, file paths and file
+        objects are streamed as a (multipart above the threshold) upload
+        """
+        if isinstance(content, bytes):
+            await asyncio.to_thread(
+                provider.client.put_object,
+                Bucket=bucket_name, Key=key, Body=content, **extra_args
+            )
+        elif isinstance(content, (str, os.PathLike)):
+            await asyncio.to_thread(
+                provider.client.upload_file,
+                os.fspath(content), bucket_name, key,
+                ExtraArgs=extra_args, Config=MULTIPART_TRANSFER_CONFIG
+            )
+        else:
+            # Rewind so the same file object can be sent to several providers
+            content.seek(0)
+            await asyncio.to_thread(
+                provider.client.upload_fileobj,
+                content, bucket_name, key,
+                ExtraArgs=extra_args, Config=MULTIPART_TRANSFER_CONFIG
+            )
+    
+    def _get_bucket_name(self, provider: StorageProvider) -> str:
+        """Resolve the bucket configured for a provider"""
         if provider.name == "cloudflare_r2":
             bucket_name = os.getenv('CLOUDFLARE_R2_BUCKET_NAME')
         elif provider.name == "backblaze_b2":
@@ -785,44 +1061,330 @@ class UniversalDualStorageManager:
         if not bucket_name:
             raise ValueError(f"No bucket configured for {provider.name}")
         
-        logger.info(f"🔍 Uploading to {provider.name} bucket: {bucket_name}")
+        return bucket_name
+    
+    def _get_public_url(self, provider: StorageProvider, bucket_name: str, filename: str) -> str:
+        """Public URL of an object stored with a provider"""
+        if provider.name == "cloudflare_r2":
+            account_id = os.getenv('CLOUDFLARE_ACCOUNT_ID')
+            # Check for custom domain first
+            custom_domain = os.getenv('R2_CUSTOM_DOMAIN') or os.getenv('CLOUDFLARE_R2_CUSTOM_DOMAIN')
+            if custom_domain:
+                return f"https://{custom_domain}/{filename}"
+            else:
+                return f"https://{bucket_name}.{account_id}.r2.cloudflarestorage.com/{filename}"
+                
+        elif provider.name == "backblaze_b2":
+            return f"https://{bucket_name}.s3.us-west-004.backblazeb2.com/{filename}"
+            
+        elif provider.name == "aws_s3":
+            region = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
+            if region == 'us-east-1':
+                return f"https://{bucket_name}.s3.amazonaws.com/{filename}"
+            else:
+                return f"https://{bucket_name}.s3.{region}.amazonaws.com/{filename}"
+    
+    async def _download_from_provider(self, provider: StorageProvider, filename: str) -> Optional[bytes]:
+        """Fetch an object from a provider, None if it does not exist"""
+        bucket_name = self._get_bucket_name(provider)
+        
+        def download() -> bytes:
+            return provider.client.get_object(Bucket=bucket_name, Key=filename)["Body"].read()
         
         try:
-            # Upload with metadata
-            provider.client.put_object(
-                Bucket=bucket_name,
-                Key=filename,
-                Body=content,
-                ContentType=mime_type,
-                Metadata={k: str(v) for k, v in metadata.items()},
-                # Add cache control and other optimizations
-                CacheControl='public, max-age=31536000',  # 1 year cache
-                ContentDisposition=f'inline; filename="{os.path.basename(filename)}"'
+            return await asyncio.to_thread(download)
+        except Exception as e:
+            logger.debug(f"Download of {filename} from {provider.name} failed: {str(e)}")
+            return None
+    
+    async def _delete_from_provider(self, provider: StorageProvider, filename: str) -> bool:
+        """Delete an object from a provider"""
+        try:
+            await asyncio.to_thread(
+                provider.client.delete_object, Bucket=self._get_bucket_name(provider), Key=filename
             )
+            return True
+        except Exception as e:
+            logger.warning(f"Delete of {filename} from {provider.name} failed: {str(e)}")
+            return False
+    
+    async def store_object(
+        self,
+        key: str,
+        content: UploadSource,
+        mime_type: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """Write an object at a fixed key on the primary provider; returns its URL or None"""
+        if not self.providers:
+            return None
+        provider = self.providers[0]
+        try:
+            return await self._upload_to_provider(provider, key, content, mime_type, metadata or {})
+        except Exception:
+            return None
+    
+    async def fetch_object(self, key: str) -> Optional[bytes]:
+        """Read an object from the primary provider, None if missing or unavailable"""
+        if not self.providers:
+            return None
+        return await self._download_from_provider(self.providers[0], key)
+    
+    # 🆕 NEW: Responsive image derivatives (WebP/AVIF/JPEG width ladder + manifest)
+    
+    async def create_image_derivatives(
+        self,
+        original_key: str,
+        image_data: bytes,
+        original_url: Optional[str] = None,
+        provider: Optional[StorageProvider] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate responsive derivatives for an image and store them next to it.
+        
+        Encoding runs in the image processing pool; the resulting manifest is
+        uploaded as ``<name>.derivatives.json`` beside the original.
+        
+        Returns:
+            The derivative manifest, or None if generation failed
+        """
+        from src.storage.utils.image_derivatives import (
+            generate_image_derivatives, build_manifest, derivative_key, manifest_key
+        )
+        from src.storage.utils.image_executor import run_image_job
+        
+        provider = provider or (self.providers[0] if self.providers else None)
+        if provider is None:
+            return None
+        
+        try:
+            generated = await run_image_job(generate_image_derivatives, image_data)
             
-            # 🔥 FIXED: Return appropriate public URL
-            if provider.name == "cloudflare_r2":
-                account_id = os.getenv('CLOUDFLARE_ACCOUNT_ID')
-                # Check for custom domain first
-                custom_domain = os.getenv('R2_CUSTOM_DOMAIN') or os.getenv('CLOUDFLARE_R2_CUSTOM_DOMAIN')
-                if custom_domain:
-                    return f"https://{custom_domain}/{filename}"
-                else:
-                    return f"https://{bucket_name}.{account_id}.r2.cloudflarestorage.com/{filename}"
-                    
-            elif provider.name == "backblaze_b2":
-                return f"https://{bucket_name}.s3.us-west-004.backblazeb2.com/{filename}"
-                
-            elif provider.name == "aws_s3":
-                region = os.getenv('AWS_DEFAULT_REGION', 'us-east-1')
-                if region == 'us-east-1':
-                    return f"https://{bucket_name}.s3.amazonaws.com/{filename}"
-                else:
-                    return f"https://{bucket_name}.s3.{region}.amazonaws.com/{filename}"
-                    
+            uploaded = []
+            for variant in generated["variants"]:
+                key = derivative_key(original_key, variant["width"], variant["format"])
+                url = await self._upload_to_provider(
+                    provider, key, variant.pop("data"), variant["mime_type"],
+                    {"derivative_of": original_key, "width": variant["width"]}
+                )
+                uploaded.append({**variant, "key": key, "url": url})
+            
+            manifest = build_manifest(
+                original_key,
+                original_url or self._get_public_url(provider, self._get_bucket_name(provider), original_key),
+                generated["width"],
+                generated["height"],
+                uploaded
+            )
+            await self._upload_to_provider(
+                provider, manifest_key(original_key), json.dumps(manifest).encode("utf-8"),
+                "application/json", {"derivative_manifest": "true"}
+            )
+            self._remember_manifest(original_key, manifest)
+            
+            logger.info(f"🖼️ Generated {len(uploaded)} derivatives for {original_key}")
+            return manifest
         except Exception as e:
-            logger.error(f"Upload to {provider.name} failed: {str(e)}")
+            logger.warning(f"Derivative generation failed for {original_key}: {str(e)}")
+            return None
+    
+    async def get_image_derivatives(
+        self,
+        original_key: str,
+        generate_if_missing: bool = True,
+        db: Optional[AsyncSession] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the derivative manifest for a stored image.
+        
+        Legacy assets uploaded before derivatives existed get theirs generated
+        lazily on the first request; concurrent first requests share one
+        generation. With ``db``, lazily generated derivatives are charged to
+        the owner of the original's storage record.
+        """
+        from src.storage.utils.image_derivatives import manifest_key
+        
+        if original_key in self.derivative_manifests:
+            self.derivative_manifests.move_to_end(original_key)
+            return self.derivative_manifests[original_key]
+        
+        if not self.providers:
+            return None
+        provider = self.providers[0]
+        
+        manifest_data = await self._download_from_provider(provider, manifest_key(original_key))
+        if manifest_data:
+            manifest = json.loads(manifest_data)
+            self._remember_manifest(original_key, manifest)
+            return manifest
+        
+        # Never download originals that derivatives cannot be made from
+        if not generate_if_missing or not self._supports_derivatives(mimetypes.guess_type(original_key)[0]):
+            return None
+        
+        job = self._derivative_jobs.get(original_key)
+        if job is not None:
+            return await asyncio.shield(job)
+        
+        job = asyncio.get_running_loop().create_future()
+        # Retrieve the exception even when nobody else awaited the job
+        job.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._derivative_jobs[original_key] = job
+        try:
+            manifest = await self._generate_missing_derivatives(original_key, provider, db)
+            job.set_result(manifest)
+            return manifest
+        except asyncio.CancelledError:
+            job.cancel()
             raise
+        except BaseException as e:
+            job.set_exception(e)
+            raise
+        finally:
+            self._derivative_jobs.pop(original_key, None)
+    
+    async def _generate_missing_derivatives(
+        self,
+        original_key: str,
+        provider: StorageProvider,
+        db: Optional[AsyncSession]
+    ) -> Optional[Dict[str, Any]]:
+        """Generate (and with ``db`` charge) derivatives for an image that has none"""
+        
+        image_data = await self._download_from_provider(provider, original_key)
+        if not image_data:
+            logger.warning(f"Original image not found for derivatives: {original_key}")
+            return None
+        
+        manifest = await self.create_image_derivatives(original_key, image_data, provider=provider)
+        if manifest and db is not None:
+            manifest = await self._track_legacy_derivatives(original_key, manifest, db)
+        return manifest
+    
+    async def delete_image_derivatives(
+        self,
+        original_key: str,
+        keys: Optional[List[str]] = None
+    ) -> int:
+        """
+        Delete an image's derivatives and manifest from the primary provider.
+        
+        ``keys`` are the tracked derivative keys from the storage record; without
+        them the stored manifest is read to find the variants.
+        
+        Returns:
+            Number of objects deleted
+        """
+        from src.storage.utils.image_derivatives import manifest_key
+        
+        if not self.providers:
+            return 0
+        provider = self.providers[0]
+        
+        if keys is None:
+            manifest = self.derivative_manifests.get(original_key)
+            if manifest is None:
+                manifest_data = await self._download_from_provider(provider, manifest_key(original_key))
+                manifest = json.loads(manifest_data) if manifest_data else None
+            keys = self._derivative_keys(manifest) if manifest else []
+        self.derivative_manifests.pop(original_key, None)
+        
+        deleted = await asyncio.gather(*[self._delete_from_provider(provider, key) for key in keys])
+        if keys:
+            logger.info(f"🗑️ Deleted {sum(deleted)}/{len(keys)} derivative objects of {original_key}")
+        return sum(deleted)
+    
+    def _derivative_keys(self, manifest: Dict[str, Any]) -> List[str]:
+        """Every object written for a manifest: the variants and the manifest itself"""
+        from src.storage.utils.image_derivatives import manifest_key
+        
+        keys = [variant["key"] for variant in manifest.get("variants", [])]
+        keys.append(manifest_key(manifest["original"]["key"]))
+        return keys
+    
+    def _derivative_metadata(self, manifest: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Storage record metadata tracking an image's derivatives"""
+        if not manifest:
+            return None
+        return {
+            "derivatives": {
+                "keys": self._derivative_keys(manifest),
+                "bytes": sum(variant.get("size", 0) for variant in manifest.get("variants", []))
+            }
+        }
+    
+    async def _charge_derivatives(
+        self,
+        user,
+        original_size: int,
+        original_key: str,
+        manifest: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        Derivative bytes to add to the user's usage, or (None, 0) after deleting
+        the derivatives again if they do not fit in the remaining quota
+        """
+        metadata = self._derivative_metadata(manifest)
+        if not metadata:
+            return None, 0
+        
+        derivative_bytes = metadata["derivatives"]["bytes"]
+        if not user.has_storage_available(original_size + derivative_bytes):
+            logger.warning(f"Derivatives of {original_key} exceed the quota of user {user.id}, removing them")
+            await self.delete_image_derivatives(original_key, metadata["derivatives"]["keys"])
+            return None, 0
+        return manifest, derivative_bytes
+    
+    async def _track_legacy_derivatives(
+        self,
+        original_key: str,
+        manifest: Dict[str, Any],
+        db: AsyncSession
+    ) -> Optional[Dict[str, Any]]:
+        """Add lazily generated derivatives to the storage record and quota of the original's owner"""
+        
+        record = await self.get_storage_record(original_key, db)
+        if record is None:
+            # Not a quota-tracked upload (e.g. generated campaign assets)
+            return manifest
+        
+        metadata = json.loads(record.file_metadata) if record.file_metadata else {}
+        if "derivatives" in metadata:
+            # Another worker generated and charged them already
+            return manifest
+        
+        user = await self._get_user_with_storage_info(record.user_id, db)
+        if user is None:
+            return manifest
+        manifest, derivative_bytes = await self._charge_derivatives(user, 0, original_key, manifest)
+        if not manifest:
+            return None
+        
+        metadata.update(self._derivative_metadata(manifest))
+        record.file_metadata = json.dumps(metadata)
+        record.file_size += derivative_bytes
+        await db.commit()
+        await self._update_user_storage_usage(record.user_id, derivative_bytes, db)
+        return manifest
+    
+    async def get_storage_record(self, file_path: str, db: AsyncSession):
+        """The live quota-tracked storage record of a file, or None"""
+        from src.users.models.user_storage import UserStorageUsage
+        
+        result = await db.execute(
+            select(UserStorageUsage).where(
+                UserStorageUsage.file_path == file_path,
+                UserStorageUsage.is_deleted == False
+            )
+        )
+        return result.scalar_one_or_none()
+    
+    def _remember_manifest(self, original_key: str, manifest: Dict[str, Any]):
+        """Keep recently used manifests in memory, bounded"""
+        self.derivative_manifests[original_key] = manifest
+        self.derivative_manifests.move_to_end(original_key)
+        while len(self.derivative_manifests) > self.max_cached_manifests:
+            self.derivative_manifests.popitem(last=False)
     
     async def _check_url_health(self, url: str) -> bool:
         """Check if URL is accessible with caching"""
@@ -846,6 +1408,10 @@ class UniversalDualStorageManager:
             self.health_cache[cache_key] = (False, datetime.now())
             return False
     
+    def _supports_derivatives(self, mime_type: str) -> bool:
+        """Raster images only - SVG scales itself and GIFs may be animated"""
+        return mime_type in ("image/jpeg", "image/png", "image/webp")
+    
     def _get_file_extension(self, filename: str) -> str:
         """Get file extension from filename"""
         return os.path.splitext(filename)[1].lower() or ".bin"
@@ -860,25 +1426,10 @@ class UniversalDualStorageManager:
         return content
     
     async def _optimize_image(self, image_data: bytes) -> bytes:
-        """Optimize image for web delivery"""
+        """Optimize image for web delivery (runs in the image processing pool)"""
         try:
-            from PIL import Image
-            
-            # Convert to PIL Image
-            img = Image.open(io.BytesIO(image_data))
-            
-            # Optimize for web
-            if img.mode in ('RGBA', 'LA', 'P'):
-                img = img.convert('RGB')
-            
-            # Resize if too large
-            if img.width > 2048 or img.height > 2048:
-                img.thumbnail((2048, 2048), Image.Resampling.LANCZOS)
-            
-            # Save optimized
-            output = io.BytesIO()
-            img.save(output, format='JPEG', quality=85, optimize=True)
-            return output.getvalue()
+            from src.storage.utils.media_processors import optimize_image_for_storage_async
+            return await optimize_image_for_storage_async(image_data)
         except Exception as e:
             logger.warning(f"Image optimization failed: {str(e)}")
             return image_data
@@ -1005,6 +1556,34 @@ class UniversalDualStorageManager:
         
         return health_status
 
+def _source_size(source: UploadSource) -> int:
+    """Size in bytes of an upload source without reading it into memory"""
+    if isinstance(source, bytes):
+        return len(source)
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    position = source.tell()
+    size = source.seek(0, io.SEEK_END)
+    source.seek(position)
+    return size
+
+def _hash_source(source: UploadSource, chunk_size: int = 1024 * 1024) -> str:
+    """md5 hex digest of an upload source, read in chunks"""
+    digest = hashlib.md5()
+    if isinstance(source, bytes):
+        digest.update(source)
+        return digest.hexdigest()
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    source.seek(0)
+    for chunk in iter(lambda: source.read(chunk_size), b""):
+        digest.update(chunk)
+    source.seek(0)
+    return digest.hexdigest()
+
 # Global instance
 _storage_manager = None
 
@@ -22,7 +22,23 @@ from src.storage.utils.media_processors import (
     compress_image,
     validate_image,
     extract_video_metadata,
-    validate_video_format
+    validate_video_format,
+    optimize_image_for_storage_async
+)
+
+from src.storage.utils.image_derivatives import (
+    generate_image_derivatives,
+    build_manifest,
+    derivative_key,
+    manifest_key
+)
+
+from src.storage.utils.image_executor import (
+    ImageProcessingExecutor,
+    ImageProcessingQueueFull,
+    ImageProcessingTimeout,
+    get_image_executor,
+    run_image_job
 )
 
 __all__ = [
@@ -35,5 +51,15 @@ __all__ = [
     "compress_image",
     "validate_image",
     "extract_video_metadata",
-    "validate_video_format"
+    "validate_video_format",
+    "optimize_image_for_storage_async",
+    "generate_image_derivatives",
+    "build_manifest",
+    "derivative_key",
+    "manifest_key",
+    "ImageProcessingExecutor",
+    "ImageProcessingQueueFull",
+    "ImageProcessingTimeout",
+    "get_image_executor",
+    "run_image_job"
 ]
\ No newline at end of file
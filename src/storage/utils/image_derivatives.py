@@ -0,0 +1,172 @@
+# ============================================================================
+# src/storage/utils/image_derivatives.py
+# ============================================================================
+
+"""
+Responsive Image Derivatives
+
+Generates a width ladder of AVIF / WebP / JPEG variants for an uploaded image
+and describes them in a JSON manifest stored next to the original. The
+landing page HTML builder turns a manifest into <picture>/srcset markup.
+
+Storage layout for an original at ``images/u1/c1/photo.jpg``::
+
+    images/u1/c1/photo.jpg                    original
+    images/u1/c1/photo_w640.webp              derivative
+    images/u1/c1/photo_w640.jpg               derivative (fallback)
+    images/u1/c1/photo.derivatives.json       manifest
+"""
+
+import io
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image, features
+
+logger = logging.getLogger(__name__)
+
+# AVIF needs Pillow >= 11.2 built with libavif, or the pillow-avif-plugin package
+try:
+    import pillow_avif  # noqa: F401
+except ImportError:
+    pass
+
+MANIFEST_VERSION = 1
+DEFAULT_WIDTHS: Tuple[int, ...] = (320, 640, 960, 1280, 1920)
+
+# Preferred order: most efficient first, JPEG always last as the <img> fallback
+FORMAT_SETTINGS: Dict[str, Dict[str, Any]] = {
+    "avif": {"pil_format": "AVIF", "extension": ".avif", "mime_type": "image/avif", "quality": 55},
+    "webp": {"pil_format": "WEBP", "extension": ".webp", "mime_type": "image/webp", "quality": 78},
+    "jpeg": {"pil_format": "JPEG", "extension": ".jpg", "mime_type": "image/jpeg", "quality": 82},
+}
+
+
+def avif_supported() -> bool:
+    """Check whether this Pillow build can encode AVIF"""
+    try:
+        return bool(features.check("avif")) or "AVIF" in Image.SAVE
+    except Exception:
+        return "AVIF" in Image.SAVE
+
+
+def default_formats() -> List[str]:
+    """Formats to generate with the current Pillow build"""
+    formats = ["webp", "jpeg"]
+    if avif_supported():
+        formats.insert(0, "avif")
+    return formats
+
+
+def derivative_key(original_key: str, width: int, fmt: str) -> str:
+    """Storage key of one derivative"""
+    base, _ = os.path.splitext(original_key)
+    return f"{base}_w{width}{FORMAT_SETTINGS[fmt]['extension']}"
+
+
+def manifest_key(original_key: str) -> str:
+    """Storage key of the derivative manifest for an original"""
+    base, _ = os.path.splitext(original_key)
+    return f"{base}.derivatives.json"
+
+
+def _target_widths(original_width: int, widths: Sequence[int]) -> List[int]:
+    """Widths to generate - never upscale, always include at least one variant"""
+    targets = sorted({w for w in widths if w < original_width})
+    if not targets or original_width <= max(widths):
+        targets.append(original_width)
+    return sorted(set(targets))
+
+
+def generate_image_derivatives(
+    image_data: bytes,
+    widths: Sequence[int] = DEFAULT_WIDTHS,
+    formats: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Encode every (width, format) variant of an image.
+
+    CPU-heavy: call through the image processing executor from async code.
+
+    Returns:
+        Dict with original dimensions and a list of variants, each carrying
+        its encoded ``data`` bytes
+    """
+    formats = [f for f in (formats or default_formats()) if f in FORMAT_SETTINGS]
+
+    image = Image.open(io.BytesIO(image_data))
+    image.load()
+    original_width, original_height = image.size
+
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "P") else "RGB")
+
+    variants = []
+    for width in _target_widths(original_width, widths):
+        height = max(1, round(original_height * width / original_width))
+        resized = image if width == original_width else image.resize((width, height), Image.Resampling.LANCZOS)
+
+        for fmt in formats:
+            settings = FORMAT_SETTINGS[fmt]
+            frame = resized
+            if fmt == "jpeg" and frame.mode == "RGBA":
+                # JPEG has no alpha channel - flatten onto white
+                flattened = Image.new("RGB", frame.size, (255, 255, 255))
+                flattened.paste(frame, mask=frame.split()[3])
+                frame = flattened
+
+            buffer = io.BytesIO()
+            save_kwargs = {"format": settings["pil_format"], "quality": settings["quality"]}
+            if fmt == "jpeg":
+                save_kwargs.update(optimize=True, progressive=True)
+            elif fmt == "webp":
+                save_kwargs["method"] = 4
+
+            try:
+                frame.save(buffer, **save_kwargs)
+            except Exception as e:
+                logger.warning(f"Derivative encoding failed for {fmt} @ {width}px: {e}")
+                continue
+
+            variants.append({
+                "width": width,
+                "height": height,
+                "format": fmt,
+                "mime_type": settings["mime_type"],
+                "size": buffer.tell(),
+                "data": buffer.getvalue()
+            })
+
+    return {
+        "width": original_width,
+        "height": original_height,
+        "variants": variants
+    }
+
+
+def build_manifest(
+    original_key: str,
+    original_url: Optional[str],
+    width: int,
+    height: int,
+    variants: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Build the JSON manifest from uploaded variants (``key``/``url`` set, ``data`` dropped)"""
+    return {
+        "version": MANIFEST_VERSION,
+        "original": {
+            "key": original_key,
+            "url": original_url,
+            "width": width,
+            "height": height
+        },
+        "formats": sorted({v["format"] for v in variants}, key=list(FORMAT_SETTINGS).index),
+        "variants": [
+            {k: v[k] for k in ("width", "height", "format", "mime_type", "size", "key", "url")}
+            for v in variants
+        ],
+        "generated_at": datetime.now(timezone.utc).isoformat()
+    }
+
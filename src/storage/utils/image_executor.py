@@ -0,0 +1,235 @@
+# ============================================================================
+# src/storage/utils/image_executor.py
+# ============================================================================
+
+"""
+Image Processing Executor
+
+Runs Pillow-heavy work (decode, resize, encode, compositing) in a bounded
+process pool so large images never block the asyncio event loop.
+
+Jobs are plain module-level functions with picklable arguments. The executor
+admits at most ``max_workers + max_queue_size`` jobs at a time; further
+submissions are rejected immediately so callers can fall back or return 503.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.core.shared.exceptions import ServiceUnavailableError, StorageError
+
+logger = logging.getLogger(__name__)
+
+
+class ImageProcessingQueueFull(ServiceUnavailableError):
+    """Raised when the image processing queue is at capacity"""
+
+    def __init__(self, message: str = "Image processing queue is full", **kwargs):
+        super().__init__(message, service_name="image_processing", **kwargs)
+
+
+class ImageProcessingTimeout(StorageError):
+    """Raised when an image processing job exceeds its timeout"""
+
+    def __init__(self, message: str, **kwargs):
+        super().__init__(message, operation="image_processing", **kwargs)
+
+
+def _run_timed(func: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+    """Worker-side wrapper returning the job result and its processing time"""
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+class ImageProcessingExecutor:
+    """Bounded process pool for CPU-bound image work with queue metrics"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        job_timeout: Optional[float] = None,
+        use_processes: Optional[bool] = None
+    ):
+        self.max_workers = max_workers or int(
+            os.getenv("IMAGE_PROCESSING_WORKERS", min(4, os.cpu_count() or 1))
+        )
+        self.max_queue_size = max_queue_size if max_queue_size is not None else int(
+            os.getenv("IMAGE_PROCESSING_QUEUE_SIZE", 32)
+        )
+        self.job_timeout = job_timeout or float(os.getenv("IMAGE_PROCESSING_TIMEOUT_SECONDS", 30))
+        if use_processes is None:
+            use_processes = os.getenv("IMAGE_PROCESSING_EXECUTOR", "process").lower() != "thread"
+        self.use_processes = use_processes
+
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        # Slots are released from the pool's callback thread, when a job
+        # actually finishes rather than when its caller stops waiting
+        self._slot_lock = threading.Lock()
+        self._in_flight = 0
+
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "rejected": 0,
+            "pool_restarts": 0,
+            "total_processing_seconds": 0.0,
+            "max_processing_seconds": 0.0,
+            "total_wait_seconds": 0.0,
+            "max_queue_depth": 0,
+        }
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of admitted jobs (running + queued)"""
+        return self.max_workers + self.max_queue_size
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs admitted but not yet picked up by a worker"""
+        return max(0, self._in_flight - self.max_workers)
+
+    def _get_executor(self) -> Executor:
+        """Create the underlying pool lazily"""
+        with self._lock:
+            if self._executor is None:
+                if self.use_processes:
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="image-processing"
+                    )
+                logger.info(
+                    f"Image processing executor started: "
+                    f"{'process' if self.use_processes else 'thread'} pool, "
+                    f"{self.max_workers} workers, queue {self.max_queue_size}"
+                )
+            return self._executor
+
+    def _reset_executor(self):
+        """Drop a broken pool so the next job starts a fresh one"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+                self._stats["pool_restarts"] += 1
+
+    def _release_slot(self, _future: Optional[Future] = None):
+        with self._slot_lock:
+            self._in_flight -= 1
+
+    async def run(
+        self,
+        func: Callable,
+        *args,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Run ``func(*args, **kwargs)`` in the pool and await the result.
+
+        Raises:
+            ImageProcessingQueueFull: the executor is at capacity
+            ImageProcessingTimeout: the job did not finish within the timeout
+        """
+        with self._slot_lock:
+            if self._in_flight >= self.capacity:
+                self._stats["rejected"] += 1
+                raise ImageProcessingQueueFull(
+                    f"Image processing queue is full ({self._in_flight}/{self.capacity} jobs)"
+                )
+            self._in_flight += 1
+
+        self._stats["submitted"] += 1
+        self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self.queue_depth)
+        job_timeout = timeout or self.job_timeout
+        submitted_at = time.perf_counter()
+
+        try:
+            job = self._get_executor().submit(_run_timed, func, args, kwargs)
+        except Exception:
+            self._stats["failed"] += 1
+            self._release_slot()
+            raise
+        job.add_done_callback(self._release_slot)
+
+        try:
+            result, processing_seconds = await asyncio.wait_for(asyncio.wrap_future(job), timeout=job_timeout)
+        except asyncio.TimeoutError:
+            # A job that already started keeps running to completion and keeps
+            # its slot until then; we only stop waiting for it
+            self._stats["timed_out"] += 1
+            raise ImageProcessingTimeout(
+                f"Image job {getattr(func, '__name__', func)} exceeded {job_timeout}s"
+            )
+        except BrokenProcessPool:
+            self._stats["failed"] += 1
+            logger.error("Image processing pool broke, restarting on next job")
+            self._reset_executor()
+            raise
+        except Exception:
+            self._stats["failed"] += 1
+            raise
+
+        wall_seconds = time.perf_counter() - submitted_at
+        self._stats["completed"] += 1
+        self._stats["total_processing_seconds"] += processing_seconds
+        self._stats["max_processing_seconds"] = max(self._stats["max_processing_seconds"], processing_seconds)
+        self._stats["total_wait_seconds"] += max(0.0, wall_seconds - processing_seconds)
+        return result
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth, throughput and processing time statistics"""
+        completed = self._stats["completed"]
+        return {
+            "executor_type": "process" if self.use_processes else "thread",
+            "max_workers": self.max_workers,
+            "max_queue_size": self.max_queue_size,
+            "job_timeout_seconds": self.job_timeout,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            **self._stats,
+            "avg_processing_seconds": round(self._stats["total_processing_seconds"] / completed, 4) if completed else 0.0,
+            "avg_wait_seconds": round(self._stats["total_wait_seconds"] / completed, 4) if completed else 0.0,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the underlying pool"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+                logger.info("Image processing executor shut down")
+
+
+# Global instance
+_image_executor = None
+
+def get_image_executor() -> ImageProcessingExecutor:
+    """Get global image processing executor instance"""
+    global _image_executor
+    if _image_executor is None:
+        _image_executor = ImageProcessingExecutor()
+    return _image_executor
+
+async def run_image_job(func: Callable, *args, **kwargs) -> Any:
+    """Run a Pillow-heavy function on the global image processing executor"""
+    return await get_image_executor().run(func, *args, **kwargs)
+
+def shutdown_image_executor(wait: bool = True):
+    """Shut down the global executor if it was started"""
+    global _image_executor
+    if _image_executor is not None:
+        _image_executor.shutdown(wait=wait)
+        _image_executor = None
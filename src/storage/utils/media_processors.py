@@ -14,6 +14,8 @@ from typing import Dict, Any, List, Optional, Tuple
 from PIL import Image, ImageOps
 from datetime import datetime
 
+from src.storage.utils.image_executor import run_image_job
+
 logger = logging.getLogger(__name__)
 
 def resize_image(
@@ -451,4 +453,38 @@ def _get_optimization_recommendations(validation: Dict, analysis: Dict) -> List[
     if analysis["has_transparency"] and validation["format"] == "JPEG":
         recommendations.append("Consider PNG format to preserve transparency")
     
-    return recommendations
\ No newline at end of file
+    return recommendations
+
+def optimize_image_for_storage(
+    image_data: bytes,
+    max_dimension: int = 2048,
+    quality: int = 85
+) -> bytes:
+    """Re-encode image as web-ready JPEG, downscaling anything above max_dimension"""
+    
+    img = Image.open(io.BytesIO(image_data))
+    
+    # Optimize for web
+    if img.mode in ('RGBA', 'LA', 'P'):
+        img = img.convert('RGB')
+    
+    # Resize if too large
+    if img.width > max_dimension or img.height > max_dimension:
+        img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    
+    # Save optimized
+    output = io.BytesIO()
+    img.save(output, format='JPEG', quality=quality, optimize=True)
+    return output.getvalue()
+
+# ============================================================================
+# ASYNC VARIANT - runs on the image processing executor, off the event loop
+# ============================================================================
+
+async def optimize_image_for_storage_async(
+    image_data: bytes,
+    max_dimension: int = 2048,
+    quality: int = 85
+) -> bytes:
+    """Async optimize_image_for_storage executed in the image processing pool"""
+    return await run_image_job(optimize_image_for_storage, image_data, max_dimension, quality)
@@ -192,6 +192,11 @@ class User(Base):
         """Set and hash a new password"""
         self.hashed_password = self.hash_password(password)
         self.updated_at = datetime.now(timezone.utc)
+
+    def set_password_hash(self, hashed_password: str) -> None:
+        """Set an already hashed password (see src.core.auth.password_hasher)"""
+        self.hashed_password = hashed_password
+        self.updated_at = datetime.now(timezone.utc)
     
     # User type management
     def set_user_type(self, user_type: Union[UserTypeEnum, str], type_data: Optional[Dict[str, Any]] = None) -> None:
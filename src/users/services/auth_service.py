@@ -10,8 +10,8 @@ from datetime import datetime, timezone, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 import logging
+import uuid
 import jwt
-from passlib.context import CryptContext
 
 from src.users.models.user import User
 from src.users.services.user_service import UserService
@@ -21,13 +21,37 @@ from src.core.shared.exceptions import ValidationError, NotFoundError
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+
+def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
+    """Verify and decode an access token without touching the database"""
+    try:
+        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        
+        # Check token type
+        if payload.get("type") != "access":
+            return None
+        
+        # Check expiration
+        exp = payload.get("exp")
+        if exp and datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(timezone.utc):
+            return None
+        
+        return payload
+        
+    except jwt.PyJWTError as e:
+        logger.warning(f"Token verification failed: {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Token verification error: {e}")
+        return None
+
+
 class AuthService:
     """Enhanced Authentication Service with full implementation"""
     
     def __init__(self, db: AsyncSession):
         self.db = db
         self.user_service = UserService(db)
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         self.secret_key = settings.JWT_SECRET_KEY
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expire_minutes = settings.ACCESS_TOKEN_EXPIRE_MINUTES
@@ -66,7 +90,13 @@ class AuthService:
                 "email": user.email,
                 "exp": expire,
                 "iat": datetime.now(timezone.utc),
-                "type": "access"
+                "jti": uuid.uuid4().hex,
+                "type": "access",
+                # Claims for endpoints that authorize from the token alone
+                "role": user.role,
+                "user_type": user.user_type,
+                "company_id": str(user.company_id) if user.company_id else None,
+                "subscription_tier": user.subscription_tier
             }
             
             encoded_jwt = jwt.encode(token_data, self.secret_key, algorithm=self.algorithm)
@@ -79,26 +109,7 @@ class AuthService:
     
     async def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify and decode JWT token"""
-        try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            
-            # Check token type
-            if payload.get("type") != "access":
-                return None
-            
-            # Check expiration
-            exp = payload.get("exp")
-            if exp and datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(timezone.utc):
-                return None
-            
-            return payload
-            
-        except jwt.PyJWTError as e:
-            logger.warning(f"Token verification failed: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Token verification error: {e}")
-            return None
+        return decode_access_token(token)
     
     async def get_current_user(self, token: str) -> Optional[User]:
         """Get current user from token"""
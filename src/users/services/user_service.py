@@ -15,6 +15,9 @@ import json
 
 from src.users.models.user import User, Company, UserTypeEnum, UserRoleEnum, SubscriptionTierEnum
 from src.core.shared.exceptions import NotFoundError, ValidationError
+from src.core.database.search import text_search
+from src.core.auth.principal_cache import invalidate_principal
+from src.core.auth.password_hasher import get_password_hasher
 
 logger = logging.getLogger(__name__)
 
@@ -109,8 +112,8 @@ class UserService:
                 }
                 user.dashboard_preferences = json.dumps(dashboard_prefs)
 
-            # Set password using the User model's method
-            user.set_password(password)
+            # Hash off the event loop
+            user.set_password_hash(await get_password_hasher().hash(password))
             
             self.db.add(user)
             await self.db.commit()
@@ -191,7 +194,8 @@ class UserService:
                 logger.warning(f"User not found for email: {email}")
                 return None
             
-            if not user.verify_password(password):
+            hasher = get_password_hasher()
+            if not await hasher.verify(password, user.hashed_password):
                 logger.warning(f"Invalid password for user: {email}")
                 return None
             
@@ -199,6 +203,12 @@ class UserService:
                 logger.warning(f"User account is deactivated: {email}")
                 return None
             
+            # Upgrade hashes made with an outdated cost while the plaintext is at hand
+            new_hash = await hasher.rehash_if_needed(password, user.hashed_password)
+            if new_hash:
+                user.set_password_hash(new_hash)
+                logger.info(f"Rehashed password for user {user.id} with {hasher.rounds} rounds")
+            
             # Update last login using the User model method
             user.record_login()
             await self.db.commit()
@@ -234,6 +244,7 @@ class UserService:
             user.updated_at = datetime.now(timezone.utc)
             await self.db.commit()
             await self.db.refresh(user)
+            await invalidate_principal(user_id)
             
             logger.info(f"Updated user {user_id}")
             return user
@@ -425,6 +436,7 @@ class UserService:
             
             await self.db.commit()
             await self.db.refresh(user)
+            await invalidate_principal(user_id)
             
             logger.info(f"Updated user {user_id} to type {user_type}")
             return user
@@ -434,6 +446,32 @@ class UserService:
             await self.db.rollback()
             raise
     
+    async def update_user_role(
+        self,
+        user_id: Union[str, UUID],
+        role: Union[str, UserRoleEnum]
+    ) -> Optional[User]:
+        """Update user role"""
+        try:
+            user = await self.get_user_by_id(user_id=user_id)
+            if not user:
+                raise NotFoundError(f"User {user_id} not found", resource_type="user", resource_id=str(user_id))
+            
+            user.set_role(role)
+            user.updated_at = datetime.now(timezone.utc)
+            
+            await self.db.commit()
+            await self.db.refresh(user)
+            await invalidate_principal(user_id)
+            
+            logger.info(f"Updated user {user_id} to role {user.role}")
+            return user
+            
+        except Exception as e:
+            logger.error(f"Error updating user role: {e}")
+            await self.db.rollback()
+            raise
+    
     async def complete_onboarding(
         self,
         user_id: Union[str, UUID],
@@ -496,7 +534,7 @@ class UserService:
             if not user:
                 raise NotFoundError(f"User {user_id} not found", resource_type="user", resource_id=str(user_id))
             
-            user.set_password(new_password)
+            user.set_password_hash(await get_password_hasher().hash(new_password))
             await self.db.commit()
             
             logger.info(f"Updated password for user {user_id}")
@@ -519,11 +557,12 @@ class UserService:
             if not user:
                 raise NotFoundError(f"User {user_id} not found", resource_type="user", resource_id=str(user_id))
             
-            if not user.verify_password(current_password):
+            hasher = get_password_hasher()
+            if not await hasher.verify(current_password, user.hashed_password):
                 logger.warning(f"Invalid current password for user {user_id}")
                 return False
             
-            user.set_password(new_password)
+            user.set_password_hash(await hasher.hash(new_password))
             await self.db.commit()
             
             logger.info(f"Password changed for user {user_id}")
@@ -548,6 +587,7 @@ class UserService:
             user.updated_at = datetime.now(timezone.utc)
             
             await self.db.commit()
+            await invalidate_principal(user_id)
             
             logger.info(f"Deactivated user {user_id}")
             return True
@@ -571,6 +611,7 @@ class UserService:
             user.updated_at = datetime.now(timezone.utc)
             
             await self.db.commit()
+            await invalidate_principal(user_id)
             
             logger.info(f"Activated user {user_id}")
             return True
@@ -650,22 +691,15 @@ class UserService:
         company_id: Optional[Union[str, UUID]] = None,
         limit: int = 50
     ) -> List[User]:
-        """Search users by email or name"""
+        """Search users by email or name, best matches first"""
         try:
-            search_query = select(User).options(selectinload(User.company))
-            
-            # Add search conditions
-            search_conditions = [
-                User.email.ilike(f"%{query}%"),
-                User.full_name.ilike(f"%{query}%")
-            ]
-            
-            search_query = search_query.where(or_(*search_conditions))
+            search = await text_search(self.db, query, User.email, User.full_name)
+            search_query = select(User).options(selectinload(User.company)).where(search.condition)
             
             if company_id:
                 search_query = search_query.where(User.company_id == str(company_id))
             
-            search_query = search_query.limit(limit)
+            search_query = search_query.order_by(search.rank.desc()).limit(limit)
             
             result = await self.db.execute(search_query)
             users = result.scalars().all()
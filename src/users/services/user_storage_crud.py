@@ -203,10 +203,14 @@ class UserStorageCRUD(BaseCRUD[UserStorageUsage]):
         
         logger.info(f"Marked file {file_id} as deleted for user {user_id}")
         
+        metadata = safe_json_loads(file_record.file_metadata) or {}
+        
         return {
             "file_id": str(file_id),
+            "file_path": file_record.file_path,
             "file_size": file_record.file_size,
             "original_filename": file_record.original_filename,
+            "derivative_keys": (metadata.get("derivatives") or {}).get("keys", []),
             "deleted_date": updated_file.deleted_date.isoformat()
         }
     
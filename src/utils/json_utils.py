@@ -4,14 +4,31 @@ JSON Utilities for handling datetime serialization
 🔧 CRITICAL FIX: Centralized solution for "datetime is not JSON serializable" errors
 """
 import json
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta
 from decimal import Decimal
 from enum import Enum
 from typing import Any, Dict
+from uuid import UUID
 import logging
 
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Non-string dict keys are stringified like json.dumps does; numpy arrays and
+# scalars from the analysis code are serialized natively
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if ORJSON_AVAILABLE else 0
+
+# Exact types that are already JSON values
+_JSON_PRIMITIVES = (str, int, float, bool, type(None))
+
 def json_serial(obj: Any) -> str:
     """
     JSON serializer for objects not serializable by default json code
@@ -69,6 +86,79 @@ def safe_json_loads(json_str: str) -> Any:
         logger.warning(f"⚠️ JSON deserialization failed: {str(e)}")
         return {}
 
+def _sqlalchemy_columns(obj: Any) -> Dict[str, Any]:
+    """Column values of a SQLAlchemy model instance, unconverted"""
+    return {column.name: getattr(obj, column.name) for column in obj.__table__.columns}
+
+def orjson_default(obj: Any) -> Any:
+    """
+    orjson ``default`` hook for the types orjson does not serialize itself
+
+    datetime, date, time, UUID, Enum and dataclasses are native to orjson.
+    This handles Decimal, timedelta, sets, pydantic models, SQLAlchemy model
+    instances and result rows. Returned containers are serialized by orjson,
+    so nested values come back here as needed.
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, timedelta):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "__table__"):
+        return _sqlalchemy_columns(obj)
+    if hasattr(obj, "_mapping"):
+        # sqlalchemy.engine.Row
+        return dict(obj._mapping)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    raise TypeError(f"Type {type(obj)} not serializable")
+
+def to_jsonable(obj: Any) -> Any:
+    """
+    Convert ``obj`` to plain JSON values (dict, list, str, int, float, bool, None)
+    in a single walk
+
+    Gives the same result as ``json.loads(safe_json_dumps(obj))`` without
+    producing the intermediate string: datetimes become ISO strings, UUIDs
+    strings, Decimals floats, Enums their value, tuples and sets lists, and
+    dict keys strings.
+    """
+    obj_type = type(obj)
+    if obj_type in _JSON_PRIMITIVES:
+        return obj
+    if obj_type is dict:
+        return {_jsonable_key(key): to_jsonable(value) for key, value in obj.items()}
+    if obj_type is list or obj_type is tuple:
+        return [to_jsonable(item) for item in obj]
+    if isinstance(obj, Enum):
+        return to_jsonable(obj.value)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, str):
+        return str.__str__(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    if isinstance(obj, dict):
+        return {_jsonable_key(key): to_jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_jsonable(item) for item in obj]
+    return to_jsonable(orjson_default(obj))
+
+def _jsonable_key(key: Any) -> str:
+    """dict key as json.dumps writes it"""
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
 def serialize_for_api(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Serialize data for API response, ensuring all datetime objects are strings
@@ -80,9 +170,7 @@ def serialize_for_api(data: Dict[str, Any]) -> Dict[str, Any]:
         Serialized dictionary safe for JSON
     """
     try:
-        # Convert the entire dict to JSON and back to handle nested datetime objects
-        json_str = safe_json_dumps(data)
-        return json.loads(json_str)
+        return to_jsonable(data)
     except Exception as e:
         logger.error(f"❌ API serialization failed: {str(e)}")
         return {"error": "Serialization failed"}
@@ -139,15 +227,7 @@ def jsonable_encoder_with_datetime(obj: Any) -> Any:
     This can be used as a drop-in replacement for FastAPI's jsonable_encoder
     when you need datetime support
     """
-    try:
-        from fastapi.encoders import jsonable_encoder
-        # Convert datetime objects first, then use FastAPI's encoder
-        json_str = safe_json_dumps(obj)
-        parsed_obj = json.loads(json_str)
-        return jsonable_encoder(parsed_obj)
-    except ImportError:
-        # Fallback if FastAPI not available
-        return serialize_for_api(obj)
+    return to_jsonable(obj)
 
 # 🔧 CRITICAL FIX: SQLAlchemy model serialization helper
 def serialize_sqlalchemy_model(model_instance: Any, exclude_fields: list = None) -> Dict[str, Any]:
@@ -231,4 +311,29 @@ def create_success_response(data: Any, message: str = "Success") -> Dict[str, An
     }
     
     # Ensure the entire response is JSON serializable
-    return serialize_for_api(response)
\ No newline at end of file
+    return serialize_for_api(response)
+
+# 🚀 Default response class for the application
+class CampaignForgeJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson in one pass
+
+    Encodes datetime, UUID, Decimal, Enum, pydantic models and SQLAlchemy
+    rows directly (see ``orjson_default``), so handlers need no
+    pre-serialization. Falls back to ``to_jsonable`` and ``json.dumps``
+    when orjson is not installed or cannot encode the content (e.g.
+    integers wider than 64 bits).
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(
+            to_jsonable(content),
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
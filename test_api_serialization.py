@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script for the orjson API response class and single-pass serialization.
+
+This script tests that:
+1. to_jsonable gives the same result as the old dumps/loads round-trip
+2. CampaignForgeJSONResponse encodes datetime, UUID, Decimal, Enum and
+   SQLAlchemy models and rows directly
+3. Rendering falls back to json when orjson cannot encode the content
+4. Endpoints return the same body with the new default response class
+"""
+
+import json
+import logging
+import sys
+import os
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, DateTime, Integer, Numeric, String, create_engine, select
+from sqlalchemy.orm import declarative_base
+
+from src.core.shared.responses import SuccessResponse
+from src.utils.json_utils import (
+    CampaignForgeJSONResponse,
+    jsonable_encoder_with_datetime,
+    safe_json_dumps,
+    serialize_for_api,
+    to_jsonable,
+)
+
+Base = declarative_base()
+
+
+class Status(str, Enum):
+    ACTIVE = "active"
+
+
+class Priority(Enum):
+    HIGH = 1
+
+
+class Product(Base):
+    __tablename__ = "products"
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    price = Column(Numeric(10, 2))
+    created_at = Column(DateTime)
+
+
+CREATED = datetime(2025, 7, 22, 20, 30, tzinfo=timezone.utc)
+PAYLOAD = {
+    "created_at": CREATED,
+    "day": date(2025, 7, 22),
+    "window": timedelta(hours=2),
+    "price": Decimal("49.95"),
+    "status": Status.ACTIVE,
+    "priority": Priority.HIGH,
+    "tags": ("a", "b"),
+    1: [{"nested": [CREATED, None, True, 1.5]}],
+    Status.ACTIVE: "enum key",
+}
+
+
+def test_walk_matches_round_trip():
+    expected = json.loads(safe_json_dumps(PAYLOAD))
+    assert to_jsonable(PAYLOAD) == expected
+    assert serialize_for_api(PAYLOAD) == expected
+    assert jsonable_encoder_with_datetime(PAYLOAD) == expected
+    # The old round-trip failed on UUIDs; the walk converts them
+    identifier = uuid.uuid4()
+    assert to_jsonable({"id": identifier}) == {"id": str(identifier)}
+
+
+def test_response_encodes_rich_types():
+    product = Product(id=1, name="AquaSculpt", price=Decimal("69.00"), created_at=CREATED)
+    identifier = uuid.uuid4()
+    body = json.loads(CampaignForgeJSONResponse({
+        "id": identifier, "price": Decimal("1.50"), "status": Status.ACTIVE, "product": product, "tags": {"x"},
+    }).body)
+    assert body == {
+        "id": str(identifier),
+        "price": 1.5,
+        "status": "active",
+        "product": {"id": 1, "name": "AquaSculpt", "price": 69.0, "created_at": "2025-07-22T20:30:00+00:00"},
+        "tags": ["x"],
+    }
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.connect() as connection:
+        connection.execute(Product.__table__.insert().values(id=2, name="LiverPure", price=Decimal("39.00")))
+        rows = connection.execute(select(Product.id, Product.name)).all()
+    assert json.loads(CampaignForgeJSONResponse(rows).body) == [{"id": 2, "name": "LiverPure"}]
+
+
+def test_render_falls_back_to_json():
+    # Wider than 64 bits: orjson refuses, json does not
+    assert json.loads(CampaignForgeJSONResponse({"big": 2 ** 70, "at": CREATED}).body) == {
+        "big": 2 ** 70, "at": "2025-07-22T20:30:00+00:00",
+    }
+
+
+def test_endpoint_body_unchanged():
+    data = [{"id": "1", "created_at": CREATED.isoformat(), "full_analysis_data": {"scores": [1.5, None]}}]
+    bodies = []
+    for response_class in (None, CampaignForgeJSONResponse):
+        app = FastAPI(**({"default_response_class": response_class} if response_class else {}))
+
+        @app.get("/campaigns/{campaign_id}", response_model=SuccessResponse[List[Dict[str, Any]]])
+        async def get_campaign_intelligence(campaign_id: str):
+            return SuccessResponse(data=data, message="ok")
+
+        response = TestClient(app).get("/campaigns/abc")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        body.pop("timestamp")
+        bodies.append(body)
+    assert bodies[0] == bodies[1]
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing API response serialization")
+    print("=" * 60)
+    print("🔁 Single walk vs dumps/loads round-trip:")
+    test_walk_matches_round_trip()
+    print("🧱 Rich types in CampaignForgeJSONResponse:")
+    test_response_encodes_rich_types()
+    print("🛟 json fallback:")
+    test_render_falls_back_to_json()
+    print("🌐 Endpoint bodies:")
+    test_endpoint_body_unchanged()
+    print("✅ All API serialization tests passed")
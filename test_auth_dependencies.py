@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test script for the authentication dependencies.
+
+This script tests that:
+1. Write endpoints (get_active_user_id) reject deactivated users, while
+   read-only endpoints (get_current_user_claims) accept the token alone
+2. A cached principal is re-checked once the user is invalidated, so a
+   deactivation applies to the user's next write
+"""
+
+import asyncio
+import logging
+import sys
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import jwt
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.auth.dependencies import get_active_user_id, get_current_user_claims
+from src.core.auth.principal_cache import get_principal_cache, invalidate_principal
+from src.core.config import settings
+from src.core.database import get_async_db
+from src.users.services.user_service import UserService
+
+
+class FakeUsers:
+    """Replaces the user lookup with an in-memory user and counts lookups"""
+
+    def __init__(self, user_id: str):
+        self.lookups = 0
+        self.user = SimpleNamespace(
+            id=user_id, email="writer@example.com", first_name="Test", last_name="Writer",
+            full_name="Test Writer", role="USER", user_type="CONTENT_CREATOR",
+            company_id=None, subscription_tier="FREE", is_active=True
+        )
+        self._original = UserService.get_user_by_id
+
+    def __enter__(self):
+        users = self
+
+        async def get_user_by_id(service, user_id, include_company=False):
+            users.lookups += 1
+            return users.user if str(user_id) == str(users.user.id) else None
+
+        UserService.get_user_by_id = get_user_by_id
+        return self
+
+    def __exit__(self, *exc):
+        UserService.get_user_by_id = self._original
+
+
+def access_token(user_id: str) -> str:
+    now = datetime.now(timezone.utc)
+    return jwt.encode(
+        {"sub": user_id, "email": "writer@example.com", "jti": uuid.uuid4().hex, "type": "access",
+         "role": "USER", "user_type": "CONTENT_CREATOR", "iat": now, "exp": now + timedelta(minutes=5)},
+        settings.JWT_SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM
+    )
+
+
+def build_client() -> TestClient:
+    app = FastAPI()
+
+    async def no_db():
+        yield None
+
+    app.dependency_overrides[get_async_db] = no_db
+
+    @app.post("/write")
+    async def write(user_id: str = Depends(get_active_user_id)):
+        return {"user_id": user_id}
+
+    @app.get("/read")
+    async def read(claims: dict = Depends(get_current_user_claims)):
+        return {"user_id": claims["id"]}
+
+    return TestClient(app)
+
+
+def test_inactive_user_rejected_on_writes():
+    get_principal_cache().clear()
+    user_id = str(uuid.uuid4())
+    client = build_client()
+
+    with FakeUsers(user_id) as users:
+        users.user.is_active = False
+        headers = {"Authorization": f"Bearer {access_token(user_id)}"}
+
+        assert client.post("/write", headers=headers).status_code == 401
+        # Reads authorize from the token alone
+        response = client.get("/read", headers=headers)
+        assert response.status_code == 200 and response.json()["user_id"] == user_id
+        assert client.post("/write").status_code == 401
+
+
+def test_deactivation_applies_after_invalidation():
+    get_principal_cache().clear()
+    user_id = str(uuid.uuid4())
+    client = build_client()
+
+    with FakeUsers(user_id) as users:
+        headers = {"Authorization": f"Bearer {access_token(user_id)}"}
+
+        assert client.post("/write", headers=headers).json()["user_id"] == user_id
+        assert client.post("/write", headers=headers).status_code == 200
+        assert users.lookups == 1, "cached principal was not reused"
+
+        # UserService invalidates the principal when a user is deactivated
+        users.user.is_active = False
+        asyncio.run(invalidate_principal(user_id))
+
+        assert client.post("/write", headers=headers).status_code == 401
+        assert users.lookups == 2
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing authentication dependencies")
+    print("=" * 60)
+    print("🚫 Inactive users on writes:")
+    test_inactive_user_rejected_on_writes()
+    print("♻️  Deactivation after invalidation:")
+    test_deactivation_applies_after_invalidation()
+    print("✅ All authentication dependency tests passed")
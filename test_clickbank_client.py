@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test script for the async ClickBank client.
+
+This script tests that:
+1. Concurrent requests to a slow ClickBank API run in parallel, not one after another
+2. The event loop keeps serving other work while requests are in flight
+3. Identical concurrent requests share one API call through the response cache,
+   and each caller gets its own copy of the response
+4. Rate-limited (429) responses are retried
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.platforms.clickbank.services.clickbank_client import ClickBankClient
+
+# Simulated ClickBank response time
+STUB_LATENCY = 0.5
+CONCURRENT_REQUESTS = 10
+
+
+class SlowClickBankStub:
+    """Local HTTP server answering every request after STUB_LATENCY seconds"""
+
+    def __init__(self, rate_limit_first: int = 0):
+        self.requests = 0
+        self.rate_limit_first = rate_limit_first
+        self.server = None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                self.requests += 1
+                await asyncio.sleep(STUB_LATENCY)
+                if self.requests <= self.rate_limit_first:
+                    status, body = b"429 Too Many Requests", b'{"error": "rate limited"}'
+                    extra = b"Retry-After: 0\r\n"
+                else:
+                    status, body = b"200 OK", b'{"transactions": []}'
+                    extra = b""
+                writer.write(
+                    b"HTTP/1.1 " + status + b"\r\nContent-Type: application/json\r\n" + extra
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+async def _concurrent_requests():
+    stub = SlowClickBankStub()
+    client = ClickBankClient(base_url=await stub.start())
+
+    # Count event loop ticks while the requests are in flight
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        client.fetch_sales(f"account{i}", "api-key", days=30)
+        for i in range(CONCURRENT_REQUESTS)
+    ))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await ticker_task
+
+    await client.close()
+    await stub.stop()
+
+    print(f"   {CONCURRENT_REQUESTS} requests in {elapsed:.2f}s (serialized would take {CONCURRENT_REQUESTS * STUB_LATENCY:.1f}s)")
+    print(f"   Event loop ticks while waiting: {ticks}")
+
+    assert len(results) == CONCURRENT_REQUESTS
+    assert stub.requests == CONCURRENT_REQUESTS
+    assert elapsed < STUB_LATENCY * 3, "requests were serialized behind the slow server"
+    assert ticks > 10, "event loop was blocked during the requests"
+
+
+async def _cached_requests():
+    stub = SlowClickBankStub()
+    client = ClickBankClient(base_url=await stub.start())
+
+    results = await asyncio.gather(*(
+        client.fetch_sales("same-account", "api-key", days=7, cache=True)
+        for _ in range(CONCURRENT_REQUESTS)
+    ))
+    # Callers modifying their response must not change what others are served
+    results[0]["transactions"].append({"transaction_id": "local"})
+    cached = await client.fetch_sales("same-account", "api-key", days=7, cache=True)
+
+    await client.close()
+    await stub.stop()
+
+    print(f"   {CONCURRENT_REQUESTS + 1} identical requests -> {stub.requests} API call(s)")
+    assert all(result == cached for result in results[1:])
+    assert cached == {"transactions": []}
+    assert stub.requests == 1
+
+
+async def _rate_limited_retry():
+    stub = SlowClickBankStub(rate_limit_first=1)
+    client = ClickBankClient(base_url=await stub.start(), backoff_base=0.01)
+
+    result = await client.fetch_sales("account", "api-key", days=1)
+
+    await client.close()
+    await stub.stop()
+
+    print(f"   429 then 200 -> {stub.requests} API calls, result {result}")
+    assert stub.requests == 2
+    assert result == {"transactions": []}
+
+
+def test_concurrent_requests_not_serialized():
+    asyncio.run(_concurrent_requests())
+
+
+def test_identical_requests_share_cache():
+    asyncio.run(_cached_requests())
+
+
+def test_rate_limited_requests_retried():
+    asyncio.run(_rate_limited_retry())
+
+
+if __name__ == "__main__":
+    print("🧪 Testing async ClickBank client")
+    print("=" * 60)
+    print("⏱️  Concurrent requests against a slow API:")
+    test_concurrent_requests_not_serialized()
+    print("📦 Response cache:")
+    test_identical_requests_share_cache()
+    print("🔁 Retry on rate limiting:")
+    test_rate_limited_requests_retried()
+    print("✅ All ClickBank client tests passed")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test script for the bulk ClickBank sales sync.
+
+This script tests that:
+1. A malformed transaction is skipped; the account's other rows are kept
+2. One account's failing or malformed feed does not stop the other accounts
+3. A flush failure ends the run with that error instead of hanging
+"""
+
+import asyncio
+import logging
+import sys
+import os
+from datetime import datetime, timezone
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.platforms.clickbank.services.sales_sync import ClickBankSalesSync
+
+FEEDS = {
+    "good": {"transactions": [
+        {"transaction_id": "T1", "amount": "10.00", "commission": "5.00", "transaction_date": "2026-10-01T10:00:00Z"},
+        {"transaction_id": "T2", "amount": "12.50", "commission": "6.25", "transaction_date": "2026-10-02T10:00:00Z"},
+    ]},
+    "partly_bad": {"transactions": [
+        {"amount": "10.00"},
+        None,
+        {"transaction_id": "T3", "amount": "7.00", "transaction_date": "2026-10-03T10:00:00Z"},
+    ]},
+    "broken": ["not", "a", "dict"],
+}
+
+
+class StubClient:
+    async def fetch_sales(self, nickname: str, api_key: str, days: int = 30):
+        if nickname == "down":
+            raise RuntimeError("ClickBank API error: 500")
+        return FEEDS[nickname]
+
+    async def close(self):
+        pass
+
+
+class RecordingSync(ClickBankSalesSync):
+    """Sync over fixed accounts, recording flushes instead of writing to a database"""
+
+    def __init__(self, nicknames, fail_flush: bool = False):
+        super().__init__(client=StubClient(), concurrency=2, flush_rows=1)
+        self.nicknames = nicknames
+        self.fail_flush = fail_flush
+        self.flushed = []
+
+    async def _load_accounts(self):
+        self.stats["accounts"] = len(self.nicknames)
+        return [
+            {"user_id": nickname, "nickname": nickname, "api_key": "key", "last_transaction_at": None, "failures": 0}
+            for nickname in self.nicknames
+        ]
+
+    async def _flush(self, results):
+        await asyncio.sleep(0.01)
+        if self.fail_flush:
+            raise RuntimeError("flush failed")
+        self.flushed.extend(results)
+
+
+async def _malformed_rows_skipped():
+    sync = RecordingSync([])
+    account = {"user_id": "u1", "nickname": "partly_bad", "api_key": "key", "last_transaction_at": None, "failures": 0}
+    result = await sync._fetch_account(account)
+
+    assert result.error is None
+    assert [row[1] for row in result.rows] == ["T3"]
+    assert result.high_water_mark == datetime(2026, 10, 3, 10, tzinfo=timezone.utc)
+    assert sync.stats["skipped_rows"] == 2
+
+
+async def _failures_isolated_per_account():
+    sync = RecordingSync(["good", "broken", "down", "partly_bad"])
+    stats = await asyncio.wait_for(sync.run(), 5)
+
+    results = {result.user_id: result for result in sync.flushed}
+    assert set(results) == {"good", "broken", "down", "partly_bad"}
+    assert len(results["good"].rows) == 2 and len(results["partly_bad"].rows) == 1
+    assert results["broken"].failures == 1 and results["down"].failures == 1
+    assert stats["failed"] == 2
+    assert stats["fetched_rows"] == 3
+
+
+async def _flush_failure_propagates():
+    sync = RecordingSync(["good", "partly_bad", "good", "partly_bad"], fail_flush=True)
+    try:
+        await asyncio.wait_for(sync.run(), 5)
+    except RuntimeError as e:
+        assert str(e) == "flush failed"
+    else:
+        raise AssertionError("flush failure was swallowed")
+
+
+def test_malformed_rows_skipped():
+    asyncio.run(_malformed_rows_skipped())
+
+
+def test_failures_isolated_per_account():
+    asyncio.run(_failures_isolated_per_account())
+
+
+def test_flush_failure_propagates():
+    asyncio.run(_flush_failure_propagates())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing ClickBank sales sync")
+    print("=" * 60)
+    print("🧹 Malformed rows:")
+    test_malformed_rows_skipped()
+    print("🧱 Per-account isolation:")
+    test_failures_isolated_per_account()
+    print("💥 Flush failure:")
+    test_flush_failure_propagates()
+    print("✅ All ClickBank sales sync tests passed")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test script for the research embedding service.
+
+This script tests that:
+1. Embedded texts are cached, so repeats never reach the provider
+2. Misses are sent in batches of at most the backend's batch size
+3. Concurrent requests for the same text share one provider call
+4. Texts the provider fails on come back as None and are not cached
+"""
+
+import asyncio
+import logging
+import sys
+import os
+from typing import List
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.shared.decorators import ResultCache
+from src.intelligence.utils.embedding_service import EmbeddingService, HashingEmbeddingBackend
+
+
+class RecordingBackend(HashingEmbeddingBackend):
+    """Hashing embeddings that record every call and can be made to fail or stall"""
+
+    def __init__(self, max_batch_size: int = 1024, fail: bool = False, delay: float = 0.0):
+        super().__init__(dimension=64)
+        self.max_batch_size = max_batch_size
+        self.fail = fail
+        self.delay = delay
+        self.calls: List[List[str]] = []
+
+    async def embed(self, texts: List[str], input_type: str) -> List[List[float]]:
+        self.calls.append(list(texts))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        return await super().embed(texts, input_type)
+
+
+def build_service(backend: RecordingBackend) -> EmbeddingService:
+    # A private cache per test; the shared one would leak entries between tests
+    cache = ResultCache("test_embeddings", ttl=3600, should_cache=lambda value: value is not None)
+    return EmbeddingService(backend, max_retries=0, cache=cache)
+
+
+async def _cache_hits():
+    backend = RecordingBackend()
+    service = build_service(backend)
+
+    first = await service.embed(["alpha beta", "gamma delta"])
+    second = await service.embed(["gamma delta", "alpha beta"])
+
+    assert len(backend.calls) == 1
+    assert second == [first[1], first[0]]
+    assert service.stats["cache_hits"] == 2
+    assert service.stats["cache_misses"] == 2
+
+    # Queries are cached separately from documents
+    await service.embed_query("alpha beta")
+    assert len(backend.calls) == 2
+
+
+async def _batching():
+    backend = RecordingBackend(max_batch_size=4)
+    service = build_service(backend)
+    texts = [f"research chunk number {i}" for i in range(10)]
+
+    vectors = await service.embed(texts + texts[:3])
+
+    assert [len(call) for call in sorted(backend.calls, key=len, reverse=True)] == [4, 4, 2]
+    assert sum(backend.calls, []) == texts
+    assert vectors[10:] == vectors[:3]
+    assert all(vector is not None for vector in vectors)
+
+
+async def _coalescing():
+    backend = RecordingBackend(delay=0.05)
+    service = build_service(backend)
+
+    first, second = await asyncio.gather(
+        service.embed(["shared text", "only first"]),
+        service.embed(["shared text", "only second"])
+    )
+
+    assert first[0] == second[0] is not None
+    assert sorted(sum(backend.calls, [])) == ["only first", "only second", "shared text"]
+    assert service.stats["coalesced"] == 1
+    assert not service._inflight
+
+
+async def _provider_failure():
+    backend = RecordingBackend(fail=True)
+    service = build_service(backend)
+
+    assert await service.embed(["will fail", "also fails"]) == [None, None]
+    assert service.stats["failed_texts"] == 2
+
+    # Failures are not cached; the next call tries the provider again
+    backend.fail = False
+    vectors = await service.embed(["will fail"])
+    assert vectors[0] is not None
+    assert len(backend.calls) == 2
+    assert not service._inflight
+
+
+def test_cache_hits():
+    asyncio.run(_cache_hits())
+
+
+def test_batching():
+    asyncio.run(_batching())
+
+
+def test_coalescing():
+    asyncio.run(_coalescing())
+
+
+def test_provider_failure():
+    asyncio.run(_provider_failure())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing embedding service")
+    print("=" * 60)
+    print("💾 Cache hits:")
+    test_cache_hits()
+    print("📦 Batching:")
+    test_batching()
+    print("🔗 Coalescing:")
+    test_coalescing()
+    print("❌ Provider failure:")
+    test_provider_failure()
+    print("✅ All embedding service tests passed")
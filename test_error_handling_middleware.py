@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for the ASGI error handling middleware.
+
+This script tests that:
+1. Application exceptions become JSON responses with their status and code
+2. Unexpected exceptions become a 500 without leaking the message
+3. HTTPExceptions keep FastAPI's own response
+4. Streaming responses pass through chunk by chunk, unbuffered
+"""
+
+import asyncio
+import logging
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.core.middleware.error_handling import ErrorHandlingMiddleware
+from src.core.shared.exceptions import NotFoundError
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ErrorHandlingMiddleware)
+
+    @app.get("/missing")
+    async def missing():
+        raise NotFoundError("Campaign not found", resource_type="campaign", resource_id="c1")
+
+    @app.get("/broken")
+    async def broken():
+        raise ValueError("database password is hunter2")
+
+    @app.get("/forbidden")
+    async def forbidden():
+        raise HTTPException(status_code=403, detail="Not yours")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n".encode()
+                await asyncio.sleep(0)
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+def test_application_errors():
+    client = TestClient(_build_app())
+    response = client.get("/missing")
+    body = response.json()
+    assert response.status_code == 404
+    assert body["success"] is False and body["error_code"] == "NOT_FOUND_ERROR"
+    assert body["details"] == {"resource_type": "campaign", "resource_id": "c1"}
+
+
+def test_unexpected_errors():
+    client = TestClient(_build_app(), raise_server_exceptions=False)
+    response = client.get("/broken")
+    assert response.status_code == 500
+    assert response.json()["error_code"] == "INTERNAL_SERVER_ERROR"
+    assert "hunter2" not in response.text
+
+
+def test_http_exceptions():
+    client = TestClient(_build_app())
+    response = client.get("/forbidden")
+    assert response.status_code == 403 and response.json() == {"detail": "Not yours"}
+
+
+async def _streaming_passthrough():
+    messages = []
+    requested = False
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "path": "/stream", "raw_path": b"/stream",
+        "root_path": "", "scheme": "http", "query_string": b"", "headers": [],
+        "client": ("127.0.0.1", 1234), "server": ("testserver", 80),
+    }
+
+    async def receive():
+        nonlocal requested
+        if requested:
+            # The client stays connected; the response listens for a disconnect until it is done
+            await asyncio.Event().wait()
+        requested = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await ErrorHandlingMiddleware(_build_app())(scope, receive, send)
+
+    bodies = [message["body"] for message in messages if message["type"] == "http.response.body" and message.get("body")]
+    assert messages[0]["status"] == 200
+    assert bodies == [b"chunk-0\n", b"chunk-1\n", b"chunk-2\n"], bodies
+
+
+def test_streaming_passthrough():
+    asyncio.run(_streaming_passthrough())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing error handling middleware")
+    print("=" * 60)
+    print("📦 Application errors:")
+    test_application_errors()
+    print("💥 Unexpected errors:")
+    test_unexpected_errors()
+    print("🚫 HTTP exceptions:")
+    test_http_exceptions()
+    print("🌊 Streaming passthrough:")
+    test_streaming_passthrough()
+    print("✅ All error handling middleware tests passed")
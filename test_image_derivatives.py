@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test script for lazily generated image derivatives.
+
+This script tests that:
+1. Concurrent first requests for a legacy image generate its derivatives
+   once and charge them to the owner's storage record once
+2. Derivatives that do not fit the owner's quota are deleted, not charged
+3. Originals that cannot have derivatives are never downloaded
+4. Derivatives already recorded by another worker are not charged again
+"""
+
+import asyncio
+import io
+import json
+import logging
+import sys
+import os
+from types import SimpleNamespace
+
+from PIL import Image
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.storage.universal_dual_storage import StorageProvider, UniversalDualStorageManager
+
+ORIGINAL_KEY = "uploads/user-1/general/photo.jpg"
+
+
+def jpeg_bytes(width: int = 1600, height: int = 900) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (40, 120, 200)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+class FakeDB:
+    async def commit(self):
+        pass
+
+
+class InMemoryStorage(UniversalDualStorageManager):
+    """Storage manager over an in-memory bucket and storage record"""
+
+    def __init__(self, quota_left: int = 10 ** 9, record_metadata: str = None):
+        super().__init__()
+        self.objects = {ORIGINAL_KEY: jpeg_bytes()}
+        self.downloads = []
+        self.generations = 0
+        self.charged = []
+        self.quota_left = quota_left
+        self.record = SimpleNamespace(user_id="user-1", file_path=ORIGINAL_KEY, file_size=1000, file_metadata=record_metadata)
+
+    def _initialize_providers(self):
+        return [StorageProvider(name="memory", client=None, priority=1, cost_per_gb=0.0)]
+
+    async def _download_from_provider(self, provider, filename):
+        self.downloads.append(filename)
+        await asyncio.sleep(0.01)
+        return self.objects.get(filename)
+
+    async def _upload_to_provider(self, provider, filename, content, content_type, metadata):
+        self.objects[filename] = content
+        return f"https://cdn.test/{filename}"
+
+    def _get_bucket_name(self, provider):
+        return "bucket"
+
+    def _get_public_url(self, provider, bucket_name, filename):
+        return f"https://cdn.test/{filename}"
+
+    async def _delete_from_provider(self, provider, filename):
+        return self.objects.pop(filename, None) is not None
+
+    async def create_image_derivatives(self, *args, **kwargs):
+        self.generations += 1
+        return await super().create_image_derivatives(*args, **kwargs)
+
+    async def get_storage_record(self, file_path, db):
+        return self.record if file_path == ORIGINAL_KEY else None
+
+    async def _get_user_with_storage_info(self, user_id, db):
+        return SimpleNamespace(id=user_id, has_storage_available=lambda size: size <= self.quota_left)
+
+    async def _update_user_storage_usage(self, user_id, bytes_delta, db):
+        self.charged.append(bytes_delta)
+
+
+async def _single_flight_and_charge():
+    storage = InMemoryStorage()
+    manifests = await asyncio.gather(*(
+        storage.get_image_derivatives(ORIGINAL_KEY, db=FakeDB()) for _ in range(5)
+    ))
+
+    assert storage.generations == 1, "concurrent requests generated derivatives more than once"
+    assert all(manifest == manifests[0] for manifest in manifests) and manifests[0]["variants"]
+    assert len(storage.charged) == 1 and storage.charged[0] > 0
+    assert storage.record.file_size == 1000 + storage.charged[0]
+    tracked = json.loads(storage.record.file_metadata)["derivatives"]
+    assert tracked["bytes"] == storage.charged[0]
+    assert all(key in storage.objects for key in tracked["keys"])
+    assert not storage._derivative_jobs
+
+    # Later requests are served from the manifest without generating
+    await storage.get_image_derivatives(ORIGINAL_KEY, db=FakeDB())
+    assert storage.generations == 1
+
+
+async def _over_quota_removed():
+    storage = InMemoryStorage(quota_left=10)
+    assert await storage.get_image_derivatives(ORIGINAL_KEY, db=FakeDB()) is None
+    assert storage.charged == []
+    assert set(storage.objects) == {ORIGINAL_KEY}
+    assert storage.record.file_metadata is None
+
+
+async def _unsupported_not_downloaded():
+    storage = InMemoryStorage()
+    for key in ("uploads/user-1/general/logo.svg", "uploads/user-1/general/report.pdf"):
+        assert await storage.get_image_derivatives(key, db=FakeDB()) is None
+        assert key not in storage.downloads
+    assert storage.generations == 0
+
+
+async def _already_charged_elsewhere():
+    recorded = json.dumps({"derivatives": {"keys": [], "bytes": 123}})
+    storage = InMemoryStorage(record_metadata=recorded)
+    assert await storage.get_image_derivatives(ORIGINAL_KEY, db=FakeDB())
+    assert storage.charged == []
+    assert storage.record.file_size == 1000
+
+
+def test_single_flight_and_charge():
+    asyncio.run(_single_flight_and_charge())
+
+
+def test_over_quota_removed():
+    asyncio.run(_over_quota_removed())
+
+
+def test_unsupported_not_downloaded():
+    asyncio.run(_unsupported_not_downloaded())
+
+
+def test_already_charged_elsewhere():
+    asyncio.run(_already_charged_elsewhere())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing lazy image derivatives")
+    print("=" * 60)
+    print("🔗 Single flight and charge:")
+    test_single_flight_and_charge()
+    print("📦 Over quota:")
+    test_over_quota_removed()
+    print("🚫 Unsupported originals:")
+    test_unsupported_not_downloaded()
+    print("♻️  Charged by another worker:")
+    test_already_charged_elsewhere()
+    print("✅ All image derivative tests passed")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script for the image processing executor.
+
+This script tests that:
+1. Image jobs run off the event loop, which keeps ticking meanwhile
+2. Jobs past max_workers + max_queue_size are rejected instead of queueing
+3. A timed-out job keeps its slot until it really finishes, so timeouts
+   cannot push more work into the pool than its capacity
+4. optimize_image_for_storage_async returns the same bytes as the blocking call
+"""
+
+import asyncio
+import io
+import logging
+import sys
+import os
+import threading
+import time
+
+from PIL import Image
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.storage.utils.image_executor import (
+    ImageProcessingExecutor,
+    ImageProcessingQueueFull,
+    ImageProcessingTimeout,
+)
+from src.storage.utils.media_processors import optimize_image_for_storage, optimize_image_for_storage_async
+
+
+def blocking_job(seconds: float) -> int:
+    time.sleep(seconds)
+    return threading.get_ident()
+
+
+def gated_job(gate: threading.Event) -> bool:
+    return gate.wait(5)
+
+
+async def _off_loop():
+    executor = ImageProcessingExecutor(max_workers=2, max_queue_size=2, use_processes=False)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.ensure_future(tick())
+    threads = await asyncio.gather(*(executor.run(blocking_job, 0.2) for _ in range(2)))
+    ticker.cancel()
+
+    assert ticks > 10, "event loop was blocked by image work"
+    assert threading.get_ident() not in threads
+    assert executor.get_metrics()["completed"] == 2
+    executor.shutdown()
+
+
+async def _capacity():
+    executor = ImageProcessingExecutor(max_workers=1, max_queue_size=1, use_processes=False)
+    gate = threading.Event()
+    admitted = [asyncio.ensure_future(executor.run(gated_job, gate)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+
+    try:
+        await executor.run(gated_job, gate)
+    except ImageProcessingQueueFull as e:
+        assert e.status_code == 503
+    else:
+        raise AssertionError("job past capacity was queued")
+
+    gate.set()
+    assert await asyncio.gather(*admitted) == [True, True]
+    assert executor.get_metrics()["rejected"] == 1
+    assert executor.get_metrics()["in_flight"] == 0
+    executor.shutdown()
+
+
+async def _timeout_keeps_slot():
+    executor = ImageProcessingExecutor(max_workers=1, max_queue_size=0, use_processes=False)
+    gate = threading.Event()
+
+    try:
+        await executor.run(gated_job, gate, timeout=0.05)
+    except ImageProcessingTimeout:
+        pass
+    else:
+        raise AssertionError("slow job did not time out")
+
+    # The timed-out job is still running in the pool and still holds the slot
+    try:
+        await executor.run(gated_job, gate)
+    except ImageProcessingQueueFull:
+        pass
+    else:
+        raise AssertionError("slot was released before the job finished")
+
+    gate.set()
+    await asyncio.sleep(0.05)
+    assert executor.get_metrics()["in_flight"] == 0
+    assert await executor.run(gated_job, gate)
+    executor.shutdown()
+
+
+async def _optimize_for_storage():
+    buffer = io.BytesIO()
+    Image.new("RGB", (3000, 1500), (10, 200, 90)).save(buffer, format="PNG")
+    image_data = buffer.getvalue()
+
+    optimized = await optimize_image_for_storage_async(image_data)
+    assert optimized == optimize_image_for_storage(image_data)
+    assert max(Image.open(io.BytesIO(optimized)).size) == 2048
+
+
+def test_off_loop():
+    asyncio.run(_off_loop())
+
+
+def test_capacity():
+    asyncio.run(_capacity())
+
+
+def test_timeout_keeps_slot():
+    asyncio.run(_timeout_keeps_slot())
+
+
+def test_optimize_for_storage():
+    asyncio.run(_optimize_for_storage())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing image processing executor")
+    print("=" * 60)
+    print("🧵 Off the event loop:")
+    test_off_loop()
+    print("🚦 Capacity:")
+    test_capacity()
+    print("⏱️  Timeouts keep their slot:")
+    test_timeout_keeps_slot()
+    print("🖼️  Storage optimization:")
+    test_optimize_for_storage()
+    print("✅ All image executor tests passed")
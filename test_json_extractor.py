@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Fuzz tests for the single-pass JSON extractor behind validate_and_parse_json.
+
+This script tests that:
+1. Typical AI responses (fences, prose, trailing commas, missing commas,
+   truncation) are recovered
+2. Any JSON value wrapped in random prose and fences, with random trailing
+   commas, extracts back to the same value
+3. Truncated JSON never raises and yields a container or None; a bare
+   trailing { or [ is a failure, not an empty container
+4. Random bracket/quote soup never raises and stays fast
+"""
+
+import json
+import logging
+import random
+import string
+import sys
+import os
+import time
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.intelligence.utils.json_extractor import ORJSON_AVAILABLE, extract_json, loads, salvage_key_values
+from src.intelligence.utils.ai_throttle import validate_and_parse_json
+
+FUZZ_CASES = 3000
+PROSE_WORDS = ["Here", "is", "the", "analysis", "(see", "[note]", "below)", "use", "{product}", "placeholders,",
+               "OK", "Sure!", "JSON:", "\n", "done.", "it's", "\"quoted\"", "—", "émoji 🎯"]
+SOUP = list('{}[],:"\\ ab1\n') + ['true', 'null', '"x"']
+
+RESPONSE_CASES = [
+    ('{"products": ["AquaSculpt"]}', {"products": ["AquaSculpt"]}),
+    ('Sure! Here is the JSON:\n```json\n{"a": [1, 2,], "b": {"c": "}{",},}\n```\nHope it helps', {"a": [1, 2], "b": {"c": "}{"}}),
+    ('```\n[{"a": 1}\n{"b": 2}]\n```', [{"a": 1}, {"b": 2}]),
+    ('Use {product} in copy. Result: {"angle": "urgency"}', {"angle": "urgency"}),
+    ('{"insights": ["one", "two", "thr', {"insights": ["one", "two", "thr"]}),
+    ('{"a": 1, "b": {"c": 2, "d"', {"a": 1, "b": {"c": 2}}),
+    ('{ ] then {"ok": true}', {"ok": True}),
+    ('"products": ["A"], "pricing": ["$1"]', ["A"]),
+    ('{"score": NaN}', {"score": float("nan")}),
+    ('{"a": 1, "b": [', {"a": 1}),
+    ('[1, 2, [', [1, 2]),
+    ('Here is the JSON: {', None),
+    ('```json\n[\n', None),
+    ('No JSON at all here.', None),
+    ('   ', None),
+]
+
+
+def random_value(rng: random.Random, depth: int = 0):
+    kind = rng.randint(0, 7 if depth < 4 else 3)
+    if kind == 0:
+        return rng.randint(-10**6, 10**6)
+    if kind == 1:
+        return "".join(rng.choice(string.printable + '{}[]",\\é🎯') for _ in range(rng.randint(0, 12)))
+    if kind == 2:
+        return rng.choice([True, False, None, 1.5, -0.25])
+    if kind == 3:
+        return rng.random()
+    if kind in (4, 5):
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"k{i}{rng.choice(['', '{', ']', ' '])}": random_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+
+def add_trailing_commas(text: str, rng: random.Random) -> str:
+    """Insert a comma before random closers that follow an element (outside strings)"""
+    out, in_string, escaped = [], False, False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "}]" and out and out[-1] not in "{[" and rng.random() < 0.5:
+            out.append("," + " " * rng.randint(0, 2))
+        out.append(char)
+    return "".join(out)
+
+
+def prose(rng: random.Random) -> str:
+    return " ".join(rng.choice(PROSE_WORDS) for _ in range(rng.randint(0, 8)))
+
+
+def _same(a, b) -> bool:
+    return json.dumps(a, sort_keys=True) == json.dumps(b, sort_keys=True)
+
+
+def test_response_cases():
+    for text, expected in RESPONSE_CASES:
+        result = validate_and_parse_json(text, "test")
+        assert (result is None and expected is None) or _same(result, expected), f"{text!r}: {result!r}"
+    assert salvage_key_values('"products": ["A"] and "angle": "fear"') == {"products": ["A"], "angle": "fear"}
+    # A lone opener is a failure, not an empty result
+    assert extract_json("Sure! {") is None and extract_json("[") is None
+    print(f"   {len(RESPONSE_CASES)} response cases recovered (orjson: {ORJSON_AVAILABLE})")
+
+
+def test_wrapped_values_round_trip():
+    rng = random.Random(0)
+    for _ in range(FUZZ_CASES):
+        value = random_value(rng)
+        if not isinstance(value, (list, dict)):
+            value = [value]
+        body = json.dumps(value, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 2]))
+        body = add_trailing_commas(body, rng)
+        fence = rng.choice(["", "```json\n", "```\n"])
+        text = f"{prose(rng)} {fence}{body}{fence and chr(10) + '```'} {prose(rng)}"
+        result = extract_json(text)
+        assert _same(result, value), f"{text!r}: {result!r}"
+    print(f"   {FUZZ_CASES} wrapped values extracted intact")
+
+
+def test_truncated_values():
+    rng = random.Random(1)
+    recovered = 0
+    for _ in range(FUZZ_CASES):
+        value = {"items": [random_value(rng) for _ in range(rng.randint(1, 5))], "meta": random_value(rng)}
+        body = json.dumps(value)
+        result = extract_json(body[:rng.randint(1, len(body))])
+        assert result is None or isinstance(result, (dict, list))
+        recovered += result is not None
+    print(f"   {recovered}/{FUZZ_CASES} truncated values recovered, none raised")
+
+
+def test_bracket_soup():
+    rng = random.Random(2)
+    slowest = 0.0
+    for _ in range(FUZZ_CASES):
+        text = "".join(rng.choice(SOUP) for _ in range(rng.randint(0, 400)))
+        started = time.perf_counter()
+        result = validate_and_parse_json(text, "fuzz")
+        slowest = max(slowest, time.perf_counter() - started)
+        if result is not None:
+            # Whatever comes back must be real JSON data
+            loads(json.dumps(result))
+    print(f"   {FUZZ_CASES} soups parsed without raising (slowest {slowest * 1000:.2f} ms)")
+    assert slowest < 0.05
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing single-pass JSON extraction")
+    print("=" * 60)
+    print("🤖 AI response cases:")
+    test_response_cases()
+    print("🎁 Wrapped values:")
+    test_wrapped_values_round_trip()
+    print("✂️  Truncated values:")
+    test_truncated_values()
+    print("🥣 Bracket soup:")
+    test_bracket_soup()
+    print("✅ All JSON extraction tests passed")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test script for the metrics registry and the /metrics endpoint.
+
+This script tests that:
+1. Labelled counters, gauges and histograms render as Prometheus text
+2. Request metrics are labelled by route template, not raw path
+3. Reading system metrics never blocks on a CPU measurement
+4. A /metrics scrape takes microseconds, not seconds
+5. /metrics is only served to token holders or internal-network clients
+"""
+
+import sys
+import os
+import time
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from src.core.health.prometheus import CONTENT_TYPE, MetricsRegistry
+from src.core.health.metrics import (
+    HTTP_REQUESTS,
+    MetricsCollector,
+    SystemMetricsSampler,
+    metrics_access_allowed,
+    metrics_collector,
+)
+from src.core.middleware.metrics import MetricsMiddleware
+
+SCRAPES = 200
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests", ("route", "status"))
+    in_flight = registry.gauge("in_flight", "In-flight requests")
+    latency = registry.histogram("latency_seconds", "Latency", ("provider",), buckets=(0.1, 1.0))
+
+    requests.inc(route="/a", status=200)
+    requests.inc(2, route="/a", status=200)
+    requests.inc(route='/b"quoted"', status=500)
+    in_flight.set(3)
+    latency.observe(0.05, provider="groq")
+    latency.observe(0.5, provider="groq")
+    latency.observe(5, provider="groq")
+
+    text = registry.render()
+    print(text)
+
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="/a",status="200"} 3' in text
+    assert 'requests_total{route="/b\\"quoted\\"",status="500"} 1' in text
+    assert "in_flight 3" in text
+    assert 'latency_seconds_bucket{provider="groq",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{provider="groq",le="1"} 2' in text
+    assert 'latency_seconds_bucket{provider="groq",le="+Inf"} 3' in text
+    assert 'latency_seconds_count{provider="groq"} 3' in text
+    assert requests.total() == 4
+
+    # Re-declaring returns the same metric; a conflicting declaration fails
+    assert registry.counter("requests_total", "Requests", ("route", "status")) is requests
+    try:
+        registry.gauge("requests_total", "Requests", ("route", "status"))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("conflicting metric type was accepted")
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": item_id}
+
+    @app.get("/metrics")
+    async def prometheus_metrics():
+        return Response(metrics_collector.render_prometheus(), media_type=CONTENT_TYPE)
+
+    return app
+
+
+def test_requests_labelled_by_route_template():
+    client = TestClient(_build_app())
+    before = HTTP_REQUESTS.value(route="/items/{item_id}", method="GET", status=200)
+
+    for item_id in range(5):
+        assert client.get(f"/items/{item_id}").status_code == 200
+    assert client.get("/missing").status_code == 404
+
+    assert HTTP_REQUESTS.value(route="/items/{item_id}", method="GET", status=200) == before + 5
+    assert HTTP_REQUESTS.value(route="unmatched", method="GET", status=404) >= 1
+    text = client.get("/metrics").text
+    assert 'route="/items/3"' not in text
+    assert 'http_request_duration_seconds_count{route="/items/{item_id}",method="GET"}' in text
+
+
+def test_system_metrics_do_not_block():
+    collector = MetricsCollector(sampler=SystemMetricsSampler(interval=0.05))
+    collector.start_sampler()
+    try:
+        time.sleep(0.2)
+        started = time.perf_counter()
+        metrics = collector.get_system_metrics()
+        elapsed = time.perf_counter() - started
+    finally:
+        collector.stop_sampler()
+
+    print(f"   get_system_metrics: {elapsed * 1000:.3f} ms, sample age {metrics['sample_age_seconds']}s")
+    assert "cpu" in metrics and "memory" in metrics
+    assert metrics["sample_age_seconds"] < 1
+    assert elapsed < 0.05, "system metrics read blocked on a measurement"
+
+
+def test_scrape_is_fast():
+    metrics_collector.sampler.sample()
+    metrics_collector.render_prometheus()
+
+    started = time.perf_counter()
+    for _ in range(SCRAPES):
+        text = metrics_collector.render_prometheus()
+    per_scrape = (time.perf_counter() - started) / SCRAPES
+
+    print(f"   {len(text.splitlines())} lines rendered in {per_scrape * 1e6:.0f} µs per scrape")
+    assert "system_cpu_percent" in text
+    assert per_scrape < 0.01
+
+
+def test_metrics_access_restricted():
+    # No token: direct internal clients only
+    assert metrics_access_allowed("127.0.0.1", None, None, token="")
+    assert metrics_access_allowed("10.0.3.7", None, None, token="")
+    assert not metrics_access_allowed("8.8.8.8", None, None, token="")
+    assert not metrics_access_allowed("10.0.3.7", None, "8.8.8.8", token="")
+    assert not metrics_access_allowed(None, None, None, token="")
+    assert not metrics_access_allowed("testclient", None, None, token="")
+
+    # With a token the address no longer matters, only the bearer token
+    assert metrics_access_allowed("8.8.8.8", "Bearer s3cret", "8.8.8.8", token="s3cret")
+    assert not metrics_access_allowed("127.0.0.1", None, None, token="s3cret")
+    assert not metrics_access_allowed("127.0.0.1", "Bearer wrong", None, token="s3cret")
+
+
+if __name__ == "__main__":
+    print("🧪 Testing metrics registry and /metrics endpoint")
+    print("=" * 60)
+    print("📝 Prometheus text format:")
+    test_registry_renders_prometheus_text()
+    print("🛣️  Route template labels:")
+    test_requests_labelled_by_route_template()
+    print("⏱️  Background system sampler:")
+    test_system_metrics_do_not_block()
+    print("📈 Scrape cost:")
+    test_scrape_is_fast()
+    print("🔒 Scrape access:")
+    test_metrics_access_restricted()
+    print("✅ All metrics tests passed")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test script for the password hasher.
+
+This script tests that:
+1. Hashes verify against the right password only; missing and malformed
+   hashes fail verification instead of raising
+2. Hashes made with another cost are upgraded after a successful login
+3. bcrypt runs off the event loop, which keeps ticking meanwhile
+4. Operations past max_pending are rejected with a 503
+"""
+
+import asyncio
+import logging
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.auth.password_hasher import PasswordHasher
+from src.core.shared.exceptions import ServiceUnavailableError
+
+
+async def _hash_and_verify():
+    hasher = PasswordHasher(rounds=4)
+    hashed = await hasher.hash("correct horse")
+
+    assert hashed.startswith("$2b$04$")
+    assert await hasher.verify("correct horse", hashed)
+    assert not await hasher.verify("wrong horse", hashed)
+    assert not await hasher.verify("correct horse", None)
+    assert not await hasher.verify("correct horse", "not-a-bcrypt-hash")
+    assert hasher.get_stats()["hashes"] == 1
+    hasher.shutdown()
+
+
+async def _rehash_outdated_cost():
+    old = PasswordHasher(rounds=4)
+    hashed = await old.hash("correct horse")
+
+    hasher = PasswordHasher(rounds=5)
+    assert hasher.needs_rehash(hashed) and not old.needs_rehash(hashed)
+    upgraded = await hasher.rehash_if_needed("correct horse", hashed)
+    assert upgraded.startswith("$2b$05$") and await hasher.verify("correct horse", upgraded)
+    assert await hasher.rehash_if_needed("correct horse", upgraded) is None
+    old.shutdown()
+    hasher.shutdown()
+
+
+async def _off_loop():
+    hasher = PasswordHasher(rounds=10, max_workers=2)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    ticker = asyncio.ensure_future(tick())
+    hashes = await asyncio.gather(*(hasher.hash(f"password-{i}") for i in range(4)))
+    ticker.cancel()
+
+    assert len(set(hashes)) == 4
+    assert ticks > 5, "event loop was blocked by bcrypt"
+    hasher.shutdown()
+
+
+async def _rejects_past_capacity():
+    hasher = PasswordHasher(rounds=10, max_workers=1, max_pending=1)
+    first = asyncio.ensure_future(hasher.hash("first"))
+    await asyncio.sleep(0)
+
+    try:
+        await hasher.hash("second")
+    except ServiceUnavailableError:
+        pass
+    else:
+        raise AssertionError("hash past capacity was queued")
+
+    assert await first
+    stats = hasher.get_stats()
+    assert stats["rejected"] == 1 and stats["pending"] == 0
+    hasher.shutdown()
+
+
+def test_hash_and_verify():
+    asyncio.run(_hash_and_verify())
+
+
+def test_rehash_outdated_cost():
+    asyncio.run(_rehash_outdated_cost())
+
+
+def test_off_loop():
+    asyncio.run(_off_loop())
+
+
+def test_rejects_past_capacity():
+    asyncio.run(_rejects_past_capacity())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing password hasher")
+    print("=" * 60)
+    print("🔐 Hash and verify:")
+    test_hash_and_verify()
+    print("⬆️  Cost upgrades:")
+    test_rehash_outdated_cost()
+    print("🧵 Off the event loop:")
+    test_off_loop()
+    print("🚦 Capacity:")
+    test_rejects_past_capacity()
+    print("✅ All password hasher tests passed")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script for offloaded PDF report rendering.
+
+This script tests that:
+1. Reports are rendered off the event loop, which keeps ticking meanwhile
+2. A finished report is served from the cache without rendering again, and
+   concurrent requests for the same report render it once
+3. Requests past the pending render cap get a 503 instead of queueing
+"""
+
+import asyncio
+import logging
+import sys
+import os
+import threading
+import time
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.shared.exceptions import ServiceUnavailableError
+from src.intelligence.services.pdf_report_service import PDFReportService
+
+SECTIONS = ["executive_summary", "product_analysis", "marketing_strategy"]
+
+
+def intelligence(name: str) -> dict:
+    return {
+        "campaign_name": name,
+        "executive_summary": f"{name} converts best with problem-aware audiences.",
+        "confidence_score": 0.82,
+        "features": ["Fast results", "Money-back guarantee"],
+        "marketing_angles": ["Before and after", "Expert endorsement"],
+    }
+
+
+class GatedRenders:
+    """Counts renders and holds each one until released"""
+
+    def __init__(self):
+        self.count = 0
+        self.threads = set()
+        self.release = threading.Event()
+        self._original = PDFReportService.render_report
+
+    def __enter__(self):
+        gate = self
+
+        def render_report(service, *args):
+            gate.count += 1
+            gate.threads.add(threading.get_ident())
+            gate.release.wait(5)
+            return gate._original(service, *args)
+
+        PDFReportService.render_report = render_report
+        return self
+
+    def __exit__(self, *exc):
+        self.release.set()
+        PDFReportService.render_report = self._original
+
+
+async def _offloaded_render_and_cache():
+    service = PDFReportService(render_workers=2, max_pending=4, executor="thread")
+    with GatedRenders() as renders:
+        ticks = 0
+        requests = asyncio.gather(*(
+            service.generate_intelligence_report("campaign-1", intelligence("Alpha"), SECTIONS)
+            for _ in range(3)
+        ))
+        # The renders are blocked in worker threads; the loop must keep running
+        started = time.perf_counter()
+        while time.perf_counter() - started < 0.2:
+            ticks += 1
+            await asyncio.sleep(0.01)
+        renders.release.set()
+        reports = await requests
+
+        assert ticks > 10, "event loop was blocked while rendering"
+        assert threading.get_ident() not in renders.threads
+        assert renders.count == 1, "identical concurrent requests rendered more than once"
+        assert reports[0].startswith(b"%PDF") and reports[0] == reports[1] == reports[2]
+
+        cached = await service.generate_intelligence_report("campaign-1", intelligence("Alpha"), SECTIONS)
+        assert cached == reports[0]
+        assert renders.count == 1
+        assert service._get_cache().stats["hits"] == 1
+
+        # Changed intelligence is a different report
+        await service.generate_intelligence_report("campaign-1", intelligence("Beta"), SECTIONS)
+        assert renders.count == 2
+    service.close()
+
+
+async def _pending_cap():
+    service = PDFReportService(render_workers=1, max_pending=1, executor="thread")
+    with GatedRenders() as renders:
+        first = asyncio.ensure_future(
+            service.generate_intelligence_report("campaign-1", intelligence("Alpha"), SECTIONS)
+        )
+        await asyncio.sleep(0.05)
+
+        try:
+            await service.generate_intelligence_report("campaign-2", intelligence("Gamma"), SECTIONS)
+        except ServiceUnavailableError as e:
+            assert e.status_code == 503
+        else:
+            raise AssertionError("request past the pending cap was queued")
+
+        renders.release.set()
+        assert (await first).startswith(b"%PDF")
+        assert renders.count == 1
+
+        # Capacity is back once the render finished
+        assert (await service.generate_intelligence_report("campaign-2", intelligence("Gamma"), SECTIONS)).startswith(b"%PDF")
+    service.close()
+
+
+def test_offloaded_render_and_cache():
+    asyncio.run(_offloaded_render_and_cache())
+
+
+def test_pending_cap_returns_503():
+    asyncio.run(_pending_cap())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing PDF report rendering")
+    print("=" * 60)
+    print("🧵 Offloaded render and cache:")
+    test_offloaded_render_and_cache()
+    print("🚦 Pending cap:")
+    test_pending_cap_returns_503()
+    print("✅ All PDF report tests passed")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Golden tests for the compiled placeholder substitution.
+
+This script tests that:
+1. substitute_product_placeholders returns exactly what the original
+   placeholder-by-placeholder implementation returned (golden cases)
+2. The single-pass engine agrees with the sequential reference on random
+   text, for single-pass and fallback product names alike
+3. substitute_placeholders_in_data rewrites nested intelligence data
+"""
+
+import logging
+import random
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.intelligence.utils.product_name_fix import (
+    _substitute_sequential,
+    get_placeholder_substitution,
+    substitute_placeholders_in_data,
+    substitute_product_placeholders,
+)
+
+# (content, product_name, company_name, result of the original implementation)
+GOLDEN_CASES = [
+    ('Discover how PRODUCT helps you lose weight naturally.', 'AquaSculpt', None,
+     'Discover how AquaSculpt helps you lose weight naturally.'),
+    ('[Product Name] by [Company Name] is the #1 choice.', 'AquaSculpt', 'Aqua Labs',
+     '[AquaSculpt Name] by [Aqua Labs Name] is the #1 choice.'),
+    ('Order your product today and see why the product works.', 'LiverPure', None,
+     'Order LiverPure  LiverPure today and see why the LiverPure works.'),
+    ('Your Company guarantees this product for 60 days.', 'MetaboFlex', 'Flex Labs',
+     'MetaboFlex  Flex Labs guarantees this MetaboFlex for 60 days.'),
+    ('Trusted by your company and YOUR family.', 'AquaSculpt', 'Aqua Labs',
+     'Trusted by Aqua Labs and AquaSculpt  family.'),
+    ("Products and PRODUCTS from COMPANY's company.", 'AquaSculpt', 'Aqua Labs',
+     "AquaSculpts and AquaSculptS from Aqua Labs's company."),
+    ('yourself, yours, your.', 'AquaSculpt', None,
+     'yourself, yours, AquaSculpt .'),
+    ('The product [PRODUCT_NAME] from [COMPANY_NAME]', 'Slimmy', 'Slim Co',
+     'The Slimmy [Slimmy_NAME] from [Slim Co_NAME]'),
+    ('Your Best Life starts with your product', 'Your Best Life', None,
+     'Your Best Life  Best Life  Best Life starts with Your Best Life  Best Life  Your Best Life  Best Life  Best Life'),
+    ('Nothing to replace here.', 'AquaSculpt', None,
+     'Nothing to replace here.'),
+    ('Your product', 'Island', None,
+     'Your product'),
+]
+
+# Names on the single-pass path and names that fall back to the sequential one
+FUZZ_NAMES = [
+    ("AquaSculpt", None), ("LiverPure", "LiverPure Inc"), ("Metabo Flex", "Flex Labs"),
+    ("Slimmy", None), ("Be You", None), ("Your Best Life", None), ("Productivity Pro", "ProCo"),
+    ("MetaboFlex+", None), ("Revita", "Company X"), ("Purely", "Yo"),
+]
+
+FUZZ_TOKENS = [
+    "PRODUCT", "Product", "product", "[PRODUCT]", "[Product Name]", "[PRODUCT_NAME]", "Your Product",
+    "your product", "the product", "This product", "COMPANY", "Company", "company", "[Company Name]",
+    "Your Company", "Your company", "your company", "Your", "your", "YOUR", "yours", "yourself",
+    "Products", " ", ".", ",", "\n", "r", "ur", "y", "Yo", "ct", "pany", "é", "_", "1",
+]
+
+
+def test_golden_results():
+    for content, product_name, company_name, expected in GOLDEN_CASES:
+        result = substitute_product_placeholders(content, product_name, company_name)
+        assert result == expected, f"{content!r} with {product_name!r}: {result!r} != {expected!r}"
+    print(f"   {len(GOLDEN_CASES)} golden cases match")
+
+
+def test_single_pass_matches_sequential():
+    rng = random.Random(0)
+    checked = 0
+    for product_name, company_name in FUZZ_NAMES:
+        substitution = get_placeholder_substitution(product_name, company_name)
+        for _ in range(2000):
+            content = "".join(rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(0, 12)))
+            expected = _substitute_sequential(content, product_name, company_name)
+            assert substitution.apply(content) == expected, f"{product_name!r}: {content!r}"
+            checked += 1
+    single_pass = sum(get_placeholder_substitution(*names).single_pass for names in FUZZ_NAMES)
+    print(f"   {checked} random strings agree ({single_pass}/{len(FUZZ_NAMES)} names single-pass)")
+
+
+def test_nested_data():
+    data = {
+        "offer_intelligence": {"products": ["PRODUCT"], "value_propositions": ["Your product works"]},
+        "scores": [1, 2.5, None],
+        "notes": "Made by COMPANY",
+    }
+    result = substitute_placeholders_in_data(data, "AquaSculpt", "Aqua Labs")
+    assert result == {
+        "offer_intelligence": {"products": ["AquaSculpt"], "value_propositions": ["AquaSculpt  AquaSculpt works"]},
+        "scores": [1, 2.5, None],
+        "notes": "Made by Aqua Labs",
+    }
+    assert data["notes"] == "Made by COMPANY", "input data was modified"
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing compiled placeholder substitution")
+    print("=" * 60)
+    print("🥇 Golden results:")
+    test_golden_results()
+    print("🎲 Single pass vs sequential reference:")
+    test_single_pass_matches_sequential()
+    print("🗂️  Nested intelligence data:")
+    test_nested_data()
+    print("✅ All placeholder substitution tests passed")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test script for the GCRA rate limiter.
+
+This script tests that:
+1. A client gets its quota as a burst and is then limited, with Retry-After
+2. Only issued API keys get their own bucket; rotating random X-API-Key
+   values still counts against the caller's IP
+3. Tier-scaled route groups multiply the quota, fixed groups do not
+4. Health checks and /metrics are never limited
+"""
+
+import asyncio
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.core.middleware.rate_limiting import (
+    InMemoryRateLimitBackend,
+    RateLimit,
+    RateLimiter,
+    RateLimitMiddleware,
+    RouteGroup,
+    resolve_client,
+)
+
+ISSUED_KEY = "issued-key-123"
+
+
+def _build_app(calls: int = 5) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, calls=calls, period=60, backend=InMemoryRateLimitBackend())
+
+    @app.get("/items")
+    async def items():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+
+def test_burst_then_limited():
+    client = TestClient(_build_app(calls=5))
+    statuses = [client.get("/items").status_code for _ in range(6)]
+
+    assert statuses == [200] * 5 + [429]
+    limited = client.get("/items")
+    assert int(limited.headers["Retry-After"]) >= 1
+    assert limited.headers["X-RateLimit-Remaining"] == "0"
+
+    # Exempt paths are served regardless
+    assert all(client.get("/health").status_code == 200 for _ in range(10))
+
+
+def test_unknown_api_keys_use_ip_identity():
+    digests = RateLimiter(api_keys=[ISSUED_KEY], backend=InMemoryRateLimitBackend()).api_key_digests
+
+    identity, _ = resolve_client({"x-api-key": ISSUED_KEY}, "10.0.0.1", digests)
+    assert identity.startswith("apikey:")
+    identity, _ = resolve_client({"x-api-key": "made-up"}, "10.0.0.1", digests)
+    assert identity == "ip:10.0.0.1"
+    # With no keys issued every header value falls back to the IP
+    identity, _ = resolve_client({"x-api-key": ISSUED_KEY}, "10.0.0.1", frozenset())
+    assert identity == "ip:10.0.0.1"
+
+
+def test_rotating_api_keys_hit_ip_limit():
+    client = TestClient(_build_app(calls=5))
+    statuses = [
+        client.get("/items", headers={"X-API-Key": f"random-{i}"}).status_code
+        for i in range(8)
+    ]
+    assert statuses == [200] * 5 + [429] * 3
+
+
+async def _issued_key_has_own_bucket():
+    limiter = RateLimiter(calls=2, period=60, backend=InMemoryRateLimitBackend(), api_keys=[ISSUED_KEY])
+    for _ in range(2):
+        result, _ = await limiter.check("/items", {}, "10.0.0.1")
+        assert result.allowed
+    result, _ = await limiter.check("/items", {}, "10.0.0.1")
+    assert not result.allowed
+
+    # The issued key is limited separately from the exhausted IP
+    result, identity = await limiter.check("/items", {"x-api-key": ISSUED_KEY}, "10.0.0.1")
+    assert result.allowed and identity.startswith("apikey:")
+
+
+def test_issued_key_has_own_bucket():
+    asyncio.run(_issued_key_has_own_bucket())
+
+
+def test_tier_quotas():
+    limiter = RateLimiter(
+        backend=InMemoryRateLimitBackend(),
+        route_groups=[
+            RouteGroup("default", ("/",), RateLimit(100, 60)),
+            RouteGroup("auth", ("/api/auth",), RateLimit(10, 60), tier_scaled=False),
+        ]
+    )
+    default, auth = limiter.route_group("/api/items"), limiter.route_group("/api/auth/login")
+    assert (default.name, auth.name) == ("default", "auth")
+    assert limiter.quota(default, "FREE").calls == 100
+    assert limiter.quota(default, "PRO").calls == 1000
+    assert limiter.quota(default, "UNKNOWN").calls == 100
+    assert limiter.quota(auth, "ENTERPRISE").calls == 10
+
+
+if __name__ == "__main__":
+    print("🧪 Testing rate limiter")
+    print("=" * 60)
+    print("🚦 Burst then limited:")
+    test_burst_then_limited()
+    print("🔑 API key identity:")
+    test_unknown_api_keys_use_ip_identity()
+    test_rotating_api_keys_hit_ip_limit()
+    test_issued_key_has_own_bucket()
+    print("🏷️  Tier quotas:")
+    test_tier_quotas()
+    print("✅ All rate limiter tests passed")
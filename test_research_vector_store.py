@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared research vector store.
+
+This script tests that:
+1. Workers writing the same mmap snapshot merge their documents instead of
+   overwriting each other's
+2. Database sync picks up rows committed out of sequence order, without
+   re-indexing documents that did not change
+3. Searches limited to some documents never return other documents' chunks
+"""
+
+import asyncio
+import logging
+import sys
+import os
+import tempfile
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.intelligence.utils.research_vector_store import ResearchVectorStore
+
+DIM = 16
+
+
+def vectors(count: int, seed: int):
+    return np.random.default_rng(seed).normal(size=(count, DIM)).astype(np.float32).tolist()
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeChunkTable:
+    """The two research_chunk_embeddings queries a postgres sync runs"""
+
+    def __init__(self):
+        self.rows = []
+        self.fetched_docs = []
+
+    def insert(self, seq: int, doc_id: str, embeddings):
+        for i, embedding in enumerate(embeddings):
+            self.rows.append(SimpleNamespace(
+                seq=seq + i, doc_id=doc_id, chunk_index=i, content=f"{doc_id} chunk {i}",
+                embedding=embedding, metadata={}, content_type="research"
+            ))
+
+    async def execute(self, statement, params):
+        sql = str(statement)
+        if "GROUP BY doc_id" in sql:
+            latest = {}
+            for row in self.rows:
+                if row.seq > params["since"]:
+                    latest[row.doc_id] = max(latest.get(row.doc_id, 0), row.seq)
+            return FakeResult([SimpleNamespace(doc_id=doc_id, max_seq=seq) for doc_id, seq in latest.items()])
+        self.fetched_docs.extend(params["doc_ids"])
+        rows = [row for row in self.rows if row.doc_id in params["doc_ids"]]
+        return FakeResult(sorted(rows, key=lambda row: (row.doc_id, row.chunk_index)))
+
+
+async def _concurrent_snapshot_writers():
+    with tempfile.TemporaryDirectory() as directory:
+        first = ResearchVectorStore(backend="mmap", index_dir=directory)
+        second = ResearchVectorStore(backend="mmap", index_dir=directory)
+
+        await first.add_document("a", ["a0", "a1"], vectors(2, seed=1))
+        # second has not seen "a" yet; its write must not drop it
+        await second.add_document("b", ["b0"], vectors(1, seed=2))
+        await first.add_document("c", ["c0"], vectors(1, seed=3))
+
+        reader = ResearchVectorStore(backend="mmap", index_dir=directory)
+        assert set(reader.documents) == {"a", "b", "c"}
+        assert len(reader.index) == 4
+        assert not first._pending and not second._pending
+
+        probe = vectors(1, seed=2)[0]
+        assert (await reader.search(probe, top_k=1))[0]['doc_id'] == "b"
+
+
+async def _out_of_order_commits():
+    table = FakeChunkTable()
+    store = ResearchVectorStore(backend="postgres")
+
+    table.insert(1, "early", vectors(2, seed=4))
+    table.insert(10, "late", vectors(2, seed=5))
+    await store.sync(table, force=True)
+    assert set(store.documents) == {"early", "late"}
+    assert store._last_seq == 11
+
+    # A transaction that took seq 5 commits after seq 11 was synced
+    table.insert(5, "slow", vectors(1, seed=6))
+    table.fetched_docs.clear()
+    await store.sync(table, force=True)
+
+    assert "slow" in store.documents and "slow" in store.index
+    # Unchanged documents in the overlap window are not re-read
+    assert table.fetched_docs == ["slow"]
+
+
+async def _scoped_search():
+    store = ResearchVectorStore(backend="memory")
+    await store.add_document("user1_doc", ["mine"], vectors(1, seed=7))
+    await store.add_document("user2_doc", ["theirs"], vectors(1, seed=8))
+    probe = vectors(1, seed=8)[0]
+
+    assert (await store.search(probe, top_k=1))[0]['doc_id'] == "user2_doc"
+    scoped = await store.search(probe, top_k=5, doc_ids=["user1_doc"])
+    assert [result['doc_id'] for result in scoped] == ["user1_doc"]
+    assert await store.search(probe, top_k=5, doc_ids=[]) == []
+
+
+def test_concurrent_snapshot_writers():
+    asyncio.run(_concurrent_snapshot_writers())
+
+
+def test_out_of_order_commits():
+    asyncio.run(_out_of_order_commits())
+
+
+def test_scoped_search():
+    asyncio.run(_scoped_search())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing research vector store")
+    print("=" * 60)
+    print("💾 Concurrent snapshot writers:")
+    test_concurrent_snapshot_writers()
+    print("🔀 Out-of-order commits:")
+    test_out_of_order_commits()
+    print("🔒 Scoped search:")
+    test_scoped_search()
+    print("✅ All research vector store tests passed")
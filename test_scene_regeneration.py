@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script for single scene regeneration.
+
+This script tests that:
+1. A successful regeneration replaces only the modified scene's visuals and
+   rebuilds the narration from the updated script
+2. A failed regeneration leaves the job's scenes, assets and request as
+   they were, so the scene can be regenerated again
+"""
+
+import asyncio
+import logging
+import sys
+import os
+from collections import OrderedDict
+from types import SimpleNamespace
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.content.services.video_generation_orchestrator import (
+    VideoGenerationOrchestrator,
+    VideoGenerationRequest,
+    VideoScene,
+    VideoType,
+    VisualStyle,
+    VoiceType,
+)
+
+
+class StubOrchestrator(VideoGenerationOrchestrator):
+    """Orchestrator whose generation steps are instant and can be made to fail"""
+
+    def __init__(self, fail_assembly: bool = False):
+        self.generation_jobs = OrderedDict()
+        self.max_tracked_jobs = 10
+        self.video_assembler = SimpleNamespace(scene_cache=None)
+        self.fail_assembly = fail_assembly
+        self.renders = 0
+
+    async def _create_visual_prompts(self, script_text, visual_style, intelligence_data):
+        return [f"{visual_style.value}: {script_text}"]
+
+    async def _generate_scene_visuals(self, scenes, request):
+        self.renders += 1
+        return [{"scene_id": scene.scene_id, "file_path": f"{scene.scene_id}_v{self.renders}.png"} for scene in scenes]
+
+    async def _generate_voiceover(self, request):
+        return {"file_path": f"voice_{len(request.script_content)}.mp3", "script": request.script_content}
+
+    async def _assemble_video(self, scenes, visual_assets, audio_assets, request):
+        if self.fail_assembly:
+            raise RuntimeError("ffmpeg failed")
+        return "video.mp4"
+
+    async def _add_branding_and_effects(self, video_file, request):
+        return f"branded_{video_file}"
+
+
+def build_job(orchestrator: StubOrchestrator) -> dict:
+    scenes = [
+        VideoScene("s1", "First line.", 5.0, "intro", ["intro prompt"]),
+        VideoScene("s2", "Second line.", 5.0, "benefit", ["benefit prompt"]),
+    ]
+    request = VideoGenerationRequest(
+        campaign_id="c1", user_id="u1", script_content="First line. Second line.",
+        video_type=VideoType.YOUTUBE_SHORT, visual_style=VisualStyle.REALISTIC,
+        voice_type=VoiceType.MALE_PROFESSIONAL, intelligence_data={}
+    )
+    job = {
+        "request": request,
+        "scenes": scenes,
+        "visual_assets": [{"scene_id": "s1", "file_path": "s1_v0.png"}, {"scene_id": "s2", "file_path": "s2_v0.png"}],
+        "audio_assets": {"file_path": "voice_0.mp3"},
+        "video_file": "original.mp4"
+    }
+    orchestrator._remember_job("job-1", job)
+    return job
+
+
+async def _successful_regeneration():
+    orchestrator = StubOrchestrator()
+    job = build_job(orchestrator)
+
+    result = await orchestrator.regenerate_scene("job-1", "s2", {"script_text": "A better second line."})
+
+    assert result["success"], result
+    assert [scene.script_text for scene in job["scenes"]] == ["First line.", "A better second line."]
+    assert job["request"].script_content == "First line. A better second line."
+    assert {asset["file_path"] for asset in job["visual_assets"]} == {"s1_v0.png", "s2_v1.png"}
+    assert job["audio_assets"]["script"] == job["request"].script_content
+    assert job["video_file"] == "video.mp4"
+
+
+async def _failed_regeneration_rolls_back():
+    orchestrator = StubOrchestrator(fail_assembly=True)
+    job = build_job(orchestrator)
+    before = {
+        "scenes": [(scene.script_text, list(scene.visual_prompts)) for scene in job["scenes"]],
+        "visual_assets": list(job["visual_assets"]),
+        "audio_assets": job["audio_assets"],
+        "request": job["request"],
+        "video_file": job["video_file"]
+    }
+
+    result = await orchestrator.regenerate_scene(
+        "job-1", "s2", {"script_text": "Broken line.", "logo_url": "https://cdn.test/logo.png"}
+    )
+
+    assert not result["success"] and "ffmpeg failed" in result["error"]
+    assert [(scene.script_text, scene.visual_prompts) for scene in job["scenes"]] == before["scenes"]
+    assert job["visual_assets"] == before["visual_assets"]
+    assert job["audio_assets"] is before["audio_assets"]
+    assert job["request"] is before["request"] and job["request"].logo_url is None
+    assert job["video_file"] == before["video_file"]
+
+
+def test_successful_regeneration():
+    asyncio.run(_successful_regeneration())
+
+
+def test_failed_regeneration_rolls_back():
+    asyncio.run(_failed_regeneration_rolls_back())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing scene regeneration")
+    print("=" * 60)
+    print("🎬 Successful regeneration:")
+    test_successful_regeneration()
+    print("↩️  Failed regeneration:")
+    test_failed_regeneration_rolls_back()
+    print("✅ All scene regeneration tests passed")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test script for streamed uploads to dual storage.
+
+This script tests that:
+1. Bytes are sent with put_object, file paths with upload_file and file
+   objects with upload_fileobj, using the multipart transfer config
+2. save_file_dual_storage hands a file on disk to both providers by path
+   and names it by its content hash
+3. File objects are rewound before each provider, so the backup gets the
+   full content too
+4. Files over the content type's size limit are refused before uploading
+"""
+
+import asyncio
+import hashlib
+import io
+import logging
+import sys
+import os
+import tempfile
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.storage.universal_dual_storage import (
+    MULTIPART_TRANSFER_CONFIG,
+    StorageProvider,
+    UniversalDualStorageManager,
+)
+
+VIDEO = os.urandom(3 * 1024 * 1024)
+
+
+class RecordingClient:
+    """The three boto3 upload calls, recording what each provider received"""
+
+    def __init__(self):
+        self.calls = []
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, **extra_args):
+        self.calls.append(("put_object", Key))
+        self.objects[Key] = Body
+
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs=None, Config=None):
+        assert Config is MULTIPART_TRANSFER_CONFIG
+        self.calls.append(("upload_file", Key))
+        with open(Filename, "rb") as f:
+            self.objects[Key] = f.read()
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, Config=None):
+        assert Config is MULTIPART_TRANSFER_CONFIG
+        self.calls.append(("upload_fileobj", Key))
+        self.objects[Key] = Fileobj.read()
+
+
+class RecordingStorage(UniversalDualStorageManager):
+    """Storage manager over two recording clients"""
+
+    def _initialize_providers(self):
+        return [
+            StorageProvider(name="primary", client=RecordingClient(), priority=1, cost_per_gb=0.015),
+            StorageProvider(name="backup", client=RecordingClient(), priority=2, cost_per_gb=0.005),
+        ]
+
+    def _get_bucket_name(self, provider):
+        return "bucket"
+
+    def _get_public_url(self, provider, bucket_name, filename):
+        return f"https://{provider.name}.test/{filename}"
+
+
+async def _upload_sources():
+    storage = RecordingStorage()
+    provider = storage.providers[0]
+    with tempfile.NamedTemporaryFile(suffix=".mp4") as f:
+        f.write(VIDEO)
+        f.flush()
+        await storage._put_object(provider, "bucket", "a.bin", b"small", {})
+        await storage._put_object(provider, "bucket", "b.mp4", f.name, {})
+        await storage._put_object(provider, "bucket", "c.mp4", io.BytesIO(VIDEO), {})
+
+    assert [call for call, _ in provider.client.calls] == ["put_object", "upload_file", "upload_fileobj"]
+    assert provider.client.objects["b.mp4"] == VIDEO == provider.client.objects["c.mp4"]
+
+
+async def _save_path_to_both_providers():
+    storage = RecordingStorage()
+    with tempfile.NamedTemporaryFile(suffix=".mp4") as f:
+        f.write(VIDEO)
+        f.flush()
+        result = await storage.save_file_dual_storage(f.name, "video", "slideshow.mp4", "user-1", "campaign-1")
+
+    key = result["filename"]
+    assert key.startswith("videos/user-1/campaign-1/") and key.endswith(f"_{hashlib.md5(VIDEO).hexdigest()[:8]}.mp4")
+    assert result["storage_status"] == "fully_redundant" and result["file_size"] == len(VIDEO)
+    for provider in storage.providers:
+        assert provider.client.calls == [("upload_file", key)]
+        assert provider.client.objects[key] == VIDEO
+
+
+async def _file_object_rewound_per_provider():
+    storage = RecordingStorage()
+    result = await storage.save_file_dual_storage(io.BytesIO(VIDEO), "video", "slideshow.mp4", "user-1")
+    for provider in storage.providers:
+        assert provider.client.objects[result["filename"]] == VIDEO
+
+
+async def _size_limit():
+    storage = RecordingStorage()
+    # 12 MB is over the 10 MB image limit
+    try:
+        await storage.save_file_dual_storage(io.BytesIO(VIDEO * 4), "image", "huge.png", "user-1")
+    except ValueError as e:
+        assert "too large" in str(e)
+    else:
+        raise AssertionError("oversized image was accepted")
+    assert all(not provider.client.calls for provider in storage.providers)
+
+
+def test_upload_sources():
+    asyncio.run(_upload_sources())
+
+
+def test_save_path_to_both_providers():
+    asyncio.run(_save_path_to_both_providers())
+
+
+def test_file_object_rewound_per_provider():
+    asyncio.run(_file_object_rewound_per_provider())
+
+
+def test_size_limit():
+    asyncio.run(_size_limit())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing streamed uploads")
+    print("=" * 60)
+    print("📤 Upload sources:")
+    test_upload_sources()
+    print("🗄️  Both providers:")
+    test_save_path_to_both_providers()
+    print("⏪ Rewound file objects:")
+    test_file_object_rewound_per_provider()
+    print("📏 Size limits:")
+    test_size_limit()
+    print("✅ All streamed upload tests passed")
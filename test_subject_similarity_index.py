@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test script for the subject template near-duplicate index.
+
+This script tests that:
+1. Small edits of an indexed template (case, punctuation, one word changed,
+   added or dropped) are found, with their exact word-shingle Jaccard
+2. Unrelated subjects are not flagged
+3. Signatures are deterministic, so stored signatures stay valid across
+   workers and restarts
+4. Templates added after the last sort are found before and after the
+   buckets are rebuilt, and removed templates are never returned
+"""
+
+import logging
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.intelligence.utils.subject_similarity_index import SubjectSimilarityIndex, jaccard, shingles
+
+TEMPLATES = [
+    "Why {product} users changed their morning routine in 7 days",
+    "The truth about {product} nobody tells busy moms",
+    "Last chance: 50% off {product} ends tonight",
+    "Your {product} order is on its way",
+    "3 reasons doctors recommend {product} for better sleep",
+]
+
+
+def build_index(**kwargs) -> SubjectSimilarityIndex:
+    index = SubjectSimilarityIndex(**kwargs)
+    for template_id, template in enumerate(TEMPLATES):
+        index.add(template_id, template)
+    return index
+
+
+def test_near_duplicates_found():
+    index = build_index()
+    variants = {
+        "WHY {PRODUCT} USERS CHANGED THEIR MORNING ROUTINE IN 7 DAYS!!": "0",
+        "Why {product} users changed their evening routine in 7 days": "0",
+        "The truth about {product} that nobody tells busy moms": "1",
+        "Last chance: 50% off {product} ends": "2",
+        "Your {product} order is on the way": "3",
+    }
+    for variant, template_id in variants.items():
+        match = index.find_similar(variant)
+        assert match is not None, variant
+        assert match[0] == template_id
+        expected = jaccard(shingles(variant), shingles(TEMPLATES[int(template_id)]))
+        assert abs(match[1] - expected) < 1e-9
+    assert index.find_similar(TEMPLATES[4]) == ("4", 1.0)
+
+
+def test_distinct_subjects_not_flagged():
+    index = build_index()
+    for subject in [
+        "Meet the team behind {product}",
+        "Is your metabolism slowing down after 40?",
+        "Free shipping on every order this weekend",
+        "",
+    ]:
+        assert not index.is_near_duplicate(subject), subject
+
+
+def test_signatures_are_deterministic():
+    text = TEMPLATES[0]
+    first, second = SubjectSimilarityIndex(), SubjectSimilarityIndex()
+    assert first.signature_bytes(text) == second.signature_bytes(text)
+    assert len(first.signature_bytes(text)) == first.num_perm * 4
+    assert first.signature_bytes(text.upper()) == first.signature_bytes(text)
+    # Stored signatures round-trip; ones made with other settings are ignored
+    assert (first._decode(first.signature_bytes(text)) == first.signature(text)).all()
+    assert SubjectSimilarityIndex(num_perm=64, bands=16)._decode(first.signature_bytes(text)) is None
+
+    try:
+        SubjectSimilarityIndex(num_perm=100, bands=32)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for an uneven band split")
+
+
+def test_pending_rows_and_removal():
+    index = build_index()
+    # Fewer rows than MIN_PENDING_BEFORE_REBUILD: all still scanned linearly
+    assert index.get_stats()["pending_rows"] == len(TEMPLATES)
+    assert index.find_similar(TEMPLATES[1])[0] == "1"
+    index._rebuild()
+    assert index.get_stats()["pending_rows"] == 0
+    assert index.find_similar(TEMPLATES[1])[0] == "1"
+
+    index.remove(1)
+    assert index.find_similar(TEMPLATES[1]) is None
+    assert len(index) == len(TEMPLATES) - 1
+
+    # Re-adding an id replaces its earlier text
+    index.add(3, "Big news: {product} now ships worldwide")
+    assert index.find_similar(TEMPLATES[3]) is None
+    assert index.find_similar("Big news: {product} now ships worldwide!")[0] == "3"
+    assert len(index) == len(TEMPLATES) - 1
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing subject similarity index")
+    print("=" * 60)
+    print("🔁 Near-duplicates:")
+    test_near_duplicates_found()
+    print("🆕 Distinct subjects:")
+    test_distinct_subjects_not_flagged()
+    print("🔏 Signatures:")
+    test_signatures_are_deterministic()
+    print("🗂️  Pending rows and removal:")
+    test_pending_rows_and_removal()
+    print("✅ All subject similarity index tests passed")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the trigram search query builder.
+
+This script tests that:
+1. On SQLite, text_search falls back to case-insensitive substring matching,
+   with prefix matches ranked first and LIKE wildcards in the term escaped
+2. With pg_trgm, the condition adds word-similarity matches and the rank is
+   word_similarity across the searched columns
+3. Terms too short to have a trigram use substring matching only
+"""
+
+import asyncio
+import logging
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.core.database.search import build_text_search, text_search
+
+metadata = MetaData()
+campaigns = Table(
+    "campaigns", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("description", String),
+)
+ROWS = [
+    (1, "Summer AquaSculpt launch", None),
+    (2, "AquaSculpt evergreen", "Retargeting"),
+    (3, "LiverPure webinar", "Follow-up for aquasculpt buyers"),
+    (4, "100% off_sale", "Clearance"),
+    (5, "GlucoTrust", "Night shift workers"),
+]
+
+
+async def search_ids(term: str):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+        await connection.execute(campaigns.insert(), [dict(zip(("id", "name", "description"), row)) for row in ROWS])
+    try:
+        async with AsyncSession(engine) as session:
+            search = await text_search(session, term, campaigns.c.name, campaigns.c.description)
+            query = select(campaigns.c.id).where(search.condition).order_by(search.rank.desc(), campaigns.c.id)
+            return list((await session.execute(query)).scalars())
+    finally:
+        await engine.dispose()
+
+
+def test_sqlite_fallback():
+    # Case-insensitive, any column, prefix matches first
+    assert asyncio.run(search_ids("aquasculpt")) == [2, 1, 3]
+    assert asyncio.run(search_ids("  SHIFT ")) == [5]
+    # Wildcards in the term are literal characters
+    assert asyncio.run(search_ids("%")) == [4]
+    assert asyncio.run(search_ids("_")) == [4]
+    assert asyncio.run(search_ids("nothing here")) == []
+
+
+def test_trigram_query():
+    search = build_text_search("glucotrst", campaigns.c.name, campaigns.c.description, trigram=True)
+    sql = str(select(campaigns.c.id).where(search.condition).order_by(search.rank.desc()).compile(dialect=postgresql.dialect()))
+    assert "campaigns.name ILIKE" in sql and "campaigns.description ILIKE" in sql
+    assert sql.count("<%%") == 2
+    assert "greatest(coalesce(word_similarity(" in sql
+
+    single = build_text_search("glucotrst", campaigns.c.name, trigram=True)
+    assert "greatest" not in str(single.rank.compile(dialect=postgresql.dialect()))
+
+
+def test_short_terms_skip_trigram():
+    search = build_text_search("ab", campaigns.c.name, trigram=True)
+    sql = str(search.condition.compile(dialect=postgresql.dialect()))
+    assert "ILIKE" in sql and "<%" not in sql
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing trigram search query builder")
+    print("=" * 60)
+    print("🪶 SQLite substring fallback:")
+    test_sqlite_fallback()
+    print("🔤 pg_trgm similarity query:")
+    test_trigram_query()
+    print("✂️  Short terms:")
+    test_short_terms_skip_trigram()
+    print("✅ All text search tests passed")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for the TTS audio cache.
+
+This script tests that:
+1. Scripts differing only in whitespace share a key; voices do not
+2. A hit is checked out to the caller's path with its duration, and that
+   copy survives the entry being evicted
+3. Entries stored by one instance are served to another from the remote
+   tier, which also fills the second instance's local tier
+4. Corrupt remote entries are treated as misses
+"""
+
+import asyncio
+import logging
+import sys
+import os
+import tempfile
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.content.services.tts_audio_cache import R2_PREFIX, TTSAudioCache
+
+AUDIO = b"ID3" + b"\x00" * 4096
+
+
+class FakeR2:
+    """The two dual storage methods the cache uses, over a dict"""
+
+    def __init__(self):
+        self.objects = {}
+
+    async def store_object(self, key, data, content_type):
+        self.objects[key] = data
+        return f"https://cdn.test/{key}"
+
+    async def fetch_object(self, key):
+        return self.objects.get(key)
+
+
+class RemoteCache(TTSAudioCache):
+    def __init__(self, cache_dir: str, r2: FakeR2, max_size_mb: float = 10):
+        super().__init__(cache_dir=cache_dir, max_size_mb=max_size_mb, use_remote=True)
+        self.r2 = r2
+
+    def _get_storage(self):
+        return self.r2
+
+
+def test_keys():
+    key = TTSAudioCache.make_key("elevenlabs", "voice-1", {"stability": 0.5}, "Hello   world.\n")
+    assert key == TTSAudioCache.make_key("elevenlabs", "voice-1", {"stability": 0.5}, " Hello world.")
+    assert key != TTSAudioCache.make_key("elevenlabs", "voice-2", {"stability": 0.5}, "Hello world.")
+    assert key != TTSAudioCache.make_key("elevenlabs", "voice-1", {"stability": 0.7}, "Hello world.")
+
+
+async def _checkout_survives_eviction():
+    with tempfile.TemporaryDirectory() as root:
+        # Room for one entry only
+        cache = TTSAudioCache(cache_dir=os.path.join(root, "cache"), max_size_mb=1.5 * len(AUDIO) / 1024 / 1024, use_remote=False)
+        destination = os.path.join(root, "voiceover.mp3")
+
+        assert await cache.get("first", destination) is None
+        await cache.put("first", AUDIO, 3.25)
+        hit = await cache.get("first", destination)
+        assert hit.local_path == destination and hit.duration_seconds == 3.25
+
+        await cache.put("second", AUDIO, 1.0)
+        assert await cache.get("first", os.path.join(root, "other.mp3")) is None, "entry was not evicted"
+        with open(destination, "rb") as f:
+            assert f.read() == AUDIO, "eviction removed a checked-out file"
+
+        stats = cache.get_stats()
+        assert (stats["local_hits"], stats["misses"], stats["evictions"]) == (1, 2, 1)
+
+
+async def _remote_tier_shared():
+    r2 = FakeR2()
+    with tempfile.TemporaryDirectory() as root:
+        first = RemoteCache(os.path.join(root, "a"), r2)
+        await first.put("key", AUDIO, 2.5, {"provider": "elevenlabs"})
+        assert set(r2.objects) == {f"{R2_PREFIX}/key.mp3", f"{R2_PREFIX}/key.json"}
+
+        second = RemoteCache(os.path.join(root, "b"), r2)
+        hit = await second.get("key", os.path.join(root, "remote.mp3"))
+        assert hit.duration_seconds == 2.5 and hit.metadata["provider"] == "elevenlabs"
+        with open(hit.local_path, "rb") as f:
+            assert f.read() == AUDIO
+
+        # The remote hit filled the local tier
+        r2.objects.clear()
+        assert await second.get("key", os.path.join(root, "local.mp3"))
+        assert (second.get_stats()["remote_hits"], second.get_stats()["local_hits"]) == (1, 1)
+
+
+async def _corrupt_remote_entry():
+    r2 = FakeR2()
+    r2.objects[f"{R2_PREFIX}/key.json"] = b"{not json"
+    r2.objects[f"{R2_PREFIX}/key.mp3"] = AUDIO
+    with tempfile.TemporaryDirectory() as root:
+        cache = RemoteCache(os.path.join(root, "cache"), r2)
+        assert await cache.get("key", os.path.join(root, "voiceover.mp3")) is None
+        assert cache.get_stats()["misses"] == 1
+
+
+def test_checkout_survives_eviction():
+    asyncio.run(_checkout_survives_eviction())
+
+
+def test_remote_tier_shared():
+    asyncio.run(_remote_tier_shared())
+
+
+def test_corrupt_remote_entry():
+    asyncio.run(_corrupt_remote_entry())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing TTS audio cache")
+    print("=" * 60)
+    print("🔑 Cache keys:")
+    test_keys()
+    print("🔗 Checkout and eviction:")
+    test_checkout_survives_eviction()
+    print("☁️  Remote tier:")
+    test_remote_tier_shared()
+    print("🧯 Corrupt remote entry:")
+    test_corrupt_remote_entry()
+    print("✅ All TTS audio cache tests passed")
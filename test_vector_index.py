@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Test script for the research chunk vector index.
+
+This script tests that:
+1. Search returns the top k rows by cosine similarity, best first, and
+   respects the minimum score
+2. Removed and replaced documents are never returned, before and after
+   the matrix is compacted
+3. The IVF layer finds nearly all of the brute-force top k, and probing
+   only empty lists returns nothing instead of failing
+4. Searches restricted to some documents only return their rows
+5. Snapshots round-trip through save and a memory-mapped load
+"""
+
+import logging
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.intelligence.utils.vector_index import VectorIndex
+
+DIM = 32
+
+
+def random_vectors(count: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(count, DIM)).astype(np.float32)
+
+
+def brute_force(vectors: np.ndarray, query: np.ndarray, top_k: int):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    order = np.argsort(-scores)[:top_k]
+    return [int(i) for i in order], scores[order]
+
+
+def test_top_k_order():
+    vectors = random_vectors(200)
+    index = VectorIndex()
+    assert index.add("doc", vectors) == len(vectors)
+
+    query = random_vectors(1, seed=1)[0]
+    expected_rows, expected_scores = brute_force(vectors, query, 10)
+    results = index.search(query, top_k=10)
+
+    assert [chunk for _, chunk, _ in results] == expected_rows
+    assert np.allclose([score for _, _, score in results], expected_scores, atol=1e-5)
+    scores = [score for _, _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+    # A vector is its own best match
+    doc_id, chunk_index, score = index.search(vectors[42], top_k=1)[0]
+    assert (doc_id, chunk_index) == ("doc", 42) and score > 0.999
+
+    # Minimum score cuts the tail; zero queries and vectors are ignored
+    assert all(score >= 0.2 for _, _, score in index.search(query, top_k=50, min_score=0.2))
+    assert index.search(np.zeros(DIM), top_k=5) == []
+    assert index.add("zeros", np.zeros((3, DIM))) == 0
+    assert "zeros" not in index
+
+
+def test_remove_and_compact():
+    index = VectorIndex()
+    index.add("a", random_vectors(20, seed=2))
+    index.add("b", random_vectors(20, seed=3))
+    probe = random_vectors(20, seed=3)[5]
+    assert index.search(probe, top_k=1)[0][:2] == ("b", 5)
+
+    assert index.remove("b")
+    assert not index.remove("b")
+    assert len(index) == 20
+    assert all(doc_id == "a" for doc_id, _, _ in index.search(probe, top_k=40))
+
+    # Re-adding replaces the earlier version instead of duplicating it
+    index.add("a", random_vectors(5, seed=4), chunk_indexes=[10, 11, 12, 13, 14])
+    assert len(index) == 5
+    assert index.get_stats()["deleted_rows"] == 40
+
+    index.compact()
+    assert index.get_stats()["deleted_rows"] == 0
+    results = index.search(random_vectors(5, seed=4)[2], top_k=10)
+    assert results[0][:2] == ("a", 12)
+    assert len(results) == 5
+
+
+def test_ivf_recall():
+    # Clustered data, as embeddings of related research chunks are
+    rng = np.random.default_rng(5)
+    centers = rng.normal(size=(40, DIM))
+    vectors = (centers[rng.integers(0, 40, size=4000)] + rng.normal(scale=0.3, size=(4000, DIM))).astype(np.float32)
+
+    index = VectorIndex(ivf_min_vectors=1000, ivf_probes=8)
+    index.add("corpus", vectors)
+
+    queries = (centers[rng.integers(0, 40, size=50)] + rng.normal(scale=0.3, size=(50, DIM))).astype(np.float32)
+    found = 0
+    for query in queries:
+        expected_rows, _ = brute_force(vectors, query, 10)
+        results = index.search(query, top_k=10)
+        found += len(set(expected_rows) & {chunk for _, chunk, _ in results})
+
+    assert index.get_stats()["ivf_lists"] > 0
+    recall = found / (len(queries) * 10)
+    assert recall >= 0.9, f"IVF recall {recall:.2f} below 0.9"
+
+    # Rows added after the build are searched before the next rebuild
+    extra = random_vectors(1, seed=6)
+    index.add("late", extra)
+    assert index.search(extra[0], top_k=1)[0][:2] == ("late", 0)
+
+
+def test_empty_ivf_probe():
+    index = VectorIndex(ivf_min_vectors=100, ivf_probes=1)
+    index.add("corpus", random_vectors(400, seed=11))
+    query = random_vectors(1, seed=12)[0]
+    index.search(query, top_k=5)
+    assert index._centroids is not None
+
+    # A list nearest to the query with no rows assigned to it
+    index._centroids = np.vstack([index._centroids, query / np.linalg.norm(query)])
+    index._ivf_offsets = np.append(index._ivf_offsets, index._ivf_offsets[-1])
+    assert index.search(query, top_k=5) == []
+
+
+def test_doc_id_filter():
+    index = VectorIndex(ivf_min_vectors=100)
+    index.add("mine", random_vectors(50, seed=13))
+    index.add("theirs", random_vectors(300, seed=14))
+    probe = random_vectors(300, seed=14)[7]
+
+    assert index.search(probe, top_k=1)[0][:2] == ("theirs", 7)
+    results = index.search(probe, top_k=10, doc_ids=["mine"])
+    assert len(results) == 10 and all(doc_id == "mine" for doc_id, _, _ in results)
+    assert index.search(probe, top_k=10, doc_ids=["unknown"]) == []
+
+    index.remove("mine")
+    assert index.search(probe, top_k=10, doc_ids=["mine"]) == []
+
+
+def test_save_and_mmap_load():
+    vectors = random_vectors(100, seed=7)
+    index = VectorIndex()
+    index.add("a", vectors[:50])
+    index.add("b", vectors[50:], chunk_indexes=list(range(100, 150)))
+    index.add("removed", random_vectors(10, seed=8))
+    index.remove("removed")
+
+    with tempfile.TemporaryDirectory() as directory:
+        index.save(directory)
+        loaded = VectorIndex.load(directory, mmap=True)
+
+        assert loaded.get_stats()["memory_mapped"]
+        assert len(loaded) == 100
+        assert "removed" not in loaded
+        query = random_vectors(1, seed=9)[0]
+        assert loaded.search(query, top_k=10) == index.search(query, top_k=10)
+        assert loaded.search(vectors[60], top_k=1)[0][:2] == ("b", 110)
+
+        # Writes copy the read-only map instead of failing
+        loaded.add("c", random_vectors(3, seed=10))
+        assert len(loaded) == 103
+        assert not loaded.get_stats()["memory_mapped"]
+        del loaded
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing vector index")
+    print("=" * 60)
+    print("🔝 Top-k order:")
+    test_top_k_order()
+    print("🗑️  Remove and compact:")
+    test_remove_and_compact()
+    print("🧭 IVF recall:")
+    test_ivf_recall()
+    print("🕳️  Empty IVF probe:")
+    test_empty_ivf_probe()
+    print("🔒 Document filter:")
+    test_doc_id_filter()
+    print("💾 Save and mmap load:")
+    test_save_and_mmap_load()
+    print("✅ All vector index tests passed")
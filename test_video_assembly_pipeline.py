@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent video assembly.
+
+This script tests that:
+1. Single-pass xfade transitions are clamped to half of the shorter scene,
+   so every offset stays positive, and scenes too short for a one-frame
+   fade are joined with concat instead
+2. No more FFmpeg processes run at once than FFMPEG_MAX_CONCURRENT, also
+   when assemblies run on different event loops
+3. A failing scene cancels the scenes still rendering
+4. Cancelling a job's token kills its running FFmpeg process, also when
+   the token is cancelled from another thread
+5. The single-pass graph pads silent scenes, ducks music under the
+   narration and encodes video and audio in one command
+"""
+
+import asyncio
+import logging
+import re
+import sys
+import os
+import threading
+import time
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.content.services import video_assembly_pipeline
+from src.content.services.video_assembly_pipeline import (
+    AssemblyJob,
+    CancellationToken,
+    VideoAssemblyCancelled,
+    VideoAssemblyPipeline,
+    VideoScene,
+    VideoSpec,
+)
+
+SPECS = VideoSpec(1080, 1920, 30, "4M")
+
+
+class OfflinePipeline(VideoAssemblyPipeline):
+    """Pipeline that does not need FFmpeg installed or an output directory"""
+
+    def __init__(self):
+        self.video_specs = {"youtube_short": SPECS}
+        self.scene_cache = None
+        self.running = 0
+        self.peak = 0
+
+    async def _exec_ffmpeg(self, cmd, cancel_token=None):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.02)
+        self.running -= 1
+        return None
+
+
+def scene(scene_id: str, duration: float, transition: str = "crossfade") -> VideoScene:
+    return VideoScene(scene_id, f"{scene_id}.png", None, duration, transition_type=transition)
+
+
+def test_xfade_clamped_to_short_scenes():
+    pipeline = OfflinePipeline()
+    scenes = [scene("s1", 0.6), scene("s2", 3.0), scene("s3", 3.0)]
+    cmd, graph = pipeline._build_single_pass_command(scenes, SPECS, None, None, "out.mp4")
+
+    fades = [(float(d), float(o)) for d, o in re.findall(r"xfade=transition=fade:duration=([\d.]+):offset=([\d.]+)", graph)]
+    assert fades == [(0.3, 0.3), (0.5, 2.8)], fades
+    assert cmd[cmd.index('-t') + 1] == "5.800"
+
+    # 20 ms is shorter than two frames at 30 fps: no xfade fits, hard cuts instead
+    scenes = [scene("s1", 0.02), scene("s2", 3.0)]
+    cmd, graph = pipeline._build_single_pass_command(scenes, SPECS, None, None, "out.mp4")
+    assert "xfade" not in graph and "concat=n=2" in graph
+    assert cmd[cmd.index('-t') + 1] == "3.020"
+
+
+def test_single_pass_audio_graph():
+    pipeline = OfflinePipeline()
+    scenes = [
+        VideoScene("s1", "s1.png", "s1.mp3", 3.0),
+        VideoScene("s2", "s2.png", None, 2.0),
+    ]
+    cmd, graph = pipeline._build_single_pass_command(scenes, SPECS, None, "music.mp3", "out.mp4")
+
+    assert cmd.count('-filter_complex') == 1 and cmd[-1] == "out.mp4"
+    assert "anullsrc" in graph and "atrim=0:2.0" in graph, "silent scene was not padded"
+    assert "concat=n=2:v=1:a=1[vjoined][voice]" in graph
+    assert "sidechaincompress" in graph and "[aout]" in graph
+    assert cmd[cmd.index('-map') + 1] == "[vjoined]" and '[aout]' in cmd and '-an' not in cmd
+
+    # No narration and no music: a silent video
+    silent = [scene("s1", 2.0, "fade"), scene("s2", 2.0, "fade")]
+    cmd, graph = pipeline._build_single_pass_command(silent, SPECS, None, None, "out.mp4")
+    assert "concat=n=2:v=1:a=0[vjoined]" in graph and '-an' in cmd and '[aout]' not in cmd
+
+
+async def _run_commands(pipeline: OfflinePipeline, count: int):
+    await asyncio.gather(*(pipeline._run_ffmpeg_command(['ffmpeg']) for _ in range(count)))
+
+
+def test_ffmpeg_slot_limit():
+    default = video_assembly_pipeline.FFMPEG_MAX_CONCURRENT
+    video_assembly_pipeline.FFMPEG_MAX_CONCURRENT = 2
+    try:
+        for _ in range(2):
+            pipeline = OfflinePipeline()
+            asyncio.run(_run_commands(pipeline, 6))
+            assert pipeline.peak == 2, pipeline.peak
+    finally:
+        video_assembly_pipeline.FFMPEG_MAX_CONCURRENT = default
+
+
+class FailingScenePipeline(OfflinePipeline):
+    """Scene "bad" fails quickly, every other scene renders slowly"""
+
+    def __init__(self):
+        super().__init__()
+        self.finished = []
+        self.cancelled = []
+
+    async def _create_single_scene_video(self, scene, specs, job, threads=0):
+        if scene["scene_id"] == "bad":
+            await asyncio.sleep(0.01)
+            raise RuntimeError("ffmpeg failed")
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.cancelled.append(scene["scene_id"])
+            raise
+        self.finished.append(scene["scene_id"])
+        return f"{scene['scene_id']}.mp4"
+
+
+async def _failing_scene_cancels_rest():
+    pipeline = FailingScenePipeline()
+    job = AssemblyJob(job_id="job", work_dir="/tmp")
+    scenes = [{"scene_id": scene_id} for scene_id in ("bad", "s1", "s2")]
+
+    started = time.monotonic()
+    try:
+        await pipeline._create_scene_videos(scenes, SPECS, job)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("scene failure was swallowed")
+
+    assert time.monotonic() - started < 0.5, "failure waited for the other scenes"
+    assert pipeline.finished == []
+    # Scenes beyond the available CPU slots may not have started at all
+    assert set(pipeline.cancelled) <= {"s1", "s2"}
+
+
+def test_failing_scene_cancels_rest():
+    asyncio.run(_failing_scene_cancels_rest())
+
+
+async def _cancel_kills_process(cancel_from_thread: bool):
+    pipeline = VideoAssemblyPipeline.__new__(VideoAssemblyPipeline)
+    token = CancellationToken()
+
+    if cancel_from_thread:
+        threading.Timer(0.1, token.cancel, kwargs={"reason": "user cancelled"}).start()
+    else:
+        asyncio.get_running_loop().call_later(0.1, token.cancel, "user cancelled")
+
+    started = time.monotonic()
+    try:
+        await pipeline._exec_ffmpeg(['sleep', '5'], token)
+    except VideoAssemblyCancelled as e:
+        assert str(e) == "user cancelled"
+    else:
+        raise AssertionError("cancelled process ran to completion")
+    assert time.monotonic() - started < 2, "process was not killed"
+
+    # A cancelled token refuses new work without spawning anything
+    try:
+        await pipeline._exec_ffmpeg(['sleep', '5'], token)
+    except VideoAssemblyCancelled:
+        pass
+    else:
+        raise AssertionError("cancelled token started a process")
+
+
+def test_cancel_kills_process():
+    asyncio.run(_cancel_kills_process(cancel_from_thread=False))
+    asyncio.run(_cancel_kills_process(cancel_from_thread=True))
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing video assembly pipeline")
+    print("=" * 60)
+    print("🎞️  Xfade clamping:")
+    test_xfade_clamped_to_short_scenes()
+    print("🔊 Single-pass audio graph:")
+    test_single_pass_audio_graph()
+    print("🚦 FFmpeg slot limit:")
+    test_ffmpeg_slot_limit()
+    print("💥 Failing scene:")
+    test_failing_scene_cancels_rest()
+    print("🛑 Cancellation:")
+    test_cancel_kills_process()
+    print("✅ All video assembly pipeline tests passed")
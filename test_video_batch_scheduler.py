@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test script for the video batch scheduler.
+
+This script tests that:
+1. A stage never runs more jobs at once than its limit, and waits and runs
+   are timed per stage and per batch
+2. The shared scheduler keeps working when batches run on different event
+   loops (each loop gets its own semaphores)
+"""
+
+import asyncio
+import logging
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.intelligence.generators.video_batch_scheduler import VideoBatchScheduler
+
+
+async def _run_contended(scheduler: VideoBatchScheduler, stage: str, jobs: int) -> int:
+    running, peak = 0, 0
+
+    async def job():
+        nonlocal running, peak
+        async with scheduler.stage(stage):
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    with scheduler.track_batch() as timings:
+        await asyncio.gather(*(job() for _ in range(jobs)))
+    assert timings.report()["stages"][stage]["calls"] == jobs
+    return peak
+
+
+def test_stage_limit():
+    scheduler = VideoBatchScheduler({"assembly": 2, "download": 5})
+    assert asyncio.run(_run_contended(scheduler, "assembly", 8)) == 2
+    assert asyncio.run(_run_contended(scheduler, "download", 8)) == 5
+
+    status = scheduler.get_status()
+    assert status["active"]["assembly"] == 0
+    assert status["lifetime"]["assembly"]["calls"] == 8
+    assert status["lifetime"]["assembly"]["total_wait_seconds"] > 0
+
+
+def test_separate_event_loops():
+    scheduler = VideoBatchScheduler({"assembly": 1})
+    # A semaphore contended on one loop cannot be waited on from another;
+    # a scheduler used by several asyncio.run() calls must not share them
+    for _ in range(3):
+        assert asyncio.run(_run_contended(scheduler, "assembly", 4)) == 1
+
+    try:
+        asyncio.run(_run_contended(scheduler, "voiceover", 1))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown stage was accepted")
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    print("🧪 Testing video batch scheduler")
+    print("=" * 60)
+    print("🚦 Stage limits:")
+    test_stage_limit()
+    print("🔁 Separate event loops:")
+    test_separate_event_loops()
+    print("✅ All video batch scheduler tests passed")